@@ -23,6 +23,7 @@ from .plugins import (
     PluginRepositoryManager,
     PluginSelector,
     RepositoryManager,
+    SecurityAuditStore,
     get_environment_manager,
 )
 from .plugins.search import (
@@ -458,6 +459,12 @@ class PACCCli:
             help="Force installation, overwriting existing extensions",
         )
 
+        sync_parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Process every extension, even those unchanged since the last sync",
+        )
+
         sync_parser.add_argument(
             "--project-dir", type=Path, help="Project directory (default: current directory)"
         )
@@ -608,14 +615,38 @@ class PACCCli:
         )
         sync_plugin_parser.add_argument(
             "--project-dir",
+            type=Path,
+            default=Path.cwd(),
             help="Directory containing pacc.json (defaults to current directory)",
         )
+        sync_plugin_parser.add_argument(
+            "--environment",
+            "-e",
+            default="default",
+            help="Environment to sync (default: default)",
+        )
         sync_plugin_parser.add_argument(
             "--dry-run",
             "-n",
             action="store_true",
             help="Show what would be synced without making changes",
         )
+        sync_plugin_parser.add_argument(
+            "--required-only", action="store_true", help="Only sync required plugins"
+        )
+        sync_plugin_parser.add_argument(
+            "--optional-only", action="store_true", help="Only sync optional plugins"
+        )
+        sync_plugin_parser.add_argument(
+            "--refresh-lock",
+            action="store_true",
+            help="Re-resolve plugin versions instead of using pacc.lock, and rewrite it",
+        )
+        sync_plugin_parser.add_argument(
+            "--worktrees",
+            action="store_true",
+            help="Keep checked-out versions as git worktrees so switching versions is instant",
+        )
         sync_plugin_parser.set_defaults(func=self.handle_plugin_sync)
 
         # Plugin info command
@@ -660,7 +691,29 @@ class PACCCli:
         convert_plugin_parser.add_argument(
             "extension", help="Path to extension file or directory to convert"
         )
+        convert_plugin_parser.add_argument("--name", help="Plugin name (auto-generated if omitted)")
+        convert_plugin_parser.add_argument(
+            "--version", default="1.0.0", help="Plugin version (default: 1.0.0)"
+        )
+        convert_plugin_parser.add_argument("--author", help="Plugin author information")
         convert_plugin_parser.add_argument("--output", "-o", help="Output directory for plugin")
+        convert_plugin_parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="Convert all extensions in directory as separate plugins",
+        )
+        convert_plugin_parser.add_argument(
+            "--repo", help="Git repository URL for direct push after conversion"
+        )
+        convert_plugin_parser.add_argument(
+            "--overwrite", action="store_true", help="Overwrite existing plugin directories"
+        )
+        convert_plugin_parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            help="Extensions to validate and copy in parallel (default: CPU count, max 8)",
+        )
         convert_plugin_parser.set_defaults(func=self.handle_plugin_convert)
 
         # Plugin push command
@@ -709,6 +762,37 @@ class PACCCli:
 
         env_plugin_parser.set_defaults(func=self.handle_plugin_env)
 
+        # Plugin audit command
+        audit_plugin_parser = plugin_subparsers.add_parser(
+            "audit",
+            help="Show security audit history",
+            description="Summarize and query the plugin security audit history",
+        )
+        audit_plugin_parser.add_argument("--plugin", help="Only show audits for this plugin")
+        audit_plugin_parser.add_argument(
+            "--days", type=int, default=30, help="Only include the last N days (0 for all)"
+        )
+        audit_plugin_parser.add_argument(
+            "--threat",
+            choices=["low", "medium", "high", "critical"],
+            help="Only include audits with an issue at or above this threat level",
+        )
+        audit_plugin_parser.add_argument(
+            "--limit", type=int, default=20, help="Number of recent audits to list"
+        )
+        audit_plugin_parser.add_argument(
+            "--format", choices=["table", "json"], default="table", help="Output format"
+        )
+        audit_plugin_parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Apply retention limits and reclaim space in the audit store",
+        )
+        audit_plugin_parser.add_argument(
+            "--import-log", type=Path, help="Import entries from a JSON-lines audit log file"
+        )
+        audit_plugin_parser.set_defaults(func=self.handle_plugin_audit)
+
     def _add_plugin_parser(self, subparsers) -> None:
         """Add the plugin command parser."""
         plugin_parser = subparsers.add_parser(
@@ -987,6 +1071,12 @@ class PACCCli:
             "--non-interactive", action="store_true", help="Don't prompt for conflict resolution"
         )
 
+        sync_fragment_parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Process every fragment, even those unchanged since the last sync",
+        )
+
         sync_fragment_parser.add_argument(
             "--dry-run",
             "-n",
@@ -1430,19 +1520,18 @@ class PACCCli:
                     return 1
 
             # Perform installation
-            success_count = 0
-            for ext in selected_extensions:
+            if args.dry_run:
+                for ext in selected_extensions:
+                    self._print_info(f"Would install: {ext.name} ({ext.extension_type})")
+            else:
                 try:
-                    if args.dry_run:
-                        self._print_info(f"Would install: {ext.name} ({ext.extension_type})")
-                    else:
-                        self._install_extension(ext, base_dir, args.force)
-                        self._print_success(f"Installed: {ext.name} ({ext.extension_type})")
-                    success_count += 1
+                    self._install_extensions(selected_extensions, base_dir, args.force)
                 except Exception as e:
-                    self._print_error(f"Failed to install {ext.name}: {e}")
-                    if not args.force:
-                        return 1
+                    self._print_error(f"Failed to install extensions: {e}")
+                    return 1
+                for ext in selected_extensions:
+                    self._print_success(f"Installed: {ext.name} ({ext.extension_type})")
+            success_count = len(selected_extensions)
 
             if args.dry_run:
                 self._print_info(f"Would install {success_count} extension(s) from Git repository")
@@ -1589,19 +1678,18 @@ class PACCCli:
                 return 1
 
         # Perform installation
-        success_count = 0
-        for ext in selected_extensions:
+        if args.dry_run:
+            for ext in selected_extensions:
+                self._print_info(f"Would install: {ext.name} ({ext.extension_type})")
+        else:
             try:
-                if args.dry_run:
-                    self._print_info(f"Would install: {ext.name} ({ext.extension_type})")
-                else:
-                    self._install_extension(ext, base_dir, args.force)
-                    self._print_success(f"Installed: {ext.name} ({ext.extension_type})")
-                success_count += 1
+                self._install_extensions(selected_extensions, base_dir, args.force)
             except Exception as e:
-                self._print_error(f"Failed to install {ext.name}: {e}")
-                if not args.force:
-                    return 1
+                self._print_error(f"Failed to install extensions: {e}")
+                return 1
+            for ext in selected_extensions:
+                self._print_success(f"Installed: {ext.name} ({ext.extension_type})")
+        success_count = len(selected_extensions)
 
         if self._json_output:
             result = CommandResult(
@@ -1805,7 +1893,10 @@ class PACCCli:
             # Perform synchronization
             sync_manager = ProjectSyncManager()
             sync_result = sync_manager.sync_project(
-                project_dir=project_dir, environment=args.environment, dry_run=args.dry_run
+                project_dir=project_dir,
+                environment=args.environment,
+                dry_run=args.dry_run,
+                full=getattr(args, "full", False) or getattr(args, "force", False),
             )
 
             # Report results
@@ -1820,6 +1911,11 @@ class PACCCli:
                 if sync_result.updated_count > 0:
                     self._print_info(f"Updated {sync_result.updated_count} existing extensions")
 
+                if sync_result.skipped_count > 0:
+                    self._print_info(
+                        f"Skipped {sync_result.skipped_count} extensions unchanged since last sync"
+                    )
+
                 if sync_result.warnings:
                     self._print_warning("Warnings during sync:")
                     for warning in sync_result.warnings:
@@ -2632,45 +2728,99 @@ class PACCCli:
 
     def _install_extension(self, extension, base_dir: Path, force: bool = False) -> None:
         """Install a single extension with configuration management."""
-        import shutil
-        from pathlib import Path
+        self._install_extensions([extension], base_dir, force)
 
-        # Create extension type directory
-        ext_dir = base_dir / extension.extension_type
-        ext_dir.mkdir(parents=True, exist_ok=True)
+    def _install_extensions(self, extensions: List, base_dir: Path, force: bool = False) -> None:
+        """Install several extensions with a single configuration update.
 
-        # Copy the extension file
-        dest_path = ext_dir / extension.file_path.name
+        Files are copied in parallel, then the settings.json entries for all
+        hooks and MCPs are merged in one update with one backup. If a copy or
+        the merge fails, every copied file is removed and overwritten files
+        are restored.
 
-        if dest_path.exists() and not force:
-            raise ValueError(f"Extension already exists: {dest_path}. Use --force to overwrite.")
+        Args:
+            extensions: Extensions to install
+            base_dir: Claude configuration directory to install into
+            force: Whether to overwrite existing extension files
 
-        shutil.copy2(extension.file_path, dest_path)
+        Raises:
+            ValueError: If an extension already exists or installation fails
+        """
+        import shutil
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Resolve every destination before touching the filesystem
+        destinations: Dict[Path, Any] = {}
+        for extension in extensions:
+            dest_path = base_dir / extension.extension_type / extension.file_path.name
+            if dest_path in destinations:
+                raise ValueError(
+                    f"Extensions {destinations[dest_path].name} and {extension.name} "
+                    f"would both be installed to {dest_path}"
+                )
+            if dest_path.exists() and not force:
+                raise ValueError(
+                    f"Extension already exists: {dest_path}. Use --force to overwrite."
+                )
+            destinations[dest_path] = extension
 
-        # Only update settings.json for hooks and mcps
-        # Agents and commands are file-based and don't need configuration entries
-        if extension.extension_type in ["hooks", "mcps"]:
-            # Update configuration using the JSON merger
-            config_manager = ClaudeConfigManager()
-            base_dir / "settings.json"
+        if not destinations:
+            return
 
-            # Load extension metadata for configuration
-            extension_config = self._create_extension_config(extension, dest_path)
+        # Keep copies of files being overwritten so a failed install can restore them
+        overwritten = [dest_path for dest_path in destinations if dest_path.exists()]
+        backup_dir = Path(tempfile.mkdtemp(prefix="pacc-install-")) if overwritten else None
+        backups = {}
 
-            # Add to configuration
-            from pathlib import Path
+        def copy_extension(dest_path: Path) -> None:
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(destinations[dest_path].file_path, dest_path)
 
-            home_claude_dir = Path.home() / ".claude"
-            is_user_level = base_dir.resolve() == home_claude_dir.resolve()
-            success = config_manager.add_extension_config(
-                extension.extension_type, extension_config, user_level=is_user_level
-            )
+        def rollback() -> None:
+            for dest_path in destinations:
+                try:
+                    if dest_path in backups:
+                        shutil.copy2(backups[dest_path], dest_path)
+                    elif dest_path.exists() and dest_path not in overwritten:
+                        # Overwritten files without a backup were never touched
+                        dest_path.unlink()
+                except OSError as e:
+                    self._print_warning(f"Could not roll back {dest_path}: {e}")
 
-            if not success:
-                # Rollback file copy if config update failed
-                if dest_path.exists():
-                    dest_path.unlink()
-                raise ValueError(f"Failed to update configuration for {extension.name}")
+        try:
+            for index, dest_path in enumerate(overwritten):
+                backups[dest_path] = backup_dir / str(index)
+                shutil.copy2(dest_path, backups[dest_path])
+
+            workers = min(8, len(destinations))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pacc-install") as pool:
+                list(pool.map(copy_extension, destinations))
+
+            # Only hooks and mcps need settings.json entries
+            # Agents and commands are file-based and discovered from their directories
+            extension_configs = [
+                (extension.extension_type, self._create_extension_config(extension, dest_path))
+                for dest_path, extension in destinations.items()
+                if extension.extension_type in ["hooks", "mcps"]
+            ]
+            if extension_configs:
+                home_claude_dir = Path.home() / ".claude"
+                is_user_level = base_dir.resolve() == home_claude_dir.resolve()
+                success = ClaudeConfigManager().add_extension_configs(
+                    extension_configs, user_level=is_user_level
+                )
+                if not success:
+                    names = ", ".join(config["name"] for _, config in extension_configs)
+                    raise ValueError(f"Failed to update configuration for {names}")
+        except Exception as e:
+            rollback()
+            if isinstance(e, ValueError):
+                raise
+            raise ValueError(f"Installation failed: {e}") from e
+        finally:
+            if backup_dir is not None:
+                shutil.rmtree(backup_dir, ignore_errors=True)
 
     def _create_extension_config(self, extension, dest_path: Path) -> Dict[str, Any]:
         """Create configuration entry for an extension.
@@ -3065,6 +3215,7 @@ class PACCCli:
         print("  sync                   Synchronize plugins from pacc.json")
         print("  convert <extension>    Convert extension to plugin format")
         print("  push <plugin> <repo>   Push local plugin to Git repository")
+        print("  audit                  Show security audit history")
         print("\nUse 'pacc plugin <command> --help' for more information on a command.")
         return 0
 
@@ -3555,7 +3706,13 @@ class PACCCli:
                             try:
                                 import shutil
 
-                                shutil.rmtree(repo_path)
+                                from .plugins.worktrees import WorktreeManager
+
+                                worktrees = WorktreeManager(plugins_dir)
+                                if worktrees.is_managed(repo_path):
+                                    worktrees.remove_repository(repo_path)
+                                else:
+                                    shutil.rmtree(repo_path)
                                 self._print_success(f"Removed repository: {repo_path}")
                             except OSError as e:
                                 self._print_error(f"Failed to remove repository files: {e}")
@@ -3920,7 +4077,11 @@ class PACCCli:
 
             # Perform sync
             result = sync_manager.sync_plugins(
-                project_dir=project_dir, environment=args.environment, dry_run=args.dry_run
+                project_dir=project_dir,
+                environment=args.environment,
+                dry_run=args.dry_run,
+                refresh_lock=getattr(args, "refresh_lock", False),
+                worktrees=getattr(args, "worktrees", False),
             )
 
             # Process filtering options
@@ -3950,6 +4111,9 @@ class PACCCli:
                 if not result.installed_count and not result.updated_count:
                     self._print_info("💡 All plugins are already synchronized")
 
+                if result.metadata.get("lock_written"):
+                    self._print_info(f"🔒 Updated {project_dir / 'pacc.lock'}")
+
             else:
                 self._print_error("❌ Plugin synchronization failed")
                 if result.error_message:
@@ -4005,7 +4169,7 @@ class PACCCli:
 
             # Initialize converter
             output_dir = args.output or Path.cwd() / "converted_plugins"
-            converter = ExtensionToPluginConverter(output_dir=output_dir)
+            converter = ExtensionToPluginConverter(output_dir=output_dir, max_workers=args.jobs)
 
             # Interactive prompts for missing metadata
             plugin_name = args.name
@@ -4033,7 +4197,7 @@ class PACCCli:
                 metadata_defaults = {"version": args.version, "author": author}
 
                 results = converter.convert_directory(
-                    source_path, metadata_defaults=metadata_defaults, overwrite=args.overwrite
+                    source_path, metadata_defaults, args.overwrite
                 )
 
                 # Display results
@@ -4233,6 +4397,71 @@ class PACCCli:
             traceback.print_exc()
             return 1
 
+    def handle_plugin_audit(self, args) -> int:
+        """Handle plugin audit command."""
+        store = SecurityAuditStore()
+        try:
+            if args.import_log:
+                imported = store.import_jsonl(args.import_log)
+                self._print_success(f"Imported {imported} audit entries from {args.import_log}")
+
+            if args.compact:
+                removed = store.compact(vacuum=True)
+                self._print_success(f"Compacted audit store, removed {removed} entries")
+
+            since = datetime.now().timestamp() - args.days * 24 * 60 * 60 if args.days else None
+            filters = {"plugin_name": args.plugin, "since": since, "min_threat": args.threat}
+            summary = store.summarize(**filters)
+            entries = store.query(limit=args.limit, **filters) if args.limit > 0 else []
+
+            if args.format == "json":
+                import json
+
+                print(json.dumps({"summary": summary, "entries": entries}, indent=2))
+                return 0
+
+            period = f"last {args.days} days" if args.days else "all time"
+            print(f"Security audits ({period}): {summary['total_audits']}")
+            if not summary["total_audits"]:
+                return 0
+
+            print(f"  Blocked operations: {summary['blocked_operations']}")
+            print(f"  High-risk audits:   {summary['high_risk_audits']}")
+            print(f"  User confirmations: {summary['user_confirmations']}")
+            print(f"  Average risk score: {summary['average_risk_score']:.1f}")
+
+            if summary["most_common_issues"]:
+                print("\nMost common issues:")
+                for issue_type, count in summary["most_common_issues"].items():
+                    print(f"  {issue_type}: {count}")
+
+            if entries:
+                print(f"\nMost recent {len(entries)} audits:")
+                rows = [
+                    [
+                        datetime.fromtimestamp(entry["timestamp"]).strftime("%Y-%m-%d %H:%M"),
+                        entry["plugin_name"],
+                        entry["action_taken"],
+                        str(entry["risk_score"]),
+                        entry["max_threat"] or "-",
+                        str(len(entry["issues"])),
+                    ]
+                    for entry in entries
+                ]
+                self._print_table(["Time", "Plugin", "Action", "Risk", "Threat", "Issues"], rows)
+
+            return 0
+
+        except Exception as e:
+            self._print_error(f"Failed to read security audit history: {e}")
+            if getattr(args, "verbose", False):
+                import traceback
+
+                traceback.print_exc()
+            return 1
+        finally:
+            store.close()
+
     def handle_plugin_create(self, args) -> int:
         """Handle plugin create command."""
         try:
@@ -5149,6 +5378,7 @@ class PACCCli:
                 add_missing=args.add_missing,
                 remove_extra=args.remove_extra,
                 update_existing=args.update_existing,
+                full=getattr(args, "full", False),
             )
 
             # Display results
@@ -1,10 +1,13 @@
 """Core utilities for PACC."""
 
 from .file_utils import DirectoryScanner, FileFilter, FilePathValidator, PathNormalizer
+from .hashing import FileHasher, get_file_hasher
 
 __all__ = [
     "DirectoryScanner",
     "FileFilter",
+    "FileHasher",
     "FilePathValidator",
     "PathNormalizer",
+    "get_file_hasher",
 ]
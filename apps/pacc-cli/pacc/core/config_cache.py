@@ -0,0 +1,159 @@
+"""Process-wide cache of parsed JSON configuration files."""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def copy_json(value: Any) -> Any:
+    """Copy a parsed JSON value.
+
+    Much cheaper than ``copy.deepcopy`` since only dicts and lists need
+    copying; strings, numbers, booleans and None are immutable.
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Independent copy of the value
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+@dataclass
+class _CachedConfig:
+    """Parsed content of a config file and the stat it was read at."""
+
+    mtime_ns: int
+    size: int
+    value: Any
+
+
+class ConfigFileCache:
+    """Thread-safe cache of parsed JSON config files.
+
+    Entries are keyed by absolute path and validated against the file's
+    (mtime_ns, size) on every load, so edits made outside PACC are picked
+    up. Writers call invalidate() after saving. Callers always receive their
+    own copy of the parsed value and may modify it freely.
+    """
+
+    # Files modified this recently are not cached, since a same-size rewrite
+    # within the filesystem's timestamp granularity would go unnoticed
+    RACY_WINDOW_SECONDS = 2.0
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize config cache.
+
+        Args:
+            max_entries: Maximum number of cached files
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedConfig] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def load_json(
+        self, path: Union[str, Path], validate: Optional[Callable[[str], None]] = None
+    ) -> Any:
+        """Load and parse a JSON file, reusing the cached result if it is unchanged.
+
+        Args:
+            path: Path to the JSON file
+            validate: Optional check run on the raw content before parsing; it
+                should raise if the content is invalid. Only called on a cache miss.
+
+        Returns:
+            Copy of the parsed JSON value
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy_json(entry.value)
+
+        with open(key, encoding="utf-8") as f:
+            content = f.read()
+        if validate is not None:
+            validate(content)
+        value = json.loads(content)
+
+        with self._lock:
+            self._misses += 1
+            after = os.stat(key)
+            unchanged = (after.st_mtime_ns, after.st_size) == (stat.st_mtime_ns, stat.st_size)
+            settled = time.time() - after.st_mtime_ns / 1e9 >= self.RACY_WINDOW_SECONDS
+            if unchanged and settled:
+                self._entries[key] = _CachedConfig(stat.st_mtime_ns, stat.st_size, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                return copy_json(value)
+
+            self._entries.pop(key, None)
+            return value
+
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """Forget the cached content of a file.
+
+        Args:
+            path: Path of the file that was written
+        """
+        with self._lock:
+            if self._entries.pop(os.path.abspath(path), None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Forget all cached files and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._invalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with the number of loads avoided (hits), files read
+            (misses), invalidations and cached files
+        """
+        with self._lock:
+            return {
+                "loads_avoided": self._hits,
+                "loads": self._misses,
+                "invalidations": self._invalidations,
+                "cached_files": len(self._entries),
+            }
+
+
+# Global cache shared by all configuration managers
+_config_cache = ConfigFileCache()
+
+
+def get_config_cache() -> ConfigFileCache:
+    """Get global config file cache instance."""
+    return _config_cache
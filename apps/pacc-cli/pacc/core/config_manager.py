@@ -18,6 +18,7 @@ from ..recovery.strategies import (
 from ..ui.components import MultiSelectList, SelectableItem
 from ..validation.base import BaseValidator
 from ..validation.formats import JSONValidator
+from .config_cache import get_config_cache
 from .file_utils import FilePathValidator, PathNormalizer
 
 logger = logging.getLogger(__name__)
@@ -100,12 +101,19 @@ class DeepMergeStrategy(MergeStrategy):
     def merge(
         self, existing_config: Dict[str, Any], new_config: Dict[str, Any], key_path: str = ""
     ) -> MergeResult:
-        """Perform deep merge of configurations."""
+        """Perform deep merge of configurations.
+
+        The merge is copy-on-write: only objects and arrays on the path of a
+        change are copied, and unchanged subtrees of ``existing_config`` are
+        shared with the merged configuration rather than deep copied. Neither
+        input is modified.
+        """
         result = MergeResult(success=True)
-        result.merged_config = deepcopy(existing_config)
 
         try:
-            self._merge_recursive(result.merged_config, new_config, result, key_path)
+            result.merged_config = self._merge_recursive(
+                existing_config, new_config, result, key_path
+            )
         except Exception as e:
             result.success = False
             result.warnings.append(f"Merge failed: {e}")
@@ -115,14 +123,27 @@ class DeepMergeStrategy(MergeStrategy):
 
     def _merge_recursive(
         self, target: Dict[str, Any], source: Dict[str, Any], result: MergeResult, key_path: str
-    ) -> None:
-        """Recursively merge source into target."""
+    ) -> Dict[str, Any]:
+        """Recursively merge source into target.
+
+        Returns:
+            ``target`` itself if nothing changed, otherwise a shallow copy with
+            the changed keys replaced
+        """
+        merged = target
+
+        def set_value(key: str, value: Any) -> None:
+            nonlocal merged
+            if merged is target:
+                merged = dict(target)
+            merged[key] = value
+
         for key, value in source.items():
             current_path = f"{key_path}.{key}" if key_path else key
 
             if key not in target:
                 # New key - just add it
-                target[key] = deepcopy(value)
+                set_value(key, deepcopy(value))
                 result.changes_made.append(f"Added {current_path}")
                 continue
 
@@ -146,12 +167,15 @@ class DeepMergeStrategy(MergeStrategy):
             # Handle different value types
             if isinstance(value, dict) and isinstance(existing_value, dict):
                 # Recursive merge for nested objects
-                self._merge_recursive(existing_value, value, result, current_path)
+                merged_value = self._merge_recursive(existing_value, value, result, current_path)
+                if merged_value is not existing_value:
+                    set_value(key, merged_value)
 
             elif isinstance(value, list) and isinstance(existing_value, list):
                 # Handle array merging
                 merged_array = self._merge_arrays(existing_value, value, current_path, result)
-                target[key] = merged_array
+                if merged_array is not existing_value:
+                    set_value(key, merged_array)
 
             elif existing_value != value:
                 # Value conflict - different primitive values
@@ -165,34 +189,45 @@ class DeepMergeStrategy(MergeStrategy):
 
                 # Apply conflict resolution strategy
                 if self.conflict_resolution == "use_new":
-                    target[key] = deepcopy(value)
+                    set_value(key, deepcopy(value))
                     result.changes_made.append(f"Updated {current_path} (used new value)")
                 elif self.conflict_resolution == "keep_existing":
                     # Keep existing value (no change)
                     result.warnings.append(f"Kept existing value at {current_path}")
                 # For 'prompt', conflicts will be handled by the caller
 
+        return merged
+
     def _merge_arrays(
         self, existing_array: List[Any], new_array: List[Any], key_path: str, result: MergeResult
     ) -> List[Any]:
-        """Merge two arrays based on strategy."""
+        """Merge two arrays based on strategy.
+
+        Returns:
+            ``existing_array`` itself if nothing was added, otherwise a new list
+        """
         if self.array_strategy == "replace":
             result.changes_made.append(f"Replaced array at {key_path}")
             return deepcopy(new_array)
 
         elif self.array_strategy == "append":
-            merged = existing_array + new_array
+            merged = existing_array + deepcopy(new_array)
             result.changes_made.append(f"Appended to array at {key_path}")
             return merged
 
         elif self.array_strategy == "dedupe":
-            # Combine arrays and remove duplicates
-            merged = existing_array.copy()
+            # Combine arrays and remove duplicates, using a hash index of the
+            # items already present instead of rescanning the array per item
+            merged = existing_array
+            index = _ArrayIndex(existing_array)
             added_count = 0
 
             for item in new_array:
-                if item not in merged:
-                    merged.append(item)
+                if item not in index:
+                    if merged is existing_array:
+                        merged = existing_array.copy()
+                    merged.append(deepcopy(item))
+                    index.add(item)
                     added_count += 1
 
             if added_count > 0:
@@ -204,7 +239,54 @@ class DeepMergeStrategy(MergeStrategy):
 
         else:
             # Default to append
-            return existing_array + new_array
+            return existing_array + deepcopy(new_array)
+
+
+def _canonical_key(value: Any) -> Any:
+    """Build a hashable key that is equal for equal JSON values.
+
+    Dicts and lists are converted to tagged tuples, with dict items sorted by
+    key, so two values get the same key exactly when they compare equal.
+
+    Raises:
+        TypeError: If the value contains unhashable or unorderable parts
+    """
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, _canonical_key(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return ("list", tuple(_canonical_key(v) for v in value))
+    hash(value)
+    return value
+
+
+class _ArrayIndex:
+    """Membership index over array items keyed by their canonical key.
+
+    Items that cannot be keyed fall back to an equality scan, so membership
+    matches ``item in array`` exactly.
+    """
+
+    def __init__(self, items: List[Any]):
+        self._keys = set()
+        self._unkeyed: List[Any] = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        """Add an item to the index."""
+        try:
+            self._keys.add(_canonical_key(item))
+        except TypeError:
+            self._unkeyed.append(item)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check whether an equal item has been added."""
+        try:
+            if _canonical_key(item) in self._keys:
+                return True
+        except TypeError:
+            pass
+        return item in self._unkeyed
 
 
 class ClaudeConfigManager:
@@ -276,17 +358,16 @@ class ClaudeConfigManager:
         if not self.file_validator.is_valid_path(config_path):
             raise ConfigurationError(f"Invalid configuration file path: {config_path}")
 
-        try:
-            with open(config_path, encoding="utf-8") as f:
-                content = f.read()
-
+        def validate_json(content: str) -> None:
             # Validate JSON syntax
             validation_result = self.json_validator.validate_content(content, config_path)
             if not validation_result.is_valid:
                 errors = [str(issue) for issue in validation_result.issues]
                 raise ConfigurationError(f"Invalid JSON in {config_path}: {'; '.join(errors)}")
 
-            config = json.loads(content)
+        try:
+            # Unchanged files are served from the shared cache without re-parsing
+            config = get_config_cache().load_json(config_path, validate=validate_json)
 
             # Validate configuration structure
             self._validate_config_structure(config, config_path)
@@ -345,6 +426,9 @@ class ClaudeConfigManager:
 
             raise ConfigurationError(f"Failed to save configuration to {config_path}: {e}")
 
+        finally:
+            get_config_cache().invalidate(config_path)
+
     def merge_config(
         self,
         config_path: Path,
@@ -441,6 +525,7 @@ class ClaudeConfigManager:
             if backup_path and backup_path.exists():
                 try:
                     shutil.copy2(backup_path, config_path)
+                    get_config_cache().invalidate(config_path)
                     logger.info("Configuration restored from backup")
                 except OSError as restore_error:
                     logger.error(f"Failed to restore backup: {restore_error}")
@@ -471,22 +556,42 @@ class ClaudeConfigManager:
         Returns:
             True if extension was added successfully
         """
+        return self.add_extension_configs([(extension_type, extension_config)], user_level)
+
+    def add_extension_configs(
+        self, extension_configs: List[Tuple[str, Dict[str, Any]]], user_level: bool = False
+    ) -> bool:
+        """Add several extension configurations to Claude settings in one update.
+
+        All entries are merged with a single load, backup and save of the
+        settings file, and none are applied if the update fails.
+
+        Args:
+            extension_configs: (extension_type, extension_config) pairs
+            user_level: Whether to update user-level or project-level config
+
+        Returns:
+            True if all extensions were added successfully
+        """
         config_path = self.get_config_path(user_level)
 
         # Prepare update based on extension type
-        if extension_type == "hooks":
-            updates = {"hooks": [extension_config]}
-        elif extension_type == "mcps":
-            updates = {"mcps": [extension_config]}
-        elif extension_type in ["agents", "commands"]:
-            # Agents and commands don't go in settings.json
-            # They are discovered from their directories
-            raise ConfigurationError(
-                f"Extension type '{extension_type}' is file-based and doesn't require settings.json entries. "
-                f"Simply place the file in the appropriate directory."
-            )
-        else:
-            raise ConfigurationError(f"Unknown extension type: {extension_type}")
+        updates: Dict[str, List[Dict[str, Any]]] = {}
+        for extension_type, extension_config in extension_configs:
+            if extension_type in ["hooks", "mcps"]:
+                updates.setdefault(extension_type, []).append(extension_config)
+            elif extension_type in ["agents", "commands"]:
+                # Agents and commands don't go in settings.json
+                # They are discovered from their directories
+                raise ConfigurationError(
+                    f"Extension type '{extension_type}' is file-based and doesn't require settings.json entries. "
+                    f"Simply place the file in the appropriate directory."
+                )
+            else:
+                raise ConfigurationError(f"Unknown extension type: {extension_type}")
+
+        if not updates:
+            return True
 
         # Use dedupe strategy for arrays to avoid duplicates
         merge_strategy = DeepMergeStrategy(array_strategy="dedupe", conflict_resolution="prompt")
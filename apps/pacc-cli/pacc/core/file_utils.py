@@ -3,8 +3,9 @@
 import fnmatch
 import os
 import stat
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterator, List, Optional, Set, Union
+from typing import Callable, Dict, Iterator, List, Optional, Set, Union
 
 
 class FilePathValidator:
@@ -167,6 +168,102 @@ class PathNormalizer:
         return path_obj
 
 
+@dataclass(frozen=True)
+class FileEntry:
+    """A regular file recorded in a tree snapshot."""
+
+    path: str  # POSIX path relative to the snapshot root
+    size: int
+    mode: int
+    mtime: float
+
+
+@dataclass
+class TreeSnapshot:
+    """Sizes, modes and mtimes of every file below a directory, from one walk.
+
+    Packages and scanners that need the file list, total size or per-file
+    stats of the same tree share a snapshot instead of walking it again.
+    """
+
+    root: Path
+    files: List[FileEntry] = field(default_factory=list)
+    directories: List[str] = field(default_factory=list)
+    _by_path: Dict[str, FileEntry] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        """Index files by relative path."""
+        self._by_path = {entry.path: entry for entry in self.files}
+
+    @classmethod
+    def scan(cls, root: Union[str, Path]) -> "TreeSnapshot":
+        """Walk a directory tree with os.scandir.
+
+        Symlinks to files are followed; symlinked directories are not
+        descended into. Unreadable directories are skipped.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            Snapshot with files sorted by relative path
+        """
+        root = Path(root)
+        files = []
+        directories = []
+        pending = [("", str(root))]
+
+        while pending:
+            rel_dir, abs_dir = pending.pop()
+            try:
+                with os.scandir(abs_dir) as entries:
+                    for entry in entries:
+                        rel_path = f"{rel_dir}{entry.name}"
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                directories.append(rel_path)
+                                pending.append((f"{rel_path}/", entry.path))
+                            elif entry.is_file():
+                                entry_stat = entry.stat()
+                                files.append(
+                                    FileEntry(
+                                        path=rel_path,
+                                        size=entry_stat.st_size,
+                                        mode=entry_stat.st_mode,
+                                        mtime=entry_stat.st_mtime,
+                                    )
+                                )
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        files.sort(key=lambda entry: entry.path)
+        directories.sort()
+        return cls(root=root, files=files, directories=directories)
+
+    @property
+    def total_size(self) -> int:
+        """Total size of all files in bytes."""
+        return sum(entry.size for entry in self.files)
+
+    @property
+    def paths(self) -> List[str]:
+        """Sorted relative POSIX paths of all files."""
+        return [entry.path for entry in self.files]
+
+    def get(self, rel_path: str) -> Optional[FileEntry]:
+        """Look up a file by relative POSIX path.
+
+        Args:
+            rel_path: Path relative to the snapshot root
+
+        Returns:
+            File entry, or None if the file was not present
+        """
+        return self._by_path.get(rel_path)
+
+
 class DirectoryScanner:
     """Scans directories for files matching criteria."""
 
@@ -179,7 +276,11 @@ class DirectoryScanner:
         self.validator = validator or FilePathValidator()
 
     def scan_directory(
-        self, directory: Union[str, Path], recursive: bool = True, max_depth: Optional[int] = None
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        max_depth: Optional[int] = None,
+        snapshot: Optional[TreeSnapshot] = None,
     ) -> Iterator[Path]:
         """Scan directory for files.
 
@@ -187,6 +288,7 @@ class DirectoryScanner:
             directory: Directory to scan
             recursive: Whether to scan recursively
             max_depth: Maximum depth for recursive scanning
+            snapshot: Snapshot of the directory to serve a recursive scan from
 
         Yields:
             Path objects for found files
@@ -197,8 +299,14 @@ class DirectoryScanner:
             return
 
         try:
-            if recursive:
-                pattern = "**/*" if max_depth is None else "/".join(["*"] * (max_depth + 1))
+            if recursive and max_depth is None:
+                snapshot = snapshot or TreeSnapshot.scan(dir_path)
+                for entry in snapshot.files:
+                    path = dir_path / entry.path
+                    if self.validator.is_valid_path(path):
+                        yield path
+            elif recursive:
+                pattern = "/".join(["*"] * (max_depth + 1))
                 for path in dir_path.glob(pattern):
                     if path.is_file() and self.validator.is_valid_path(path):
                         yield path
@@ -251,14 +359,14 @@ class DirectoryScanner:
             return stats
 
         try:
-            for path in self.scan_directory(dir_path, recursive=True):
-                if path.is_file():
-                    stats["total_files"] += 1
-                    stats["total_size"] += path.stat().st_size
-                    if path.suffix:
-                        stats["extensions"].add(path.suffix.lower())
-                elif path.is_dir():
-                    stats["total_directories"] += 1
+            # One walk serves both the scan and the per-file sizes
+            snapshot = TreeSnapshot.scan(dir_path)
+            for path in self.scan_directory(dir_path, recursive=True, snapshot=snapshot):
+                stats["total_files"] += 1
+                stats["total_size"] += snapshot.get(path.relative_to(dir_path).as_posix()).size
+                if path.suffix:
+                    stats["extensions"].add(path.suffix.lower())
+            stats["total_directories"] = len(snapshot.directories)
 
         except (OSError, PermissionError):
             pass
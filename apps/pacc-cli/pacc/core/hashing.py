@@ -0,0 +1,205 @@
+"""Shared file hashing with stat-keyed digest caching and parallel tree hashing."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Read buffer used when hashlib.file_digest is unavailable (Python < 3.11)
+CHUNK_SIZE = 1024 * 1024
+
+
+def _digest_file(file_path: Union[str, Path], algorithm: str) -> str:
+    """Hash a file's content without going through the cache."""
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        hasher = hashlib.new(algorithm)
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+        return hasher.hexdigest()
+
+
+class FileHasher:
+    """Thread-safe file hasher with a digest cache.
+
+    Digests are cached by (device, inode, mtime_ns, size), so a file is only
+    re-read after it changes. Multiple files are hashed on a thread pool since
+    hashlib releases the GIL while hashing large buffers.
+    """
+
+    # Files modified this recently are not cached, since a same-size rewrite
+    # within the filesystem's timestamp granularity would go unnoticed
+    RACY_WINDOW_SECONDS = 2.0
+
+    def __init__(self, max_workers: Optional[int] = None, max_cache_entries: int = 10_000):
+        """Initialize file hasher.
+
+        Args:
+            max_workers: Maximum number of hashing threads (defaults to CPU count, max 8)
+            max_cache_entries: Maximum number of cached digests
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.max_cache_entries = max_cache_entries
+        self._cache: OrderedDict[Tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hash_file(self, file_path: Union[str, Path], algorithm: str = "sha256") -> str:
+        """Get the hex digest of a file's content.
+
+        Args:
+            file_path: Path to file
+            algorithm: Hash algorithm to use
+
+        Returns:
+            Hexadecimal digest string
+        """
+        stat = os.stat(file_path)
+        key = (algorithm, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            digest = self._cache.get(key)
+            if digest is not None:
+                self._cache.move_to_end(key)
+                return digest
+
+        digest = _digest_file(file_path, algorithm)
+
+        # Only cache if the file did not change while it was being read and
+        # its mtime is old enough to reveal any later change
+        after = os.stat(file_path)
+        unchanged = (after.st_ino, after.st_mtime_ns, after.st_size) == key[2:]
+        settled = time.time() - after.st_mtime_ns / 1e9 >= self.RACY_WINDOW_SECONDS
+        if unchanged and settled:
+            with self._lock:
+                self._cache[key] = digest
+                while len(self._cache) > self.max_cache_entries:
+                    self._cache.popitem(last=False)
+
+        return digest
+
+    def hash_files(
+        self, file_paths: Iterable[Union[str, Path]], algorithm: str = "sha256"
+    ) -> Dict[Path, str]:
+        """Hash several files in parallel.
+
+        Args:
+            file_paths: Paths of files to hash
+            algorithm: Hash algorithm to use
+
+        Returns:
+            Dictionary mapping each path to its hex digest, in input order
+        """
+        paths = [Path(p) for p in file_paths]
+        if len(paths) <= 1 or self.max_workers <= 1:
+            return {path: self.hash_file(path, algorithm) for path in paths}
+
+        workers = min(self.max_workers, len(paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pacc-hash") as pool:
+            digests = pool.map(lambda path: self.hash_file(path, algorithm), paths)
+            return dict(zip(paths, digests))
+
+    def hash_tree(
+        self,
+        root: Union[str, Path],
+        algorithm: str = "sha256",
+        files: Optional[List[str]] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """Hash every file below a directory and compute the tree's Merkle root.
+
+        Each directory node hashes the sorted names, kinds and digests of its
+        children, so the root changes if any file's content, name or location
+        changes. Empty directories do not contribute.
+
+        Args:
+            root: Directory to hash
+            algorithm: Hash algorithm to use
+            files: POSIX relative paths of the files below root, if already known
+
+        Returns:
+            Tuple of (Merkle root hex digest, mapping of POSIX relative path to file digest)
+        """
+        root = Path(root)
+        if files is None:
+            files = list_tree_files(root)
+        digests = self.hash_files((root / rel_path for rel_path in files), algorithm)
+        file_digests = dict(zip(files, digests.values()))
+        return merkle_root(file_digests, algorithm), file_digests
+
+    def clear_cache(self) -> None:
+        """Forget all cached digests."""
+        with self._lock:
+            self._cache.clear()
+
+
+def list_tree_files(root: Union[str, Path]) -> List[str]:
+    """List files below a directory as sorted POSIX relative paths.
+
+    Args:
+        root: Directory to list
+
+    Returns:
+        Sorted list of relative file paths
+    """
+    root = Path(root)
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root)
+        for filename in filenames:
+            if os.path.isfile(os.path.join(dirpath, filename)):
+                files.append((rel_dir / filename).as_posix())
+    return sorted(files)
+
+
+def merkle_root(file_digests: Dict[str, str], algorithm: str = "sha256") -> str:
+    """Compute the Merkle root of a tree from its file digests.
+
+    Args:
+        file_digests: Mapping of POSIX relative path to file hex digest
+        algorithm: Hash algorithm used for directory nodes
+
+    Returns:
+        Hexadecimal digest of the root directory node
+    """
+    tree: Dict = {}
+    for rel_path, digest in file_digests.items():
+        node = tree
+        *dirs, name = rel_path.split("/")
+        for part in dirs:
+            node = node.setdefault(part, {})
+        node[name] = digest
+
+    def node_digest(node: Dict) -> str:
+        hasher = hashlib.new(algorithm)
+        for name in sorted(node):
+            child = node[name]
+            if isinstance(child, dict):
+                hasher.update(f"tree {name}\0{node_digest(child)}\n".encode())
+            else:
+                hasher.update(f"blob {name}\0{child}\n".encode())
+        return hasher.hexdigest()
+
+    return node_digest(tree)
+
+
+# Global hasher instance shared by packaging and security scanning
+_file_hasher = FileHasher()
+
+
+def get_file_hasher() -> FileHasher:
+    """Get global file hasher instance."""
+    return _file_hasher
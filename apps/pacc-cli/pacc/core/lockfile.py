@@ -0,0 +1,204 @@
+"""Project lockfile (pacc.lock) recording resolved plugin and fragment versions."""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config_cache import get_config_cache
+from .hashing import get_file_hasher
+
+logger = logging.getLogger(__name__)
+
+
+LOCKFILE_NAME = "pacc.lock"
+LOCKFILE_VERSION = 1
+
+
+def lock_key(repository: str, version: Optional[str]) -> str:
+    """Get the lock key for a repository spec, matching its string form in pacc.json.
+
+    Args:
+        repository: Repository in owner/repo format
+        version: Version specifier, if any
+
+    Returns:
+        Key such as ``owner/repo@v1.0.0``
+    """
+    return f"{repository}@{version}" if version else repository
+
+
+@dataclass
+class LockedRepository:
+    """A plugin repository spec and the commit it resolved to."""
+
+    repository: str
+    version: Optional[str]
+    commit: str
+
+    @property
+    def key(self) -> str:
+        """Lock key, matching the spec string in pacc.json."""
+        return lock_key(self.repository, self.version)
+
+
+@dataclass
+class LockedFragment:
+    """An installed fragment's version and content hash."""
+
+    name: str
+    version: Optional[str]
+    path: str
+    content_hash: Optional[str]
+
+
+@dataclass
+class ProjectLock:
+    """Parsed content of a pacc.lock file."""
+
+    repositories: Dict[str, LockedRepository] = field(default_factory=dict)
+    fragments: Dict[str, LockedFragment] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProjectLock":
+        """Create ProjectLock from parsed lockfile JSON."""
+        repositories = {
+            key: LockedRepository(
+                repository=entry["repository"],
+                version=entry.get("version"),
+                commit=entry["commit"],
+            )
+            for key, entry in data.get("repositories", {}).items()
+        }
+        fragments = {
+            name: LockedFragment(
+                name=name,
+                version=entry.get("version"),
+                path=entry["path"],
+                content_hash=entry.get("contentHash"),
+            )
+            for name, entry in data.get("fragments", {}).items()
+        }
+        return cls(repositories=repositories, fragments=fragments)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to lockfile JSON, with keys sorted for stable diffs."""
+        return {
+            "lockfileVersion": LOCKFILE_VERSION,
+            "repositories": {
+                key: {
+                    "repository": entry.repository,
+                    "version": entry.version,
+                    "commit": entry.commit,
+                }
+                for key, entry in sorted(self.repositories.items())
+            },
+            "fragments": {
+                name: {
+                    "version": entry.version,
+                    "path": entry.path,
+                    "contentHash": entry.content_hash,
+                }
+                for name, entry in sorted(self.fragments.items())
+            },
+        }
+
+
+class LockfileManager:
+    """Reads and writes a project's pacc.lock."""
+
+    def __init__(self, project_dir: Path):
+        """Initialize lockfile manager.
+
+        Args:
+            project_dir: Directory containing pacc.json
+        """
+        self.project_dir = project_dir
+        self.path = project_dir / LOCKFILE_NAME
+
+    def load(self) -> Optional[ProjectLock]:
+        """Load the lockfile.
+
+        Returns:
+            Parsed lock, or None if there is no usable lockfile
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            data = get_config_cache().load_json(self.path)
+            if data.get("lockfileVersion") != LOCKFILE_VERSION:
+                logger.warning(f"Ignoring {self.path}: unsupported lockfile version")
+                return None
+            return ProjectLock.from_dict(data)
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable lockfile {self.path}: {e}")
+            return None
+
+    def save(self, lock: ProjectLock) -> bool:
+        """Write the lockfile if its content changed.
+
+        Args:
+            lock: Lock to write
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        existing = self.load()
+        if existing is not None and existing.to_dict() == lock.to_dict():
+            return False
+
+        temp_path = self.path.with_name(f".{LOCKFILE_NAME}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(lock.to_dict(), f, indent=2)
+            f.write("\n")
+        os.replace(temp_path, self.path)
+        get_config_cache().invalidate(self.path)
+        logger.info(f"Wrote {self.path}")
+        return True
+
+    def lock_fragments(self, installed: Dict[str, Any]) -> Dict[str, LockedFragment]:
+        """Record the versions and content hashes of installed fragments.
+
+        Args:
+            installed: The ``fragments`` section of pacc.json
+
+        Returns:
+            Mapping of fragment name to locked fragment
+        """
+        fragments = {}
+        for name, info in installed.items():
+            ref_path = info.get("reference_path")
+            if not ref_path:
+                continue
+            file_path = self._fragment_path(ref_path)
+            content_hash = get_file_hasher().hash_file(file_path) if file_path.is_file() else None
+            fragments[name] = LockedFragment(
+                name=name, version=info.get("version"), path=ref_path, content_hash=content_hash
+            )
+        return fragments
+
+    def verify_fragments(self, lock: ProjectLock) -> List[str]:
+        """Check installed fragment files against the lock.
+
+        Args:
+            lock: Lock to verify against
+
+        Returns:
+            Names of fragments that are missing or whose content changed
+        """
+        drifted = []
+        for name, entry in lock.fragments.items():
+            file_path = self._fragment_path(entry.path)
+            if not file_path.is_file():
+                drifted.append(name)
+            elif get_file_hasher().hash_file(file_path) != entry.content_hash:
+                drifted.append(name)
+        return drifted
+
+    def _fragment_path(self, ref_path: str) -> Path:
+        """Resolve a fragment reference path from pacc.json."""
+        path = Path(ref_path).expanduser()
+        return path if path.is_absolute() else self.project_dir / path
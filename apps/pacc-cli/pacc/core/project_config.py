@@ -12,7 +12,10 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from .. import __version__ as pacc_version
 from ..errors.exceptions import ConfigurationError, PACCError, ProjectConfigError, ValidationError
 from ..validation.formats import JSONValidator
+from .config_cache import get_config_cache
 from .file_utils import FilePathValidator, PathNormalizer
+from .lockfile import LockedRepository, LockfileManager, ProjectLock, lock_key
+from .sync_state import SyncState, SyncStateStore, fingerprint, path_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -295,6 +298,7 @@ class ProjectSyncResult:
     success: bool
     installed_count: int = 0
     updated_count: int = 0
+    skipped_count: int = 0
     failed_extensions: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     error_message: Optional[str] = None
@@ -337,9 +341,9 @@ class ProjectConfigSchema:
         """Validate required fields in configuration."""
         required_fields = ["name", "version"]
 
-        for field in required_fields:
-            if field not in config:
-                result.add_error("MISSING_REQUIRED_FIELD", f"Missing required field: {field}")
+        for field_name in required_fields:
+            if field_name not in config:
+                result.add_error("MISSING_REQUIRED_FIELD", f"Missing required field: {field_name}")
 
     def _validate_project_metadata(self, config: Dict[str, Any], result: ConfigValidationResult):
         """Validate project metadata fields."""
@@ -402,11 +406,11 @@ class ProjectConfigSchema:
 
         # Required fields for extension spec
         required_fields = ["name", "source", "version"]
-        for field in required_fields:
-            if field not in ext_spec:
+        for field_name in required_fields:
+            if field_name not in ext_spec:
                 result.add_error(
                     "MISSING_EXTENSION_FIELD",
-                    f"Missing required field '{field}' in extension",
+                    f"Missing required field '{field_name}' in extension",
                     context,
                 )
 
@@ -530,11 +534,11 @@ class ProjectConfigSchema:
         elif isinstance(repo_spec, dict):
             # Object format with detailed configuration
             required_fields = ["repository"]
-            for field in required_fields:
-                if field not in repo_spec:
+            for field_name in required_fields:
+                if field_name not in repo_spec:
                     result.add_error(
                         "MISSING_REPOSITORY_FIELD",
-                        f"Missing required field '{field}' in repository specification",
+                        f"Missing required field '{field_name}' in repository specification",
                         context,
                     )
 
@@ -659,6 +663,7 @@ class ProjectConfigManager:
         # Write configuration file
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
+        get_config_cache().invalidate(config_path)
 
         logger.info(f"Initialized project configuration: {config_path}")
 
@@ -670,8 +675,7 @@ class ProjectConfigManager:
             return None
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config = json.load(f)
+            config = get_config_cache().load_json(config_path)
 
             logger.debug(f"Loaded project configuration: {config_path}")
             return config
@@ -710,6 +714,8 @@ class ProjectConfigManager:
 
         except OSError as e:
             raise ConfigurationError(f"Failed to save project configuration to {config_path}: {e}")
+        finally:
+            get_config_cache().invalidate(config_path)
 
     def update_project_config(self, project_dir: Path, updates: Dict[str, Any]) -> None:
         """Update project configuration with new values."""
@@ -845,9 +851,30 @@ class ProjectSyncManager:
         self.config_manager = ProjectConfigManager()
 
     def sync_project(
-        self, project_dir: Path, environment: str = "default", dry_run: bool = False
+        self,
+        project_dir: Path,
+        environment: str = "default",
+        dry_run: bool = False,
+        full: bool = False,
     ) -> ProjectSyncResult:
-        """Synchronize project extensions based on pacc.json configuration."""
+        """Synchronize project extensions based on pacc.json configuration.
+
+        Each extension is fingerprinted from its spec, its local source and
+        its installed file. Extensions whose fingerprint matches the one
+        recorded by the last sync are skipped, and a sync where nothing
+        changed returns before touching any of them. Extensions with URL or
+        git sources are never recorded, since their content can change
+        upstream without any local trace, so they are processed every time.
+
+        Args:
+            project_dir: Directory containing pacc.json
+            environment: Environment whose extensions to sync
+            dry_run: Only report what would be installed
+            full: Process every extension, ignoring the recorded sync state
+
+        Returns:
+            ProjectSyncResult with counts, failures and warnings
+        """
         result = ProjectSyncResult(success=True)
 
         try:
@@ -861,35 +888,75 @@ class ProjectSyncManager:
             # Get extensions for environment
             extensions = self.config_manager.get_extensions_for_environment(config, environment)
 
+            entries = {}
+            duplicates = []
+            for ext_type, ext_list in extensions.items():
+                for ext_spec_dict in ext_list:
+                    key = f"{ext_type}/{ext_spec_dict.get('name', 'unknown')}"
+                    if key in entries:
+                        duplicates.append(key)
+                        result.failed_extensions.append(key)
+                        result.warnings.append(
+                            f"Duplicate {ext_type} name '{ext_spec_dict.get('name', 'unknown')}' "
+                            f"in pacc.json; only the first one is synced"
+                        )
+                    else:
+                        entries[key] = (ext_type, ext_spec_dict)
+            fingerprints = {
+                key: self._extension_fingerprint(project_dir, ext_type, ext_spec_dict)
+                for key, (ext_type, ext_spec_dict) in entries.items()
+            }
+            remote = {key for key, value in fingerprints.items() if value is None}
+
+            state_store = SyncStateStore(project_dir)
+            scope = f"extensions:{environment}"
+            state = SyncState() if full else state_store.load(scope)
+            if not duplicates and state.is_unchanged(fingerprints):
+                result.skipped_count = len(entries)
+                result.metadata["unchanged"] = True
+                logger.info(f"Project extensions unchanged since last sync ({environment})")
+                return result
+
+            changed = set(state.changed_entries(fingerprints)) | remote
+            settled = {key: fingerprints[key] for key in entries if key not in changed}
+            result.skipped_count = len(settled)
+
             # Install each extension
             installer = get_extension_installer()
 
-            for ext_type, ext_list in extensions.items():
-                for ext_spec_dict in ext_list:
-                    try:
-                        ext_spec = ExtensionSpec.from_dict(ext_spec_dict)
+            for key, (ext_type, ext_spec_dict) in entries.items():
+                if key not in changed:
+                    continue
+                try:
+                    ext_spec = ExtensionSpec.from_dict(ext_spec_dict)
 
-                        if dry_run:
-                            logger.info(
-                                f"Would install {ext_type}: {ext_spec.name} from {ext_spec.source}"
-                            )
-                        else:
-                            success = installer.install_extension(ext_spec, ext_type, project_dir)
-
-                            if success:
-                                result.installed_count += 1
-                                logger.info(f"Installed {ext_type}: {ext_spec.name}")
-                            else:
-                                result.failed_extensions.append(f"{ext_type}/{ext_spec.name}")
-                                result.warnings.append(
-                                    f"Failed to install {ext_type}: {ext_spec.name}"
+                    if dry_run:
+                        logger.info(
+                            f"Would install {ext_type}: {ext_spec.name} from {ext_spec.source}"
+                        )
+                    else:
+                        success = installer.install_extension(ext_spec, ext_type, project_dir)
+
+                        if success:
+                            result.installed_count += 1
+                            if key not in remote:
+                                settled[key] = self._extension_fingerprint(
+                                    project_dir, ext_type, ext_spec_dict
                                 )
+                            logger.info(f"Installed {ext_type}: {ext_spec.name}")
+                        else:
+                            result.failed_extensions.append(f"{ext_type}/{ext_spec.name}")
+                            result.warnings.append(f"Failed to install {ext_type}: {ext_spec.name}")
 
-                    except Exception as e:
-                        result.failed_extensions.append(
-                            f"{ext_type}/{ext_spec_dict.get('name', 'unknown')}"
-                        )
-                        result.warnings.append(f"Failed to install {ext_type}: {e}")
+                except Exception as e:
+                    result.failed_extensions.append(
+                        f"{ext_type}/{ext_spec_dict.get('name', 'unknown')}"
+                    )
+                    result.warnings.append(f"Failed to install {ext_type}: {e}")
+
+            if not dry_run:
+                complete = not duplicates and len(settled) == len(entries)
+                state_store.save(scope, settled, complete=complete)
 
             # Check if any installations failed
             if result.failed_extensions:
@@ -899,7 +966,8 @@ class ProjectSyncManager:
                 )
 
             logger.info(
-                f"Project sync completed: {result.installed_count} installed, {len(result.failed_extensions)} failed"
+                f"Project sync completed: {result.installed_count} installed, "
+                f"{result.skipped_count} unchanged, {len(result.failed_extensions)} failed"
             )
 
         except Exception as e:
@@ -909,6 +977,46 @@ class ProjectSyncManager:
 
         return result
 
+    def _extension_fingerprint(
+        self, project_dir: Path, ext_type: str, ext_spec_dict: Dict[str, Any]
+    ) -> Optional[str]:
+        """Fingerprint an extension's spec, local source and installed file.
+
+        Returns None for URL and git sources, whose content is not visible locally.
+        """
+        source = ext_spec_dict.get("source", "")
+        if "://" in source or source.startswith(("git@", "git+")):
+            return None
+
+        source_path = None
+        if source:
+            source_path = Path(source).expanduser()
+            if not source_path.is_absolute():
+                source_path = project_dir / source_path
+
+        installed_path = None
+        try:
+            resolver = InstallationPathResolver()
+            install_dir = resolver.get_extension_install_directory(
+                ext_type, project_dir / ".claude"
+            )
+            installed_path = resolver.resolve_target_path(
+                ExtensionSpec.from_dict(ext_spec_dict),
+                install_dir,
+                source_path if source_path and source_path.is_file() else None,
+            )
+        except (ValueError, ValidationError):
+            pass
+
+        return fingerprint(
+            {
+                "type": ext_type,
+                "spec": ext_spec_dict,
+                "source": path_fingerprint(source_path) if source_path else None,
+                "installed": path_fingerprint(installed_path) if installed_path else None,
+            }
+        )
+
 
 @dataclass
 class ConflictResolution:
@@ -947,9 +1055,30 @@ class PluginSyncManager:
         self.config_manager = ProjectConfigManager()
 
     def sync_plugins(
-        self, project_dir: Path, environment: str = "default", dry_run: bool = False
+        self,
+        project_dir: Path,
+        environment: str = "default",
+        dry_run: bool = False,
+        refresh_lock: bool = False,
+        worktrees: bool = False,
     ) -> PluginSyncResult:
-        """Synchronize plugins based on pacc.json configuration."""
+        """Synchronize plugins based on pacc.json configuration.
+
+        Repository versions recorded in pacc.lock are used as-is, so a sync
+        where every repository is already at its locked commit runs no git
+        fetches. Specs missing from the lock are resolved and added to it.
+
+        Args:
+            project_dir: Directory containing pacc.json
+            environment: Environment whose plugin configuration to sync
+            dry_run: Only report what would change
+            refresh_lock: Ignore pacc.lock and re-resolve every version
+            worktrees: Move plain clones into the worktree layout when checking
+                out a version
+
+        Returns:
+            PluginSyncResult with counts, failures and warnings
+        """
         result = PluginSyncResult(success=True)
 
         try:
@@ -978,8 +1107,24 @@ class PluginSyncManager:
             # Get currently installed plugins
             installed_plugins = self._get_installed_plugins(plugin_manager)
 
+            lockfile = LockfileManager(project_dir)
+            existing_lock = lockfile.load()
+            lock = None if refresh_lock else existing_lock
+            new_lock = ProjectLock()
+            if existing_lock is not None:
+                # Entries of other environments stay until pacc.json stops listing them
+                synced = {lock_key(spec.repository, spec.version) for spec in repositories}
+                listed = self._configured_lock_keys(config)
+                new_lock.repositories = {
+                    key: entry
+                    for key, entry in existing_lock.repositories.items()
+                    if key in listed and key not in synced
+                }
+
             # Process each repository
             for repo_spec in repositories:
+                key = lock_key(repo_spec.repository, repo_spec.version)
+                locked = lock.repositories.get(key) if lock else None
                 try:
                     sync_result = self._sync_repository(
                         repo_spec,
@@ -988,8 +1133,21 @@ class PluginSyncManager:
                         installed_plugins,
                         plugin_manager,
                         dry_run,
+                        locked_commit=locked.commit if locked else None,
+                        worktrees=worktrees,
                     )
 
+                    commit = sync_result.get("commit")
+                    if commit is None and locked and sync_result.get("failed"):
+                        # Keep the pin of a repository that failed to sync for the retry
+                        commit = locked.commit
+                    if commit:
+                        new_lock.repositories[key] = LockedRepository(
+                            repository=repo_spec.repository,
+                            version=repo_spec.version,
+                            commit=commit,
+                        )
+
                     result.installed_count += sync_result.get("installed", 0)
                     result.updated_count += sync_result.get("updated", 0)
                     result.skipped_count += sync_result.get("skipped", 0)
@@ -998,6 +1156,9 @@ class PluginSyncManager:
                         result.failed_plugins.extend(sync_result["failed"])
 
                 except Exception as e:
+                    # Keep the locked commit so one failed sync does not unpin the spec
+                    if locked:
+                        new_lock.repositories[key] = locked
                     error_msg = f"Failed to sync repository {repo_spec.repository}: {e}"
                     result.failed_plugins.append(repo_spec.repository)
                     result.warnings.append(error_msg)
@@ -1012,6 +1173,32 @@ class PluginSyncManager:
                     [f"Required plugin not found: {plugin}" for plugin in missing_required]
                 )
 
+            # Locked fragments are only verified; re-locking them needs --refresh-lock
+            installed_fragments = config.get("fragments", {})
+            if lock is not None:
+                new_lock.fragments = {
+                    name: entry
+                    for name, entry in lock.fragments.items()
+                    if name in installed_fragments
+                }
+                for name in lockfile.verify_fragments(new_lock):
+                    result.warnings.append(
+                        f"Fragment {name} does not match pacc.lock (use --refresh-lock to update)"
+                    )
+            new_lock.fragments.update(
+                lockfile.lock_fragments(
+                    {
+                        name: info
+                        for name, info in installed_fragments.items()
+                        if name not in new_lock.fragments
+                    }
+                )
+            )
+
+            result.metadata["frozen"] = lock is not None
+            if not dry_run:
+                result.metadata["lock_written"] = lockfile.save(new_lock)
+
             # Set final result status
             if result.failed_plugins or missing_required:
                 result.success = False
@@ -1061,6 +1248,16 @@ class PluginSyncManager:
 
         return merged
 
+    def _configured_lock_keys(self, config: Dict[str, Any]) -> Set[str]:
+        """Get the lock keys of the repository specs listed in any environment."""
+        repositories = list(config.get("plugins", {}).get("repositories", []))
+        for env_config in config.get("environments", {}).values():
+            repositories.extend(env_config.get("plugins", {}).get("repositories", []))
+        return {
+            lock_key(spec.repository, spec.version)
+            for spec in self._parse_repository_specs(repositories)
+        }
+
     def _parse_repository_specs(
         self, repositories: List[Union[str, Dict[str, Any]]]
     ) -> List[PluginSpec]:
@@ -1095,8 +1292,25 @@ class PluginSyncManager:
         installed_plugins: Dict[str, Any],
         plugin_manager: Any,
         dry_run: bool,
+        locked_commit: Optional[str] = None,
+        worktrees: bool = False,
     ) -> Dict[str, Any]:
-        """Sync a single repository with differential updates."""
+        """Sync a single repository with differential updates.
+
+        Args:
+            repo_spec: Repository specification from pacc.json
+            required_plugins: Names of required plugins
+            optional_plugins: Names of optional plugins
+            installed_plugins: Currently installed repositories
+            plugin_manager: Plugin configuration manager
+            dry_run: Only report what would change
+            locked_commit: Commit recorded for this spec in pacc.lock, if any
+            worktrees: Move a plain clone into the worktree layout on checkout
+
+        Returns:
+            Dictionary of installed/updated/skipped counts, failed repositories
+            and the commit the repository is at afterwards, if known
+        """
         result = {"installed": 0, "updated": 0, "skipped": 0, "failed": []}
 
         repo_key = repo_spec.get_repo_key()
@@ -1108,9 +1322,17 @@ class PluginSyncManager:
             repo_path = Path.home() / ".claude" / "plugins" / "repos" / owner / repo
 
             if repo_path.exists():
-                # Resolve target version to commit SHA for accurate comparison
-                target_commit = self._resolve_version_to_commit(repo_spec, repo_path)
                 current_commit = self._get_current_commit(repo_path)
+                if locked_commit:
+                    # Frozen sync: only fetch if the locked commit is not in the clone yet
+                    target_commit = locked_commit
+                    if current_commit != locked_commit and not self._has_commit(
+                        repo_path, locked_commit
+                    ):
+                        self._resolve_version_to_commit(repo_spec, repo_path)
+                else:
+                    # Resolve target version to commit SHA for accurate comparison
+                    target_commit = self._resolve_version_to_commit(repo_spec, repo_path)
 
                 if target_commit and current_commit and target_commit != current_commit:
                     if dry_run:
@@ -1118,10 +1340,14 @@ class PluginSyncManager:
                             f"Would update repository {repo_key} to {repo_spec.get_version_specifier()} ({target_commit[:8]})"
                         )
                     # Perform version-locked update
-                    elif self._checkout_version(repo_spec, repo_path):
-                        # Update metadata with resolved commit
-                        success = plugin_manager.update_repository(repo_key, target_commit)
+                    elif self._checkout_version(
+                        repo_spec, repo_path, target_commit, worktrees=worktrees
+                    ):
+                        # Record the commit actually checked out, not just the one requested
+                        new_commit = self._get_current_commit(repo_path) or target_commit
+                        success = plugin_manager.update_repository(repo_key, new_commit)
                         if success:
+                            result["commit"] = new_commit
                             result["updated"] += 1
                             logger.info(
                                 f"Updated repository {repo_key} to {repo_spec.get_version_specifier()}"
@@ -1134,6 +1360,7 @@ class PluginSyncManager:
                             f"Failed to checkout version {repo_spec.get_version_specifier()} for {repo_key}"
                         )
                 else:
+                    result["commit"] = current_commit
                     result["skipped"] += 1
                     logger.debug(f"Repository {repo_key} already at target version")
             else:
@@ -1148,6 +1375,9 @@ class PluginSyncManager:
                 else:
                     success = plugin_manager.install_repository(repo_spec)
                     if success:
+                        result["commit"] = self._checkout_installed(
+                            repo_spec, repo_path, locked_commit, worktrees
+                        )
                         result["installed"] += 1
                         logger.info(f"Reinstalled repository {repo_key}")
                     else:
@@ -1158,13 +1388,11 @@ class PluginSyncManager:
         else:
             success = plugin_manager.install_repository(repo_spec)
             if success:
-                # After installation, checkout the specific version if needed
-                if repo_spec.version and repo_spec.is_version_locked():
-                    owner, repo = repo_key.split("/", 1)
-                    repo_path = Path.home() / ".claude" / "plugins" / "repos" / owner / repo
-                    if repo_path.exists():
-                        self._checkout_version(repo_spec, repo_path)
-
+                owner, repo = repo_key.split("/", 1)
+                repo_path = Path.home() / ".claude" / "plugins" / "repos" / owner / repo
+                result["commit"] = self._checkout_installed(
+                    repo_spec, repo_path, locked_commit, worktrees
+                )
                 result["installed"] += 1
                 logger.info(f"Installed repository {repo_key}")
             else:
@@ -1181,6 +1409,31 @@ class PluginSyncManager:
 
         return result
 
+    def _checkout_installed(
+        self,
+        repo_spec: PluginSpec,
+        repo_path: Path,
+        locked_commit: Optional[str],
+        worktrees: bool,
+    ) -> Optional[str]:
+        """Check out the locked or pinned version of a freshly installed repository.
+
+        Args:
+            repo_spec: Repository specification from pacc.json
+            repo_path: Path of the new clone
+            locked_commit: Commit recorded for this spec in pacc.lock, if any
+            worktrees: Move the clone into the worktree layout on checkout
+
+        Returns:
+            Commit the clone is at afterwards, or None if it cannot be read
+        """
+        if not repo_path.exists():
+            return None
+        # A fresh clone is at upstream HEAD, which only matches an unlocked, unpinned spec
+        if locked_commit or (repo_spec.version and repo_spec.is_version_locked()):
+            self._checkout_version(repo_spec, repo_path, locked_commit, worktrees=worktrees)
+        return self._get_current_commit(repo_path)
+
     def _needs_update(self, current_version: str, target_version: str) -> bool:
         """Check if repository needs to be updated."""
         if target_version in ["latest", "main", "master"]:
@@ -1285,20 +1538,50 @@ class PluginSyncManager:
             )
             return None
 
-    def _checkout_version(self, repo_spec: PluginSpec, repo_path: Path) -> bool:
-        """Checkout specific version in repository."""
+    def _checkout_version(
+        self,
+        repo_spec: PluginSpec,
+        repo_path: Path,
+        commit: Optional[str] = None,
+        worktrees: bool = False,
+    ) -> bool:
+        """Checkout specific version in repository.
+
+        Repositories already in the worktree layout activate the resolved
+        commit as a worktree, so switching back to a recently used version
+        only flips the repository symlink. Plain clones are moved into that
+        layout only when ``worktrees`` is set, and are otherwise checked out
+        in place, as are repositories that cannot use the layout.
+
+        Args:
+            repo_spec: Repository specification with the version to check out
+            repo_path: Path to the installed repository
+            commit: Commit SHA the version resolves to, if already known
+            worktrees: Move a plain clone into the worktree layout
+
+        Returns:
+            True if the repository is at the requested version
+        """
         try:
             import subprocess
 
             version_info = repo_spec.parse_version_components()
             ref = version_info["ref"]
 
+            commit = commit or self._resolve_version_to_commit(repo_spec, repo_path)
+            manager = self._get_worktree_manager()
+            if commit and manager.activate(repo_path, commit, adopt=worktrees):
+                # Tag and commit pins never move, so plugin update leaves them alone
+                following = version_info["type"] in ["branch", "default"]
+                manager.track(repo_path, ref if following else None)
+                return True
+
             logger.info(f"Checking out {version_info['type']} '{ref}' in {repo_spec.repository}")
 
             # For commits and tags, checkout directly
             if version_info["type"] in ["commit", "tag"]:
                 result = subprocess.run(
-                    ["git", "checkout", "--quiet", ref],
+                    ["git", "checkout", "--quiet", commit or ref],
                     cwd=repo_path,
                     capture_output=True,
                     text=True,
@@ -1314,10 +1597,10 @@ class PluginSyncManager:
 
             # For branches, checkout and potentially track remote
             elif version_info["type"] == "branch":
-                # Try to checkout remote branch first
+                # Try to checkout remote branch first, at the resolved commit if known
                 remote_ref = f"origin/{ref}"
                 result = subprocess.run(
-                    ["git", "checkout", "--quiet", "-B", ref, remote_ref],
+                    ["git", "checkout", "--quiet", "-B", ref, commit or remote_ref],
                     cwd=repo_path,
                     capture_output=True,
                     text=True,
@@ -1350,6 +1633,24 @@ class PluginSyncManager:
             logger.error(f"Failed to checkout version for {repo_spec.repository}: {e}")
             return False
 
+    def _has_commit(self, repo_path: Path, commit: str) -> bool:
+        """Check if a commit exists in the local clone."""
+        try:
+            import subprocess
+
+            result = subprocess.run(
+                ["git", "cat-file", "-e", f"{commit}^{{commit}}"],
+                cwd=repo_path,
+                capture_output=True,
+                timeout=30,
+                check=False,
+            )
+            return result.returncode == 0
+
+        except Exception as e:
+            logger.debug(f"Failed to look up {commit} in {repo_path}: {e}")
+            return False
+
     def _get_current_commit(self, repo_path: Path) -> Optional[str]:
         """Get current commit SHA of repository."""
         try:
@@ -1409,6 +1710,13 @@ class PluginSyncManager:
 
         return PluginConfigManager()
 
+    def _get_worktree_manager(self):
+        """Get worktree manager for the user's plugin directory."""
+        # Import here to avoid circular imports
+        from ..plugins.worktrees import WorktreeManager
+
+        return WorktreeManager()
+
     def sync_plugins_with_conflict_resolution(
         self,
         project_dir: Path,
@@ -0,0 +1,155 @@
+"""Recorded sync-state fingerprints used to skip unchanged sync work."""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .config_cache import get_config_cache
+from .file_utils import TreeSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+SYNC_STATE_VERSION = 1
+
+
+def fingerprint(value: Any) -> str:
+    """Hash a JSON-serializable value.
+
+    Args:
+        value: Value to hash; dict keys are sorted, so key order does not matter
+
+    Returns:
+        Hexadecimal SHA-256 digest
+    """
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def path_fingerprint(path: Union[str, Path]) -> Optional[List[Any]]:
+    """Describe a file or directory by the stat data of its files.
+
+    Only stats are read, so the fingerprint of an unchanged tree is cheap to
+    recompute. Files rewritten with the same size and mtime are not noticed.
+
+    Args:
+        path: File or directory
+
+    Returns:
+        [size, mtime_ns] for a file, a sorted list of [path, size, mtime]
+        for each file below a directory, or None if path does not exist
+    """
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return None
+    if stat.S_ISDIR(path_stat.st_mode):
+        return [[entry.path, entry.size, entry.mtime] for entry in TreeSnapshot.scan(path).files]
+    return [path_stat.st_size, path_stat.st_mtime_ns]
+
+
+@dataclass
+class SyncState:
+    """Fingerprints recorded by the last sync of one scope.
+
+    ``entries`` maps each entry (extension or fragment) to the fingerprint
+    it had when it was last found in sync. ``fingerprint`` covers all
+    entries and is only recorded when the whole scope was in sync.
+    """
+
+    fingerprint: Optional[str] = None
+    entries: Dict[str, str] = field(default_factory=dict)
+
+    def is_unchanged(self, current: Dict[str, str]) -> bool:
+        """Check if a scope's current entry fingerprints match this state.
+
+        Args:
+            current: Current fingerprint of every entry in the scope
+
+        Returns:
+            True if the scope was fully in sync and nothing changed since
+        """
+        return self.fingerprint is not None and self.fingerprint == fingerprint(current)
+
+    def changed_entries(self, current: Dict[str, str]) -> List[str]:
+        """Get entries whose fingerprint differs from the recorded one.
+
+        Args:
+            current: Current fingerprint of every entry in the scope
+
+        Returns:
+            Keys of entries that need processing, in input order
+        """
+        return [key for key, value in current.items() if self.entries.get(key) != value]
+
+
+class SyncStateStore:
+    """Reads and writes a project's .pacc/sync-state.json."""
+
+    def __init__(self, project_dir: Path):
+        """Initialize sync state store.
+
+        Args:
+            project_dir: Directory containing pacc.json
+        """
+        self.path = project_dir / ".pacc" / "sync-state.json"
+
+    def load(self, scope: str) -> SyncState:
+        """Load the recorded state of a scope.
+
+        Args:
+            scope: Name of the synced scope, e.g. ``extensions:default``
+
+        Returns:
+            Recorded state, or an empty state if none was recorded
+        """
+        data = self._load_all()
+        entry = data.get("scopes", {}).get(scope)
+        if not isinstance(entry, dict):
+            return SyncState()
+        return SyncState(fingerprint=entry.get("fingerprint"), entries=entry.get("entries", {}))
+
+    def save(self, scope: str, settled: Dict[str, str], complete: bool) -> None:
+        """Record the entries of a scope that are in sync.
+
+        Args:
+            scope: Name of the synced scope
+            settled: Fingerprints of the entries that are now in sync
+            complete: Whether every entry of the scope is in sync, so the
+                scope fingerprint can be recorded
+        """
+        data = self._load_all()
+        data["version"] = SYNC_STATE_VERSION
+        data.setdefault("scopes", {})[scope] = {
+            "fingerprint": fingerprint(settled) if complete else None,
+            "entries": settled,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not record sync state in {self.path}: {e}")
+        finally:
+            get_config_cache().invalidate(self.path)
+
+    def _load_all(self) -> Dict[str, Any]:
+        """Load the whole state file, ignoring missing or unreadable files."""
+        if not self.path.exists():
+            return {}
+        try:
+            data = get_config_cache().load_json(self.path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable sync state {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SYNC_STATE_VERSION:
+            return {}
+        return data
@@ -7,10 +7,11 @@ selective installation, versioning, dependencies, and atomic operations.
 import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import yaml
 
@@ -114,6 +115,18 @@ class CollectionInstallResult:
     changes_made: List[str] = field(default_factory=list)
 
 
+@dataclass
+class CollectionInstallPlan:
+    """Plan for installing the dependencies of a collection."""
+
+    # Collections to install, dependencies before their dependents
+    install_order: List[str] = field(default_factory=list)
+    # Dependencies that are already installed
+    satisfied: List[str] = field(default_factory=list)
+    # Collections to install whose own dependencies could not be inspected
+    unresolved: List[str] = field(default_factory=list)
+
+
 @dataclass
 class CollectionUpdateInfo:
     """Information about collection updates."""
@@ -278,49 +291,88 @@ class CollectionDependencyResolver:
         """Initialize dependency resolver."""
         self.storage_manager = storage_manager
 
-    def resolve_dependencies(self, metadata: CollectionMetadata) -> List[str]:
+    def resolve_dependencies(
+        self,
+        metadata: CollectionMetadata,
+        find_collection: Optional[Callable[[str], Optional[CollectionMetadata]]] = None,
+    ) -> List[str]:
         """Resolve collection dependencies.
 
         Args:
             metadata: Collection metadata with dependencies
+            find_collection: Lookup for metadata of collections that are not installed
+
+        Returns:
+            List of collection names that need to be installed first, in install order
+
+        Raises:
+            PACCError: If circular dependencies detected
+        """
+        return self.plan_installation(metadata, find_collection).install_order
+
+    def plan_installation(
+        self,
+        metadata: CollectionMetadata,
+        find_collection: Optional[Callable[[str], Optional[CollectionMetadata]]] = None,
+    ) -> CollectionInstallPlan:
+        """Resolve the transitive dependencies of a collection into an install plan.
+
+        The installed-collection inventory is read once per plan. Dependencies
+        that are not installed are followed through ``find_collection``.
+
+        Args:
+            metadata: Collection metadata with dependencies
+            find_collection: Lookup for metadata of collections that are not installed
 
         Returns:
-            List of collection names that need to be installed first
+            CollectionInstallPlan with collections in topological order
 
         Raises:
             PACCError: If circular dependencies detected
         """
+        plan = CollectionInstallPlan()
         if not metadata.dependencies:
-            return []
+            return plan
 
-        resolved = []
-        visited = set()
-        visiting = set()
+        installed: Optional[Set[str]] = None
+        visited: Set[str] = set()
+        chain = [metadata.name]
 
-        def _resolve_recursive(collection_name: str) -> None:
-            if collection_name in visiting:
-                raise PACCError(f"Circular dependency detected involving: {collection_name}")
+        def _visit(collection_name: str) -> None:
+            nonlocal installed
+
+            if collection_name in chain:
+                cycle = [*chain[chain.index(collection_name) :], collection_name]
+                raise PACCError(f"Circular dependency detected: {' -> '.join(cycle)}")
 
             if collection_name in visited:
                 return
+            visited.add(collection_name)
+
+            if installed is None:
+                # list_collections walks project and user storage, so snapshot it once
+                installed = set(self.storage_manager.list_collections())
 
-            visiting.add(collection_name)
+            if collection_name in installed:
+                plan.satisfied.append(collection_name)
+                return
 
-            # Check if collection is already installed
-            collections = self.storage_manager.list_collections()
-            if collection_name not in collections:
-                # Collection needs to be installed
-                if collection_name not in resolved:
-                    resolved.append(collection_name)
+            dependency = find_collection(collection_name) if find_collection else None
+            if dependency is None:
+                plan.unresolved.append(collection_name)
+            else:
+                chain.append(collection_name)
+                for dep in dependency.dependencies:
+                    _visit(dep)
+                chain.pop()
 
-            visiting.remove(collection_name)
-            visited.add(collection_name)
+            # Post-order: every dependency is planned before its dependent
+            plan.install_order.append(collection_name)
 
-        # Resolve each dependency
         for dep in metadata.dependencies:
-            _resolve_recursive(dep)
+            _visit(dep)
 
-        return resolved
+        return plan
 
     def check_dependency_conflicts(self, collections: List[CollectionMetadata]) -> List[str]:
         """Check for dependency conflicts between collections.
@@ -425,7 +477,9 @@ class FragmentCollectionManager:
 
             # Resolve dependencies if requested
             if options.resolve_dependencies:
-                missing_deps = self.dependency_resolver.resolve_dependencies(metadata)
+                missing_deps = self.dependency_resolver.resolve_dependencies(
+                    metadata, self._sibling_collection_finder(collection_path)
+                )
                 if missing_deps:
                     result.dependencies_resolved = missing_deps
                     result.warnings.append(f"Missing dependencies: {', '.join(missing_deps)}")
@@ -469,6 +523,24 @@ class FragmentCollectionManager:
             result.error_message = str(e)
             return result
 
+    def _sibling_collection_finder(
+        self, collection_path: Path
+    ) -> Callable[[str], Optional[CollectionMetadata]]:
+        """Look up dependency collections next to the collection being installed."""
+
+        def _find(collection_name: str) -> Optional[CollectionMetadata]:
+            # SECURITY: Dependency names come from the collection's own metadata,
+            # so reject anything that would resolve outside the parent directory
+            if "/" in collection_name or "\\" in collection_name or ".." in collection_name:
+                logger.warning(f"Rejected collection dependency name: {collection_name}")
+                return None
+            candidate = collection_path.parent / collection_name
+            if not candidate.is_dir():
+                return None
+            return self.metadata_parser.parse_collection_metadata(candidate)
+
+        return _find
+
     def _select_files_for_installation(
         self, collection_path: Path, metadata: CollectionMetadata, options: CollectionInstallOptions
     ) -> List[str]:
@@ -554,44 +626,59 @@ class FragmentCollectionManager:
 
             # Install files in order (if specified)
             install_order = metadata.install_order if metadata.install_order else files_to_install
+            ordered_files = [f for f in install_order if f in files_to_install]
 
-            for file_name in install_order:
-                if file_name not in files_to_install:
-                    continue
+            existing = set(
+                self.storage_manager.existing_fragments(
+                    ordered_files, options.storage_type, collection_path.name
+                )
+            )
 
-                file_path = collection_path / f"{file_name}.md"
-                if not file_path.exists():
+            files_to_store = []
+            for file_name in ordered_files:
+                if not (collection_path / f"{file_name}.md").exists():
                     result.failed_files.append(file_name)
                     result.warnings.append(f"File not found: {file_name}")
-                    continue
-
-                try:
-                    # Install individual fragment
-                    content = file_path.read_text(encoding="utf-8")
-                    self.storage_manager.store_fragment(
-                        fragment_name=file_name,
-                        content=content,
-                        storage_type=options.storage_type,
-                        collection=collection_path.name,
-                        overwrite=options.force_overwrite,
-                    )
+                elif file_name in existing and not options.force_overwrite:
+                    result.skipped_files.append(file_name)
+                    result.changes_made.append(f"Skipped existing: {file_name}")
+                else:
+                    files_to_store.append(file_name)
+
+            # Read concurrently, then store everything in one staged operation
+            workers = max(1, min(FragmentInstallationManager.MAX_WORKERS, len(files_to_store)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                contents = pool.map(
+                    lambda name: (collection_path / f"{name}.md").read_text(encoding="utf-8"),
+                    files_to_store,
+                )
+                fragments = dict(zip(files_to_store, contents))
 
-                    result.installed_files.append(file_name)
-                    result.changes_made.append(f"Installed: {file_name}")
+            self.storage_manager.store_fragments(
+                fragments,
+                storage_type=options.storage_type,
+                collection=collection_path.name,
+                overwrite=options.force_overwrite,
+                max_workers=FragmentInstallationManager.MAX_WORKERS,
+            )
 
-                    # Track version if source URL available
-                    if metadata.source_url:
-                        self.version_tracker.track_installation(
-                            file_name, metadata.source_url, "collection", file_path
+            for file_name in files_to_store:
+                result.installed_files.append(file_name)
+                result.changes_made.append(f"Installed: {file_name}")
+
+            # Track versions if source URL available
+            if metadata.source_url:
+                self.version_tracker.track_installations(
+                    [
+                        (
+                            file_name,
+                            metadata.source_url,
+                            "collection",
+                            collection_path / f"{file_name}.md",
                         )
-
-                except PACCError as e:
-                    if "already exists" in str(e) and not options.force_overwrite:
-                        result.skipped_files.append(file_name)
-                        result.changes_made.append(f"Skipped existing: {file_name}")
-                    else:
-                        result.failed_files.append(file_name)
-                        result.warnings.append(f"Failed to install {file_name}: {e}")
+                        for file_name in files_to_store
+                    ]
+                )
 
             # Update collection tracking
             self._track_collection_installation(metadata, options.storage_type)
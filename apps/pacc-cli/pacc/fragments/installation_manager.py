@@ -8,10 +8,11 @@ import json
 import logging
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..core.config_manager import ClaudeConfigManager
 from ..core.file_utils import FilePathValidator
@@ -57,6 +58,9 @@ class InstallationResult:
 class FragmentInstallationManager:
     """Manages installation of Claude Code memory fragments."""
 
+    # Maximum number of fragments validated or prepared concurrently
+    MAX_WORKERS = 8
+
     def __init__(self, project_root: Optional[Union[str, Path]] = None):
         """Initialize fragment installation manager.
 
@@ -368,6 +372,8 @@ class FragmentInstallationManager:
     def _validate_fragments(self, fragments: List[Path], _force: bool) -> Dict[str, List[str]]:
         """Validate fragments before installation.
 
+        Fragments are validated concurrently; messages keep the input order.
+
         Args:
             fragments: Fragment files to validate
             force: Whether to force installation despite errors
@@ -375,10 +381,10 @@ class FragmentInstallationManager:
         Returns:
             Dictionary with 'errors' and 'warnings' lists
         """
-        errors = []
-        warnings = []
 
-        for fragment in fragments:
+        def validate(fragment: Path):
+            errors = []
+            warnings = []
             try:
                 result = self.validator.validate_single(fragment)
 
@@ -391,8 +397,25 @@ class FragmentInstallationManager:
             except Exception as e:
                 errors.append(f"{fragment.name}: Validation failed - {e}")
 
+            return errors, warnings
+
+        errors = []
+        warnings = []
+        for fragment_errors, fragment_warnings in self._map_concurrently(validate, fragments):
+            errors.extend(fragment_errors)
+            warnings.extend(fragment_warnings)
+
         return {"errors": errors, "warnings": warnings}
 
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to items on a thread pool, returning results in input order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        workers = min(self.MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pacc-fragment") as pool:
+            return list(pool.map(func, items))
+
     def _perform_dry_run_installation(
         self, result: InstallationResult, fragments: List[Path], target_type: str
     ) -> InstallationResult:
@@ -448,6 +471,10 @@ class FragmentInstallationManager:
     ) -> InstallationResult:
         """Perform actual fragment installation.
 
+        Fragments are prepared concurrently, stored together through a staging
+        directory, and then registered with a single CLAUDE.md and pacc.json
+        update. Any failure rolls back every change.
+
         Args:
             result: Installation result to update
             fragments: Fragments to install
@@ -458,15 +485,48 @@ class FragmentInstallationManager:
             Updated installation result
         """
         installed_fragments = []
+        staged_store = None
+        backup_state = None
 
         try:
             # Create backup of current state for rollback
             backup_state = self._create_installation_backup(target_type)
 
-            # Install fragments atomically
-            for fragment in fragments:
-                fragment_info = self._install_single_fragment(
-                    fragment, target_type, force, source_url
+            if not force:
+                existing = self.storage_manager.existing_fragments(
+                    [fragment.stem for fragment in fragments], target_type
+                )
+                if existing:
+                    names = ", ".join(f"'{name}'" for name in existing)
+                    raise PACCError(
+                        f"Fragment {names} already exists. Use --force to overwrite."
+                        if len(existing) == 1
+                        else f"Fragments {names} already exist. Use --force to overwrite."
+                    )
+
+            prepared = self._map_concurrently(
+                lambda fragment: self._prepare_fragment(fragment, force), fragments
+            )
+
+            # Overwritten fragments are kept until the whole install succeeds
+            staged_store = self.storage_manager.begin_store_fragments(
+                {fragment.stem: content for fragment, (content, _) in zip(fragments, prepared)},
+                storage_type=target_type,
+                overwrite=force,
+                max_workers=self.MAX_WORKERS,
+            )
+            stored_paths = staged_store.paths
+
+            versions = self._track_fragment_versions(fragments, source_url)
+
+            for fragment, (_, metadata) in zip(fragments, prepared):
+                fragment_info = self._build_fragment_info(
+                    fragment.stem,
+                    metadata,
+                    stored_paths[fragment.stem],
+                    target_type=target_type,
+                    source_url=source_url,
+                    version_info=versions.get(fragment.stem),
                 )
                 installed_fragments.append(fragment_info)
                 result.installed_fragments[fragment_info["name"]] = fragment_info
@@ -480,6 +540,7 @@ class FragmentInstallationManager:
             self._update_pacc_json_with_fragments(installed_fragments, target_type)
             result.changes_made.append("Updated pacc.json with fragment tracking")
 
+            staged_store.commit()
             result.success = True
             result.installed_count = len(installed_fragments)
 
@@ -489,38 +550,36 @@ class FragmentInstallationManager:
             logger.error(f"Installation failed, performing rollback: {e}")
 
             # Rollback on failure
-            try:
-                self._rollback_installation(backup_state, installed_fragments)
-                result.changes_made.append("Rolled back changes due to installation failure")
-            except Exception as rollback_error:
-                logger.error(f"Rollback failed: {rollback_error}")
-                result.changes_made.append(f"Rollback failed: {rollback_error}")
+            if backup_state is not None:
+                try:
+                    if staged_store is not None:
+                        staged_store.rollback()
+                    self._rollback_installation(backup_state, [])
+                    result.changes_made.append("Rolled back changes due to installation failure")
+                except Exception as rollback_error:
+                    logger.error(f"Rollback failed: {rollback_error}")
+                    result.changes_made.append(f"Rollback failed: {rollback_error}")
 
             result.error_message = f"Installation failed: {e}"
             result.success = False
 
         return result
 
-    def _install_single_fragment(
-        self, fragment: Path, target_type: str, force: bool, source_url: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Install a single fragment to storage.
+    def _prepare_fragment(self, fragment: Path, force: bool) -> Tuple[str, Dict[str, Any]]:
+        """Read a fragment and extract its metadata ahead of storage.
 
         Args:
             fragment: Fragment file to install
-            target_type: Installation target type
-            force: Force overwrite existing fragments
+            force: Whether to proceed without metadata if validation fails
 
         Returns:
-            Fragment information dictionary
+            Tuple of (content, metadata)
 
         Raises:
-            PACCError: If installation fails
+            PACCError: If validation fails and force is not set
         """
-        fragment_name = fragment.stem
         content = fragment.read_text(encoding="utf-8")
 
-        # Get fragment metadata
         try:
             validation_result = self.validator.validate_single(fragment)
             metadata = validation_result.metadata or {}
@@ -529,21 +588,48 @@ class FragmentInstallationManager:
                 raise PACCError(f"Fragment validation failed: {e}") from e
             metadata = {}
 
-        # Store fragment in appropriate location
+        return content, metadata
+
+    def _track_fragment_versions(
+        self, fragments: List[Path], source_url: Optional[str]
+    ) -> Dict[str, str]:
+        """Record version information for installed fragments in one batch.
+
+        Args:
+            fragments: Source fragment files that were installed
+            source_url: Source the fragments were installed from
+
+        Returns:
+            Dictionary of fragment names to version IDs
+        """
+        if not source_url:
+            return {}
+
+        source_type = (
+            "git" if (source_url.endswith(".git") or "github.com" in source_url) else "url"
+        )
         try:
-            stored_path = self.storage_manager.store_fragment(
-                fragment_name=fragment_name,
-                content=content,
-                storage_type=target_type,
-                overwrite=force,
+            tracker = FragmentVersionTracker(self.project_root)
+            versions = tracker.track_installations(
+                [(fragment.stem, source_url, source_type, fragment) for fragment in fragments]
             )
-        except PACCError as e:
-            if "already exists" in str(e) and not force:
-                raise PACCError(
-                    f"Fragment '{fragment_name}' already exists. Use --force to overwrite."
-                ) from e
-            raise
+        except Exception as e:
+            logger.warning(f"Could not track version: {e}")
+            return {}
+
+        return {name: version.version_id for name, version in versions.items()}
 
+    def _build_fragment_info(
+        self,
+        fragment_name: str,
+        metadata: Dict[str, Any],
+        stored_path: Path,
+        *,
+        target_type: str,
+        source_url: Optional[str],
+        version_info: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the fragment information dictionary for an installed fragment."""
         # Generate reference path relative to project/user root
         if target_type == "user":
             ref_path = f"~/.claude/pacc/fragments/{fragment_name}.md"
@@ -551,21 +637,6 @@ class FragmentInstallationManager:
             project_relative = stored_path.relative_to(self.project_root)
             ref_path = str(project_relative).replace("\\", "/")
 
-        # Get version info if Git source
-        version_info = None
-        if source_url:
-            try:
-                tracker = FragmentVersionTracker(self.project_root)
-                source_type = (
-                    "git" if (source_url.endswith(".git") or "github.com" in source_url) else "url"
-                )
-                version = tracker.track_installation(
-                    fragment_name, source_url, source_type, fragment
-                )
-                version_info = version.version_id
-            except Exception as e:
-                logger.warning(f"Could not track version: {e}")
-
         return {
             "name": fragment_name,
             "title": metadata.get("title", ""),
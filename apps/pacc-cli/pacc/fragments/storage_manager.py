@@ -5,12 +5,18 @@ with support for collection directories and automatic gitignore management.
 """
 
 import fnmatch
+import json
 import logging
+import os
 import shutil
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, ClassVar, Dict, List, Optional, Set, Tuple, Union
 
 from ..core.file_utils import DirectoryScanner, FilePathValidator, PathNormalizer
 from ..errors.exceptions import PACCError
@@ -31,7 +37,10 @@ class FragmentLocation:
     size: Optional[int] = None
 
     def __post_init__(self):
-        """Populate metadata from file system."""
+        """Populate metadata from file system unless it was already provided."""
+        if self.last_modified is not None or self.size is not None:
+            return
+
         if self.path.exists():
             stat = self.path.stat()
             self.last_modified = datetime.fromtimestamp(stat.st_mtime)
@@ -126,6 +135,271 @@ class GitIgnoreManager:
             return False
 
 
+@dataclass
+class _IndexedDirectory:
+    """Cached listing of one fragment storage directory."""
+
+    mtime_ns: int
+    files: Set[str] = field(default_factory=set)
+    subdirs: List[str] = field(default_factory=list)
+    trusted: bool = True
+
+
+class FragmentStorageIndex:
+    """In-memory index of the fragment files under one storage directory.
+
+    Each directory listing is cached together with the directory's mtime and
+    only rescanned when that mtime changes, so name lookups cost one stat per
+    directory instead of a full listing. Only names are cached: editing a file
+    in place does not change its directory's mtime, so sizes and modification
+    times are read from the files themselves when they are reported. Listings
+    can be persisted next to the storage directory for fast cold starts.
+    """
+
+    INDEX_FILENAME = "fragment_index.json"
+    INDEX_VERSION = 2
+
+    # Directories modified this recently are rescanned on next use, since a
+    # change within the same mtime tick would otherwise go unnoticed
+    RACY_WINDOW_SECONDS = 2.0
+
+    _instances: ClassVar[Dict[Tuple[Path, bool], "FragmentStorageIndex"]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, base_path: Path, extensions: Set[str], persist: bool = True):
+        """Initialize storage index.
+
+        Args:
+            base_path: Fragment storage directory to index
+            extensions: File extensions counted as fragments
+            persist: Whether to load and save the index file beside base_path
+        """
+        self.base_path = base_path
+        self.extensions = extensions
+        self.index_file = base_path.parent / self.INDEX_FILENAME if persist else None
+        self._directories: Dict[str, _IndexedDirectory] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_path(
+        cls, base_path: Path, extensions: Set[str], persist: bool = True
+    ) -> "FragmentStorageIndex":
+        """Return the process-wide index for a storage directory."""
+        key = (base_path, persist)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls(base_path, extensions, persist)
+                cls._instances[key] = index
+            return index
+
+    def directory(self, collection: Optional[str] = None) -> Optional[_IndexedDirectory]:
+        """Get the listing of the storage root or a collection directory.
+
+        Args:
+            collection: Collection name, or None for the storage root
+
+        Returns:
+            Up-to-date directory listing, or None if the directory does not exist
+        """
+        key = collection or ""
+        path = self.base_path / collection if collection else self.base_path
+
+        with self._lock:
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                if self._directories.pop(key, None) is not None:
+                    self._dirty = True
+                return None
+
+            cached = self._directories.get(key)
+            if cached is not None and cached.trusted and cached.mtime_ns == mtime_ns:
+                return cached
+
+            listing = self._scan(path, mtime_ns, include_subdirs=not collection)
+            if listing is not None:
+                self._directories[key] = listing
+                self._dirty = True
+            return listing
+
+    def collections(self) -> List[str]:
+        """Get the names of all collection directories.
+
+        Returns:
+            Sorted collection directory names
+        """
+        root = self.directory()
+        return list(root.subdirs) if root else []
+
+    def snapshot(self) -> Dict[Optional[str], _IndexedDirectory]:
+        """Get up-to-date listings of the storage root and every collection.
+
+        Returns:
+            Dictionary mapping collection name (None for the root) to its listing
+        """
+        with self._lock:
+            root = self.directory()
+            if root is None:
+                return {}
+
+            listings: Dict[Optional[str], _IndexedDirectory] = {None: root}
+            for collection in root.subdirs:
+                listing = self.directory(collection)
+                if listing is not None:
+                    listings[collection] = listing
+
+            # Forget collections that no longer exist
+            for key in list(self._directories):
+                if key and key not in root.subdirs:
+                    del self._directories[key]
+                    self._dirty = True
+
+            self.save()
+            return listings
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """Drop a cached listing after changing files in place.
+
+        Args:
+            collection: Collection name, or None for the storage root
+        """
+        with self._lock:
+            if self._directories.pop(collection or "", None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist trusted listings if anything changed since the last save."""
+        with self._lock:
+            if self.index_file is None or not self._dirty:
+                return
+
+            data = {
+                "version": self.INDEX_VERSION,
+                "directories": {
+                    key: {
+                        "mtime_ns": listing.mtime_ns,
+                        "files": sorted(listing.files),
+                        "subdirs": listing.subdirs,
+                    }
+                    for key, listing in self._directories.items()
+                    if listing.trusted
+                },
+            }
+            try:
+                tmp_file = self.index_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp_file, self.index_file)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not save fragment index {self.index_file}: {e}")
+
+    def _load(self) -> None:
+        """Load persisted listings; they are revalidated against directory mtimes on use."""
+        if self.index_file is None or not self.index_file.exists():
+            return
+
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if data.get("version") != self.INDEX_VERSION:
+                return
+            for key, entry in data["directories"].items():
+                self._directories[key] = _IndexedDirectory(
+                    mtime_ns=entry["mtime_ns"],
+                    files=set(entry["files"]),
+                    subdirs=list(entry["subdirs"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable fragment index {self.index_file}: {e}")
+            self._directories = {}
+
+    def _scan(
+        self, path: Path, mtime_ns: int, include_subdirs: bool
+    ) -> Optional[_IndexedDirectory]:
+        """List fragment files (and optionally subdirectories) of a directory."""
+        listing = _IndexedDirectory(
+            mtime_ns=mtime_ns,
+            trusted=time.time() - mtime_ns / 1e9 > self.RACY_WINDOW_SECONDS,
+        )
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if include_subdirs:
+                            listing.subdirs.append(entry.name)
+                    elif entry.is_file() and Path(entry.name).suffix.lower() in self.extensions:
+                        listing.files.add(entry.name)
+        except OSError as e:
+            logger.debug(f"Could not scan fragment directory {path}: {e}")
+            return None
+
+        listing.subdirs.sort()
+        return listing
+
+
+class StagedFragmentStore:
+    """Fragments moved into storage whose overwritten files are kept aside.
+
+    Returned by FragmentStorageManager.begin_store_fragments. Call commit()
+    once the surrounding operation has succeeded to discard the replaced
+    files, or rollback() to remove the new fragments and restore them.
+    """
+
+    def __init__(
+        self,
+        paths: Dict[str, Path],
+        moved: List[Path],
+        replaced: Dict[Path, Path],
+        staging_dir: Optional[Path],
+        on_change: Callable[[], None],
+    ):
+        """Initialize staged store.
+
+        Args:
+            paths: Mapping of fragment name to the path where it was stored
+            moved: Fragment paths moved into storage so far
+            replaced: Mapping of overwritten fragment paths to their backups
+            staging_dir: Staging directory holding the backups
+            on_change: Called after rollback changes storage
+        """
+        self.paths = paths
+        self._moved = moved
+        self._replaced = replaced
+        self._staging_dir = staging_dir
+        self._on_change = on_change
+
+    def commit(self) -> None:
+        """Discard the replaced fragments, making the store permanent."""
+        self._cleanup()
+
+    def rollback(self) -> None:
+        """Remove the stored fragments and restore the ones they replaced."""
+        for target in self._moved:
+            try:
+                target.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove {target} during rollback: {e}")
+
+        for target, backup in self._replaced.items():
+            try:
+                os.replace(backup, target)
+            except OSError as e:
+                logger.error(f"Could not restore {target} during rollback: {e}")
+
+        self._moved.clear()
+        self._replaced.clear()
+        self._on_change()
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        """Remove the staging directory."""
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+
+
 class FragmentStorageManager:
     """Manages storage of Claude Code memory fragments."""
 
@@ -133,14 +407,16 @@ class FragmentStorageManager:
     PROJECT_FRAGMENT_DIR = ".claude/pacc/fragments"
     USER_FRAGMENT_DIR = ".claude/pacc/fragments"
 
-    def __init__(self, project_root: Optional[Union[str, Path]] = None):
+    def __init__(self, project_root: Optional[Union[str, Path]] = None, persist_index: bool = True):
         """Initialize fragment storage manager.
 
         Args:
             project_root: Project root directory (defaults to current working directory)
+            persist_index: Whether to persist the storage index for fast cold starts
         """
         self.project_root = PathNormalizer.normalize(project_root or Path.cwd())
         self.user_home = Path.home()
+        self.persist_index = persist_index
 
         # Initialize storage paths
         self.project_storage = self.project_root / self.PROJECT_FRAGMENT_DIR
@@ -165,6 +441,21 @@ class FragmentStorageManager:
                 # Non-fatal - storage may not be available
                 pass
 
+    def _get_index(self, base_path: Path) -> FragmentStorageIndex:
+        """Get the shared storage index for a storage directory."""
+        return FragmentStorageIndex.for_path(
+            base_path, self.FRAGMENT_EXTENSIONS, persist=self.persist_index
+        )
+
+    def _storage_locations(self, storage_type: Optional[str]) -> List[Tuple[str, Path]]:
+        """Get (storage_type, base_path) pairs to search, project first."""
+        locations = []
+        if storage_type == "project" or storage_type is None:
+            locations.append(("project", self.project_storage))
+        if storage_type == "user" or storage_type is None:
+            locations.append(("user", self.user_storage))
+        return locations
+
     def get_project_storage_path(self) -> Path:
         """Get project-level storage path.
 
@@ -204,24 +495,7 @@ class FragmentStorageManager:
         Raises:
             PACCError: If fragment already exists and overwrite=False
         """
-        # Determine storage location
-        if storage_type == "user":
-            base_path = self.user_storage
-        else:
-            base_path = self.project_storage
-
-        # Handle collection directories
-        if collection:
-            storage_path = base_path / collection
-            PathNormalizer.ensure_directory(storage_path)
-        else:
-            storage_path = base_path
-
-        # Ensure fragment has .md extension
-        if not fragment_name.endswith(".md"):
-            fragment_name += ".md"
-
-        fragment_path = storage_path / fragment_name
+        fragment_path = self._get_fragment_path(fragment_name, storage_type, collection)
 
         # Check for existing fragment
         if fragment_path.exists() and not overwrite:
@@ -229,7 +503,9 @@ class FragmentStorageManager:
 
         # Store the fragment
         try:
+            PathNormalizer.ensure_directory(fragment_path.parent)
             fragment_path.write_text(content, encoding="utf-8")
+            self._get_index(self._base_path(storage_type)).invalidate(collection)
 
             # Update gitignore for project fragments
             if storage_type == "project":
@@ -240,6 +516,170 @@ class FragmentStorageManager:
 
         return fragment_path
 
+    def store_fragments(
+        self,
+        fragments: Dict[str, str],
+        storage_type: str = "project",
+        collection: Optional[str] = None,
+        overwrite: bool = False,
+        max_workers: int = 8,
+    ) -> Dict[str, Path]:
+        """Store several fragments as a single all-or-nothing operation.
+
+        Fragments are written concurrently into a staging directory next to the
+        storage directory and then moved into place. If any write or move fails,
+        fragments already moved are removed and overwritten ones are restored.
+
+        Args:
+            fragments: Mapping of fragment name (without extension) to content
+            storage_type: 'project' or 'user'
+            collection: Optional collection name (subdirectory)
+            overwrite: Whether to overwrite existing fragments
+            max_workers: Maximum number of concurrent staging writes
+
+        Returns:
+            Mapping of fragment name to the path where it was stored
+
+        Raises:
+            PACCError: If any fragment already exists and overwrite=False, or if
+                storing fails (in which case storage is left unchanged)
+        """
+        staged = self.begin_store_fragments(
+            fragments, storage_type, collection, overwrite, max_workers
+        )
+        staged.commit()
+        return staged.paths
+
+    def begin_store_fragments(
+        self,
+        fragments: Dict[str, str],
+        storage_type: str = "project",
+        collection: Optional[str] = None,
+        overwrite: bool = False,
+        max_workers: int = 8,
+    ) -> "StagedFragmentStore":
+        """Store several fragments, keeping replaced files until the caller commits.
+
+        Works like store_fragments, but overwritten fragments are kept aside
+        until commit() is called on the returned handle, so a caller whose
+        later steps fail can call rollback() to restore storage completely.
+
+        Args:
+            fragments: Mapping of fragment name (without extension) to content
+            storage_type: 'project' or 'user'
+            collection: Optional collection name (subdirectory)
+            overwrite: Whether to overwrite existing fragments
+            max_workers: Maximum number of concurrent staging writes
+
+        Returns:
+            Handle holding the stored paths, to be committed or rolled back
+
+        Raises:
+            PACCError: If any fragment already exists and overwrite=False, or if
+                storing fails (in which case storage is left unchanged)
+        """
+        targets = {
+            name: self._get_fragment_path(name, storage_type, collection) for name in fragments
+        }
+        base_path = self._base_path(storage_type)
+
+        def invalidate() -> None:
+            self._get_index(base_path).invalidate(collection)
+
+        if not fragments:
+            return StagedFragmentStore(targets, [], {}, None, invalidate)
+
+        existing = [name for name, path in targets.items() if path.exists()]
+        if existing and not overwrite:
+            raise PACCError(f"Fragments already exist: {', '.join(existing)}")
+
+        moved: List[Path] = []
+        replaced: Dict[Path, Path] = {}
+
+        try:
+            PathNormalizer.ensure_directory(base_path)
+            # Stage beside the storage directory so the final moves are renames
+            # on the same filesystem and the staging area is never listed
+            staging_dir = Path(tempfile.mkdtemp(prefix=".fragment-staging-", dir=base_path.parent))
+        except OSError as e:
+            raise PACCError(f"Failed to store fragments: {e}") from e
+
+        staged = StagedFragmentStore(targets, moved, replaced, staging_dir, invalidate)
+        try:
+            staged_files = {name: staging_dir / targets[name].name for name in fragments}
+            workers = max(1, min(max_workers, len(fragments)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        lambda name: staged_files[name].write_text(
+                            fragments[name], encoding="utf-8"
+                        ),
+                        fragments,
+                    )
+                )
+
+            backup_dir = staging_dir / "replaced"
+            for name, target in targets.items():
+                PathNormalizer.ensure_directory(target.parent)
+                if target.exists():
+                    PathNormalizer.ensure_directory(backup_dir)
+                    backup = backup_dir / f"{len(replaced)}{target.suffix}"
+                    os.replace(target, backup)
+                    replaced[target] = backup
+                os.replace(staged_files[name], target)
+                moved.append(target)
+
+        except OSError as e:
+            staged.rollback()
+            raise PACCError(f"Failed to store fragments: {e}") from e
+
+        finally:
+            invalidate()
+
+        if storage_type == "project":
+            self._update_gitignore_for_project_fragments()
+
+        return staged
+
+    def _base_path(self, storage_type: str) -> Path:
+        """Get the storage directory for a storage type."""
+        return self.user_storage if storage_type == "user" else self.project_storage
+
+    def _get_fragment_path(
+        self, fragment_name: str, storage_type: str, collection: Optional[str]
+    ) -> Path:
+        """Build the storage path for a fragment name."""
+        base_path = self._base_path(storage_type)
+        storage_path = base_path / collection if collection else base_path
+
+        # Ensure fragment has .md extension
+        if not fragment_name.endswith(".md"):
+            fragment_name += ".md"
+
+        return storage_path / fragment_name
+
+    def existing_fragments(
+        self,
+        fragment_names: List[str],
+        storage_type: str = "project",
+        collection: Optional[str] = None,
+    ) -> List[str]:
+        """Return which of the given fragment names are already stored.
+
+        Args:
+            fragment_names: Fragment names (without extension)
+            storage_type: 'project' or 'user'
+            collection: Optional collection name
+
+        Returns:
+            Names from fragment_names that already exist in storage
+        """
+        return [
+            name
+            for name in fragment_names
+            if self._get_fragment_path(name, storage_type, collection).exists()
+        ]
+
     def load_fragment(
         self, fragment_name: str, storage_type: str = "project", collection: Optional[str] = None
     ) -> str:
@@ -282,60 +722,21 @@ class FragmentStorageManager:
             Path to fragment if found, None otherwise
         """
         # SECURITY: Reject identifiers containing path separators to prevent path traversal
-        if "/" in fragment_name or "\\" in fragment_name or ".." in fragment_name:
-            logger.warning(f"Rejected fragment identifier with path separators: {fragment_name}")
-            return None
+        for identifier in (fragment_name, collection or ""):
+            if "/" in identifier or "\\" in identifier or ".." in identifier:
+                logger.warning(f"Rejected fragment identifier with path separators: {identifier}")
+                return None
 
         # Ensure fragment has .md extension for searching
         if not fragment_name.endswith(".md"):
             fragment_name += ".md"
 
         # Only search within controlled fragment storage directories
-        search_paths = []
-
-        if storage_type == "project" or storage_type is None:
-            if self.project_storage and self.project_storage.exists():
-                if collection:
-                    potential_path = self.project_storage / collection / fragment_name
-                else:
-                    potential_path = self.project_storage / fragment_name
-
-                # SECURITY: Verify path stays within fragment storage boundaries
-                try:
-                    if potential_path.exists() and potential_path.is_relative_to(
-                        self.project_storage
-                    ):
-                        search_paths.append(potential_path)
-                except (ValueError, TypeError):
-                    pass  # Path is not relative to storage, skip it
-
-        if storage_type == "user" or storage_type is None:
-            if self.user_storage and self.user_storage.exists():
-                if collection:
-                    potential_path = self.user_storage / collection / fragment_name
-                else:
-                    potential_path = self.user_storage / fragment_name
-
-                # SECURITY: Verify path stays within fragment storage boundaries
-                try:
-                    if potential_path.exists() and potential_path.is_relative_to(self.user_storage):
-                        search_paths.append(potential_path)
-                except (ValueError, TypeError):
-                    pass  # Path is not relative to storage, skip it
-
-        # Additional validation for found paths
-        for path in search_paths:
-            if path.exists():
-                # Double-check the path is actually within our storage directories
-                # We don't use self.validator.is_valid_path here because it rejects absolute paths
-                # But our search_paths are already validated to be within storage directories
-                try:
-                    if (self.project_storage and path.is_relative_to(self.project_storage)) or (
-                        self.user_storage and path.is_relative_to(self.user_storage)
-                    ):
-                        return path
-                except (ValueError, TypeError):
-                    pass  # Path is not relative to storage
+        for _, base_path in self._storage_locations(storage_type):
+            listing = self._get_index(base_path).directory(collection)
+            if listing is not None and fragment_name in listing.files:
+                storage_path = base_path / collection if collection else base_path
+                return storage_path / fragment_name
 
         return None
 
@@ -357,46 +758,32 @@ class FragmentStorageManager:
         """
         fragments = []
 
-        # Define search locations
-        search_locations = []
-        if storage_type == "project" or storage_type is None:
-            search_locations.append(("project", self.project_storage))
-        if storage_type == "user" or storage_type is None:
-            search_locations.append(("user", self.user_storage))
-
-        for location_type, base_path in search_locations:
-            if not base_path.exists():
-                continue
+        for location_type, base_path in self._storage_locations(storage_type):
+            index = self._get_index(base_path)
 
-            # Search in specific collection or all collections
+            # Search in specific collection or the base directory and all collections
             if collection:
-                search_dirs = [base_path / collection] if (base_path / collection).exists() else []
+                listing = index.directory(collection)
+                listings = {collection: listing} if listing is not None else {}
             else:
-                # Search base directory and all subdirectories
-                search_dirs = [base_path]
-                if base_path.exists():
-                    search_dirs.extend([p for p in base_path.iterdir() if p.is_dir()])
+                listings = index.snapshot()
 
-            for search_dir in search_dirs:
-                if not search_dir.exists():
-                    continue
+            for collection_name, listing in listings.items():
+                search_dir = base_path / collection_name if collection_name else base_path
+
+                for file_name in listing.files:
+                    fragment_path = search_dir / file_name
 
-                for fragment_path in self.scanner.find_files_by_extension(
-                    search_dir, self.FRAGMENT_EXTENSIONS, recursive=False
-                ):
                     # Apply pattern filter if specified (match against stem, not full filename)
                     if pattern and not fnmatch.fnmatch(fragment_path.stem, pattern):
                         continue
 
-                    # Determine if this is in a collection
-                    is_collection = search_dir != base_path
-                    collection_name = search_dir.name if is_collection else None
-
+                    # Size and modification time are read from the file itself
                     fragments.append(
                         FragmentLocation(
                             path=fragment_path,
                             name=fragment_path.stem,
-                            is_collection=is_collection,
+                            is_collection=collection_name is not None,
                             storage_type=location_type,
                             collection_name=collection_name,
                         )
@@ -416,34 +803,15 @@ class FragmentStorageManager:
         """
         collections = {}
 
-        # Define search locations
-        search_locations = []
-        if storage_type == "project" or storage_type is None:
-            search_locations.append(self.project_storage)
-        if storage_type == "user" or storage_type is None:
-            search_locations.append(self.user_storage)
-
-        for base_path in search_locations:
-            if not base_path.exists():
-                continue
-
-            for collection_dir in base_path.iterdir():
-                if not collection_dir.is_dir():
+        for _, base_path in self._storage_locations(storage_type):
+            for collection_name, listing in self._get_index(base_path).snapshot().items():
+                if collection_name is None:
                     continue
 
                 # Get fragments in this collection
-                fragment_names = []
-                for fragment_path in self.scanner.find_files_by_extension(
-                    collection_dir, self.FRAGMENT_EXTENSIONS, recursive=False
-                ):
-                    fragment_names.append(fragment_path.stem)
-
+                fragment_names = [Path(file_name).stem for file_name in listing.files]
                 if fragment_names:
-                    collection_key = f"{collection_dir.name}"
-                    if collection_key in collections:
-                        collections[collection_key].extend(fragment_names)
-                    else:
-                        collections[collection_key] = fragment_names
+                    collections.setdefault(collection_name, []).extend(fragment_names)
 
         return collections
 
@@ -473,6 +841,10 @@ class FragmentStorageManager:
             # Clean up empty collection directories
             parent_dir = fragment_path.parent
             storage_bases = [self.project_storage, self.user_storage]
+            base_path = parent_dir if parent_dir in storage_bases else parent_dir.parent
+            self._get_index(base_path).invalidate(
+                None if parent_dir in storage_bases else parent_dir.name
+            )
 
             if parent_dir not in storage_bases and parent_dir.exists():
                 try:
@@ -586,6 +958,10 @@ class FragmentStorageManager:
         rel_path = self.project_storage.relative_to(self.project_root)
         ignore_paths.append(f"{rel_path.as_posix()}/")
 
+        # The persisted storage index is a local cache
+        if self.persist_index:
+            ignore_paths.append((rel_path.parent / FragmentStorageIndex.INDEX_FILENAME).as_posix())
+
         # Update gitignore
         self.gitignore_manager.ensure_fragment_entries(ignore_paths)
 
@@ -6,11 +6,12 @@ through pacc.json specifications and sync commands.
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from ..core.project_config import ProjectConfigManager
+from ..core.sync_state import SyncState, SyncStateStore, fingerprint, path_fingerprint
 from .claude_md_manager import CLAUDEmdManager
 from .installation_manager import FragmentInstallationManager
 from .storage_manager import FragmentStorageManager
@@ -53,6 +54,7 @@ class SyncResult:
     added_count: int = 0
     updated_count: int = 0
     removed_count: int = 0
+    skipped_count: int = 0
     conflict_count: int = 0
     conflicts: List[SyncConflict] = field(default_factory=list)
     changes_made: List[str] = field(default_factory=list)
@@ -201,9 +203,14 @@ class FragmentSyncManager:
         add_missing: bool = True,
         remove_extra: bool = False,
         update_existing: bool = True,
+        full: bool = False,
     ) -> SyncResult:
         """Synchronize fragments based on pacc.json specifications.
 
+        Fragments whose spec, installed metadata and file are unchanged since
+        they were last found in sync are skipped; if nothing changed at all
+        the sync returns without detecting conflicts.
+
         Args:
             interactive: Use interactive conflict resolution
             force: Force sync even with conflicts
@@ -211,6 +218,7 @@ class FragmentSyncManager:
             add_missing: Add fragments specified but not installed
             remove_extra: Remove installed fragments not in specs
             update_existing: Update existing fragments to spec versions
+            full: Process every fragment, ignoring the recorded sync state
 
         Returns:
             Result of sync operation
@@ -228,6 +236,29 @@ class FragmentSyncManager:
             # Get currently installed fragments
             installed_fragments = self._get_installed_fragments()
 
+            options = {
+                "add_missing": add_missing,
+                "remove_extra": remove_extra,
+                "update_existing": update_existing,
+            }
+            fingerprints = self._fragment_fingerprints(specs, installed_fragments, options)
+            state_store = SyncStateStore(self.project_root)
+            state = SyncState() if full else state_store.load("fragments")
+            if state.is_unchanged(fingerprints):
+                result.success = True
+                result.skipped_count = len(specs)
+                result.changes_made.append("Fragments unchanged since last sync")
+                return result
+
+            # Only process fragments whose fingerprint changed
+            changed = set(state.changed_entries(fingerprints))
+            unchanged = {spec.name for spec in specs if spec.name not in changed}
+            result.skipped_count = len(unchanged)
+            specs = [spec for spec in specs if spec.name in changed]
+            installed_fragments = {
+                name: info for name, info in installed_fragments.items() if name not in unchanged
+            }
+
             # Detect conflicts
             conflicts = self.detect_conflicts(specs, installed_fragments)
 
@@ -257,12 +288,84 @@ class FragmentSyncManager:
 
             result.success = result.conflict_count == 0 and len(result.errors) == 0
 
+            if result.success and not dry_run:
+                self._record_sync_state(state_store, options)
+
         except Exception as e:
             logger.error(f"Fragment sync failed: {e}")
             result.errors.append(str(e))
 
         return result
 
+    def _fragment_fingerprints(
+        self,
+        specs: List[FragmentSyncSpec],
+        installed: Dict[str, Any],
+        options: Dict[str, bool],
+    ) -> Dict[str, str]:
+        """Fingerprint each spec with its installed metadata and file.
+
+        Installed fragments without a spec are included when extra fragments
+        are being removed, so that installing one outside a sync is noticed.
+        """
+        names = [spec.name for spec in specs]
+        if options["remove_extra"]:
+            names += sorted(set(installed) - set(names))
+        spec_map = {spec.name: spec for spec in specs}
+
+        fingerprints = {}
+        for name in names:
+            info = installed.get(name)
+            file_path = None
+            if isinstance(info, dict) and info.get("reference_path"):
+                file_path = Path(info["reference_path"]).expanduser()
+                if not file_path.is_absolute():
+                    file_path = self.project_root / file_path
+            fingerprints[name] = fingerprint(
+                {
+                    "spec": asdict(spec_map[name]) if name in spec_map else None,
+                    "installed": info,
+                    "file": path_fingerprint(file_path) if file_path else None,
+                    "options": options,
+                }
+            )
+        return fingerprints
+
+    def _record_sync_state(self, state_store: SyncStateStore, options: Dict[str, bool]) -> None:
+        """Record fingerprints of the fragments that are now in sync."""
+        specs = self.load_sync_specifications()
+        installed = self._get_installed_fragments()
+        fingerprints = self._fragment_fingerprints(specs, installed, options)
+
+        pending = self._pending_fragments(specs, installed, **options)
+        settled = {name: fp for name, fp in fingerprints.items() if name not in pending}
+        state_store.save("fragments", settled, complete=len(settled) == len(fingerprints))
+
+    def _pending_fragments(
+        self,
+        specs: List[FragmentSyncSpec],
+        installed: Dict[str, Any],
+        add_missing: bool,
+        remove_extra: bool,
+        update_existing: bool,
+    ) -> Set[str]:
+        """Get the names of fragments a sync with these options would still change."""
+        spec_names = {spec.name for spec in specs}
+        pending = set()
+        if add_missing:
+            pending |= spec_names - set(installed)
+        if remove_extra:
+            pending |= set(installed) - spec_names
+        if update_existing:
+            pending |= {
+                spec.name
+                for spec in specs
+                if spec.name in installed
+                and spec.version
+                and installed[spec.name].get("version") != spec.version
+            }
+        return pending
+
     def _get_installed_fragments(self) -> Dict[str, Any]:
         """Get currently installed fragments from pacc.json.
 
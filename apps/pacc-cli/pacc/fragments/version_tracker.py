@@ -11,7 +11,7 @@ import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -106,28 +106,88 @@ class FragmentVersionTracker:
         Returns:
             Version information for the fragment
         """
-        version = None
+        tracked = self.track_installations(
+            [(fragment_name, source_url, source_type, fragment_path)]
+        )
+        return tracked[fragment_name]
 
-        if source_type == "git":
-            version = self._get_git_version(source_url, fragment_path)
-        else:
-            version = self._get_content_version(fragment_path, source_type, source_url)
+    def track_installations(
+        self, installations: List[Tuple[str, str, str, Path]]
+    ) -> Dict[str, FragmentVersion]:
+        """Track several fragment installations with a single save.
 
-        self.versions[fragment_name] = version
-        self._save_versions()
+        Git information is looked up once per source directory rather than once
+        per fragment.
+
+        Args:
+            installations: (fragment_name, source_url, source_type, fragment_path) tuples
+
+        Returns:
+            Dictionary of fragment names to version information
+        """
+        git_info: Dict[Path, Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+        tracked = {}
 
-        return version
+        for fragment_name, source_url, source_type, fragment_path in installations:
+            if source_type == "git":
+                version = self._get_git_version(source_url, fragment_path, git_info)
+            else:
+                version = self._get_content_version(fragment_path, source_type, source_url)
+
+            self.versions[fragment_name] = version
+            tracked[fragment_name] = version
+
+        if tracked:
+            self._save_versions()
 
-    def _get_git_version(self, source_url: str, fragment_path: Path) -> FragmentVersion:
+        return tracked
+
+    def _get_git_version(
+        self,
+        source_url: str,
+        fragment_path: Path,
+        git_info: Optional[Dict[Path, Tuple[Optional[str], Optional[str], Optional[str]]]] = None,
+    ) -> FragmentVersion:
         """Get version information from Git source.
 
         Args:
             source_url: Git repository URL
             fragment_path: Path to fragment file
+            git_info: Optional memo of Git information keyed by directory
 
         Returns:
             Fragment version information
         """
+        directory = fragment_path.parent
+        if git_info is not None and directory in git_info:
+            version_id, commit_message, author = git_info[directory]
+        else:
+            version_id, commit_message, author = self._read_git_info(directory)
+            if git_info is not None:
+                git_info[directory] = (version_id, commit_message, author)
+
+        # Fall back to content hash if Git info not available
+        if not version_id:
+            version_id = self._calculate_content_hash(fragment_path)
+
+        return FragmentVersion(
+            version_id=version_id,
+            source_type="git",
+            timestamp=datetime.now(),
+            source_url=source_url,
+            commit_message=commit_message,
+            author=author,
+        )
+
+    def _read_git_info(self, directory: Path) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Read the current commit SHA, message and author for a directory.
+
+        Args:
+            directory: Directory inside a Git working tree
+
+        Returns:
+            Tuple of (short SHA, commit message, author), with None for unavailable values
+        """
         version_id = None
         commit_message = None
         author = None
@@ -137,7 +197,7 @@ class FragmentVersionTracker:
             # Get current commit SHA
             result = subprocess.run(
                 ["git", "rev-parse", "HEAD"],
-                cwd=fragment_path.parent,
+                cwd=directory,
                 capture_output=True,
                 text=True,
                 check=False,
@@ -149,7 +209,7 @@ class FragmentVersionTracker:
                 # Get commit message
                 result = subprocess.run(
                     ["git", "log", "-1", "--pretty=%s"],
-                    cwd=fragment_path.parent,
+                    cwd=directory,
                     capture_output=True,
                     text=True,
                     check=False,
@@ -161,7 +221,7 @@ class FragmentVersionTracker:
                 # Get author
                 result = subprocess.run(
                     ["git", "log", "-1", "--pretty=%an"],
-                    cwd=fragment_path.parent,
+                    cwd=directory,
                     capture_output=True,
                     text=True,
                     check=False,
@@ -173,18 +233,7 @@ class FragmentVersionTracker:
         except Exception as e:
             logger.warning(f"Could not get Git version info: {e}")
 
-        # Fall back to content hash if Git info not available
-        if not version_id:
-            version_id = self._calculate_content_hash(fragment_path)
-
-        return FragmentVersion(
-            version_id=version_id,
-            source_type="git",
-            timestamp=datetime.now(),
-            source_url=source_url,
-            commit_message=commit_message,
-            author=author,
-        )
+        return version_id, commit_message, author
 
     def _get_content_version(
         self, fragment_path: Path, source_type: str, source_url: Optional[str]
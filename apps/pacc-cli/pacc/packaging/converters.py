@@ -1,16 +1,25 @@
 """Format converters for transforming between package formats."""
 
-import io
+import contextlib
 import logging
+import os
 import shutil
+import stat
 import tarfile
 import tempfile
+import time
 import zipfile
+import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ..core.hashing import CHUNK_SIZE
+from ..performance.optimization import get_performance_optimizer
 from .formats import (
+    ArchiveMember,
+    ArchivePackage,
     BasePackage,
     MultiFilePackage,
     PackageFormat,
@@ -60,6 +69,247 @@ class ConversionResult:
             return f"Conversion failed: {self.error_message}"
 
 
+_ARCHIVE_FORMATS = (
+    PackageFormat.ZIP_ARCHIVE,
+    PackageFormat.TAR_ARCHIVE,
+    PackageFormat.TAR_GZ_ARCHIVE,
+)
+
+
+# Files at least this large are compressed in a worker process when a ZIP is
+# written from files on disk; smaller files are not worth the hand-off
+PARALLEL_COMPRESS_MIN_SIZE = 256 * 1024
+
+
+def _zip_info(member: ArchiveMember, compression: int) -> zipfile.ZipInfo:
+    """Build the ZIP header for a package member."""
+    # ZIP timestamps cannot predate 1980
+    date_time = max(time.localtime(member.mtime)[:6], (1980, 1, 1, 0, 0, 0))
+    zip_info = zipfile.ZipInfo(member.name, date_time)
+    zip_info.compress_type = compression
+    zip_info.external_attr = (stat.S_IFREG | (member.mode & 0o777)) << 16
+    zip_info.file_size = member.size
+    return zip_info
+
+
+def _deflate_file(source_path: str, compress_level: int, part_path: str) -> Tuple[int, int, int]:
+    """Compress a file into a raw deflate stream (runs in a worker process).
+
+    Args:
+        source_path: File to compress
+        compress_level: zlib compression level
+        part_path: File to write the compressed data to
+
+    Returns:
+        Tuple of (CRC-32, compressed size, uncompressed size)
+    """
+    compressor = zlib.compressobj(compress_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = 0
+    file_size = 0
+
+    with open(source_path, "rb") as source, open(part_path, "wb") as part:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            part.write(compressor.compress(chunk))
+        part.write(compressor.flush())
+        return crc, part.tell(), file_size
+
+
+# Members deflated by worker processes are appended through zipfile
+# internals that are unchanged in CPython 3.8 through 3.12, the versions this
+# package declares support for. If a zipfile lacks any of them, large files
+# are compressed in-process instead.
+_RAW_MEMBER_ATTRIBUTES = (
+    "_lock",
+    "_writecheck",
+    "_didModify",
+    "fp",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+)
+
+
+def _supports_raw_member_writes(zip_file: zipfile.ZipFile) -> bool:
+    """Check that an open ZIP archive has every internal _write_compressed_member uses."""
+    return hasattr(zipfile.ZipInfo, "FileHeader") and all(
+        hasattr(zip_file, name) for name in _RAW_MEMBER_ATTRIBUTES
+    )
+
+
+def _write_compressed_member(
+    zip_file: zipfile.ZipFile, zip_info: zipfile.ZipInfo, part_path: Path
+) -> None:
+    """Append a member whose data was deflated ahead of time.
+
+    zipfile has no public API for adding compressed data, so this does what
+    ZipFile.write() does internally: write the local header and raw data at
+    the end of the archive, then register the member for the central directory.
+    Only used when _supports_raw_member_writes() holds for the archive.
+    """
+    zip64 = max(zip_info.file_size, zip_info.compress_size) > zipfile.ZIP64_LIMIT
+
+    with zip_file._lock:
+        zip_file._writecheck(zip_info)
+        zip_file._didModify = True
+        zip_file.fp.seek(zip_file.start_dir)
+        zip_info.header_offset = zip_file.fp.tell()
+        zip_file.fp.write(zip_info.FileHeader(zip64))
+        with open(part_path, "rb") as part:
+            shutil.copyfileobj(part, zip_file.fp, CHUNK_SIZE)
+        zip_file.start_dir = zip_file.fp.tell()
+        zip_file.filelist.append(zip_info)
+        zip_file.NameToInfo[zip_info.filename] = zip_info
+
+
+def _compression_pool(
+    source_package: BasePackage,
+    zip_file: zipfile.ZipFile,
+    compression: int,
+    options: Dict[str, Any],
+) -> Optional[ProcessPoolExecutor]:
+    """Create a process pool for compressing large files, if it is worthwhile.
+
+    Only directory packages qualify: their files can be read by worker
+    processes, and the snapshot tells up front how many are large.
+
+    Args:
+        source_package: Package being converted
+        zip_file: Archive the compressed members are appended to
+        compression: ZIP compression method
+        options: Conversion options ('jobs' limits the number of processes)
+
+    Returns:
+        Process pool, or None to compress everything in this process
+    """
+    if compression != zipfile.ZIP_DEFLATED or not _supports_raw_member_writes(zip_file):
+        return None
+
+    snapshot = source_package.snapshot()
+    if snapshot is None:
+        return None
+
+    large_files = sum(1 for entry in snapshot.files if entry.size >= PARALLEL_COMPRESS_MIN_SIZE)
+    workers = min(options.get("jobs") or os.cpu_count() or 1, large_files)
+    if workers < 2:
+        return None
+
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError) as e:
+        logger.debug(f"Compressing in-process, no process pool available: {e}")
+        return None
+
+
+def _write_zip(
+    source_package: BasePackage, output_path: Path, options: Dict[str, Any]
+) -> Dict[str, int]:
+    """Write every file of a package into a ZIP archive.
+
+    Small files and archive members are compressed in this process as they
+    are read. Large files of directory packages are deflated by a process
+    pool and appended once the smaller files are written.
+
+    Args:
+        source_package: Package to read
+        output_path: Path of the ZIP archive to create
+        options: Conversion options ('compression', 'compress_level', 'jobs')
+
+    Returns:
+        Statistics with the number of files, uncompressed bytes and files
+        compressed in worker processes
+    """
+    compression = options.get("compression", zipfile.ZIP_DEFLATED)
+    compress_level = options.get("compress_level")
+    stats = {"files": 0, "bytes": 0, "parallel_files": 0}
+    pending = []
+
+    with contextlib.ExitStack() as stack:
+        zip_file = stack.enter_context(
+            zipfile.ZipFile(output_path, "w", compression=compression, compresslevel=compress_level)
+        )
+        pool = _compression_pool(source_package, zip_file, compression, options)
+        if pool is not None:
+            # The pool is shut down before its part files are removed
+            parts_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="pacc_zip_")))
+            stack.enter_context(pool)
+            level = zlib.Z_DEFAULT_COMPRESSION if compress_level is None else compress_level
+
+        for member, source in source_package.iter_files():
+            stats["files"] += 1
+            stats["bytes"] += member.size
+
+            if pool is not None and member.size >= PARALLEL_COMPRESS_MIN_SIZE:
+                part_path = parts_dir / f"{len(pending)}.part"
+                future = pool.submit(_deflate_file, str(member.source_path), level, str(part_path))
+                pending.append((member, part_path, future))
+            elif member.source_path is not None:
+                zip_file.write(member.source_path, member.name)
+            else:
+                with zip_file.open(_zip_info(member, compression), "w") as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+        for member, part_path, future in pending:
+            crc, compress_size, file_size = future.result()
+            zip_info = _zip_info(member, compression)
+            zip_info.CRC = crc
+            zip_info.compress_size = compress_size
+            zip_info.file_size = file_size
+            _write_compressed_member(zip_file, zip_info, part_path)
+            part_path.unlink()
+            stats["parallel_files"] += 1
+
+    return stats
+
+
+def _write_archive(
+    source_package: BasePackage,
+    output_path: Path,
+    target_format: PackageFormat,
+    compression: Optional[str],
+    options: Dict[str, Any],
+) -> Tuple[BasePackage, Dict[str, int]]:
+    """Copy every file of a package into a new archive.
+
+    Files are streamed in fixed-size chunks and each member is written as
+    soon as it is read, so neither a temporary directory nor whole files in
+    memory are needed.
+
+    Args:
+        source_package: Package to read
+        output_path: Path of the archive to create
+        target_format: ZIP, TAR or TAR.GZ target format
+        compression: TAR compression type ('gz', 'bz2', 'xz', or None)
+        options: Conversion options ('compression', 'compress_level' and
+            'jobs' apply to ZIP output)
+
+    Returns:
+        Tuple of (package for the created archive, conversion statistics)
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Planning and streaming a directory package share one walk of its tree
+    with source_package.shared_snapshot():
+        if target_format == PackageFormat.ZIP_ARCHIVE:
+            stats = _write_zip(source_package, output_path, options)
+            return ZipPackage(output_path), stats
+
+        stats = {"files": 0, "bytes": 0, "parallel_files": 0}
+        mode = f"w:{compression}" if compression else "w"
+        with tarfile.open(output_path, mode) as tar_file:
+            for member, source in source_package.iter_files():
+                tar_info = tarfile.TarInfo(name=member.name)
+                tar_info.size = member.size
+                tar_info.mtime = member.mtime
+                tar_info.mode = member.mode
+                tar_file.addfile(tar_info, fileobj=source)
+                stats["files"] += 1
+                stats["bytes"] += member.size
+
+    return TarPackage(output_path, compression=compression), stats
+
+
 class BaseConverter(ABC):
     """Base class for package format converters."""
 
@@ -168,6 +418,11 @@ class UniversalConverter(BaseConverter):
     ) -> ConversionResult:
         """Convert package using universal approach (extract -> repackage).
 
+        Archive targets are written by streaming the source's files straight
+        into the new archive, and file and directory sources are read in
+        place; only archives converted to files or directories are extracted
+        to a temporary directory first.
+
         Args:
             source_package: Source package to convert
             target_format: Target format
@@ -181,13 +436,32 @@ class UniversalConverter(BaseConverter):
         output_path = Path(output_path)
 
         try:
-            # Create temporary directory for extraction
-            with tempfile.TemporaryDirectory(prefix="pacc_convert_") as temp_dir:
-                temp_path = Path(temp_dir)
+            if target_format in _ARCHIVE_FORMATS:
+                # Stream files into the archive without extracting
+                compression = "gz" if target_format == PackageFormat.TAR_GZ_ARCHIVE else None
+                target_package, stats = _write_archive(
+                    source_package, output_path, target_format, compression, options
+                )
+                self._preserve_package_info(source_package, target_package)
+                return ConversionResult(
+                    success=True,
+                    output_path=output_path,
+                    source_format=source_package.get_format(),
+                    target_format=target_format,
+                    metadata=stats,
+                )
 
-                # Step 1: Extract source package
-                logger.debug(f"Extracting {source_package.path} to {temp_path}")
-                extracted_path = source_package.extract_to(temp_path)
+            with contextlib.ExitStack() as stack:
+                if isinstance(source_package, ArchivePackage):
+                    # Step 1: Extract source package
+                    temp_path = Path(
+                        stack.enter_context(tempfile.TemporaryDirectory(prefix="pacc_convert_"))
+                    )
+                    logger.debug(f"Extracting {source_package.path} to {temp_path}")
+                    extracted_path = source_package.extract_to(temp_path)
+                else:
+                    # Files and directories are read in place
+                    extracted_path = source_package.path
 
                 # Step 2: Create target package from extracted content
                 logger.debug(f"Creating {target_format} package at {output_path}")
@@ -200,15 +474,6 @@ class UniversalConverter(BaseConverter):
                     result = self._convert_to_multi_file(
                         extracted_path, output_path, source_package, options
                     )
-                elif target_format == PackageFormat.ZIP_ARCHIVE:
-                    result = self._convert_to_zip(
-                        extracted_path, output_path, source_package, options
-                    )
-                elif target_format in [PackageFormat.TAR_ARCHIVE, PackageFormat.TAR_GZ_ARCHIVE]:
-                    compression = "gz" if target_format == PackageFormat.TAR_GZ_ARCHIVE else None
-                    result = self._convert_to_tar(
-                        extracted_path, output_path, source_package, compression, options
-                    )
                 else:
                     return ConversionResult(
                         success=False,
@@ -333,104 +598,6 @@ class UniversalConverter(BaseConverter):
             target_format=PackageFormat.MULTI_FILE,
         )
 
-    def _convert_to_zip(
-        self,
-        source_path: Path,
-        output_path: Path,
-        source_package: BasePackage,
-        options: Dict[str, Any],
-    ) -> ConversionResult:
-        """Convert to ZIP archive format."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        compression = options.get("compression", zipfile.ZIP_DEFLATED)
-        compress_level = options.get("compress_level", 6)
-
-        with zipfile.ZipFile(
-            output_path, "w", compression=compression, compresslevel=compress_level
-        ) as zip_file:
-            if source_path.is_file():
-                # Single file
-                zip_file.write(source_path, source_path.name)
-            elif source_path.is_dir():
-                # Directory tree
-                for file_path in source_path.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(source_path)
-                        zip_file.write(file_path, arcname)
-            else:
-                return ConversionResult(
-                    success=False,
-                    source_format=source_package.get_format(),
-                    target_format=PackageFormat.ZIP_ARCHIVE,
-                    error_message=f"Invalid source path: {source_path}",
-                )
-
-        # Create and configure target package
-        target_package = ZipPackage(output_path)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=source_package.get_format(),
-            target_format=PackageFormat.ZIP_ARCHIVE,
-        )
-
-    def _convert_to_tar(
-        self,
-        source_path: Path,
-        output_path: Path,
-        source_package: BasePackage,
-        compression: Optional[str],
-        _options: Dict[str, Any],
-    ) -> ConversionResult:
-        """Convert to TAR archive format."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Determine TAR mode
-        if compression == "gz":
-            mode = "w:gz"
-            target_format = PackageFormat.TAR_GZ_ARCHIVE
-        elif compression == "bz2":
-            mode = "w:bz2"
-            target_format = PackageFormat.TAR_ARCHIVE
-        elif compression == "xz":
-            mode = "w:xz"
-            target_format = PackageFormat.TAR_ARCHIVE
-        else:
-            mode = "w"
-            target_format = PackageFormat.TAR_ARCHIVE
-
-        with tarfile.open(output_path, mode) as tar_file:
-            if source_path.is_file():
-                # Single file
-                tar_file.add(source_path, arcname=source_path.name)
-            elif source_path.is_dir():
-                # Directory tree
-                for file_path in source_path.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(source_path)
-                        tar_file.add(file_path, arcname=arcname)
-            else:
-                return ConversionResult(
-                    success=False,
-                    source_format=source_package.get_format(),
-                    target_format=target_format,
-                    error_message=f"Invalid source path: {source_path}",
-                )
-
-        # Create and configure target package
-        target_package = TarPackage(output_path, compression=compression)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=source_package.get_format(),
-            target_format=target_format,
-        )
-
 
 class SpecializedConverter(BaseConverter):
     """Specialized converter for specific format pairs with optimizations."""
@@ -482,135 +649,55 @@ class SpecializedConverter(BaseConverter):
         self, source_package: SingleFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert single file to ZIP (optimized)."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        compression = options.get("compression", zipfile.ZIP_DEFLATED)
-
-        with zipfile.ZipFile(output_path, "w", compression=compression) as zip_file:
-            zip_file.write(source_package.path, source_package.path.name)
-
-        target_package = ZipPackage(output_path)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=PackageFormat.SINGLE_FILE,
-            target_format=PackageFormat.ZIP_ARCHIVE,
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.ZIP_ARCHIVE, None
         )
 
     def _single_to_tar(
         self, source_package: SingleFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert single file to TAR (optimized)."""
-        return self._single_to_tar_common(source_package, output_path, options, None)
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.TAR_ARCHIVE, None
+        )
 
     def _single_to_tar_gz(
         self, source_package: SingleFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert single file to TAR.GZ (optimized)."""
-        return self._single_to_tar_common(source_package, output_path, options, "gz")
-
-    def _single_to_tar_common(
-        self,
-        source_package: SingleFilePackage,
-        output_path: Path,
-        _options: Dict[str, Any],
-        compression: Optional[str],
-    ) -> ConversionResult:
-        """Common implementation for single file to TAR conversion."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        mode = f"w:{compression}" if compression else "w"
-        target_format = (
-            PackageFormat.TAR_GZ_ARCHIVE if compression == "gz" else PackageFormat.TAR_ARCHIVE
-        )
-
-        with tarfile.open(output_path, mode) as tar_file:
-            tar_file.add(source_package.path, arcname=source_package.path.name)
-
-        target_package = TarPackage(output_path, compression=compression)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=PackageFormat.SINGLE_FILE,
-            target_format=target_format,
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.TAR_GZ_ARCHIVE, "gz"
         )
 
     def _multi_to_zip(
         self, source_package: MultiFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert multi-file to ZIP (optimized)."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        compression = options.get("compression", zipfile.ZIP_DEFLATED)
-
-        with zipfile.ZipFile(output_path, "w", compression=compression) as zip_file:
-            for file_path in source_package.path.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_package.path)
-                    zip_file.write(file_path, arcname)
-
-        target_package = ZipPackage(output_path)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=PackageFormat.MULTI_FILE,
-            target_format=PackageFormat.ZIP_ARCHIVE,
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.ZIP_ARCHIVE, None
         )
 
     def _multi_to_tar(
         self, source_package: MultiFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert multi-file to TAR (optimized)."""
-        return self._multi_to_tar_common(source_package, output_path, options, None)
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.TAR_ARCHIVE, None
+        )
 
     def _multi_to_tar_gz(
         self, source_package: MultiFilePackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert multi-file to TAR.GZ (optimized)."""
-        return self._multi_to_tar_common(source_package, output_path, options, "gz")
-
-    def _multi_to_tar_common(
-        self,
-        source_package: MultiFilePackage,
-        output_path: Path,
-        _options: Dict[str, Any],
-        compression: Optional[str],
-    ) -> ConversionResult:
-        """Common implementation for multi-file to TAR conversion."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        mode = f"w:{compression}" if compression else "w"
-        target_format = (
-            PackageFormat.TAR_GZ_ARCHIVE if compression == "gz" else PackageFormat.TAR_ARCHIVE
-        )
-
-        with tarfile.open(output_path, mode) as tar_file:
-            for file_path in source_package.path.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_package.path)
-                    tar_file.add(file_path, arcname=arcname)
-
-        target_package = TarPackage(output_path, compression=compression)
-        self._preserve_package_info(source_package, target_package)
-
-        return ConversionResult(
-            success=True,
-            output_path=output_path,
-            source_format=PackageFormat.MULTI_FILE,
-            target_format=target_format,
+        return self._to_archive(
+            source_package, output_path, options, PackageFormat.TAR_GZ_ARCHIVE, "gz"
         )
 
     def _zip_to_tar(
         self, source_package: ZipPackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert ZIP to TAR (optimized)."""
-        return self._archive_to_archive(
+        return self._to_archive(
             source_package, output_path, options, PackageFormat.TAR_ARCHIVE, None
         )
 
@@ -618,7 +705,7 @@ class SpecializedConverter(BaseConverter):
         self, source_package: ZipPackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert ZIP to TAR.GZ (optimized)."""
-        return self._archive_to_archive(
+        return self._to_archive(
             source_package, output_path, options, PackageFormat.TAR_GZ_ARCHIVE, "gz"
         )
 
@@ -626,11 +713,11 @@ class SpecializedConverter(BaseConverter):
         self, source_package: TarPackage, output_path: Path, options: Dict[str, Any]
     ) -> ConversionResult:
         """Convert TAR to ZIP (optimized)."""
-        return self._archive_to_archive(
+        return self._to_archive(
             source_package, output_path, options, PackageFormat.ZIP_ARCHIVE, None
         )
 
-    def _archive_to_archive(
+    def _to_archive(
         self,
         source_package: BasePackage,
         output_path: Path,
@@ -638,43 +725,11 @@ class SpecializedConverter(BaseConverter):
         target_format: PackageFormat,
         compression: Optional[str],
     ) -> ConversionResult:
-        """Optimized archive-to-archive conversion without full extraction."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
+        """Stream every file of the source package into a new archive."""
         try:
-            if target_format == PackageFormat.ZIP_ARCHIVE:
-                zip_compression = options.get("compression", zipfile.ZIP_DEFLATED)
-
-                with zipfile.ZipFile(output_path, "w", compression=zip_compression) as zip_file:
-                    for file_path in source_package.list_contents():
-                        file_data = source_package.get_file_content(file_path)
-                        zip_file.writestr(file_path, file_data)
-
-                target_package = ZipPackage(output_path)
-
-            elif target_format in [PackageFormat.TAR_ARCHIVE, PackageFormat.TAR_GZ_ARCHIVE]:
-                mode = f"w:{compression}" if compression else "w"
-
-                with tarfile.open(output_path, mode) as tar_file:
-                    for file_path in source_package.list_contents():
-                        file_data = source_package.get_file_content(file_path)
-
-                        # Create tarinfo
-                        tarinfo = tarfile.TarInfo(name=file_path)
-                        tarinfo.size = len(file_data)
-
-                        # Add file to tar
-                        tar_file.addfile(tarinfo, fileobj=io.BytesIO(file_data))
-
-                target_package = TarPackage(output_path, compression=compression)
-
-            else:
-                return ConversionResult(
-                    success=False,
-                    source_format=source_package.get_format(),
-                    target_format=target_format,
-                    error_message=f"Unsupported target format: {target_format}",
-                )
+            target_package, stats = _write_archive(
+                source_package, output_path, target_format, compression, options
+            )
 
             self._preserve_package_info(source_package, target_package)
 
@@ -683,6 +738,7 @@ class SpecializedConverter(BaseConverter):
                 output_path=output_path,
                 source_format=source_package.get_format(),
                 target_format=target_format,
+                metadata=stats,
             )
 
         except Exception as e:
@@ -728,6 +784,8 @@ class FormatConverter:
             Conversion result
         """
         try:
+            start_time = time.perf_counter()
+
             # Create source package
             source_package = create_package(source_path, source_format)
 
@@ -736,25 +794,61 @@ class FormatConverter:
                 return self._copy_package(source_package, Path(output_path))
 
             # Try specialized converter first if preferred
-            if self.prefer_specialized:
-                if self.specialized_converter.can_convert(
-                    source_package.get_format(), target_format
-                ):
-                    logger.debug("Using specialized converter")
-                    return self.specialized_converter.convert(
-                        source_package, target_format, output_path, options
-                    )
+            if self.prefer_specialized and self.specialized_converter.can_convert(
+                source_package.get_format(), target_format
+            ):
+                logger.debug("Using specialized converter")
+                result = self.specialized_converter.convert(
+                    source_package, target_format, output_path, options
+                )
+            else:
+                # Fall back to universal converter
+                logger.debug("Using universal converter")
+                result = self.universal_converter.convert(
+                    source_package, target_format, output_path, options
+                )
 
-            # Fall back to universal converter
-            logger.debug("Using universal converter")
-            return self.universal_converter.convert(
-                source_package, target_format, output_path, options
-            )
+            if result.success:
+                self._record_throughput(result, source_package, time.perf_counter() - start_time)
+            return result
 
         except Exception as e:
             logger.error(f"Conversion failed: {e}")
             return ConversionResult(success=False, error_message=str(e))
 
+    def _record_throughput(
+        self, result: ConversionResult, source_package: BasePackage, duration: float
+    ) -> None:
+        """Add throughput to a conversion result and report it to the performance monitor.
+
+        Args:
+            result: Successful conversion result
+            source_package: Package that was converted
+            duration: Conversion time in seconds
+        """
+        # Archive writers count the uncompressed bytes they stream
+        bytes_converted = result.metadata.get("bytes")
+        if bytes_converted is None:
+            bytes_converted = source_package.get_size()
+
+        result.metadata["duration"] = duration
+        result.metadata["throughput_bytes_per_second"] = (
+            bytes_converted / duration if duration > 0 else 0.0
+        )
+
+        get_performance_optimizer().monitor.record_operation(
+            "package_conversion",
+            duration,
+            metadata={
+                "source_format": result.source_format.value,
+                "target_format": result.target_format.value,
+                "bytes": bytes_converted,
+                "files": result.metadata.get("files"),
+                "parallel_files": result.metadata.get("parallel_files", 0),
+                "throughput_bytes_per_second": result.metadata["throughput_bytes_per_second"],
+            },
+        )
+
     def _copy_package(self, source_package: BasePackage, output_path: Path) -> ConversionResult:
         """Copy package when no conversion is needed."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -872,6 +966,12 @@ class PackageConverter:
                     "default": 6,
                     "description": "Compression level (0-9)",
                 },
+                "jobs": {
+                    "type": "int",
+                    "min": 1,
+                    "default": None,
+                    "description": "Processes used to compress large files (defaults to CPU count)",
+                },
             }
         elif target_format in [PackageFormat.TAR_ARCHIVE, PackageFormat.TAR_GZ_ARCHIVE]:
             return {
@@ -5,14 +5,17 @@ import logging
 import os
 import shutil
 import tarfile
-import tempfile
 import zipfile
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
+from ..core.file_utils import TreeSnapshot
+from ..core.hashing import CHUNK_SIZE, get_file_hasher
 from ..errors import PACCError
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,18 @@ class PackageInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ArchiveMember:
+    """A regular file stored in a package."""
+
+    name: str
+    size: int
+    mtime: float = 0.0
+    mode: int = 0o644
+    # Location on disk for file and directory packages, None for archive members
+    source_path: Optional[Path] = None
+
+
 class BasePackage(ABC):
     """Base class for all package formats."""
 
@@ -57,6 +72,8 @@ class BasePackage(ABC):
         """
         self.path = Path(path)
         self.info = info or PackageInfo(format=self.get_format(), name=self.path.stem)
+        self._snapshot: Optional[TreeSnapshot] = None
+        self._snapshot_holds = 0
 
     @abstractmethod
     def get_format(self) -> PackageFormat:
@@ -105,6 +122,56 @@ class BasePackage(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_files(self) -> Iterator[Tuple[ArchiveMember, BinaryIO]]:
+        """Stream the package's regular files with a single pass over the package.
+
+        Each file object is only valid until the iterator advances.
+
+        Yields:
+            Tuples of (member, readable file object)
+        """
+        pass
+
+    def snapshot(self, refresh: bool = False) -> Optional[TreeSnapshot]:
+        """Get the snapshot of a directory package's files.
+
+        Inside a shared_snapshot() block the tree is walked once and the
+        snapshot reused until refreshed. Outside one every call walks the
+        tree, so results always reflect the directory's current state.
+
+        Args:
+            refresh: Walk the tree again even if a snapshot is being shared
+
+        Returns:
+            Tree snapshot, or None if the package is not a directory
+        """
+        if not self.path.is_dir():
+            return None
+        if self._snapshot_holds == 0:
+            return TreeSnapshot.scan(self.path)
+        if refresh or self._snapshot is None:
+            self._snapshot = TreeSnapshot.scan(self.path)
+        return self._snapshot
+
+    @contextmanager
+    def shared_snapshot(self) -> Iterator[Optional[TreeSnapshot]]:
+        """Share one walk of a directory package across several calls.
+
+        Size, checksum, listing and file iteration used within the block
+        reuse the same snapshot. Blocks may be nested.
+
+        Yields:
+            Tree snapshot, or None if the package is not a directory
+        """
+        self._snapshot_holds += 1
+        try:
+            yield self.snapshot()
+        finally:
+            self._snapshot_holds -= 1
+            if self._snapshot_holds == 0:
+                self._snapshot = None
+
     def get_size(self) -> int:
         """Get package size in bytes.
 
@@ -114,53 +181,59 @@ class BasePackage(ABC):
         try:
             if self.path.is_file():
                 return self.path.stat().st_size
-            elif self.path.is_dir():
-                total_size = 0
-                for file_path in self.path.rglob("*"):
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
-                return total_size
-            return 0
+            snapshot = self.snapshot()
+            return snapshot.total_size if snapshot is not None else 0
         except OSError:
             return 0
 
-    def calculate_checksum(self, algorithm: str = "sha256") -> str:
+    def calculate_checksum(self, algorithm: str = "sha256", merkle: bool = True) -> str:
         """Calculate package checksum.
 
+        Directory checksums are the Merkle root of the package tree, with files
+        hashed in parallel. The legacy form hashes every relative path and file
+        content as one sequential stream.
+
         Args:
             algorithm: Hash algorithm to use
+            merkle: Use the Merkle tree form for directory packages
 
         Returns:
             Hexadecimal checksum string
         """
-        hasher = hashlib.new(algorithm)
+        hasher = get_file_hasher()
 
         if self.path.is_file():
             # Single file checksum
-            with open(self.path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-        elif self.path.is_dir():
-            # Directory checksum (all files sorted by path)
-            file_paths = sorted(self.path.rglob("*"))
-            for file_path in file_paths:
-                if file_path.is_file():
-                    # Include relative path in hash
-                    rel_path = file_path.relative_to(self.path)
-                    hasher.update(str(rel_path).encode())
-
-                    # Include file content in hash
-                    with open(file_path, "rb") as f:
-                        for chunk in iter(lambda: f.read(8192), b""):
-                            hasher.update(chunk)
-
-        return hasher.hexdigest()
+            return hasher.hash_file(self.path, algorithm)
+
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return hashlib.new(algorithm).hexdigest()
+
+        if merkle:
+            root_digest, _ = hasher.hash_tree(self.path, algorithm, files=snapshot.paths)
+            return root_digest
+
+        # Legacy directory checksum (all files sorted by path components)
+        stream = hashlib.new(algorithm)
+        for entry in sorted(snapshot.files, key=lambda entry: entry.path.split("/")):
+            # Include relative path in hash
+            rel_path = Path(entry.path)
+            stream.update(str(rel_path).encode())
+
+            # Include file content in hash
+            with open(self.path / rel_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    stream.update(chunk)
+
+        return stream.hexdigest()
 
     def update_info(self) -> None:
         """Update package info with current state."""
-        self.info.size_bytes = self.get_size()
-        self.info.file_count = len(self.list_contents())
-        self.info.checksum = self.calculate_checksum()
+        with self.shared_snapshot():
+            self.info.size_bytes = self.get_size()
+            self.info.file_count = len(self.list_contents())
+            self.info.checksum = self.calculate_checksum()
 
 
 class SingleFilePackage(BasePackage):
@@ -216,6 +289,23 @@ class SingleFilePackage(BasePackage):
         else:
             raise PACCError(f"File not found in package: {file_path}")
 
+    def iter_files(self) -> Iterator[Tuple[ArchiveMember, BinaryIO]]:
+        """Stream the single file.
+
+        Yields:
+            Tuple of (member, readable file object)
+        """
+        stat = self.path.stat()
+        member = ArchiveMember(
+            name=self.path.name,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            mode=stat.st_mode & 0o777,
+            source_path=self.path,
+        )
+        with open(self.path, "rb") as file_obj:
+            yield member, file_obj
+
     def validate(self) -> bool:
         """Validate package (check if file exists and is readable).
 
@@ -264,16 +354,11 @@ class MultiFilePackage(BasePackage):
         Returns:
             List of relative file paths
         """
-        if not self.path.is_dir():
+        snapshot = self.snapshot()
+        if snapshot is None:
             return []
 
-        contents = []
-        for file_path in self.path.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.path)
-                contents.append(str(rel_path))
-
-        return sorted(contents)
+        return sorted(str(Path(rel_path)) for rel_path in snapshot.paths)
 
     def get_file_content(self, file_path: str) -> bytes:
         """Get content of specific file.
@@ -292,6 +377,28 @@ class MultiFilePackage(BasePackage):
         else:
             raise PACCError(f"File not found in package: {file_path}")
 
+    def iter_files(self) -> Iterator[Tuple[ArchiveMember, BinaryIO]]:
+        """Stream files from the directory in sorted path order.
+
+        Yields:
+            Tuples of (member, readable file object)
+        """
+        snapshot = self.snapshot()
+        if snapshot is None:
+            raise PACCError(f"Source directory does not exist: {self.path}")
+
+        for entry in snapshot.files:
+            file_path = self.path / entry.path
+            member = ArchiveMember(
+                name=entry.path,
+                size=entry.size,
+                mtime=entry.mtime,
+                mode=entry.mode & 0o777,
+                source_path=file_path,
+            )
+            with open(file_path, "rb") as file_obj:
+                yield member, file_obj
+
     def validate(self) -> bool:
         """Validate package (check if directory exists and contains files).
 
@@ -299,21 +406,20 @@ class MultiFilePackage(BasePackage):
             True if valid
         """
         try:
-            if not self.path.is_dir():
-                return False
-
-            # Check if directory contains at least one file
-            for item in self.path.rglob("*"):
-                if item.is_file():
-                    return True
-
-            return False  # Empty directory
+            snapshot = self.snapshot(refresh=True)
+            # Empty directories are not valid packages
+            return snapshot is not None and len(snapshot.files) > 0
         except OSError:
             return False
 
 
 class ArchivePackage(BasePackage):
-    """Base class for archive-based packages (ZIP, TAR, etc.)."""
+    """Base class for archive-based packages (ZIP, TAR, etc.).
+
+    Listing and member reads are served from the archive's own index, which
+    is read once and reused until the archive file changes. Nothing is
+    extracted to disk except by extract_to().
+    """
 
     def __init__(self, path: Union[str, Path], info: Optional[PackageInfo] = None):
         """Initialize archive package.
@@ -323,30 +429,8 @@ class ArchivePackage(BasePackage):
             info: Package information
         """
         super().__init__(path, info)
-        self._temp_dir: Optional[Path] = None
-
-    def __del__(self):
-        """Clean up temporary directory."""
-        self._cleanup_temp()
-
-    def _cleanup_temp(self) -> None:
-        """Clean up temporary extraction directory."""
-        if self._temp_dir and self._temp_dir.exists():
-            try:
-                shutil.rmtree(self._temp_dir)
-                self._temp_dir = None
-            except OSError as e:
-                logger.warning(f"Failed to clean up temp directory {self._temp_dir}: {e}")
-
-    def _get_temp_dir(self) -> Path:
-        """Get or create temporary extraction directory.
-
-        Returns:
-            Path to temporary directory
-        """
-        if self._temp_dir is None or not self._temp_dir.exists():
-            self._temp_dir = Path(tempfile.mkdtemp(prefix="pacc_"))
-        return self._temp_dir
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_stat: Optional[Tuple[int, int]] = None
 
     @abstractmethod
     def _extract_archive(self, destination: Path) -> None:
@@ -358,11 +442,11 @@ class ArchivePackage(BasePackage):
         pass
 
     @abstractmethod
-    def _list_archive_contents(self) -> List[str]:
-        """List archive contents (implementation specific).
+    def _read_index(self) -> Dict[str, Any]:
+        """Read the archive's index of regular files (implementation specific).
 
         Returns:
-            List of file paths in archive
+            Mapping of member path to the archive library's member info, in archive order
         """
         pass
 
@@ -378,6 +462,27 @@ class ArchivePackage(BasePackage):
         """
         pass
 
+    def _get_index(self) -> Dict[str, Any]:
+        """Get the archive index, re-reading it only if the archive changed.
+
+        Returns:
+            Mapping of member path to member info
+        """
+        stat = self.path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._index is None or self._index_stat != key:
+            self._index = self._read_index()
+            self._index_stat = key
+        return self._index
+
+    def _list_archive_contents(self) -> List[str]:
+        """List archive contents from the index.
+
+        Returns:
+            List of file paths in archive
+        """
+        return list(self._get_index())
+
     def extract_to(self, destination: Union[str, Path]) -> Path:
         """Extract archive to destination.
 
@@ -457,14 +562,14 @@ class ZipPackage(ArchivePackage):
 
             zip_file.extractall(destination)
 
-    def _list_archive_contents(self) -> List[str]:
-        """List ZIP archive contents.
+    def _read_index(self) -> Dict[str, zipfile.ZipInfo]:
+        """Read the ZIP central directory.
 
         Returns:
-            List of file paths in archive
+            Mapping of member path to ZipInfo
         """
         with zipfile.ZipFile(self.path, "r") as zip_file:
-            return [name for name in zip_file.namelist() if not name.endswith("/")]
+            return {info.filename: info for info in zip_file.infolist() if not info.is_dir()}
 
     def _get_archive_file_content(self, file_path: str) -> bytes:
         """Get file content from ZIP archive.
@@ -475,11 +580,32 @@ class ZipPackage(ArchivePackage):
         Returns:
             File content as bytes
         """
+        info = self._get_index().get(file_path)
+        if info is None:
+            raise PACCError(f"File not found in ZIP archive: {file_path}")
+
         with zipfile.ZipFile(self.path, "r") as zip_file:
-            try:
-                return zip_file.read(file_path)
-            except KeyError as err:
-                raise PACCError(f"File not found in ZIP archive: {file_path}") from err
+            return zip_file.read(info)
+
+    def iter_files(self) -> Iterator[Tuple[ArchiveMember, BinaryIO]]:
+        """Stream regular files from the ZIP archive.
+
+        Yields:
+            Tuples of (member, readable file object)
+        """
+        with zipfile.ZipFile(self.path, "r") as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir():
+                    continue
+                mode = (info.external_attr >> 16) & 0o777 or 0o644
+                member = ArchiveMember(
+                    name=info.filename,
+                    size=info.file_size,
+                    mtime=datetime(*info.date_time).timestamp(),
+                    mode=mode,
+                )
+                with zip_file.open(info) as file_obj:
+                    yield member, file_obj
 
     def validate(self) -> bool:
         """Validate ZIP archive.
@@ -512,33 +638,34 @@ class TarPackage(ArchivePackage):
             compression: Compression type ('gz', 'bz2', 'xz', or None)
             info: Package information
         """
-        super().__init__(path, info)
+        # Compression must be known before the base class asks for the format
         self.compression = compression
+        super().__init__(path, info)
 
         # Determine format based on compression
-        if compression == "gz":
-            self.info.format = PackageFormat.TAR_GZ_ARCHIVE
-        else:
-            self.info.format = PackageFormat.TAR_ARCHIVE
+        self.info.format = self.get_format()
 
     def get_format(self) -> PackageFormat:
         """Get package format."""
-        return self.info.format
+        if self.compression == "gz":
+            return PackageFormat.TAR_GZ_ARCHIVE
+        return PackageFormat.TAR_ARCHIVE
 
-    def _get_tar_mode(self) -> str:
+    def _get_tar_mode(self, stream: bool = False) -> str:
         """Get TAR file mode string.
 
+        Args:
+            stream: Whether to open the archive as a forward-only stream
+
         Returns:
             Mode string for tarfile.open()
         """
-        if self.compression == "gz":
-            return "r:gz"
-        elif self.compression == "bz2":
-            return "r:bz2"
-        elif self.compression == "xz":
-            return "r:xz"
-        else:
-            return "r"
+        separator = "|" if stream else ":"
+        if self.compression in ("gz", "bz2", "xz"):
+            return f"r{separator}{self.compression}"
+        # Stream mode does not detect compression unless asked to; .tar.bz2
+        # and .tar.xz files are opened without a known compression
+        return "r|*" if stream else "r"
 
     def _extract_archive(self, destination: Path) -> None:
         """Extract TAR archive to destination.
@@ -554,33 +681,55 @@ class TarPackage(ArchivePackage):
 
             tar_file.extractall(destination)
 
-    def _list_archive_contents(self) -> List[str]:
-        """List TAR archive contents.
+    def _read_index(self) -> Dict[str, tarfile.TarInfo]:
+        """Read the TAR member headers.
 
         Returns:
-            List of file paths in archive
+            Mapping of member path to TarInfo, including data offsets
         """
         with tarfile.open(self.path, self._get_tar_mode()) as tar_file:
-            return [member.name for member in tar_file.getmembers() if member.isfile()]
+            return {member.name: member for member in tar_file.getmembers() if member.isfile()}
 
     def _get_archive_file_content(self, file_path: str) -> bytes:
         """Get file content from TAR archive.
 
+        The member's data offset comes from the cached index, so the archive
+        headers are not re-parsed for each read.
+
         Args:
             file_path: Path to file within archive
 
         Returns:
             File content as bytes
         """
+        member = self._get_index().get(file_path)
+        if member is None:
+            raise PACCError(f"File not found in TAR archive: {file_path}")
+
         with tarfile.open(self.path, self._get_tar_mode()) as tar_file:
-            try:
-                member = tar_file.getmember(file_path)
-                file_obj = tar_file.extractfile(member)
-                if file_obj is None:
-                    raise PACCError(f"Cannot extract file from TAR archive: {file_path}")
-                return file_obj.read()
-            except KeyError as err:
-                raise PACCError(f"File not found in TAR archive: {file_path}") from err
+            file_obj = tar_file.extractfile(member)
+            if file_obj is None:
+                raise PACCError(f"Cannot extract file from TAR archive: {file_path}")
+            return file_obj.read()
+
+    def iter_files(self) -> Iterator[Tuple[ArchiveMember, BinaryIO]]:
+        """Stream regular files from the TAR archive in a single forward pass.
+
+        Yields:
+            Tuples of (member, readable file object)
+        """
+        with tarfile.open(self.path, self._get_tar_mode(stream=True)) as tar_file:
+            for tar_info in tar_file:
+                if not tar_info.isfile():
+                    continue
+                file_obj = tar_file.extractfile(tar_info)
+                member = ArchiveMember(
+                    name=tar_info.name,
+                    size=tar_info.size,
+                    mtime=tar_info.mtime,
+                    mode=tar_info.mode,
+                )
+                yield member, file_obj
 
     def validate(self) -> bool:
         """Validate TAR archive.
@@ -599,15 +748,16 @@ class TarPackage(ArchivePackage):
 
 def _detect_file_format(path_obj: Path) -> PackageFormat:
     """Detect package format for a file based on extension."""
-    suffix = path_obj.suffix.lower()
+    name = path_obj.name.lower()
 
-    if suffix == ".zip":
+    if name.endswith(".zip"):
         return PackageFormat.ZIP_ARCHIVE
 
-    if suffix in [".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz"]:
+    # Path.suffix only holds the last suffix, so match compound ones on the name
+    if name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
         return (
             PackageFormat.TAR_GZ_ARCHIVE
-            if suffix in [".tar.gz", ".tgz"]
+            if name.endswith((".tar.gz", ".tgz"))
             else PackageFormat.TAR_ARCHIVE
         )
 
@@ -1,6 +1,5 @@
 """Package metadata management and manifest generation."""
 
-import hashlib
 import json
 import logging
 from dataclasses import asdict, dataclass, field
@@ -8,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from ..core.file_utils import FileEntry
+from ..core.hashing import get_file_hasher
 from .formats import BasePackage, PackageFormat
 
 logger = logging.getLogger(__name__)
@@ -47,11 +48,7 @@ class FileMetadata:
             rel_path = file_path
 
         # Calculate checksum
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        checksum = hasher.hexdigest()
+        checksum = get_file_hasher().hash_file(file_path)
 
         # Get permissions
         permissions = oct(stat.st_mode)[-3:]
@@ -64,6 +61,25 @@ class FileMetadata:
             permissions=permissions,
         )
 
+    @classmethod
+    def from_entry(cls, entry: FileEntry, checksum: str) -> "FileMetadata":
+        """Create file metadata from a tree snapshot entry.
+
+        Args:
+            entry: Snapshot entry for the file
+            checksum: Hex digest of the file content
+
+        Returns:
+            File metadata instance
+        """
+        return cls(
+            path=str(Path(entry.path)),
+            size=entry.size,
+            checksum=checksum,
+            modified=entry.mtime,
+            permissions=oct(entry.mode)[-3:],
+        )
+
 
 @dataclass
 class DependencyInfo:
@@ -96,6 +112,7 @@ class PackageMetadata:
     size_bytes: int = 0
     file_count: int = 0
     checksum: Optional[str] = None
+    checksum_scheme: Optional[str] = None  # 'merkle', or None for the legacy stream checksum
 
     # Content information
     files: List[FileMetadata] = field(default_factory=list)
@@ -121,36 +138,39 @@ class PackageMetadata:
         Returns:
             Package metadata instance
         """
-        metadata = cls(
-            name=package.info.name,
-            version=package.info.version or "1.0.0",
-            description=package.info.description,
-            author=package.info.author,
-            format=package.get_format(),
-            created_at=package.info.created_at or datetime.now().isoformat(),
-            size_bytes=package.get_size(),
-            checksum=package.calculate_checksum(),
-        )
+        # Walk a directory package once; size, checksum and listing reuse the snapshot
+        with package.shared_snapshot() as snapshot:
+            metadata = cls(
+                name=package.info.name,
+                version=package.info.version or "1.0.0",
+                description=package.info.description,
+                author=package.info.author,
+                format=package.get_format(),
+                created_at=package.info.created_at or datetime.now().isoformat(),
+                size_bytes=package.get_size(),
+                checksum=package.calculate_checksum(),
+                checksum_scheme="merkle",
+            )
 
-        # Add file information
-        try:
-            contents = package.list_contents()
-            metadata.file_count = len(contents)
-
-            # Create file metadata for each file
-            if package.path.is_dir():
-                base_path = package.path
-                for content_path in contents:
-                    full_path = package.path / content_path
-                    if full_path.exists() and full_path.is_file():
-                        file_meta = FileMetadata.from_path(full_path, base_path)
-                        metadata.files.append(file_meta)
-            elif package.path.is_file():
-                file_meta = FileMetadata.from_path(package.path)
-                metadata.files.append(file_meta)
+            # Add file information
+            try:
+                contents = package.list_contents()
+                metadata.file_count = len(contents)
+
+                # Create file metadata for each file
+                if snapshot is not None:
+                    # Digests were just computed for the checksum and are served from cache
+                    digests = get_file_hasher().hash_files(
+                        package.path / entry.path for entry in snapshot.files
+                    )
+                    for entry, checksum in zip(snapshot.files, digests.values()):
+                        metadata.files.append(FileMetadata.from_entry(entry, checksum))
+                elif package.path.is_file():
+                    file_meta = FileMetadata.from_path(package.path)
+                    metadata.files.append(file_meta)
 
-        except Exception as e:
-            logger.warning(f"Failed to extract file metadata: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to extract file metadata: {e}")
 
         return metadata
 
@@ -300,45 +320,49 @@ class PackageMetadata:
             True if package matches metadata
         """
         try:
-            # Check basic properties
-            if self.size_bytes != package.get_size():
-                logger.warning("Package size mismatch")
-                return False
-
-            if self.checksum != package.calculate_checksum():
-                logger.warning("Package checksum mismatch")
-                return False
-
-            # Check file count
-            contents = package.list_contents()
-            if self.file_count != len(contents):
-                logger.warning("File count mismatch")
-                return False
-
-            # Verify individual files if possible
-            if package.path.is_dir():
-                for file_meta in self.files:
-                    file_path = package.path / file_meta.path
-                    if not file_path.exists():
-                        logger.warning(f"Missing file: {file_meta.path}")
-                        return False
-
-                    # Check file size
-                    if file_path.stat().st_size != file_meta.size:
-                        logger.warning(f"File size mismatch: {file_meta.path}")
-                        return False
-
-                    # Check file checksum
-                    hasher = hashlib.sha256()
-                    with open(file_path, "rb") as f:
-                        for chunk in iter(lambda: f.read(8192), b""):
-                            hasher.update(chunk)
-
-                    if hasher.hexdigest() != file_meta.checksum:
-                        logger.warning(f"File checksum mismatch: {file_meta.path}")
-                        return False
-
-            return True
+            with package.shared_snapshot() as snapshot:
+                # Check basic properties
+                if self.size_bytes != package.get_size():
+                    logger.warning("Package size mismatch")
+                    return False
+
+                if self.checksum != package.calculate_checksum(
+                    merkle=self.checksum_scheme == "merkle"
+                ):
+                    logger.warning("Package checksum mismatch")
+                    return False
+
+                # Check file count
+                contents = package.list_contents()
+                if self.file_count != len(contents):
+                    logger.warning("File count mismatch")
+                    return False
+
+                # Verify individual files if possible
+                if snapshot is not None:
+                    file_paths = []
+                    for file_meta in self.files:
+                        file_path = package.path / file_meta.path
+                        entry = snapshot.get(Path(file_meta.path).as_posix())
+                        if entry is None:
+                            logger.warning(f"Missing file: {file_meta.path}")
+                            return False
+
+                        # Check file size
+                        if entry.size != file_meta.size:
+                            logger.warning(f"File size mismatch: {file_meta.path}")
+                            return False
+
+                        file_paths.append(file_path)
+
+                    # Check file checksums, hashing files in parallel
+                    digests = get_file_hasher().hash_files(file_paths)
+                    for file_meta, file_path in zip(self.files, file_paths):
+                        if digests[file_path] != file_meta.checksum:
+                            logger.warning(f"File checksum mismatch: {file_meta.path}")
+                            return False
+
+                return True
 
         except Exception as e:
             logger.error(f"Integrity verification failed: {e}")
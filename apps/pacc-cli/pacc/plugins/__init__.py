@@ -1,5 +1,6 @@
 """Plugin configuration management for Claude Code integration."""
 
+from .audit_store import SecurityAuditStore
 from .config import AtomicFileWriter, ConfigBackup, PluginConfigManager
 from .converter import (
     ConversionResult,
@@ -93,6 +94,7 @@ from .security import (
     PluginSecurityManager,
     SecurityAuditEntry,
     SecurityAuditLogger,
+    SecurityScanCache,
 )
 from .security_integration import (
     SecurityValidatorMixin,
@@ -101,6 +103,7 @@ from .security_integration import (
     enhance_validation_with_security,
     validate_plugin_in_sandbox,
 )
+from .worktrees import WorktreeManager
 
 # Create aliases for CLI compatibility
 RepositoryManager = PluginRepositoryManager
@@ -179,12 +182,15 @@ __all__ = [
     "SearchResult",
     "SecurityAuditEntry",
     "SecurityAuditLogger",
+    "SecurityAuditStore",
+    "SecurityScanCache",
     "SecurityValidatorMixin",
     "SemanticVersion",
     "Shell",
     "SortBy",
     "TemplateEngine",
     "UpdateResult",
+    "WorktreeManager",
     "convert_extensions_to_plugin",
     # Sprint 7 - Security Integration
     "convert_security_issues_to_validation_errors",
@@ -0,0 +1,430 @@
+"""Indexed, queryable storage for plugin security audit history."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Threat levels ordered by severity, stored as ranks so they can be range-queried
+THREAT_RANKS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+
+class SecurityAuditStore:
+    """SQLite-backed store of security audit entries.
+
+    Entries are indexed by timestamp, plugin name and highest threat level so
+    range queries and summaries do not scan the whole history. Issues are kept
+    in a separate table for issue-type aggregation.
+    """
+
+    DB_FILENAME = "security_audit.db"
+
+    # Retention limits are applied after this many new entries, or once the
+    # last compaction is older than COMPACT_MAX_AGE_SECONDS. Both are tracked
+    # in the database so short-lived CLI processes still trigger compaction.
+    COMPACT_INTERVAL = 1000
+    COMPACT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_age_days: Optional[int] = 365,
+        max_entries: Optional[int] = 500_000,
+    ):
+        """Initialize audit store.
+
+        Args:
+            db_path: Path to the audit database
+            max_age_days: Entries older than this are removed on compaction
+            max_entries: Maximum number of entries kept on compaction
+        """
+        self.db_path = db_path or Path.home() / ".claude" / "pacc" / self.DB_FILENAME
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # (highest entry id, time) of the last compaction, read from the database
+        self._last_compaction: Optional[Tuple[int, float]] = None
+
+    def record(
+        self,
+        *,
+        timestamp: float,
+        operation: str,
+        plugin_name: str,
+        security_level: str,
+        risk_score: int,
+        action_taken: str,
+        user_confirmed: bool,
+        issues: Iterable[Dict[str, Any]],
+        cached_files: int = 0,
+    ) -> None:
+        """Append an audit entry.
+
+        Args:
+            timestamp: Unix timestamp of the audit
+            operation: Operation being performed
+            plugin_name: Name of plugin being processed
+            security_level: Security level value used for validation
+            risk_score: Calculated risk score
+            action_taken: Action taken based on security findings
+            user_confirmed: Whether user confirmed risky operations
+            issues: Serialized issues, each with at least threat_level and issue_type
+            cached_files: Number of files whose scan results came from cache
+        """
+        issues = list(issues)
+        max_rank = max((THREAT_RANKS.get(i["threat_level"], 0) for i in issues), default=0)
+
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO audits (timestamp, operation, plugin_name, security_level, "
+                    "risk_score, max_threat, issue_count, action_taken, user_confirmed, "
+                    "cached_files, issues) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        timestamp,
+                        operation,
+                        plugin_name,
+                        security_level,
+                        risk_score,
+                        max_rank,
+                        len(issues),
+                        action_taken,
+                        int(user_confirmed),
+                        cached_files,
+                        json.dumps(issues, separators=(",", ":")),
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO audit_issues (audit_id, timestamp, issue_type, threat) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            cursor.lastrowid,
+                            timestamp,
+                            issue["issue_type"],
+                            THREAT_RANKS.get(issue["threat_level"], 0),
+                        )
+                        for issue in issues
+                    ],
+                )
+
+            if self._compaction_due(cursor.lastrowid):
+                self.compact()
+
+    def query(
+        self,
+        plugin_name: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_threat: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Query audit entries, newest first.
+
+        Args:
+            plugin_name: Only return entries for this plugin
+            since: Only return entries at or after this Unix timestamp
+            until: Only return entries before this Unix timestamp
+            min_threat: Only return entries with an issue at or above this threat level
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of audit entry dictionaries
+        """
+        where, params = self._build_filters(plugin_name, since, until, min_threat)
+        with self._lock:
+            connection = self._existing_connection()
+            if connection is None:
+                return []
+            rows = connection.execute(
+                "SELECT timestamp, operation, plugin_name, security_level, risk_score, "
+                "max_threat, action_taken, user_confirmed, cached_files, issues "
+                f"FROM audits{where} ORDER BY timestamp DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+        levels = {rank: level for level, rank in THREAT_RANKS.items()}
+        return [
+            {
+                "timestamp": row[0],
+                "operation": row[1],
+                "plugin_name": row[2],
+                "security_level": row[3],
+                "risk_score": row[4],
+                "max_threat": levels.get(row[5]),
+                "action_taken": row[6],
+                "user_confirmed": bool(row[7]),
+                "cached_files": row[8],
+                "issues": json.loads(row[9]),
+            }
+            for row in rows
+        ]
+
+    def summarize(
+        self,
+        plugin_name: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_threat: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Summarize audit entries matching the filters.
+
+        Args:
+            plugin_name: Only include entries for this plugin
+            since: Only include entries at or after this Unix timestamp
+            until: Only include entries before this Unix timestamp
+            min_threat: Only include entries with an issue at or above this threat level
+
+        Returns:
+            Summary dictionary in the same shape as SecurityAuditLogger.get_audit_summary
+        """
+        where, params = self._build_filters(plugin_name, since, until, min_threat)
+        with self._lock:
+            connection = self._existing_connection()
+            if connection is None:
+                return {
+                    "total_audits": 0,
+                    "high_risk_audits": 0,
+                    "blocked_operations": 0,
+                    "user_confirmations": 0,
+                    "average_risk_score": 0,
+                    "most_common_issues": {},
+                    "most_audited_plugins": {},
+                }
+            total, high_risk, blocked, confirmed, average = connection.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(risk_score > 75), 0), "
+                "COALESCE(SUM(instr(action_taken, 'blocked') > 0), 0), "
+                "COALESCE(SUM(user_confirmed), 0), "
+                "COALESCE(AVG(risk_score), 0) "
+                f"FROM audits{where}",
+                params,
+            ).fetchone()
+
+            issue_rows = connection.execute(
+                "SELECT issue_type, COUNT(*) AS n FROM audit_issues "
+                f"WHERE audit_id IN (SELECT id FROM audits{where}) "
+                "GROUP BY issue_type ORDER BY n DESC LIMIT 10",
+                params,
+            ).fetchall()
+
+            plugin_rows = connection.execute(
+                "SELECT plugin_name, COUNT(*) AS n FROM audits"
+                f"{where} GROUP BY plugin_name ORDER BY n DESC LIMIT 10",
+                params,
+            ).fetchall()
+
+        return {
+            "total_audits": total,
+            "high_risk_audits": high_risk,
+            "blocked_operations": blocked,
+            "user_confirmations": confirmed,
+            "average_risk_score": average,
+            "most_common_issues": dict(issue_rows),
+            "most_audited_plugins": dict(plugin_rows),
+        }
+
+    def compact(self, vacuum: bool = False) -> int:
+        """Apply retention limits and optionally reclaim disk space.
+
+        Args:
+            vacuum: Whether to rebuild the database file afterwards
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            connection = self._existing_connection()
+            if connection is None:
+                return 0
+            with connection:
+                if self.max_age_days is not None:
+                    cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+                    removed += self._delete_where(connection, "timestamp < ?", (cutoff,))
+
+                if self.max_entries is not None:
+                    row = connection.execute(
+                        "SELECT timestamp FROM audits ORDER BY timestamp DESC LIMIT 1 OFFSET ?",
+                        (self.max_entries,),
+                    ).fetchone()
+                    if row is not None:
+                        removed += self._delete_where(connection, "timestamp <= ?", (row[0],))
+
+                last_id = connection.execute("SELECT COALESCE(MAX(id), 0) FROM audits").fetchone()
+                self._last_compaction = (last_id[0], time.time())
+                connection.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("compacted_id", self._last_compaction[0]),
+                        ("compacted_at", self._last_compaction[1]),
+                    ],
+                )
+
+            if vacuum:
+                connection.execute("VACUUM")
+
+        if removed:
+            logger.info(f"Compacted security audit store: removed {removed} entries")
+        return removed
+
+    def import_jsonl(self, log_file: Path) -> int:
+        """Import entries from a JSON-lines audit log written by SecurityAuditLogger.
+
+        Args:
+            log_file: Path to the JSON-lines audit log
+
+        Returns:
+            Number of entries imported
+        """
+        imported = 0
+        with open(log_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    self.record(
+                        timestamp=datetime.fromisoformat(data["timestamp"]).timestamp(),
+                        operation=data["operation"],
+                        plugin_name=data["plugin_name"],
+                        security_level=data["security_level"],
+                        risk_score=data["risk_score"],
+                        action_taken=data["action_taken"],
+                        user_confirmed=data.get("user_confirmed", False),
+                        issues=data.get("issues", []),
+                        cached_files=len(data.get("cached_files", [])),
+                    )
+                    imported += 1
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.debug(f"Skipping unreadable audit log line: {e}")
+
+        return imported
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _compaction_due(self, entry_id: int) -> bool:
+        """Check whether retention limits should be applied after recording an entry."""
+        if self._last_compaction is None:
+            meta = dict(self._get_connection().execute("SELECT key, value FROM meta"))
+            self._last_compaction = (
+                int(meta.get("compacted_id", 0)),
+                meta.get("compacted_at", time.time()),
+            )
+
+        compacted_id, compacted_at = self._last_compaction
+        return (
+            entry_id - compacted_id >= self.COMPACT_INTERVAL
+            # Ids restart once every entry has been removed
+            or entry_id < compacted_id
+            or time.time() - compacted_at >= self.COMPACT_MAX_AGE_SECONDS
+        )
+
+    @staticmethod
+    def _delete_where(connection: sqlite3.Connection, condition: str, params: tuple) -> int:
+        """Delete audits and their issues matching a condition on the audits table."""
+        connection.execute(f"DELETE FROM audit_issues WHERE {condition}", params)
+        return connection.execute(f"DELETE FROM audits WHERE {condition}", params).rowcount
+
+    @staticmethod
+    def _build_filters(
+        plugin_name: Optional[str],
+        since: Optional[float],
+        until: Optional[float],
+        min_threat: Optional[str],
+    ) -> tuple:
+        """Build a WHERE clause for the audits table."""
+        clauses = []
+        params: List[Any] = []
+        if plugin_name is not None:
+            clauses.append("plugin_name = ?")
+            params.append(plugin_name)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if min_threat is not None:
+            clauses.append("max_threat >= ?")
+            params.append(THREAT_RANKS[min_threat])
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    def _existing_connection(self) -> Optional[sqlite3.Connection]:
+        """Open the audit database for reading, or return None if nothing was recorded yet."""
+        if self._connection is None and not self.db_path.exists():
+            return None
+        return self._get_connection()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the audit database, creating the schema on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # Appends are frequent and small; WAL avoids a full sync per entry
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS audits ("
+                    "id INTEGER PRIMARY KEY, "
+                    "timestamp REAL NOT NULL, "
+                    "operation TEXT NOT NULL, "
+                    "plugin_name TEXT NOT NULL, "
+                    "security_level TEXT NOT NULL, "
+                    "risk_score INTEGER NOT NULL, "
+                    "max_threat INTEGER NOT NULL, "
+                    "issue_count INTEGER NOT NULL, "
+                    "action_taken TEXT NOT NULL, "
+                    "user_confirmed INTEGER NOT NULL, "
+                    "cached_files INTEGER NOT NULL DEFAULT 0, "
+                    "issues TEXT NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS audit_issues ("
+                    "audit_id INTEGER NOT NULL, "
+                    "timestamp REAL NOT NULL, "
+                    "issue_type TEXT NOT NULL, "
+                    "threat INTEGER NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_audits_timestamp ON audits (timestamp)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_audits_plugin "
+                    "ON audits (plugin_name, timestamp)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_audits_threat ON audits (max_threat, timestamp)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_audit_issues_audit ON audit_issues (audit_id)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_audit_issues_timestamp "
+                    "ON audit_issues (timestamp)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL NOT NULL)"
+                )
+                # A new database counts as freshly compacted
+                connection.executemany(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                    [("compacted_id", 0), ("compacted_at", time.time())],
+                )
+            self._connection = connection
+        return self._connection
@@ -8,12 +8,12 @@ import shutil
 import tempfile
 import threading
 from contextlib import contextmanager
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, ContextManager, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Set
 
+from ..core.config_cache import get_config_cache
 from ..errors.exceptions import ConfigurationError
 from ..validation.base import ValidationResult
 from ..validation.formats import JSONValidator
@@ -103,6 +103,9 @@ class AtomicFileWriter:
                 self._rollback()
                 raise ConfigurationError(f"Atomic write failed for {self.target_path}: {e}") from e
             finally:
+                # The target changed or was rolled back; drop any cached parse of it
+                get_config_cache().invalidate(self.target_path)
+
                 # Clean up temporary file
                 if self.temp_path and self.temp_path.exists():
                     try:
@@ -246,6 +249,7 @@ class ConfigBackup:
 
             # Restore file
             shutil.copy2(backup_info.backup_path, backup_info.original_path)
+            get_config_cache().invalidate(backup_info.original_path)
             logger.info(f"Restored backup to {backup_info.original_path}")
             return True
 
@@ -414,12 +418,6 @@ class PluginConfigManager:
         self.json_validator = JSONValidator()
         self._lock = threading.RLock()
 
-        # Configuration caching for performance
-        self._config_cache = {}
-        self._config_mtime = {}
-        self._settings_cache = None
-        self._settings_mtime = 0
-
         # Ensure directories exist
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
         self.repos_dir.mkdir(parents=True, exist_ok=True)
@@ -678,6 +676,32 @@ class PluginConfigManager:
             logger.error(f"Failed to list installed repositories: {e}")
             return {}
 
+    def load_config(self) -> Dict[str, Any]:
+        """Load the plugin configuration (config.json).
+
+        Returns:
+            Plugin configuration dictionary with a ``repositories`` section
+        """
+        return self._load_plugin_config()
+
+    def get_enabled_plugins(self) -> Set[str]:
+        """Get the names of all plugins enabled in settings.json.
+
+        Returns:
+            Set of enabled plugin names across all repositories
+        """
+        try:
+            settings = self._load_settings()
+        except ConfigurationError as e:
+            logger.error(f"Failed to load enabled plugins: {e}")
+            return set()
+
+        enabled = set()
+        for plugin_names in settings.get("enabledPlugins", {}).values():
+            if isinstance(plugin_names, list):
+                enabled.update(name for name in plugin_names if isinstance(name, str))
+        return enabled
+
     def get_repository_info(self, repo_key: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific repository.
 
@@ -888,41 +912,21 @@ class PluginConfigManager:
         Returns:
             Plugin configuration dictionary
         """
-        config_key = str(self.config_path)
-
         if not self.config_path.exists():
             return {"repositories": {}}
 
-        try:
-            # Check cache first
-            current_mtime = self.config_path.stat().st_mtime
-            if (
-                config_key in self._config_cache
-                and self._config_mtime.get(config_key, 0) >= current_mtime
-            ):
-                logger.debug(f"Using cached config for {self.config_path}")
-                return deepcopy(self._config_cache[config_key])
-
-            # Load from file
-            with open(self.config_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Validate JSON
+        def validate_json(content: str) -> None:
             validation_result = self.json_validator.validate_content(content, self.config_path)
             if not validation_result.is_valid:
                 raise ConfigurationError(f"Invalid JSON in {self.config_path}")
 
-            config = json.loads(content)
+        try:
+            config = get_config_cache().load_json(self.config_path, validate=validate_json)
 
             # Ensure basic structure
             if "repositories" not in config:
                 config["repositories"] = {}
 
-            # Update cache
-            self._config_cache[config_key] = deepcopy(config)
-            self._config_mtime[config_key] = current_mtime
-            logger.debug(f"Cached config for {self.config_path}")
-
             return config
 
         except json.JSONDecodeError as e:
@@ -950,12 +954,6 @@ class PluginConfigManager:
             writer = AtomicFileWriter(self.config_path, create_backup=True)
             writer.write_json(config, indent=2)
 
-            # Invalidate cache
-            config_key = str(self.config_path)
-            if config_key in self._config_cache:
-                del self._config_cache[config_key]
-                del self._config_mtime[config_key]
-
             logger.debug(f"Saved plugin configuration to {self.config_path}")
             return True
 
@@ -972,30 +970,13 @@ class PluginConfigManager:
         if not self.settings_path.exists():
             return {}
 
-        try:
-            # Check cache first
-            current_mtime = self.settings_path.stat().st_mtime
-            if self._settings_cache is not None and self._settings_mtime >= current_mtime:
-                logger.debug(f"Using cached settings for {self.settings_path}")
-                return deepcopy(self._settings_cache)
-
-            # Load from file
-            with open(self.settings_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Validate JSON
+        def validate_json(content: str) -> None:
             validation_result = self.json_validator.validate_content(content, self.settings_path)
             if not validation_result.is_valid:
                 raise ConfigurationError(f"Invalid JSON in {self.settings_path}")
 
-            settings = json.loads(content)
-
-            # Update cache
-            self._settings_cache = deepcopy(settings)
-            self._settings_mtime = current_mtime
-            logger.debug(f"Cached settings for {self.settings_path}")
-
-            return settings
+        try:
+            return get_config_cache().load_json(self.settings_path, validate=validate_json)
 
         except json.JSONDecodeError as e:
             raise ConfigurationError(f"Invalid JSON in {self.settings_path}: {e}") from e
@@ -1016,10 +997,6 @@ class PluginConfigManager:
             writer = AtomicFileWriter(self.settings_path, create_backup=True)
             writer.write_json(settings, indent=2)
 
-            # Invalidate cache
-            self._settings_cache = None
-            self._settings_mtime = 0
-
             logger.debug(f"Saved settings to {self.settings_path}")
             return True
 
@@ -7,15 +7,17 @@ plugin format that can be managed by the plugin system.
 
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from ..core.file_utils import FilePathValidator
+from ..core.file_utils import FilePathValidator, TreeSnapshot
 from ..validators.agents import AgentsValidator
 from ..validators.commands import CommandsValidator
 from ..validators.hooks import HooksValidator
@@ -83,16 +85,40 @@ class PluginConverter:
     directories into structured plugins that can be managed by the plugin system.
     """
 
-    def __init__(self):
-        """Initialize the plugin converter."""
+    # Extension directories, the file suffix they hold and whether subdirectories count
+    _EXTENSION_DIRS = (
+        ("hooks", ".json", False),
+        ("agents", ".md", True),
+        ("commands", ".md", True),
+        ("mcp", ".json", False),
+    )
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the plugin converter.
+
+        Args:
+            max_workers: Maximum number of threads used to validate and copy
+                extensions (defaults to CPU count, max 8)
+        """
         self.path_validator = FilePathValidator()
         self.hooks_validator = HooksValidator()
         self.agents_validator = AgentsValidator()
         self.commands_validator = CommandsValidator()
         self.mcp_validator = MCPValidator()
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
 
         self._reserved_names = {"claude", "system", "plugin", "pacc"}
 
+    def _map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Apply func to every item on the worker pool, keeping input order."""
+        items = list(items)
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [func(item) for item in items]
+
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pacc-convert") as pool:
+            return list(pool.map(func, items))
+
     def scan_extensions(self, source_directory: Union[str, Path]) -> List[ExtensionInfo]:
         """Scan a directory for Claude Code extensions.
 
@@ -108,39 +134,27 @@ class PluginConverter:
             logger.warning(f"Source directory does not exist: {source_path}")
             return []
 
-        extensions = []
-
         # First, check if this is a .claude directory itself
-        if (
-            source_path.name == ".claude"
-            or (source_path / "hooks").exists()
-            or (source_path / "agents").exists()
-            or (source_path / "commands").exists()
-            or (source_path / "mcp").exists()
+        if source_path.name == ".claude" or any(
+            (source_path / dir_name).exists() for dir_name, _, _ in self._EXTENSION_DIRS
         ):
             # Scan directly from this directory
-            extensions.extend(self._scan_hooks(source_path))
-            extensions.extend(self._scan_agents(source_path))
-            extensions.extend(self._scan_commands(source_path))
-            extensions.extend(self._scan_mcp(source_path))
-        else:
-            # Look for .claude directory
+            claude_dir = source_path
+        elif (source_path / ".claude").exists():
             claude_dir = source_path / ".claude"
-            if claude_dir.exists():
-                extensions.extend(self._scan_hooks(claude_dir))
-                extensions.extend(self._scan_agents(claude_dir))
-                extensions.extend(self._scan_commands(claude_dir))
-                extensions.extend(self._scan_mcp(claude_dir))
-            else:
-                # Check if source_path itself contains extension directories
-                logger.debug(
-                    f"No .claude directory found in {source_path}, "
-                    f"checking for direct extension directories"
-                )
-                extensions.extend(self._scan_hooks(source_path))
-                extensions.extend(self._scan_agents(source_path))
-                extensions.extend(self._scan_commands(source_path))
-                extensions.extend(self._scan_mcp(source_path))
+        else:
+            # Check if source_path itself contains extension directories
+            logger.debug(
+                f"No .claude directory found in {source_path}, "
+                f"checking for direct extension directories"
+            )
+            claude_dir = source_path
+
+        # One walk finds the candidates; validation runs on the worker pool
+        candidates = self._find_extension_files(claude_dir)
+        extensions = [
+            ext for ext in self._map(self._scan_extension_file, candidates) if ext is not None
+        ]
 
         logger.info(f"Found {len(extensions)} extensions in {source_path}")
         return extensions
@@ -316,10 +330,10 @@ class PluginConverter:
                 result.errors.append("No extensions were successfully converted")
                 return result
 
-            # Generate plugin manifest
+            # Generate plugin manifest from what the conversion pass recorded
             manifest = self.generate_manifest(
                 plugin_name=plugin_name,
-                extensions_by_type=extensions_by_type,
+                extensions_by_type=self._group_extensions_by_type(result.converted_extensions),
                 author_name=author_name,
                 description=description,
             )
@@ -439,109 +453,105 @@ class PluginConverter:
             result.errors.append(f"Failed to create plugin directory: {e}")
             return False
 
-    def _scan_hooks(self, claude_dir: Path) -> List[ExtensionInfo]:
-        """Scan for hook extensions."""
-        hooks_dir = claude_dir / "hooks"
-        if not hooks_dir.exists():
-            return []
+    def _find_extension_files(self, claude_dir: Path) -> List[Tuple[str, Path]]:
+        """Find candidate extension files with a single walk of each extension directory.
 
-        extensions = []
-        for hook_file in hooks_dir.glob("*.json"):
-            try:
-                validation_result = self.hooks_validator.validate_single(hook_file)
-
-                ext_info = ExtensionInfo(
-                    path=hook_file,
-                    extension_type="hooks",
-                    name=hook_file.stem,
-                    metadata=validation_result.metadata,
-                    validation_errors=validation_result.errors,
-                    is_valid=validation_result.is_valid,
-                )
-                extensions.append(ext_info)
+        Args:
+            claude_dir: Directory containing hooks/, agents/, commands/ and mcp/
 
-            except Exception as e:
-                logger.warning(f"Failed to validate hook {hook_file}: {e}")
+        Returns:
+            List of (extension type, file path) tuples, grouped by type and
+            sorted by path
+        """
+        candidates = []
+        for extension_type, suffix, recursive in self._EXTENSION_DIRS:
+            type_dir = claude_dir / extension_type
+            if not type_dir.is_dir():
+                continue
 
-        return extensions
+            for entry in TreeSnapshot.scan(type_dir).files:
+                if entry.path.endswith(suffix) and (recursive or "/" not in entry.path):
+                    candidates.append((extension_type, type_dir / entry.path))
 
-    def _scan_agents(self, claude_dir: Path) -> List[ExtensionInfo]:
-        """Scan for agent extensions."""
-        agents_dir = claude_dir / "agents"
-        if not agents_dir.exists():
-            return []
+        return candidates
 
-        extensions = []
-        for agent_file in agents_dir.rglob("*.md"):
-            try:
-                validation_result = self.agents_validator.validate_single(agent_file)
-
-                ext_info = ExtensionInfo(
-                    path=agent_file,
-                    extension_type="agents",
-                    name=agent_file.stem,
-                    metadata=validation_result.metadata,
-                    validation_errors=validation_result.errors,
-                    is_valid=validation_result.is_valid,
-                )
-                extensions.append(ext_info)
+    def _scan_extension_file(self, candidate: Tuple[str, Path]) -> Optional[ExtensionInfo]:
+        """Validate a candidate extension file (runs on the worker pool)."""
+        extension_type, file_path = candidate
+        validator = {
+            "hooks": self.hooks_validator,
+            "agents": self.agents_validator,
+            "commands": self.commands_validator,
+            "mcp": self.mcp_validator,
+        }[extension_type]
 
-            except Exception as e:
-                logger.warning(f"Failed to validate agent {agent_file}: {e}")
+        try:
+            validation_result = validator.validate_single(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to validate {extension_type} {file_path}: {e}")
+            return None
 
-        return extensions
+        return ExtensionInfo(
+            path=file_path,
+            extension_type=extension_type,
+            name=file_path.stem,
+            metadata=validation_result.metadata,
+            validation_errors=validation_result.errors,
+            is_valid=validation_result.is_valid,
+        )
 
-    def _scan_commands(self, claude_dir: Path) -> List[ExtensionInfo]:
-        """Scan for command extensions."""
-        commands_dir = claude_dir / "commands"
-        if not commands_dir.exists():
-            return []
+    def _run_conversions(
+        self,
+        extensions: List[ExtensionInfo],
+        convert_one: Callable[[ExtensionInfo], Any],
+        kind: str,
+        result: ConversionResult,
+    ) -> List[Tuple[ExtensionInfo, Any]]:
+        """Convert extensions on the worker pool and record the outcome of each.
 
-        extensions = []
-        for cmd_file in commands_dir.rglob("*.md"):
-            try:
-                validation_result = self.commands_validator.validate_single(cmd_file)
-
-                ext_info = ExtensionInfo(
-                    path=cmd_file,
-                    extension_type="commands",
-                    name=cmd_file.stem,
-                    metadata=validation_result.metadata,
-                    validation_errors=validation_result.errors,
-                    is_valid=validation_result.is_valid,
-                )
-                extensions.append(ext_info)
+        Args:
+            extensions: Extensions to convert
+            convert_one: Converts one extension and returns its converted data
+            kind: Extension kind used in messages (e.g. "hook")
+            result: Conversion result to record converted and skipped extensions in
 
-            except Exception as e:
-                logger.warning(f"Failed to validate command {cmd_file}: {e}")
+        Returns:
+            List of (extension, converted data) tuples in input order
+        """
+        valid_extensions = []
+        for ext in extensions:
+            if ext.is_valid:
+                valid_extensions.append(ext)
+            else:
+                result.skipped_extensions.append(ext)
+                result.warnings.append(f"Skipped invalid {kind}: {ext.name}")
 
-        return extensions
+        def attempt(ext: ExtensionInfo) -> Tuple[ExtensionInfo, Any, Optional[Exception]]:
+            try:
+                return ext, convert_one(ext), None
+            except Exception as e:
+                return ext, None, e
 
-    def _scan_mcp(self, claude_dir: Path) -> List[ExtensionInfo]:
-        """Scan for MCP extensions."""
-        mcp_dir = claude_dir / "mcp"
-        if not mcp_dir.exists():
-            return []
+        converted = []
+        for ext, data, error in self._map(attempt, valid_extensions):
+            if error is None:
+                result.converted_extensions.append(ext)
+                converted.append((ext, data))
+            else:
+                result.errors.append(f"Failed to convert {kind} {ext.name}: {error}")
+                result.skipped_extensions.append(ext)
 
-        extensions = []
-        for mcp_file in mcp_dir.glob("*.json"):
-            try:
-                validation_result = self.mcp_validator.validate_single(mcp_file)
-
-                ext_info = ExtensionInfo(
-                    path=mcp_file,
-                    extension_type="mcp",
-                    name=mcp_file.stem,
-                    metadata=validation_result.metadata,
-                    validation_errors=validation_result.errors,
-                    is_valid=validation_result.is_valid,
-                )
-                extensions.append(ext_info)
+        return converted
 
-            except Exception as e:
-                logger.warning(f"Failed to validate MCP {mcp_file}: {e}")
+    def _load_json(self, ext: ExtensionInfo) -> Any:
+        """Read a JSON extension file."""
+        with open(ext.path, encoding="utf-8") as f:
+            return json.load(f)
 
-        return extensions
+    def _copy_with_plugin_paths(self, source_path: Path, target_path: Path) -> None:
+        """Copy a Markdown extension, rewriting .claude paths to plugin-relative ones."""
+        content = source_path.read_text(encoding="utf-8")
+        target_path.write_text(self._convert_paths_to_plugin_relative(content), encoding="utf-8")
 
     def _convert_hooks(
         self, extensions: List[ExtensionInfo], plugin_path: Path, result: ConversionResult
@@ -551,31 +561,15 @@ class PluginConverter:
         hooks_dir.mkdir(exist_ok=True)
 
         merged_hooks = {"hooks": []}
-        converted_count = 0
-
-        for ext in extensions:
-            if not ext.is_valid:
-                result.skipped_extensions.append(ext)
-                result.warnings.append(f"Skipped invalid hook: {ext.name}")
-                continue
-
-            try:
-                with open(ext.path, encoding="utf-8") as f:
-                    hook_data = json.load(f)
+        converted = self._run_conversions(extensions, self._load_json, "hook", result)
 
-                # Handle both single hook and hooks array formats
-                if "hooks" in hook_data:
-                    merged_hooks["hooks"].extend(hook_data["hooks"])
-                else:
-                    # Single hook format
-                    merged_hooks["hooks"].append(hook_data)
-
-                result.converted_extensions.append(ext)
-                converted_count += 1
-
-            except Exception as e:
-                result.errors.append(f"Failed to convert hook {ext.name}: {e}")
-                result.skipped_extensions.append(ext)
+        for _, hook_data in converted:
+            # Handle both single hook and hooks array formats
+            if "hooks" in hook_data:
+                merged_hooks["hooks"].extend(hook_data["hooks"])
+            else:
+                # Single hook format
+                merged_hooks["hooks"].append(hook_data)
 
         # Write merged hooks file
         if merged_hooks["hooks"]:
@@ -583,7 +577,7 @@ class PluginConverter:
             with open(hooks_file, "w", encoding="utf-8") as f:
                 json.dump(merged_hooks, f, indent=2, ensure_ascii=False)
 
-        return converted_count
+        return len(converted)
 
     def _convert_agents(
         self, extensions: List[ExtensionInfo], plugin_path: Path, result: ConversionResult
@@ -592,39 +586,30 @@ class PluginConverter:
         agents_dir = plugin_path / "agents"
         agents_dir.mkdir(exist_ok=True)
 
-        converted_count = 0
-
+        # Pick target filenames up front so naming conflicts resolve the same
+        # way regardless of which copy finishes first (keyed by identity since
+        # ExtensionInfo is unhashable)
+        targets: Dict[int, Path] = {}
+        taken = set()
         for ext in extensions:
             if not ext.is_valid:
-                result.skipped_extensions.append(ext)
-                result.warnings.append(f"Skipped invalid agent: {ext.name}")
                 continue
 
-            try:
-                # Determine target filename and handle conflicts
-                target_name = f"{ext.name}.md"
-                target_path = agents_dir / target_name
-
-                # Handle naming conflicts
-                counter = 1
-                while target_path.exists():
-                    target_name = f"{ext.name}_{counter}.md"
-                    target_path = agents_dir / target_name
-                    counter += 1
-
-                # Copy agent file with path conversion
-                content = ext.path.read_text(encoding="utf-8")
-                converted_content = self._convert_paths_to_plugin_relative(content)
-                target_path.write_text(converted_content, encoding="utf-8")
+            target_name = f"{ext.name}.md"
+            counter = 1
+            while target_name in taken or (agents_dir / target_name).exists():
+                target_name = f"{ext.name}_{counter}.md"
+                counter += 1
 
-                result.converted_extensions.append(ext)
-                converted_count += 1
+            taken.add(target_name)
+            targets[id(ext)] = agents_dir / target_name
 
-            except Exception as e:
-                result.errors.append(f"Failed to convert agent {ext.name}: {e}")
-                result.skipped_extensions.append(ext)
+        def copy_agent(ext: ExtensionInfo) -> Path:
+            target_path = targets[id(ext)]
+            self._copy_with_plugin_paths(ext.path, target_path)
+            return target_path
 
-        return converted_count
+        return len(self._run_conversions(extensions, copy_agent, "agent", result))
 
     def _convert_commands(
         self, extensions: List[ExtensionInfo], plugin_path: Path, result: ConversionResult
@@ -633,44 +618,26 @@ class PluginConverter:
         commands_dir = plugin_path / "commands"
         commands_dir.mkdir(exist_ok=True)
 
-        converted_count = 0
-
-        for ext in extensions:
-            if not ext.is_valid:
-                result.skipped_extensions.append(ext)
-                result.warnings.append(f"Skipped invalid command: {ext.name}")
-                continue
-
-            try:
-                # Preserve directory structure relative to commands directory
-                claude_commands_dir = ext.path.parent
-                while (
-                    claude_commands_dir.name != "commands"
-                    and claude_commands_dir.parent != claude_commands_dir
-                ):
-                    claude_commands_dir = claude_commands_dir.parent
-
-                if claude_commands_dir.name == "commands":
-                    rel_path = ext.path.relative_to(claude_commands_dir)
-                else:
-                    rel_path = ext.path.name
-
-                target_path = commands_dir / rel_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy command file with path conversion
-                content = ext.path.read_text(encoding="utf-8")
-                converted_content = self._convert_paths_to_plugin_relative(content)
-                target_path.write_text(converted_content, encoding="utf-8")
-
-                result.converted_extensions.append(ext)
-                converted_count += 1
+        def copy_command(ext: ExtensionInfo) -> Path:
+            # Preserve directory structure relative to commands directory
+            claude_commands_dir = ext.path.parent
+            while (
+                claude_commands_dir.name != "commands"
+                and claude_commands_dir.parent != claude_commands_dir
+            ):
+                claude_commands_dir = claude_commands_dir.parent
+
+            if claude_commands_dir.name == "commands":
+                rel_path = ext.path.relative_to(claude_commands_dir)
+            else:
+                rel_path = ext.path.name
 
-            except Exception as e:
-                result.errors.append(f"Failed to convert command {ext.name}: {e}")
-                result.skipped_extensions.append(ext)
+            target_path = commands_dir / rel_path
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._copy_with_plugin_paths(ext.path, target_path)
+            return target_path
 
-        return converted_count
+        return len(self._run_conversions(extensions, copy_command, "command", result))
 
     def _convert_mcp(
         self, extensions: List[ExtensionInfo], plugin_path: Path, result: ConversionResult
@@ -680,28 +647,12 @@ class PluginConverter:
         mcp_dir.mkdir(exist_ok=True)
 
         merged_config = {"mcpServers": {}}
-        converted_count = 0
-
-        for ext in extensions:
-            if not ext.is_valid:
-                result.skipped_extensions.append(ext)
-                result.warnings.append(f"Skipped invalid MCP config: {ext.name}")
-                continue
+        converted = self._run_conversions(extensions, self._load_json, "MCP config", result)
 
-            try:
-                with open(ext.path, encoding="utf-8") as f:
-                    mcp_data = json.load(f)
-
-                # Merge MCP server configurations
-                if "mcpServers" in mcp_data:
-                    merged_config["mcpServers"].update(mcp_data["mcpServers"])
-
-                result.converted_extensions.append(ext)
-                converted_count += 1
-
-            except Exception as e:
-                result.errors.append(f"Failed to convert MCP config {ext.name}: {e}")
-                result.skipped_extensions.append(ext)
+        for _, mcp_data in converted:
+            # Merge MCP server configurations
+            if "mcpServers" in mcp_data:
+                merged_config["mcpServers"].update(mcp_data["mcpServers"])
 
         # Write merged MCP config
         if merged_config["mcpServers"]:
@@ -709,7 +660,7 @@ class PluginConverter:
             with open(config_file, "w", encoding="utf-8") as f:
                 json.dump(merged_config, f, indent=2, ensure_ascii=False)
 
-        return converted_count
+        return len(converted)
 
     def _convert_paths_to_plugin_relative(self, content: str) -> str:
         """Convert absolute .claude paths to plugin-relative paths."""
@@ -791,10 +742,15 @@ class PluginMetadata:
 class ExtensionToPluginConverter:
     """CLI-compatible converter interface."""
 
-    def __init__(self, output_dir: Optional[Path] = None):
-        """Initialize converter."""
+    def __init__(self, output_dir: Optional[Path] = None, max_workers: Optional[int] = None):
+        """Initialize converter.
+
+        Args:
+            output_dir: Directory to create plugins in
+            max_workers: Maximum number of threads used to validate and copy extensions
+        """
         self.output_dir = output_dir or Path.cwd()
-        self.converter = PluginConverter()
+        self.converter = PluginConverter(max_workers=max_workers)
 
     def convert_extension(
         self,
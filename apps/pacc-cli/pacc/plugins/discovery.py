@@ -7,8 +7,9 @@ repositories following Claude Code plugin conventions.
 import json
 import logging
 import re
+import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -20,7 +21,71 @@ from ..validation.formats import JSONValidator
 
 logger = logging.getLogger(__name__)
 
+# Metadata strings up to this length are interned; authors, categories and tags
+# repeat across thousands of fragments in large shared repositories.
+_INTERN_MAX_LENGTH = 256
 
+
+def _add_slots(cls=None, *, compact_paths: Tuple[str, ...] = ()):
+    """Rebuild a dataclass with ``__slots__`` (``dataclass(slots=True)`` for Python < 3.10).
+
+    Discovery creates one record per plugin and fragment, so dropping the
+    per-instance ``__dict__`` noticeably reduces memory for large repositories.
+    Fields named in ``compact_paths`` are stored as plain strings and
+    materialized as ``Path`` objects on access.
+    """
+
+    def wrap(cls):
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = tuple(
+            f"_{name}" if name in compact_paths else name for name in field_names
+        )
+        for name in field_names:
+            # Class-level defaults would conflict with the slot descriptors
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        for name in compact_paths:
+            cls_dict[name] = _compact_path_property(f"_{name}")
+
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    return wrap if cls is None else wrap(cls)
+
+
+def _compact_path_property(slot: str) -> property:
+    """Create a property that keeps a path as ``str`` in ``slot``."""
+
+    def getter(self) -> Path:
+        return Path(getattr(self, slot))
+
+    def setter(self, value: Union[str, Path]) -> None:
+        setattr(self, slot, str(value))
+
+    return property(getter, setter)
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern short strings so repeated values share one object."""
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _intern_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern repeated string values and string lists in a metadata dict in place."""
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            metadata[key] = [_intern_str(item) for item in value]
+        else:
+            metadata[key] = _intern_str(value)
+    return metadata
+
+
+@_add_slots
 @dataclass
 class PluginInfo:
     """Information about a discovered plugin."""
@@ -95,6 +160,7 @@ class PluginInfo:
         return namespaced
 
 
+@_add_slots(compact_paths=("path",))
 @dataclass
 class FragmentInfo:
     """Information about a discovered memory fragment."""
@@ -119,6 +185,7 @@ class FragmentInfo:
         return self.metadata.get("has_frontmatter", False)
 
 
+@_add_slots(compact_paths=("path",))
 @dataclass
 class FragmentCollectionInfo:
     """Information about a collection of memory fragments."""
@@ -169,6 +236,7 @@ class FragmentCollectionInfo:
         return collection_name in self.dependencies
 
 
+@_add_slots
 @dataclass
 class RepositoryInfo:
     """Information about a plugin repository."""
@@ -1159,7 +1227,7 @@ class PluginScanner:
             FragmentInfo object or None if creation failed
         """
         try:
-            fragment_info = FragmentInfo(name=fragment_path.stem, path=fragment_path)
+            fragment_info = FragmentInfo(name=_intern_str(fragment_path.stem), path=fragment_path)
 
             # Validate fragment if validator is available
             if self.fragment_validator:
@@ -1194,6 +1262,8 @@ class PluginScanner:
                 # Basic metadata extraction without validation
                 fragment_info.metadata = self._extract_basic_fragment_metadata(fragment_path)
 
+            _intern_metadata(fragment_info.metadata)
+
             logger.debug(f"Created fragment info: {fragment_info.name}")
             return fragment_info
 
@@ -1217,7 +1287,7 @@ class PluginScanner:
         try:
             # Find all .md files in the collection
             md_files = list(collection_path.glob("*.md"))
-            fragment_names = [f.stem for f in md_files]
+            fragment_names = [_intern_str(f.stem) for f in md_files]
 
             # Check for special files
             has_pacc_json = (collection_path / "pacc.json").exists()
@@ -1242,8 +1312,10 @@ class PluginScanner:
                     collection_info.version = collection_metadata.version
                     collection_info.description = collection_metadata.description
                     collection_info.author = collection_metadata.author
-                    collection_info.tags = collection_metadata.tags
-                    collection_info.dependencies = collection_metadata.dependencies
+                    collection_info.tags = [_intern_str(tag) for tag in collection_metadata.tags]
+                    collection_info.dependencies = [
+                        _intern_str(dep) for dep in collection_metadata.dependencies
+                    ]
                     collection_info.optional_files = collection_metadata.optional_files
                     collection_info.checksum = collection_metadata.checksum
 
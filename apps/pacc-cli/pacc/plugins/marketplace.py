@@ -5,17 +5,24 @@ including registry API clients, metadata caching, dependency resolution,
 and support for both public and private registries.
 """
 
-import hashlib
 import json
+import logging
+import operator
 import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Set
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
 
 class RegistryType(Enum):
     """Types of plugin registries."""
@@ -178,12 +185,19 @@ class PluginDependency:
     def is_satisfied_by(self, available_version: str) -> bool:
         """Check if an available version satisfies this dependency."""
         try:
-            available = SemanticVersion.parse(available_version)
-            # Only parse required version for non-range constraints
-            if self.constraint_type != DependencyConstraint.RANGE:
-                required = SemanticVersion.parse(self.version)
+            available = _parse_version(available_version)
+        except ValueError:
+            return False
+        return self.is_satisfied_by_semver(available)
+
+    def is_satisfied_by_semver(self, available: SemanticVersion) -> bool:
+        """Check if an already parsed version satisfies this dependency."""
+        try:
+            if self.constraint_type == DependencyConstraint.RANGE:
+                # Parse range format: ">=1.0.0,<2.0.0"
+                bounds = _parse_range(self.version)
             else:
-                required = None
+                required = _parse_version(self.version)
         except ValueError:
             return False
 
@@ -196,43 +210,40 @@ class PluginDependency:
         elif self.constraint_type == DependencyConstraint.COMPATIBLE:
             return available.is_compatible_with(required) and available >= required
         elif self.constraint_type == DependencyConstraint.RANGE:
-            # Parse range format: ">=1.0.0,<2.0.0"
-            parts = self.version.split(",")
-            satisfies_all = True
+            return all(compare(available, bound) for compare, bound in bounds)
 
-            for part in parts:
-                part = part.strip()
-                if not part:  # Skip empty parts
-                    continue
+        return False
 
-                try:
-                    if part.startswith(">="):
-                        min_version = SemanticVersion.parse(part[2:].strip())
-                        if available < min_version:
-                            satisfies_all = False
-                            break
-                    elif part.startswith("<="):
-                        max_version = SemanticVersion.parse(part[2:].strip())
-                        if available > max_version:
-                            satisfies_all = False
-                            break
-                    elif part.startswith("<"):
-                        max_version = SemanticVersion.parse(part[1:].strip())
-                        if available >= max_version:
-                            satisfies_all = False
-                            break
-                    elif part.startswith(">"):
-                        min_version = SemanticVersion.parse(part[1:].strip())
-                        if available <= min_version:
-                            satisfies_all = False
-                            break
-                except ValueError:
-                    # Invalid version in constraint
-                    return False
 
-            return satisfies_all
+# Range operators, longest first so ">=" is not read as ">"
+_RANGE_OPERATORS = (
+    (">=", operator.ge),
+    ("<=", operator.le),
+    ("<", operator.lt),
+    (">", operator.gt),
+)
 
-        return False
+
+@lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> SemanticVersion:
+    """Parse a version string once per process.
+
+    The returned instance is shared between callers and must not be mutated.
+    """
+    return SemanticVersion.parse(version_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_range(range_str: str) -> Tuple[Tuple[Any, SemanticVersion], ...]:
+    """Parse a range constraint into (comparison, bound) pairs."""
+    bounds = []
+    for raw_part in range_str.split(","):
+        part = raw_part.strip()
+        for symbol, compare in _RANGE_OPERATORS:
+            if part.startswith(symbol):
+                bounds.append((compare, _parse_version(part[len(symbol) :].strip())))
+                break
+    return tuple(bounds)
 
 
 @dataclass
@@ -299,7 +310,10 @@ class PluginVersion:
         """Convert to dictionary for serialization."""
         data = asdict(self)
         data["released_at"] = self.released_at.isoformat()
-        data["dependencies"] = [dep.__dict__ for dep in self.dependencies]
+        data["dependencies"] = [
+            {**dep.__dict__, "constraint_type": dep.constraint_type.value}
+            for dep in self.dependencies
+        ]
         return data
 
 
@@ -447,16 +461,55 @@ class CacheEntry(NamedTuple):
 
 
 class MetadataCache:
-    """Cache system for plugin metadata with TTL support."""
-
-    def __init__(self, cache_dir: Optional[Path] = None, default_ttl: int = 3600):
-        """Initialize cache with optional directory and TTL."""
+    """Cache system for plugin metadata with TTL support.
+
+    Entries are packed into a single SQLite database indexed by registry,
+    endpoint, timestamp and last access, so expiry and per-registry
+    invalidation are indexed deletes rather than a scan of one file per key.
+    Total size is bounded with least-recently-used eviction, and a small
+    in-memory LRU keeps hot entries.
+    """
+
+    DB_FILENAME = "metadata_cache.db"
+    # Per-key files of the old cache were named by the MD5 of the key
+    LEGACY_FILE_PATTERN = re.compile(r"[0-9a-f]{32}\.json")
+    # Access times are written in batches of this size, or before eviction
+    ACCESS_FLUSH_THRESHOLD = 256
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        default_ttl: int = 3600,
+        max_entries: int = 50_000,
+        max_size_bytes: int = 100 * 1024 * 1024,
+        memory_entries: int = 256,
+    ):
+        """Initialize cache with optional directory and TTL.
+
+        Args:
+            cache_dir: Directory to store the cache database
+            default_ttl: Default time-to-live for entries in seconds
+            max_entries: Maximum number of entries kept on disk
+            max_size_bytes: Maximum total size of serialized entries
+            memory_entries: Number of recently used entries kept in memory
+        """
         if cache_dir is None:
             cache_dir = Path.home() / ".claude" / "pacc" / "cache" / "marketplace"
 
         self.cache_dir = cache_dir
         self.default_ttl = default_ttl
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.memory_entries = memory_entries
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self._memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Access times of cache hits not yet written to the database
+        self._pending_access: Dict[str, float] = {}
+        # Running (entry count, total size), loaded from the database on first write
+        self._totals: Optional[List[int]] = None
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -471,12 +524,7 @@ class MetadataCache:
             param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
             key_data += f"?{param_str}"
 
-        # Use hash for long keys
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def _get_cache_file(self, cache_key: str) -> Path:
-        """Get cache file path for key."""
-        return self.cache_dir / f"{cache_key}.json"
+        return key_data
 
     def get(
         self,
@@ -490,43 +538,48 @@ class MetadataCache:
         ttl = ttl or self.default_ttl
         current_time = time.time()
 
-        # Check memory cache first
-        if cache_key in self._memory_cache:
-            entry = self._memory_cache[cache_key]
-            if current_time - entry.timestamp < ttl:
-                return entry.data
-            else:
+        with self._lock:
+            # Check memory cache first
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None:
+                if current_time - entry.timestamp < ttl:
+                    self._memory_cache.move_to_end(cache_key)
+                    self._touch(cache_key, current_time)
+                    return entry.data
                 del self._memory_cache[cache_key]
 
-        # Check disk cache
-        cache_file = self._get_cache_file(cache_key)
-        if cache_file.exists():
+            # Check disk cache
             try:
-                with open(cache_file, encoding="utf-8") as f:
-                    cached_data = json.load(f)
+                row = (
+                    self._get_connection()
+                    .execute(
+                        "SELECT timestamp, etag, data FROM entries WHERE key = ?", (cache_key,)
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to read marketplace cache entry {cache_key}: {e}")
+                return None
 
-                timestamp = cached_data.get("timestamp", 0)
-                if current_time - timestamp < ttl:
-                    data = cached_data.get("data")
-                    etag = cached_data.get("etag")
+            if row is None:
+                return None
 
-                    # Update memory cache
-                    self._memory_cache[cache_key] = CacheEntry(
-                        timestamp, data, etag, registry_name, endpoint
-                    )
-                    return data
-                else:
-                    # Expired, remove file
-                    try:
-                        cache_file.unlink()
-                    except FileNotFoundError:
-                        pass
-            except (OSError, json.JSONDecodeError):
-                # Corrupted cache file, remove it
-                if cache_file.exists():
-                    cache_file.unlink()
+            timestamp, etag, payload = row
+            if current_time - timestamp >= ttl:
+                # Expired, remove entry
+                self._delete("key = ?", (cache_key,))
+                return None
 
-        return None
+            try:
+                data = json.loads(payload)
+            except json.JSONDecodeError:
+                # Corrupted entry, remove it
+                self._delete("key = ?", (cache_key,))
+                return None
+
+            self._remember(cache_key, CacheEntry(timestamp, data, etag, registry_name, endpoint))
+            self._touch(cache_key, current_time)
+            return data
 
     def set(
         self,
@@ -540,76 +593,563 @@ class MetadataCache:
         cache_key = self._get_cache_key(registry_name, endpoint, params)
         timestamp = time.time()
 
-        # Update memory cache
-        self._memory_cache[cache_key] = CacheEntry(timestamp, data, etag, registry_name, endpoint)
-
-        # Update disk cache
-        cache_file = self._get_cache_file(cache_key)
-        cache_data = {"timestamp": timestamp, "data": data, "etag": etag}
+        with self._lock:
+            # Update memory cache
+            self._remember(cache_key, CacheEntry(timestamp, data, etag, registry_name, endpoint))
 
-        try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
-        except OSError:
-            # Ignore cache write failures
-            pass
+            # Update disk cache
+            try:
+                payload = json.dumps(data, separators=(",", ":"))
+                connection = self._get_connection()
+                totals = self._get_totals()
+                previous = connection.execute(
+                    "SELECT size FROM entries WHERE key = ?", (cache_key,)
+                ).fetchone()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(key, registry, endpoint, timestamp, last_access, size, etag, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            cache_key,
+                            registry_name,
+                            endpoint,
+                            timestamp,
+                            timestamp,
+                            len(payload),
+                            etag,
+                            payload,
+                        ),
+                    )
+                if previous is None:
+                    totals[0] += 1
+                else:
+                    totals[1] -= previous[0]
+                totals[1] += len(payload)
+                self._evict()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                # Ignore cache write failures
+                logger.debug(f"Failed to write marketplace cache entry {cache_key}: {e}")
 
     def invalidate(self, registry_name: str, endpoint: str = "", params: Optional[Dict] = None):
         """Invalidate cached data."""
-        if endpoint:
-            # Invalidate specific endpoint
-            cache_key = self._get_cache_key(registry_name, endpoint, params)
-            if cache_key in self._memory_cache:
-                del self._memory_cache[cache_key]
+        with self._lock:
+            if endpoint:
+                # Invalidate specific endpoint
+                cache_key = self._get_cache_key(registry_name, endpoint, params)
+                self._memory_cache.pop(cache_key, None)
+                self._delete("key = ?", (cache_key,))
+            else:
+                # Invalidate all entries for registry
+                for key, entry in list(self._memory_cache.items()):
+                    if entry.registry_name == registry_name:
+                        del self._memory_cache[key]
+                self._delete("registry = ?", (registry_name,))
 
-            cache_file = self._get_cache_file(cache_key)
-            if cache_file.exists():
-                cache_file.unlink()
-        else:
-            # Invalidate all entries for registry
-            keys_to_remove = []
+    def clear_expired(self, ttl: Optional[int] = None) -> int:
+        """Clear all expired cache entries.
 
-            for key, entry in list(self._memory_cache.items()):
-                if entry.registry_name == registry_name:
-                    keys_to_remove.append(key)
+        Returns:
+            Number of entries removed from disk
+        """
+        ttl = ttl or self.default_ttl
+        cutoff = time.time() - ttl
 
-            for key in keys_to_remove:
+        with self._lock:
+            # Clear memory cache
+            for key in [k for k, entry in self._memory_cache.items() if entry.timestamp <= cutoff]:
                 del self._memory_cache[key]
 
-            # Remove corresponding disk cache files
-            for key in keys_to_remove:
-                cache_file = self._get_cache_file(key)
+            # Clear disk cache
+            return self._delete("timestamp <= ?", (cutoff,))
+
+    def close(self) -> None:
+        """Close the cache database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._flush_access()
+                self._connection.close()
+                self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the cache database, creating the schema on first use."""
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # Writes are frequent and small; WAL avoids a full sync per entry
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, "
+                    "registry TEXT NOT NULL, "
+                    "endpoint TEXT NOT NULL, "
+                    "timestamp REAL NOT NULL, "
+                    "last_access REAL NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "etag TEXT, "
+                    "data TEXT NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_entries_registry "
+                    "ON entries (registry, endpoint)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries (timestamp)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)"
+                )
+            self._connection = connection
+
+            # Remove per-key files written by older versions, leaving any other JSON alone
+            for cache_file in self.cache_dir.glob("*.json"):
+                if not self.LEGACY_FILE_PATTERN.fullmatch(cache_file.name):
+                    continue
                 try:
                     cache_file.unlink()
-                except FileNotFoundError:
+                except OSError:
                     pass
+        return self._connection
+
+    def _get_totals(self) -> List[int]:
+        """Get the running entry count and total size of stored entries."""
+        if self._totals is None:
+            count, size = (
+                self._get_connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")
+                .fetchone()
+            )
+            self._totals = [count, size]
+        return self._totals
 
-    def clear_expired(self, ttl: Optional[int] = None):
-        """Clear all expired cache entries."""
-        ttl = ttl or self.default_ttl
-        current_time = time.time()
+    def _delete(self, condition: str, params: tuple) -> int:
+        """Delete entries matching a condition and return how many were removed."""
+        try:
+            connection = self._get_connection()
+            with connection:
+                removed = connection.execute(f"DELETE FROM entries WHERE {condition}", params)
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to delete marketplace cache entries: {e}")
+            return 0
+
+        # Recount lazily on the next write
+        self._totals = None
+        return max(removed.rowcount, 0)
+
+    def _touch(self, cache_key: str, access_time: float) -> None:
+        """Record an access used for LRU eviction.
+
+        Cache hits stay reads: access times are kept in memory and written
+        in batches, before eviction, or when the cache is closed.
+        """
+        self._pending_access[cache_key] = access_time
+        if len(self._pending_access) >= self.ACCESS_FLUSH_THRESHOLD:
+            self._flush_access()
 
-        # Clear memory cache
-        keys_to_remove = [
-            key
-            for key, entry in self._memory_cache.items()
-            if current_time - entry.timestamp >= ttl
-        ]
-        for key in keys_to_remove:
-            del self._memory_cache[key]
+    def _flush_access(self) -> None:
+        """Write pending access times to the database."""
+        if not self._pending_access:
+            return
+        updates = [(access_time, key) for key, access_time in self._pending_access.items()]
+        self._pending_access.clear()
+        try:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany("UPDATE entries SET last_access = ? WHERE key = ?", updates)
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to record marketplace cache accesses: {e}")
+
+    def _remember(self, cache_key: str, entry: CacheEntry) -> None:
+        """Add an entry to the in-memory LRU."""
+        self._memory_cache[cache_key] = entry
+        self._memory_cache.move_to_end(cache_key)
+        while len(self._memory_cache) > self.memory_entries:
+            self._memory_cache.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries beyond the count and size limits."""
+        totals = self._get_totals()
+        excess_entries = totals[0] - self.max_entries
+        excess_bytes = totals[1] - self.max_size_bytes
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+
+        self._flush_access()
+        connection = self._get_connection()
+        evicted = []
+        cursor = connection.execute("SELECT key, size FROM entries ORDER BY last_access")
+        for key, size in cursor:
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            evicted.append((key,))
+            excess_entries -= 1
+            excess_bytes -= size
+            totals[0] -= 1
+            totals[1] -= size
+        cursor.close()
+
+        with connection:
+            connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        for (key,) in evicted:
+            self._memory_cache.pop(key, None)
 
-        # Clear disk cache
-        for cache_file in self.cache_dir.glob("*.json"):
+        logger.debug(f"Evicted {len(evicted)} marketplace cache entries")
+
+
+@dataclass
+class _ResolutionState:
+    """Lookups memoized for the duration of a single resolution."""
+
+    metadata: Dict[str, Optional[PluginMetadata]] = field(default_factory=dict)
+    candidates: Dict[str, List[Tuple[SemanticVersion, PluginVersion]]] = field(default_factory=dict)
+
+
+_CONSTRAINT_SYMBOLS = {
+    DependencyConstraint.EXACT: "==",
+    DependencyConstraint.MINIMUM: ">=",
+    DependencyConstraint.MAXIMUM: "<=",
+    DependencyConstraint.COMPATIBLE: "^",
+    DependencyConstraint.RANGE: "",
+}
+
+# Marks a plugin that has not been decided yet, as opposed to one left out (None)
+_UNASSIGNED = object()
+
+
+def _describe_requirement(dependency: PluginDependency) -> str:
+    """Render a dependency as e.g. 'lib >=1.0.0'."""
+    symbol = _CONSTRAINT_SYMBOLS[dependency.constraint_type]
+    return f"{dependency.full_name} {symbol}{dependency.version}"
+
+
+@dataclass
+class _Candidate:
+    """A version the solver may choose for a plugin."""
+
+    # None means the plugin is left out, only offered when every requirement is optional
+    version: Optional[str]
+    semver: Optional[SemanticVersion]
+    dependencies: List[PluginDependency]
+
+
+@dataclass
+class _Decision:
+    """A plugin being decided, with its remaining candidates and conflict set."""
+
+    name: str
+    candidates: List[_Candidate]
+    index: int = 0
+    conflict: Set[str] = field(default_factory=set)
+    rejections: List[str] = field(default_factory=list)
+
+    @property
+    def chosen(self) -> _Candidate:
+        """The candidate currently assigned."""
+        return self.candidates[self.index - 1]
+
+
+class _VersionSolver:
+    """Backtracking version solver with conflict learning.
+
+    Plugins are decided in the order they are first required, newest version
+    first. When no version of a plugin fits, the decisions responsible are
+    recorded as an incompatibility (a combination of versions that can never
+    be part of a solution) and the search jumps straight back to the most
+    recent of them, skipping unrelated decisions in between. Learned
+    incompatibilities prune the rest of the search.
+    """
+
+    # Upper bound on candidate evaluations before giving up
+    MAX_ATTEMPTS = 100_000
+
+    def __init__(
+        self,
+        resolver: "DependencyResolver",
+        state: _ResolutionState,
+        installed_plugins: Dict[str, str],
+    ):
+        """Initialize solver.
+
+        Args:
+            resolver: Resolver used for memoized metadata lookups
+            state: Per-resolution lookup memo
+            installed_plugins: Installed plugin versions, which cannot be changed
+        """
+        self.resolver = resolver
+        self.state = state
+        self.installed_plugins = installed_plugins
+        self.assigned: Dict[str, Optional[str]] = {}
+        self.requirements: Dict[str, List[Tuple[str, PluginDependency]]] = {}
+        self.stack: List[_Decision] = []
+        self.incompatibilities: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        self.explanation: List[str] = []
+        self.failed: Optional[_Decision] = None
+        self.failed_constraints = ""
+        self.attempts = 0
+        self.root = ""
+        self._root_dependencies: List[PluginDependency] = []
+
+    def solve(self, plugin_name: str, plugin_version: PluginVersion) -> bool:
+        """Find versions for every plugin required by the root plugin.
+
+        Args:
+            plugin_name: Root plugin name
+            plugin_version: Root plugin version to install
+
+        Returns:
+            True if a solution was found
+        """
+        self.root = plugin_name
+        self._assign(
+            plugin_name,
+            _Candidate(
+                plugin_version.version,
+                _parse_version(plugin_version.version),
+                plugin_version.dependencies,
+            ),
+        )
+
+        while True:
+            name = self._next_plugin()
+            if name is None:
+                return True
+
+            decision = _Decision(name, self._candidates(name))
+            self.stack.append(decision)
+
+            while not self._advance(decision):
+                decision = self._backjump(decision)
+                if decision is None:
+                    return False
+
+    @property
+    def solution(self) -> Dict[str, str]:
+        """Chosen version of each plugin, root first, in decision order."""
+        return {name: version for name, version in self.assigned.items() if version is not None}
+
+    @property
+    def decisions(self) -> List[_Decision]:
+        """Decisions made, in order."""
+        return self.stack
+
+    def constraints_on(self, name: str) -> str:
+        """Comma-separated version constraints currently placed on a plugin."""
+        return ", ".join(dict.fromkeys(dep.version for _, dep in self.requirements.get(name, [])))
+
+    def find_cycles(self) -> List[List[str]]:
+        """Find cycles of required dependencies among the chosen versions."""
+        chosen = {self.root: self._root_dependencies}
+        chosen.update({decision.name: decision.chosen.dependencies for decision in self.stack})
+        edges = {
+            name: [
+                dep.full_name
+                for dep in dependencies
+                if not dep.optional and self.assigned.get(dep.full_name) is not None
+            ]
+            for name, dependencies in chosen.items()
+            if self.assigned.get(name) is not None
+        }
+
+        cycles = []
+        finished: Set[str] = set()
+        for start, targets in edges.items():
+            if start in finished:
+                continue
+            path = [start]
+            iterators = [iter(targets)]
+            while iterators:
+                target = next(iterators[-1], None)
+                if target is None:
+                    finished.add(path.pop())
+                    iterators.pop()
+                elif target in path:
+                    cycles.append([*path[path.index(target) :], target])
+                elif target not in finished and target in edges:
+                    path.append(target)
+                    iterators.append(iter(edges[target]))
+        return cycles
+
+    def _next_plugin(self) -> Optional[str]:
+        """First required plugin that has not been decided."""
+        for name in self.requirements:
+            if name not in self.assigned:
+                return name
+        return None
+
+    def _candidates(self, name: str) -> List[_Candidate]:
+        """Versions that may be chosen for a plugin, preferred first."""
+        if name in self.installed_plugins:
+            installed = self.installed_plugins[name]
             try:
-                with open(cache_file, encoding="utf-8") as f:
-                    cached_data = json.load(f)
+                semver = _parse_version(installed)
+            except ValueError:
+                semver = None
+            candidates = [_Candidate(installed, semver, [])]
+        else:
+            metadata = self.resolver._get_metadata(name, self.state)
+            candidates = [
+                _Candidate(plugin_version.version, semver, plugin_version.dependencies)
+                for semver, plugin_version in (
+                    self.resolver._get_candidates(metadata, self.state) if metadata else []
+                )
+            ]
 
-                timestamp = cached_data.get("timestamp", 0)
-                if current_time - timestamp >= ttl:
-                    cache_file.unlink()
-            except (OSError, json.JSONDecodeError):
-                # Remove corrupted files
-                cache_file.unlink()
+        if all(dep.optional for _, dep in self.requirements[name]):
+            candidates.append(_Candidate(None, None, []))
+        return candidates
+
+    def _advance(self, decision: _Decision) -> bool:
+        """Assign the next acceptable candidate of a decision.
+
+        Returns:
+            False if the decision has no acceptable candidates left
+        """
+        while decision.index < len(decision.candidates):
+            candidate = decision.candidates[decision.index]
+            decision.index += 1
+
+            self.attempts += 1
+            if self.attempts > self.MAX_ATTEMPTS:
+                raise RuntimeError(
+                    f"Dependency resolution aborted after {self.MAX_ATTEMPTS} attempts"
+                )
+
+            rejection = self._check(decision.name, candidate)
+            if rejection is None:
+                self._assign(decision.name, candidate)
+                return True
+
+            culprits, reason = rejection
+            decision.conflict |= culprits
+            decision.rejections.append(reason)
+
+        return False
+
+    def _check(self, name: str, candidate: _Candidate) -> Optional[Tuple[Set[str], str]]:
+        """Check a candidate against current decisions.
+
+        Returns:
+            None if acceptable, otherwise the plugins responsible and a reason
+        """
+        label = f"{name} {candidate.version}"
+
+        for source, dep in self.requirements[name]:
+            if candidate.version is None:
+                if not dep.optional:
+                    return {source}, f"{source} {self.assigned[source]} requires {name}"
+            elif candidate.semver is None or not dep.is_satisfied_by_semver(candidate.semver):
+                return (
+                    {source},
+                    f"{source} {self.assigned[source]} requires {_describe_requirement(dep)}, "
+                    f"excluding {label}",
+                )
+
+        for dep in candidate.dependencies:
+            chosen = self.assigned.get(dep.full_name, _UNASSIGNED)
+            if chosen is _UNASSIGNED:
+                continue
+            if chosen is None:
+                if not dep.optional:
+                    return (
+                        {dep.full_name},
+                        f"{label} requires {dep.full_name}, which was left out",
+                    )
+            elif not dep.is_satisfied_by(chosen):
+                return (
+                    {dep.full_name},
+                    f"{label} requires {_describe_requirement(dep)} "
+                    f"but {dep.full_name} {chosen} was selected",
+                )
+
+        for incompatibility in self.incompatibilities.get(name, []):
+            if incompatibility[name] == candidate.version and all(
+                self.assigned.get(other, _UNASSIGNED) == version
+                for other, version in incompatibility.items()
+                if other != name
+            ):
+                others = ", ".join(
+                    f"{other} {version}"
+                    for other, version in incompatibility.items()
+                    if other != name
+                )
+                return set(incompatibility) - {name}, f"{label} is incompatible with {others}"
+
+        return None
+
+    def _backjump(self, exhausted: _Decision) -> Optional[_Decision]:
+        """Learn why a decision failed and return to the most recent culprit.
+
+        Returns:
+            The decision to retry, or None if the root plugin cannot be satisfied
+        """
+        self.stack.pop()
+        constraints = self.constraints_on(exhausted.name)
+
+        # The plugin is only needed because of its required-by sources
+        culprits = set(exhausted.conflict)
+        culprits.update(
+            source for source, dep in self.requirements[exhausted.name] if not dep.optional
+        )
+        culprits.discard(exhausted.name)
+
+        self._learn(exhausted, culprits)
+
+        while self.stack and self.stack[-1].name not in culprits:
+            self._unassign(self.stack.pop())
+
+        if not self.stack:
+            self.failed = exhausted
+            self.failed_constraints = constraints
+            return None
+
+        decision = self.stack[-1]
+        decision.conflict |= culprits - {decision.name}
+        self._unassign(decision)
+        return decision
+
+    def _learn(self, exhausted: _Decision, culprits: Set[str]) -> None:
+        """Record the culprits' versions as an incompatibility."""
+        incompatibility = {name: self.assigned[name] for name in culprits}
+        for name in culprits:
+            self.incompatibilities.setdefault(name, []).append(incompatibility)
+
+        reasons = list(dict.fromkeys(exhausted.rejections))
+        if not reasons:
+            reasons = [f"{exhausted.name} is not available"]
+        elif len(reasons) > 5:
+            reasons = [*reasons[:5], f"and {len(reasons) - 5} more"]
+        self.explanation.append(f"No version of {exhausted.name} fits: {'; '.join(reasons)}")
+
+    def _assign(self, name: str, candidate: _Candidate) -> None:
+        """Choose a candidate and add its dependencies as requirements."""
+        self.assigned[name] = candidate.version
+        if name == self.root:
+            self._root_dependencies = candidate.dependencies
+
+        for dep in candidate.dependencies:
+            self.requirements.setdefault(dep.full_name, []).append((name, dep))
+
+        self.resolver._prefetch(
+            (
+                dep.full_name
+                for dep in candidate.dependencies
+                if dep.full_name not in self.installed_plugins
+            ),
+            self.state,
+        )
+
+    def _unassign(self, decision: _Decision) -> None:
+        """Undo the candidate currently chosen for a decision, if any."""
+        if decision.name not in self.assigned:
+            return
+
+        del self.assigned[decision.name]
+        for dep in decision.chosen.dependencies:
+            sources = self.requirements[dep.full_name]
+            sources.remove((decision.name, dep))
+            if not sources:
+                del self.requirements[dep.full_name]
 
 
 class DependencyResolver:
@@ -625,15 +1165,32 @@ class DependencyResolver:
         """
         Resolve dependencies for a plugin.
 
+        Versions are chosen by a backtracking solver, so a newer version picked
+        early is revisited if a plugin required later needs an older one.
+        Installed plugins are kept at their installed version. Optional
+        dependencies that cannot be satisfied are left out and reported as
+        conflicts without failing the resolution.
+
         Returns:
-            Dict with 'success', 'dependencies', 'conflicts', and 'messages' keys
+            Dict with 'success', 'dependencies', 'conflicts', and 'messages' keys,
+            plus 'solution' (plugin name to version, including the root and
+            installed plugins), 'cycles' and, on failure, 'explanation'
         """
         installed_plugins = installed_plugins or {}
-        result = {"success": True, "dependencies": [], "conflicts": [], "messages": []}
+        result = {
+            "success": True,
+            "dependencies": [],
+            "conflicts": [],
+            "messages": [],
+            "solution": {},
+            "cycles": [],
+            "explanation": [],
+        }
+        state = _ResolutionState()
 
         try:
             # Get plugin metadata
-            metadata = self.client.get_plugin_metadata(plugin_name)
+            metadata = self._get_metadata(plugin_name, state)
             if not metadata:
                 result["success"] = False
                 result["messages"].append(f"Plugin {plugin_name} not found in marketplace")
@@ -646,41 +1203,56 @@ class DependencyResolver:
                 result["messages"].append(f"Version {version} not found for plugin {plugin_name}")
                 return result
 
-            # Check each dependency
-            for dependency in plugin_version.dependencies:
-                dep_result = self._resolve_single_dependency(dependency, installed_plugins)
+            solver = _VersionSolver(self, state, installed_plugins)
+            if not solver.solve(plugin_name, plugin_version):
+                failed = solver.failed.name
+                conflict = {
+                    "dependency": failed,
+                    "required": solver.failed_constraints,
+                    "installed": installed_plugins.get(failed),
+                    "reason": self._unsatisfied_reason(
+                        failed, solver.failed_constraints, installed_plugins, state
+                    ),
+                }
+                result["success"] = False
+                result["conflicts"].append(conflict)
+                result["explanation"] = solver.explanation
+                result["messages"].append(f"Conflict with {failed}: {conflict['reason']}")
+                return result
 
-                if dep_result["status"] == "satisfied":
-                    result["messages"].append(
-                        f"Dependency {dependency.full_name} already satisfied"
-                    )
-                elif dep_result["status"] == "installable":
+            for decision in solver.decisions:
+                name = decision.name
+                chosen = solver.assigned[name]
+                constraints = solver.constraints_on(name)
+                if chosen is None:
+                    conflict = {
+                        "dependency": name,
+                        "required": constraints,
+                        "installed": installed_plugins.get(name),
+                        "reason": self._unsatisfied_reason(
+                            name, constraints, installed_plugins, state
+                        ),
+                    }
+                    result["conflicts"].append(conflict)
+                    result["messages"].append(f"Conflict with {name}: {conflict['reason']}")
+                elif name in installed_plugins:
+                    result["messages"].append(f"Dependency {name} already satisfied")
+                else:
+                    requirements = [dep for _, dep in solver.requirements[name]]
                     result["dependencies"].append(
                         {
-                            "name": dependency.full_name,
-                            "version": dep_result["version"],
-                            "constraint": dependency.version,
-                            "optional": dependency.optional,
+                            "name": name,
+                            "version": chosen,
+                            "constraint": constraints,
+                            "optional": all(dep.optional for dep in requirements),
                         }
                     )
-                    result["messages"].append(
-                        f"Will install {dependency.full_name} {dep_result['version']}"
-                    )
-                else:
-                    conflict = {
-                        "dependency": dependency.full_name,
-                        "required": dependency.version,
-                        "installed": dep_result.get("installed_version"),
-                        "reason": dep_result.get("reason", "Unknown conflict"),
-                    }
-                    result["conflicts"].append(conflict)
-
-                    if not dependency.optional:
-                        result["success"] = False
+                    result["messages"].append(f"Will install {name} {chosen}")
 
-                    result["messages"].append(
-                        f"Conflict with {dependency.full_name}: {conflict['reason']}"
-                    )
+            result["solution"] = solver.solution
+            result["cycles"] = solver.find_cycles()
+            for cycle in result["cycles"]:
+                result["messages"].append(f"Circular dependency detected: {' -> '.join(cycle)}")
 
         except Exception as e:
             result["success"] = False
@@ -688,91 +1260,138 @@ class DependencyResolver:
 
         return result
 
-    def _resolve_single_dependency(
-        self, dependency: PluginDependency, installed_plugins: Dict[str, str]
+    @staticmethod
+    def _unsatisfied_reason(
+        name: str,
+        constraints: str,
+        installed_plugins: Dict[str, str],
+        state: _ResolutionState,
+    ) -> str:
+        """Describe why no version of a plugin could be chosen."""
+        if name in installed_plugins:
+            installed_version = installed_plugins[name]
+            return f"Installed version {installed_version} doesn't satisfy constraint {constraints}"
+        if not state.metadata.get(name):
+            return f"Plugin {name} not found"
+        return f"No compatible version found for constraint {constraints}"
+
+    def check_circular_dependencies(
+        self, plugin_name: str, version: str, dependency_chain: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
-        """Resolve a single dependency."""
+        """Check for circular dependencies."""
+        chain = list(dependency_chain or [])
 
-        # Check if already installed
-        if dependency.full_name in installed_plugins:
-            installed_version = installed_plugins[dependency.full_name]
-            if dependency.is_satisfied_by(installed_version):
-                return {"status": "satisfied", "installed_version": installed_version}
+        try:
+            if plugin_name in chain:
+                cycle = [*chain, plugin_name]
             else:
+                state = _ResolutionState()
+                metadata = self._get_metadata(plugin_name, state)
+                if not metadata:
+                    return {"has_circular": False, "message": f"Plugin {plugin_name} not found"}
+                if not metadata.get_version(version):
+                    return {"has_circular": False, "message": f"Version {version} not found"}
+                cycle = self._find_cycle(plugin_name, version, chain, set(), state)
+
+            if cycle:
                 return {
-                    "status": "conflict",
-                    "installed_version": installed_version,
-                    "reason": f"Installed version {installed_version} doesn't satisfy constraint {dependency.version}",
+                    "has_circular": True,
+                    "chain": cycle,
+                    "message": f"Circular dependency detected: {' -> '.join(cycle)}",
                 }
 
-        # Find compatible version in marketplace
-        try:
-            metadata = self.client.get_plugin_metadata(dependency.full_name)
-            if not metadata:
-                return {"status": "not_found", "reason": f"Plugin {dependency.full_name} not found"}
+            return {"has_circular": False, "message": "No circular dependencies found"}
 
-            # Find latest compatible version
-            compatible_versions = []
-            for version in metadata.versions:
-                if not version.is_yanked and dependency.is_satisfied_by(version.version):
-                    compatible_versions.append(version)
+        except Exception as e:
+            return {
+                "has_circular": False,
+                "message": f"Error checking circular dependencies: {e!s}",
+            }
 
-            if not compatible_versions:
-                return {
-                    "status": "no_compatible_version",
-                    "reason": f"No compatible version found for constraint {dependency.version}",
-                }
+    def _find_cycle(
+        self,
+        plugin_name: str,
+        version: str,
+        chain: List[str],
+        acyclic: Set[Tuple[str, str]],
+        state: _ResolutionState,
+    ) -> Optional[List[str]]:
+        """Depth-first search for a cycle of required dependencies.
+
+        Args:
+            plugin_name: Plugin to expand
+            version: Version of the plugin to expand
+            chain: Plugins on the current path, extended and restored in place
+            acyclic: Plugin versions already fully explored without finding a cycle
+            state: Per-resolution lookup memo
 
-            # Sort and pick latest compatible version
-            compatible_versions.sort(key=lambda v: v.semantic_version, reverse=True)
-            latest_compatible = compatible_versions[0]
+        Returns:
+            The cycle as a list of plugin names, or None
+        """
+        metadata = self._get_metadata(plugin_name, state)
+        plugin_version = metadata.get_version(version) if metadata else None
+        if plugin_version is None:
+            return None
 
-            return {"status": "installable", "version": latest_compatible.version}
+        # Only check required dependencies
+        required = [dep.full_name for dep in plugin_version.dependencies if not dep.optional]
+        self._prefetch(required, state)
 
-        except Exception as e:
-            return {"status": "error", "reason": f"Error checking dependency: {e!s}"}
+        chain.append(plugin_name)
+        for dep_name in required:
+            if dep_name in chain:
+                return [*chain, dep_name]
 
-    def check_circular_dependencies(
-        self, plugin_name: str, version: str, dependency_chain: Optional[Set[str]] = None
-    ) -> Dict[str, Any]:
-        """Check for circular dependencies."""
-        dependency_chain = dependency_chain or set()
+            dep_metadata = state.metadata.get(dep_name)
+            if not dep_metadata or not dep_metadata.latest_version:
+                continue
 
-        if plugin_name in dependency_chain:
-            return {
-                "has_circular": True,
-                "chain": [*list(dependency_chain), plugin_name],
-                "message": f"Circular dependency detected: {' -> '.join(dependency_chain)} -> {plugin_name}",
-            }
+            dep_version = dep_metadata.latest_version.version
+            if (dep_name, dep_version) in acyclic:
+                continue
 
-        try:
-            metadata = self.client.get_plugin_metadata(plugin_name)
-            if not metadata:
-                return {"has_circular": False, "message": f"Plugin {plugin_name} not found"}
+            cycle = self._find_cycle(dep_name, dep_version, chain, acyclic, state)
+            if cycle:
+                return cycle
+        chain.pop()
 
-            plugin_version = metadata.get_version(version)
-            if not plugin_version:
-                return {"has_circular": False, "message": f"Version {version} not found"}
-
-            # Check each dependency recursively
-            new_chain = dependency_chain | {plugin_name}
-            for dependency in plugin_version.dependencies:
-                if not dependency.optional:  # Only check required dependencies
-                    dep_metadata = self.client.get_plugin_metadata(dependency.full_name)
-                    if dep_metadata and dep_metadata.latest_version:
-                        circular_check = self.check_circular_dependencies(
-                            dependency.full_name, dep_metadata.latest_version.version, new_chain
-                        )
-                        if circular_check["has_circular"]:
-                            return circular_check
+        acyclic.add((plugin_name, version))
+        return None
 
-            return {"has_circular": False, "message": "No circular dependencies found"}
+    def _prefetch(self, plugin_names: Iterable[str], state: _ResolutionState) -> None:
+        """Fetch metadata for plugins not yet in the memo, batched where supported."""
+        missing = [name for name in dict.fromkeys(plugin_names) if name not in state.metadata]
+        if not missing:
+            return
 
-        except Exception as e:
-            return {
-                "has_circular": False,
-                "message": f"Error checking circular dependencies: {e!s}",
-            }
+        if isinstance(self.client, MarketplaceClient):
+            state.metadata.update(self.client.get_many_plugin_metadata(missing))
+        else:
+            # Clients without batch lookups are queried one plugin at a time
+            for name in missing:
+                state.metadata[name] = self.client.get_plugin_metadata(name)
+
+    def _get_metadata(self, plugin_name: str, state: _ResolutionState) -> Optional[PluginMetadata]:
+        """Get plugin metadata through the per-resolution memo."""
+        if plugin_name not in state.metadata:
+            self._prefetch([plugin_name], state)
+        return state.metadata[plugin_name]
+
+    @staticmethod
+    def _get_candidates(
+        metadata: PluginMetadata, state: _ResolutionState
+    ) -> List[Tuple[SemanticVersion, PluginVersion]]:
+        """Get non-yanked versions of a plugin, parsed and sorted newest first."""
+        candidates = state.candidates.get(metadata.full_name)
+        if candidates is None:
+            candidates = [
+                (_parse_version(plugin_version.version), plugin_version)
+                for plugin_version in metadata.versions
+                if not plugin_version.is_yanked
+            ]
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            state.candidates[metadata.full_name] = candidates
+        return candidates
 
 
 class MarketplaceClient:
@@ -788,6 +1407,11 @@ class MarketplaceClient:
         self.cache = MetadataCache()
         self.dependency_resolver = DependencyResolver(self)
 
+        # Local registry used by the mock API, indexed by plugin name and
+        # keyed on the file's (mtime_ns, size) so it is parsed once per change
+        self.registry_file = Path(__file__).parent / "registry.json"
+        self._registry_index: Optional[Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = None
+
         # Load configuration
         self._load_config()
 
@@ -898,29 +1522,91 @@ class MarketplaceClient:
 
         return None
 
+    def get_many_plugin_metadata(
+        self, plugin_names: Iterable[str], registry_name: Optional[str] = None
+    ) -> Dict[str, Optional[PluginMetadata]]:
+        """Get metadata for several plugins in one pass over each registry.
+
+        Args:
+            plugin_names: Names of the plugins to look up
+            registry_name: Only search this registry
+
+        Returns:
+            Mapping of each requested name to its metadata, or None if not found
+        """
+        results: Dict[str, Optional[PluginMetadata]] = dict.fromkeys(plugin_names)
+        remaining = list(results)
+
+        registries_to_search = [registry_name] if registry_name else list(self.registries.keys())
+
+        for reg_name in registries_to_search:
+            if not remaining:
+                break
+            if reg_name not in self.registries or not self.registries[reg_name].enabled:
+                continue
+
+            not_found = []
+            for plugin_name in remaining:
+                # Check cache first
+                cached = self.cache.get(reg_name, f"plugins/{plugin_name}")
+                if cached:
+                    results[plugin_name] = self._dict_to_plugin_metadata(cached)
+                    continue
+
+                # For MVP, simulate API call by checking local registry.json
+                plugin_data = self._load_registry_index().get(plugin_name)
+                if plugin_data is None:
+                    not_found.append(plugin_name)
+                    continue
+
+                metadata = self._registry_to_plugin_metadata(plugin_data)
+                self.cache.set(reg_name, f"plugins/{plugin_name}", metadata.to_dict())
+                results[plugin_name] = metadata
+
+            remaining = not_found
+
+        return results
+
     def _mock_get_plugin_metadata(
         self, plugin_name: str, registry_name: str
     ) -> Optional[PluginMetadata]:
         """Mock implementation using local registry.json for MVP."""
         # This would be replaced with actual HTTP API calls in production
-        registry_file = Path(__file__).parent / "registry.json"
-
-        if not registry_file.exists():
+        plugin_data = self._load_registry_index().get(plugin_name)
+        if plugin_data is None:
             return None
 
+        # Convert registry data to PluginMetadata
+        return self._registry_to_plugin_metadata(plugin_data)
+
+    def _load_registry_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the local registry.json indexed by plugin name.
+
+        The parsed index is reused until the file's mtime or size changes.
+        """
         try:
-            with open(registry_file, encoding="utf-8") as f:
+            stat = self.registry_file.stat()
+        except OSError:
+            return {}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._registry_index is not None and self._registry_index[0] == signature:
+            return self._registry_index[1]
+
+        index: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.registry_file, encoding="utf-8") as f:
                 registry_data = json.load(f)
 
             for plugin_data in registry_data.get("plugins", []):
-                if plugin_data.get("name") == plugin_name:
-                    # Convert registry data to PluginMetadata
-                    return self._registry_to_plugin_metadata(plugin_data)
+                # First entry wins, matching a linear search of the file
+                index.setdefault(plugin_data.get("name"), plugin_data)
 
         except (OSError, json.JSONDecodeError):
             pass
 
-        return None
+        self._registry_index = (signature, index)
+        return index
 
     def _registry_to_plugin_metadata(self, plugin_data: Dict[str, Any]) -> PluginMetadata:
         """Convert registry data to PluginMetadata."""
@@ -933,7 +1619,10 @@ class MarketplaceClient:
             ),
             changelog=f"Version {version_str}",
             download_count=plugin_data.get("popularity_score", 0) * 10,  # Mock download count
-            dependencies=[],  # Would be parsed from actual plugin metadata
+            dependencies=[
+                self._dict_to_dependency(dep_data)
+                for dep_data in plugin_data.get("dependencies", [])
+            ],
         )
 
         return PluginMetadata(
@@ -956,16 +1645,10 @@ class MarketplaceClient:
         # Parse versions
         versions = []
         for version_data in data.get("versions", []):
-            dependencies = []
-            for dep_data in version_data.get("dependencies", []):
-                dep = PluginDependency(
-                    name=dep_data["name"],
-                    constraint_type=DependencyConstraint(dep_data["constraint_type"]),
-                    version=dep_data["version"],
-                    optional=dep_data.get("optional", False),
-                    namespace=dep_data.get("namespace"),
-                )
-                dependencies.append(dep)
+            dependencies = [
+                self._dict_to_dependency(dep_data)
+                for dep_data in version_data.get("dependencies", [])
+            ]
 
             version = PluginVersion(
                 version=version_data["version"],
@@ -1020,6 +1703,23 @@ class MarketplaceClient:
             reviews=reviews,
         )
 
+    @staticmethod
+    def _dict_to_dependency(dep_data: Dict[str, Any]) -> PluginDependency:
+        """Convert dictionary back to PluginDependency.
+
+        Registry entries may list a dependency by name alone; a missing
+        constraint means any version at or above the given one.
+        """
+        return PluginDependency(
+            name=dep_data["name"],
+            constraint_type=DependencyConstraint(
+                dep_data.get("constraint_type", DependencyConstraint.MINIMUM.value)
+            ),
+            version=dep_data.get("version", "0.0.0"),
+            optional=dep_data.get("optional", False),
+            namespace=dep_data.get("namespace"),
+        )
+
     def search_plugins(
         self,
         query: str = "",
@@ -1074,7 +1774,7 @@ class MarketplaceClient:
         offset: int,
     ) -> List[PluginMetadata]:
         """Mock search implementation for MVP."""
-        registry_file = Path(__file__).parent / "registry.json"
+        registry_file = self.registry_file
         results = []
 
         if not registry_file.exists():
@@ -21,6 +21,7 @@ from urllib.parse import urlparse
 from ..core.file_utils import FilePathValidator
 from ..errors.exceptions import PACCError, ValidationError
 from .config import PluginConfigManager
+from .worktrees import WorktreeManager
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,7 @@ class PluginRepositoryManager:
         self.plugins_dir = plugins_dir
         self.repos_dir = plugins_dir / "repos"
         self.config_manager = config_manager or PluginConfigManager(plugins_dir=plugins_dir)
+        self.worktrees = WorktreeManager(plugins_dir)
 
         self.path_validator = FilePathValidator()
         self._lock = threading.RLock()
@@ -255,6 +257,10 @@ class PluginRepositoryManager:
                 # Get current commit SHA before update
                 old_sha = self._get_current_commit_sha(repo_path)
 
+                # Worktrees are detached, so they follow their tracked branch instead
+                if self.worktrees.is_managed(repo_path):
+                    return self._update_worktree(repo_path, old_sha)
+
                 # Perform git pull --ff-only
                 cmd = ["git", "pull", "--ff-only"]
                 result = subprocess.run(
@@ -304,6 +310,108 @@ class PluginRepositoryManager:
                 logger.error(f"Update failed for {repo_path}: {e}")
                 return UpdateResult(success=False, error_message=f"Update failed: {e}")
 
+    def _update_worktree(self, repo_path: Path, old_sha: str) -> UpdateResult:
+        """Fast-forward a worktree-managed repository to its tracked branch.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+            old_sha: Commit of the active worktree
+
+        Returns:
+            UpdateResult with update status and details
+        """
+        branch = self.worktrees.tracked_branch(repo_path)
+        if branch is None:
+            return UpdateResult(
+                success=False,
+                error_message=(
+                    "Repository is pinned to a tag or commit. "
+                    "Change the pinned version to update it."
+                ),
+                old_sha=old_sha,
+            )
+
+        store = self.worktrees.store_path(repo_path)
+        result = subprocess.run(
+            ["git", "fetch", "--quiet", "origin"],
+            cwd=store,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=False,
+        )
+        if result.returncode != 0:
+            return UpdateResult(
+                success=False,
+                error_message=f"Git fetch failed: {result.stderr}",
+                old_sha=old_sha,
+            )
+
+        new_sha = None
+        for ref in (f"origin/{branch}", branch):
+            result = subprocess.run(
+                ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+                cwd=store,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                check=False,
+            )
+            if result.returncode == 0:
+                new_sha = result.stdout.strip()
+                break
+        if new_sha is None:
+            return UpdateResult(
+                success=False,
+                error_message=f"Tracked branch {branch} not found",
+                old_sha=old_sha,
+            )
+
+        if new_sha == old_sha:
+            return UpdateResult(
+                success=True, old_sha=old_sha, new_sha=new_sha, message="Already up to date."
+            )
+
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", old_sha, new_sha],
+            cwd=store,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
+        if result.returncode != 0:
+            return UpdateResult(
+                success=False,
+                error_message=(
+                    "Update failed due to merge conflict. "
+                    "Repository requires manual merge or rollback."
+                ),
+                old_sha=old_sha,
+            )
+
+        if not self.worktrees.activate(repo_path, new_sha):
+            return UpdateResult(
+                success=False,
+                error_message=f"Failed to activate worktree for {new_sha[:8]}",
+                old_sha=old_sha,
+            )
+
+        validation_result = self.validate_repository_structure(repo_path)
+        if not validation_result.is_valid:
+            logger.warning(
+                "Repository structure validation failed after update: "
+                f"{validation_result.error_message}"
+            )
+
+        return UpdateResult(
+            success=True,
+            had_changes=True,
+            old_sha=old_sha,
+            new_sha=new_sha,
+            message=f"Fast-forward {old_sha[:8]}..{new_sha[:8]} on {branch}",
+        )
+
     def rollback_plugin(self, repo_path: Path, commit_sha: str) -> bool:
         """Rollback plugin repository to specific commit.
 
@@ -330,6 +438,10 @@ class PluginRepositoryManager:
                     logger.error(f"Invalid commit SHA {commit_sha}: {result.stderr}")
                     return False
 
+                # Worktree layouts roll back by pointing at the old commit's worktree
+                if self.worktrees.is_managed(repo_path):
+                    return self.worktrees.activate(repo_path, commit_sha)
+
                 # Perform hard reset to target commit
                 cmd = ["git", "reset", "--hard", commit_sha]
                 result = subprocess.run(
@@ -1,6 +1,8 @@
 """Plugin search and discovery functionality for PACC."""
 
 import json
+import logging
+import os
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
@@ -8,7 +10,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from .config import PluginConfigManager
-from .discovery import PluginScanner
+from .discovery import PluginScanner, RepositoryInfo
+
+logger = logging.getLogger(__name__)
 
 
 class SearchPluginType(Enum):
@@ -235,72 +239,265 @@ class PluginRegistry:
 
 
 class LocalPluginIndex:
-    """Manages indexing of locally installed plugins."""
+    """Manages indexing of locally installed plugins.
+
+    Scan results are persisted to ``search_index.json`` in the plugins
+    directory, keyed by repository path and current commit. A repository is
+    only rescanned when its commit changes or when one of the directories and
+    manifests recorded during the previous scan has a different mtime.
+    """
 
-    def __init__(self, config_manager: Optional[PluginConfigManager] = None):
-        """Initialize with optional config manager."""
+    INDEX_FILENAME = "search_index.json"
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        config_manager: Optional[PluginConfigManager] = None,
+        index_path: Optional[Path] = None,
+    ):
+        """Initialize with optional config manager and index file location."""
         self.config_manager = config_manager or PluginConfigManager()
         self.scanner = PluginScanner()
+        self.index_path = index_path
+        self._index: Optional[Dict[str, Any]] = None
 
-    def get_installed_plugins(self) -> List[SearchResult]:
-        """Get all locally installed plugins."""
+    def get_installed_plugins(self, force_refresh: bool = False) -> List[SearchResult]:
+        """Get all locally installed plugins.
+
+        Args:
+            force_refresh: Rescan every repository regardless of fingerprints
+
+        Returns:
+            List of search results for installed plugins
+        """
         results = []
 
         try:
             # Get installed plugins from config
             config = self.config_manager.load_config()
             enabled_plugins = self.config_manager.get_enabled_plugins()
+            repositories = config.get("repositories", {})
 
-            # Scan each repository
-            for _repo_key, repo_info in config.get("repositories", {}).items():
-                repo_path = Path(repo_info.get("path", ""))
-                if not repo_path.exists():
-                    continue
+            index = self._load_index()
+            entries = index["repositories"]
+            index_changed = False
+
+            # Drop entries for repositories that are no longer installed
+            for stale_key in set(entries) - set(repositories):
+                del entries[stale_key]
+                index_changed = True
 
-                try:
-                    # Discover plugins in this repository
-                    plugins = self.scanner.scan_repository(repo_path)
-
-                    for plugin in plugins:
-                        # Extract description from manifest
-                        description = (
-                            plugin.manifest.get("description", "") if plugin.manifest else ""
-                        )
-
-                        # Extract namespace from plugin name (if it contains colons)
-                        namespace = None
-                        if ":" in plugin.name:
-                            parts = plugin.name.split(":")
-                            if len(parts) >= 2:
-                                namespace = parts[0]
-
-                        # Convert to SearchResult
-                        result = SearchResult(
-                            name=plugin.name,
-                            description=description,
-                            plugin_type=self._plugin_type_from_components(plugin.components),
-                            repository_url=repo_info.get("url", ""),
-                            author=repo_info.get("owner", ""),
-                            version=repo_info.get("current_commit", "")[:8]
-                            if repo_info.get("current_commit")
-                            else "unknown",
-                            last_updated=repo_info.get("last_updated"),
-                            installed=True,
-                            enabled=plugin.name in enabled_plugins,
-                            namespace=namespace,
-                        )
-                        results.append(result)
-
-                except Exception:
-                    # Skip repositories that can't be scanned
+            for repo_key, repo_info in repositories.items():
+                repo_path = self._get_repo_path(repo_key, repo_info)
+                if repo_path is None or not repo_path.exists():
                     continue
 
+                commit = self._get_repo_commit(repo_info)
+                entry = entries.get(repo_key)
+
+                if force_refresh or not self._is_entry_fresh(entry, repo_path, commit):
+                    try:
+                        entry = self._build_entry(repo_path, commit)
+                    except Exception as e:
+                        # Skip repositories that can't be scanned
+                        logger.debug(f"Failed to index repository {repo_key}: {e}")
+                        entries.pop(repo_key, None)
+                        continue
+
+                    if entry["fingerprint"] is None:
+                        entries.pop(repo_key, None)
+                    else:
+                        entries[repo_key] = entry
+                    index_changed = True
+                else:
+                    logger.debug(f"Using indexed plugins for {repo_key}")
+
+                for plugin_data in entry["plugins"]:
+                    results.append(
+                        self._make_result(plugin_data, repo_info, commit, enabled_plugins)
+                    )
+
+            if index_changed:
+                self._save_index(index)
+
         except Exception:
             # Return empty list on any major error
             pass
 
         return results
 
+    def invalidate(self, repo_key: Optional[str] = None) -> None:
+        """Drop indexed scan results.
+
+        Args:
+            repo_key: Repository to invalidate, or None to clear the whole index
+        """
+        index = self._load_index()
+        if repo_key is None:
+            index["repositories"].clear()
+        else:
+            index["repositories"].pop(repo_key, None)
+        self._save_index(index)
+
+    def _get_index_path(self) -> Optional[Path]:
+        """Get the location of the persisted index."""
+        if self.index_path is not None:
+            return self.index_path
+
+        plugins_dir = getattr(self.config_manager, "plugins_dir", None)
+        if isinstance(plugins_dir, Path):
+            return plugins_dir / self.INDEX_FILENAME
+        return None
+
+    def _load_index(self) -> Dict[str, Any]:
+        """Load the persisted index, once per instance."""
+        if self._index is not None:
+            return self._index
+
+        index = {"version": self.INDEX_VERSION, "repositories": {}}
+        index_path = self._get_index_path()
+
+        if index_path is not None and index_path.exists():
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == self.INDEX_VERSION and isinstance(
+                    data.get("repositories"), dict
+                ):
+                    index = data
+            except (OSError, json.JSONDecodeError, AttributeError) as e:
+                logger.debug(f"Ignoring unreadable plugin index {index_path}: {e}")
+
+        self._index = index
+        return index
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        """Persist the index, ignoring write failures."""
+        self._index = index
+        index_path = self._get_index_path()
+        if index_path is None:
+            return
+
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = index_path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            logger.debug(f"Failed to save plugin index {index_path}: {e}")
+
+    def _get_repo_path(self, repo_key: str, repo_info: Dict[str, Any]) -> Optional[Path]:
+        """Resolve the on-disk location of an installed repository."""
+        if repo_info.get("path"):
+            return Path(repo_info["path"])
+
+        repos_dir = getattr(self.config_manager, "repos_dir", None)
+        if isinstance(repos_dir, Path):
+            return repos_dir / repo_key
+        return None
+
+    def _get_repo_commit(self, repo_info: Dict[str, Any]) -> str:
+        """Get the recorded commit for a repository, if any."""
+        return repo_info.get("current_commit") or repo_info.get("commitSha") or ""
+
+    def _is_entry_fresh(
+        self, entry: Optional[Dict[str, Any]], repo_path: Path, commit: str
+    ) -> bool:
+        """Check whether an index entry still matches the repository on disk."""
+        if not entry:
+            return False
+        if entry.get("path") != str(repo_path) or entry.get("commit") != commit:
+            return False
+
+        fingerprint = entry.get("fingerprint")
+        if not fingerprint:
+            return False
+        return self._compute_fingerprint(list(fingerprint)) == fingerprint
+
+    def _build_entry(self, repo_path: Path, commit: str) -> Dict[str, Any]:
+        """Scan a repository and build its index entry."""
+        # The index fingerprint decides freshness; the scanner cache only checks the root mtime
+        repo_scan = self.scanner.scan_repository(repo_path, use_cache=False)
+        plugins = repo_scan.plugins if isinstance(repo_scan, RepositoryInfo) else repo_scan
+
+        plugin_entries = []
+        watched_paths = [
+            repo_path,
+            repo_path / "plugins",
+            repo_path / "src" / "plugins",
+        ]
+
+        for plugin in plugins:
+            # Extract description from manifest
+            description = plugin.manifest.get("description", "") if plugin.manifest else ""
+
+            # Extract namespace from plugin name (if it contains colons)
+            namespace = None
+            if ":" in plugin.name:
+                parts = plugin.name.split(":")
+                if len(parts) >= 2:
+                    namespace = parts[0]
+
+            plugin_entries.append(
+                {
+                    "name": plugin.name,
+                    "description": description,
+                    "plugin_type": self._plugin_type_from_components(plugin.components).value,
+                    "namespace": namespace,
+                }
+            )
+
+            plugin_path = Path(plugin.path)
+            watched_paths.append(plugin_path)
+            watched_paths.append(plugin_path / "plugin.json")
+            watched_paths.extend(plugin_path / component for component in plugin.components)
+
+        try:
+            fingerprint = self._compute_fingerprint(
+                list(dict.fromkeys(str(path) for path in watched_paths))
+            )
+        except OSError:
+            fingerprint = None
+
+        return {
+            "path": str(repo_path),
+            "commit": commit,
+            "fingerprint": fingerprint,
+            "plugins": plugin_entries,
+        }
+
+    def _compute_fingerprint(self, paths: List[str]) -> Dict[str, int]:
+        """Map each watched path to its mtime in nanoseconds (-1 if absent)."""
+        fingerprint = {}
+        for path in paths:
+            try:
+                fingerprint[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                fingerprint[path] = -1
+        return fingerprint
+
+    def _make_result(
+        self,
+        plugin_data: Dict[str, Any],
+        repo_info: Dict[str, Any],
+        commit: str,
+        enabled_plugins: Set[str],
+    ) -> SearchResult:
+        """Convert an index entry into a search result."""
+        return SearchResult(
+            name=plugin_data["name"],
+            description=plugin_data["description"],
+            plugin_type=SearchPluginType(plugin_data["plugin_type"]),
+            repository_url=repo_info.get("url", ""),
+            author=repo_info.get("owner", ""),
+            version=commit[:8] if commit else "unknown",
+            last_updated=repo_info.get("last_updated"),
+            installed=True,
+            enabled=plugin_data["name"] in enabled_plugins,
+            namespace=plugin_data["namespace"],
+        )
+
     def _plugin_type_from_components(self, components: Dict[str, Any]) -> SearchPluginType:
         """Determine plugin type from its components."""
         # Components is a dict mapping component type to list of paths
@@ -1,14 +1,18 @@
 """Plugin-specific security validation and scanning for PACC."""
 
+import hashlib
 import json
 import logging
+import os
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+from pacc.plugins.audit_store import SecurityAuditStore
 from pacc.security.security_measures import (
     FileContentScanner,
     InputSanitizer,
@@ -17,6 +21,8 @@ from pacc.security.security_measures import (
     ThreatLevel,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class PluginSecurityLevel(Enum):
     """Security levels for plugin operations."""
@@ -56,6 +62,7 @@ class SecurityAuditEntry:
     risk_score: int
     action_taken: str
     user_confirmed: bool = False
+    cached_files: List[str] = field(default_factory=list)
 
 
 class AdvancedCommandScanner:
@@ -360,36 +367,42 @@ class PluginManifestValidator:
         issues = []
 
         # Validate required fields
-        for field, expected_type in self.required_fields.items():
-            if field not in manifest_data:
+        for field_name, expected_type in self.required_fields.items():
+            if field_name not in manifest_data:
                 issues.append(
                     SecurityIssue(
                         threat_level=ThreatLevel.HIGH,
                         issue_type="missing_required_field",
-                        description=f"Required field '{field}' is missing from manifest",
-                        recommendation=f"Add '{field}' field to the plugin manifest.",
+                        description=f"Required field '{field_name}' is missing from manifest",
+                        recommendation=f"Add '{field_name}' field to the plugin manifest.",
                     )
                 )
-            elif not isinstance(manifest_data[field], expected_type):
+            elif not isinstance(manifest_data[field_name], expected_type):
                 issues.append(
                     SecurityIssue(
                         threat_level=ThreatLevel.MEDIUM,
                         issue_type="invalid_field_type",
-                        description=f"Field '{field}' must be of type {expected_type.__name__}",
-                        recommendation=f"Change '{field}' to {expected_type.__name__} type.",
+                        description=(
+                            f"Field '{field_name}' must be of type {expected_type.__name__}"
+                        ),
+                        recommendation=f"Change '{field_name}' to {expected_type.__name__} type.",
                     )
                 )
 
         # Validate optional fields
-        for field, expected_type in self.optional_fields.items():
-            if field in manifest_data:
-                if not isinstance(manifest_data[field], expected_type):
+        for field_name, expected_type in self.optional_fields.items():
+            if field_name in manifest_data:
+                if not isinstance(manifest_data[field_name], expected_type):
                     issues.append(
                         SecurityIssue(
                             threat_level=ThreatLevel.MEDIUM,
                             issue_type="invalid_field_type",
-                            description=f"Field '{field}' must be of type {expected_type.__name__}",
-                            recommendation=f"Change '{field}' to {expected_type.__name__} type.",
+                            description=(
+                                f"Field '{field_name}' must be of type {expected_type.__name__}"
+                            ),
+                            recommendation=(
+                                f"Change '{field_name}' to {expected_type.__name__} type."
+                            ),
                         )
                     )
 
@@ -720,14 +733,25 @@ class PermissionAnalyzer:
 class SecurityAuditLogger:
     """Logs security audit events and maintains audit trails."""
 
-    def __init__(self, log_file: Optional[Path] = None):
+    def __init__(
+        self,
+        log_file: Optional[Path] = None,
+        store: Optional[SecurityAuditStore] = None,
+        max_memory_entries: int = 1000,
+        max_log_bytes: int = 10 * 1024 * 1024,
+    ):
         """Initialize security audit logger.
 
         Args:
             log_file: Path to audit log file
+            store: Indexed audit store that keeps the full audit history
+            max_memory_entries: Number of recent entries kept in memory
+            max_log_bytes: Size at which the audit log file is rotated
         """
         self.log_file = log_file
-        self.audit_entries: List[SecurityAuditEntry] = []
+        self.store = store
+        self.max_log_bytes = max_log_bytes
+        self.audit_entries: Deque[SecurityAuditEntry] = deque(maxlen=max_memory_entries)
 
         # Set up logging
         self.logger = logging.getLogger("pacc.security")
@@ -746,6 +770,7 @@ class SecurityAuditLogger:
         action_taken: str,
         security_level: PluginSecurityLevel = PluginSecurityLevel.STANDARD,
         user_confirmed: bool = False,
+        cached_files: Optional[List[str]] = None,
     ) -> None:
         """Log a security audit event.
 
@@ -756,6 +781,7 @@ class SecurityAuditLogger:
             action_taken: Action taken based on security findings
             security_level: Security level used for validation
             user_confirmed: Whether user confirmed risky operations
+            cached_files: Files whose scan results were reused from the scan cache
         """
         # Calculate risk score
         risk_score = sum(self._get_risk_value(issue.threat_level) for issue in issues)
@@ -770,6 +796,7 @@ class SecurityAuditLogger:
             risk_score=risk_score,
             action_taken=action_taken,
             user_confirmed=user_confirmed,
+            cached_files=list(cached_files or []),
         )
 
         self.audit_entries.append(entry)
@@ -787,6 +814,9 @@ class SecurityAuditLogger:
         if self.log_file:
             self._write_audit_entry(entry)
 
+        if self.store is not None:
+            self._store_audit_entry(entry)
+
     def _get_risk_value(self, threat_level: ThreatLevel) -> int:
         """Get numeric risk value for threat level."""
         values = {
@@ -797,6 +827,21 @@ class SecurityAuditLogger:
         }
         return values.get(threat_level, 25)
 
+    @staticmethod
+    def _serialize_issues(issues: List[SecurityIssue]) -> List[Dict[str, Any]]:
+        """Convert issues to JSON-serializable dictionaries."""
+        return [
+            {
+                "threat_level": issue.threat_level.value,
+                "issue_type": issue.issue_type,
+                "description": issue.description,
+                "recommendation": issue.recommendation,
+                "file_path": issue.file_path,
+                "line_number": issue.line_number,
+            }
+            for issue in issues
+        ]
+
     def _write_audit_entry(self, entry: SecurityAuditEntry) -> None:
         """Write audit entry to log file."""
         try:
@@ -812,25 +857,44 @@ class SecurityAuditLogger:
                 "risk_score": entry.risk_score,
                 "action_taken": entry.action_taken,
                 "user_confirmed": entry.user_confirmed,
-                "issues": [
-                    {
-                        "threat_level": issue.threat_level.value,
-                        "issue_type": issue.issue_type,
-                        "description": issue.description,
-                        "recommendation": issue.recommendation,
-                        "file_path": issue.file_path,
-                        "line_number": issue.line_number,
-                    }
-                    for issue in entry.issues
-                ],
+                "cached_files": entry.cached_files,
+                "issues": self._serialize_issues(entry.issues),
             }
 
+            self._rotate_log_file()
             with open(self.log_file, "a") as f:
                 f.write(json.dumps(entry_dict) + "\n")
 
         except Exception as e:
             self.logger.error(f"Failed to write audit entry: {e}")
 
+    def _rotate_log_file(self) -> None:
+        """Move the audit log aside once it grows past max_log_bytes."""
+        try:
+            if self.log_file.stat().st_size < self.max_log_bytes:
+                return
+        except OSError:
+            return
+
+        os.replace(self.log_file, self.log_file.with_name(self.log_file.name + ".1"))
+
+    def _store_audit_entry(self, entry: SecurityAuditEntry) -> None:
+        """Record audit entry in the indexed audit store."""
+        try:
+            self.store.record(
+                timestamp=datetime.fromisoformat(entry.timestamp).timestamp(),
+                operation=entry.operation,
+                plugin_name=entry.plugin_name,
+                security_level=entry.security_level.value,
+                risk_score=entry.risk_score,
+                action_taken=entry.action_taken,
+                user_confirmed=entry.user_confirmed,
+                issues=self._serialize_issues(entry.issues),
+                cached_files=len(entry.cached_files),
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to store audit entry: {e}")
+
     def get_audit_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get audit summary for the last N days.
 
@@ -841,6 +905,16 @@ class SecurityAuditLogger:
             Audit summary dictionary
         """
         cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
+
+        # The store holds the full history; memory only has recent entries
+        if self.store is not None:
+            try:
+                summary = self.store.summarize(since=cutoff)
+                summary.pop("most_audited_plugins", None)
+                return summary
+            except Exception as e:
+                self.logger.error(f"Failed to read audit store: {e}")
+
         recent_entries = [
             entry
             for entry in self.audit_entries
@@ -872,6 +946,128 @@ class SecurityAuditLogger:
         return dict(sorted_issues[:10])
 
 
+class SecurityScanCache:
+    """Persistent store of file content scan results.
+
+    Results are keyed by the SHA-256 of the file content, the scanner ruleset
+    version and the security level, so unchanged files are not rescanned.
+    Issues are stored without their file path, which is filled in on lookup.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_path: Optional[Path] = None, max_entries: int = 20000):
+        """Initialize scan cache.
+
+        Args:
+            cache_path: Path to the JSON file holding cached results
+            max_entries: Maximum number of results kept; oldest are dropped first
+        """
+        self.cache_path = cache_path or (
+            Path.home() / ".claude" / "pacc" / "cache" / "security_scans.json"
+        )
+        self.max_entries = max_entries
+        self._entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._dirty = False
+
+    @staticmethod
+    def make_key(content_hash: str, ruleset_version: str, level: PluginSecurityLevel) -> str:
+        """Build the cache key for a scanned file."""
+        return f"{content_hash}:{ruleset_version}:{level.value}"
+
+    def get(self, key: str, file_path: Path) -> Optional[List[SecurityIssue]]:
+        """Look up cached scan results.
+
+        Args:
+            key: Cache key from make_key
+            file_path: Path to report on the returned issues
+
+        Returns:
+            Cached issues for the file, or None if not cached
+        """
+        entries = self._load()
+        stored = entries.get(key)
+        if stored is None:
+            return None
+
+        # Keep recently used results at the end so they survive pruning. The
+        # new order is only written out with the next change, so fully cached
+        # scans do not rewrite the file.
+        entries[key] = entries.pop(key)
+
+        return [
+            SecurityIssue(
+                threat_level=ThreatLevel(item["threat_level"]),
+                issue_type=item["issue_type"],
+                description=item["description"],
+                file_path=str(file_path),
+                line_number=item.get("line_number"),
+                recommendation=item.get("recommendation"),
+                cve_references=item.get("cve_references"),
+            )
+            for item in stored
+        ]
+
+    def put(self, key: str, issues: List[SecurityIssue]) -> None:
+        """Store scan results for a file.
+
+        Args:
+            key: Cache key from make_key
+            issues: Issues found when scanning the file
+        """
+        entries = self._load()
+        entries.pop(key, None)
+        entries[key] = [
+            {
+                "threat_level": issue.threat_level.value,
+                "issue_type": issue.issue_type,
+                "description": issue.description,
+                "line_number": issue.line_number,
+                "recommendation": issue.recommendation,
+                "cve_references": issue.cve_references,
+            }
+            for issue in issues
+        ]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write cached results to disk if they changed."""
+        if not self._dirty or self._entries is None:
+            return
+
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.CACHE_VERSION, "entries": self._entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not save security scan cache: {e}")
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load cached results from disk on first use."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == self.CACHE_VERSION:
+                    self._entries = dict(data.get("entries", {}))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug(f"Ignoring unreadable scan cache: {e}")
+        return self._entries
+
+
 class PluginSecurityManager:
     """Main security manager for plugin operations."""
 
@@ -879,12 +1075,16 @@ class PluginSecurityManager:
         self,
         security_level: PluginSecurityLevel = PluginSecurityLevel.STANDARD,
         audit_log_path: Optional[Path] = None,
+        scan_cache: Optional[SecurityScanCache] = None,
+        audit_store: Optional[SecurityAuditStore] = None,
     ):
         """Initialize plugin security manager.
 
         Args:
             security_level: Default security level for operations
             audit_log_path: Path to security audit log file
+            scan_cache: Store of previous content scan results
+            audit_store: Indexed store for audit history
         """
         self.security_level = security_level
 
@@ -892,12 +1092,15 @@ class PluginSecurityManager:
         self.command_scanner = AdvancedCommandScanner()
         self.manifest_validator = PluginManifestValidator()
         self.permission_analyzer = PermissionAnalyzer()
-        self.audit_logger = SecurityAuditLogger(audit_log_path)
+        self.audit_logger = SecurityAuditLogger(
+            audit_log_path, store=audit_store or SecurityAuditStore()
+        )
 
         # Legacy security components
         self.input_sanitizer = InputSanitizer()
         self.path_protector = PathTraversalProtector()
         self.content_scanner = FileContentScanner()
+        self.scan_cache = scan_cache or SecurityScanCache()
 
     def validate_plugin_security(
         self,
@@ -917,6 +1120,7 @@ class PluginSecurityManager:
         """
         level = security_level or self.security_level
         all_issues = []
+        cached_files: List[str] = []
 
         try:
             # 1. Path safety validation
@@ -938,13 +1142,12 @@ class PluginSecurityManager:
 
             # 3. Content security scanning
             if plugin_path.is_file():
-                content_issues = self.content_scanner.scan_file(plugin_path)
-                all_issues.extend(content_issues)
+                all_issues.extend(self._scan_file_content(plugin_path, level, cached_files))
             elif plugin_path.is_dir():
                 for file_path in plugin_path.rglob("*"):
                     if file_path.is_file():
-                        content_issues = self.content_scanner.scan_file(file_path)
-                        all_issues.extend(content_issues)
+                        all_issues.extend(self._scan_file_content(file_path, level, cached_files))
+            self.scan_cache.save()
 
             # 4. Plugin-type specific validation
             type_specific_issues = self._validate_by_plugin_type(plugin_path, plugin_type)
@@ -965,6 +1168,7 @@ class PluginSecurityManager:
                 issues=all_issues,
                 action_taken=action,
                 security_level=level,
+                cached_files=cached_files,
             )
 
             return is_safe, all_issues
@@ -984,10 +1188,37 @@ class PluginSecurityManager:
                 issues=all_issues,
                 action_taken="error",
                 security_level=level,
+                cached_files=cached_files,
             )
 
             return False, all_issues
 
+    def _scan_file_content(
+        self, file_path: Path, level: PluginSecurityLevel, cached_files: List[str]
+    ) -> List[SecurityIssue]:
+        """Scan one file, reusing the stored result when its content is unchanged."""
+        try:
+            if file_path.stat().st_size > self.content_scanner.max_file_size:
+                return self.content_scanner.scan_file(file_path)
+
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            # Let the scanner report the access problem
+            return self.content_scanner.scan_file(file_path)
+
+        key = self.scan_cache.make_key(
+            hashlib.sha256(data).hexdigest(), self.content_scanner.ruleset_version, level
+        )
+        cached = self.scan_cache.get(key, file_path)
+        if cached is not None:
+            cached_files.append(str(file_path))
+            return cached
+
+        issues = self.content_scanner.scan_bytes(data, file_path)
+        self.scan_cache.put(key, issues)
+        return issues
+
     def _validate_plugin_manifest(self, manifest_path: Path) -> List[SecurityIssue]:
         """Validate plugin manifest file."""
         issues = []
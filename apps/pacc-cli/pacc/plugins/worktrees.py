@@ -0,0 +1,268 @@
+"""Worktree-per-commit checkouts for pinned plugin repository versions."""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Git config key in the store recording the branch the active worktree follows
+TRACKING_KEY = "pacc.trackedBranch"
+
+
+class WorktreeManager:
+    """Keeps pinned commits of plugin repositories checked out side by side.
+
+    Layout below the plugins directory::
+
+        repos/owner/repo              symlink to the active worktree
+        store/owner/repo              the clone holding objects and refs
+        worktrees/owner/repo/<sha>    one detached worktree per commit
+
+    A plain clone in ``repos/`` is moved into ``store/`` the first time a
+    version is activated. Switching to a commit that already has a worktree
+    only replaces the symlink, so flipping between environment pins or
+    rolling back does not rewrite any files. Worktrees beyond
+    ``max_worktrees`` are removed, least recently activated first. Worktrees
+    are detached, so the branch a repository follows on update is recorded
+    in the store's git config.
+    """
+
+    def __init__(self, plugins_dir: Optional[Path] = None, max_worktrees: int = 4):
+        """Initialize worktree manager.
+
+        Args:
+            plugins_dir: Directory for plugin storage (default: ~/.claude/plugins)
+            max_worktrees: Number of worktrees kept per repository
+        """
+        if plugins_dir is None:
+            plugins_dir = Path.home() / ".claude" / "plugins"
+
+        self.plugins_dir = Path(os.path.abspath(plugins_dir))
+        self.repos_dir = self.plugins_dir / "repos"
+        self.store_dir = self.plugins_dir / "store"
+        self.worktrees_dir = self.plugins_dir / "worktrees"
+        self.max_worktrees = max(1, max_worktrees)
+        self._lock = threading.RLock()
+
+    def is_managed(self, repo_path: Path) -> bool:
+        """Check if a repository path points into a managed worktree.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+
+        Returns:
+            True if repo_path is a symlink to one of this manager's worktrees
+        """
+        if not repo_path.is_symlink():
+            return False
+        try:
+            Path(os.readlink(repo_path)).relative_to(self.worktrees_dir)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def store_path(self, repo_path: Path) -> Path:
+        """Get the clone backing a repository's worktrees.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+
+        Returns:
+            Path of the clone in ``store/``
+        """
+        owner, repo = self._repo_key(repo_path)
+        return self.store_dir / owner / repo
+
+    def list_worktrees(self, repo_path: Path) -> List[Path]:
+        """List a repository's materialized worktrees.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+
+        Returns:
+            Worktree paths, most recently activated first
+        """
+        owner, repo = self._repo_key(repo_path)
+        parent = self.worktrees_dir / owner / repo
+        if not parent.is_dir():
+            return []
+        worktrees = [path for path in parent.iterdir() if path.is_dir()]
+        return sorted(worktrees, key=lambda path: path.stat().st_mtime_ns, reverse=True)
+
+    def activate(self, repo_path: Path, commit: str, adopt: bool = True) -> bool:
+        """Point a repository at the worktree for a commit, creating it if needed.
+
+        If the worktree or the symlink cannot be created, an adopted clone is
+        moved back to ``repos/``, so the repository is left as it was.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+            commit: Commit SHA or any ref that resolves to a commit
+            adopt: Whether a plain clone may be moved into the worktree layout
+
+        Returns:
+            True if repo_path now shows the requested commit, False otherwise
+        """
+        with self._lock:
+            try:
+                owner, repo = self._repo_key(repo_path)
+            except ValueError as e:
+                logger.debug(str(e))
+                return False
+
+            if not repo_path.exists():
+                logger.error(f"Repository path does not exist: {repo_path}")
+                return False
+
+            sha = self._git_output(repo_path, "rev-parse", "--verify", f"{commit}^{{commit}}")
+            if sha is None:
+                logger.error(f"Cannot resolve {commit} in {owner}/{repo}")
+                return False
+
+            store = self.store_dir / owner / repo
+            adopted = False
+            if not repo_path.is_symlink():
+                if not adopt:
+                    return False
+                if store.exists() or not (repo_path / ".git").is_dir():
+                    logger.warning(f"Cannot move {repo_path} into the worktree layout")
+                    return False
+                store.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(repo_path, store)
+                adopted = True
+                logger.info(f"Moved {owner}/{repo} clone to {store}")
+
+            worktree = self.worktrees_dir / owner / repo / sha
+            try:
+                activated = self._ensure_worktree(store, worktree, sha)
+                if activated:
+                    self._point(repo_path, worktree)
+            except OSError as e:
+                logger.warning(f"Cannot activate worktree for {owner}/{repo}: {e}")
+                activated = False
+
+            if not activated:
+                if adopted:
+                    self._remove_worktree(store, worktree)
+                    os.replace(store, repo_path)
+                    logger.info(f"Moved {owner}/{repo} clone back to {repo_path}")
+                return False
+
+            os.utime(worktree)
+            logger.info(f"Activated {owner}/{repo} at {sha[:8]}")
+
+            self._evict(store, repo_path, keep=worktree)
+            return True
+
+    def track(self, repo_path: Path, branch: Optional[str]) -> None:
+        """Record the branch a managed repository follows on update.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+            branch: Branch name, ``HEAD`` for the branch checked out in the
+                store, or None if the repository is pinned to a tag or commit
+        """
+        store = self.store_path(repo_path)
+        if branch == "HEAD":
+            branch = self._git_output(store, "symbolic-ref", "--quiet", "--short", "HEAD")
+        if branch:
+            self._git_output(store, "config", "--local", TRACKING_KEY, branch)
+        else:
+            self._git_output(store, "config", "--local", "--unset", TRACKING_KEY)
+
+    def tracked_branch(self, repo_path: Path) -> Optional[str]:
+        """Get the branch a managed repository follows on update.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+
+        Returns:
+            Branch name, or None if the repository is pinned to a tag or commit
+        """
+        return self._git_output(self.store_path(repo_path), "config", "--local", TRACKING_KEY)
+
+    def remove_repository(self, repo_path: Path) -> None:
+        """Delete a managed repository with its clone and all worktrees.
+
+        Args:
+            repo_path: Path of the repository below ``repos/``
+        """
+        with self._lock:
+            owner, repo = self._repo_key(repo_path)
+            repo_path.unlink()
+            shutil.rmtree(self.worktrees_dir / owner / repo, ignore_errors=True)
+            shutil.rmtree(self.store_dir / owner / repo, ignore_errors=True)
+
+    def _repo_key(self, repo_path: Path) -> Tuple[str, str]:
+        """Get (owner, repo) for a path directly below ``repos/owner/``."""
+        parts = Path(os.path.abspath(repo_path)).relative_to(self.repos_dir).parts
+        if len(parts) != 2:
+            raise ValueError(f"{repo_path} is not a repository path under {self.repos_dir}")
+        return parts[0], parts[1]
+
+    def _ensure_worktree(self, store: Path, worktree: Path, sha: str) -> bool:
+        """Create the worktree for a commit, or check an existing one is intact."""
+        if worktree.is_dir():
+            head = self._git_output(worktree, "rev-parse", "HEAD")
+            status = self._git_output(worktree, "status", "--porcelain")
+            if head == sha and status == "":
+                return True
+            logger.warning(f"Recreating modified worktree {worktree}")
+            self._remove_worktree(store, worktree)
+
+        # Forget worktrees whose directories were deleted outside PACC
+        self._git_output(store, "worktree", "prune")
+        worktree.parent.mkdir(parents=True, exist_ok=True)
+        if self._git_output(store, "worktree", "add", "--detach", str(worktree), sha) is None:
+            logger.error(f"Failed to create worktree for {sha[:8]} in {store}")
+            return False
+        return True
+
+    def _point(self, repo_path: Path, worktree: Path) -> None:
+        """Atomically replace repo_path with a symlink to worktree."""
+        temp_link = repo_path.with_name(f".{repo_path.name}.{os.getpid()}.tmp")
+        if temp_link.is_symlink():
+            temp_link.unlink()
+        os.symlink(worktree, temp_link, target_is_directory=True)
+        try:
+            os.replace(temp_link, repo_path)
+        except OSError:
+            temp_link.unlink()
+            raise
+
+    def _evict(self, store: Path, repo_path: Path, keep: Path) -> None:
+        """Remove the least recently activated worktrees beyond the limit."""
+        worktrees = [path for path in self.list_worktrees(repo_path) if path != keep]
+        for worktree in worktrees[self.max_worktrees - 1 :]:
+            logger.debug(f"Evicting worktree {worktree}")
+            self._remove_worktree(store, worktree)
+
+    def _remove_worktree(self, store: Path, worktree: Path) -> None:
+        """Unregister and delete a worktree."""
+        if self._git_output(store, "worktree", "remove", "--force", str(worktree)) is None:
+            shutil.rmtree(worktree, ignore_errors=True)
+            self._git_output(store, "worktree", "prune")
+
+    def _git_output(self, cwd: Path, *args: str) -> Optional[str]:
+        """Run a git command and return its stripped stdout, or None on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"git {args[0]} failed in {cwd}: {e}")
+            return None
+        if result.returncode != 0:
+            logger.debug(f"git {args[0]} failed in {cwd}: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip()
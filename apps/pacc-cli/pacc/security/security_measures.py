@@ -10,8 +10,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from pacc.core.hashing import get_file_hasher
 from pacc.errors.exceptions import SecurityError
 
+# Version of the scanning logic in FileContentScanner. It is part of the
+# ruleset digest that keys stored scan results, so bump it whenever scan_file
+# or scan_bytes change what they report for the same rules (decoding, line
+# handling, threat levels, new checks).
+SCANNER_VERSION = 1
+
 
 class ThreatLevel(Enum):
     """Threat level enumeration for security issues."""
@@ -154,6 +161,125 @@ class PathTraversalProtector:
             ) from e
 
 
+_SCAN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Categories reported below HIGH severity
+_CATEGORY_THREAT_LEVELS = {
+    "file_operations": ThreatLevel.MEDIUM,
+    "network_operations": ThreatLevel.MEDIUM,
+}
+
+_SUSPICIOUS_ENCODINGS = [
+    re.compile(pattern)
+    for pattern in (
+        r"\\x[0-9a-fA-F]{2}",  # Hex encoding
+        r"\\u[0-9a-fA-F]{4}",  # Unicode encoding
+        r"%[0-9a-fA-F]{2}",  # URL encoding
+        r"&#\d+;",  # HTML entity encoding
+        r"&[a-zA-Z]+;",  # HTML named entities
+        r"\\[0-7]{3}",  # Octal encoding
+    )
+]
+
+# Every encoding pattern starts with one of these characters
+_ENCODING_TRIGGERS = ("\\", "%", "&")
+
+# Escapes that match a class of characters rather than a literal
+_CLASS_ESCAPES = frozenset("sSdDwWbB")
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """Find a lowercase substring that any match of ``pattern`` must contain.
+
+    Only simple patterns (literals, escapes, classes and quantifiers without
+    groups or alternation) are analysed; anything else returns None so the
+    pattern is always evaluated.
+    """
+    runs = []
+    current = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= len(pattern):
+                return None
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in _CLASS_ESCAPES:
+                runs.append(current)
+                current = ""
+            elif escaped.isalnum():
+                return None
+            else:
+                current += escaped
+            continue
+        if char in "([|":
+            return None
+        if char in "*?{":
+            # The preceding character is optional
+            runs.append(current[:-1])
+            current = ""
+            if char == "{":
+                close = pattern.find("}", i)
+                if close == -1:
+                    return None
+                i = close
+        elif char == "+":
+            runs.append(current)
+            current = ""
+        elif char in ".^$)":
+            runs.append(current)
+            current = ""
+        else:
+            current += char
+        i += 1
+    runs.append(current)
+
+    literal = max(runs, key=len)
+    if not literal or not literal.isascii():
+        return None
+    return literal.lower()
+
+
+class _CompiledPatternTable:
+    """Compiled sanitizer patterns tagged with their category and trigger literal."""
+
+    def __init__(self, suspicious_patterns: Dict[str, List[str]]):
+        self.rules = []
+        for category, patterns in suspicious_patterns.items():
+            threat_level = _CATEGORY_THREAT_LEVELS.get(category, ThreatLevel.HIGH)
+            label = category.replace("_", " ")
+            for pattern in patterns:
+                self.rules.append(
+                    (
+                        category,
+                        label,
+                        threat_level,
+                        re.compile(pattern, _SCAN_FLAGS),
+                        _required_literal(pattern),
+                    )
+                )
+
+
+# Compiled tables shared by all sanitizers using the same pattern set
+_PATTERN_TABLES: Dict[Tuple[Tuple[str, Tuple[str, ...]], ...], _CompiledPatternTable] = {}
+
+
+def _pattern_table_key(
+    suspicious_patterns: Dict[str, List[str]],
+) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    return tuple((category, tuple(patterns)) for category, patterns in suspicious_patterns.items())
+
+
+def _get_pattern_table(
+    key: Tuple[Tuple[str, Tuple[str, ...]], ...], suspicious_patterns: Dict[str, List[str]]
+) -> _CompiledPatternTable:
+    table = _PATTERN_TABLES.get(key)
+    if table is None:
+        table = _PATTERN_TABLES[key] = _CompiledPatternTable(suspicious_patterns)
+    return table
+
+
 class InputSanitizer:
     """Sanitizes various types of input to prevent injection attacks."""
 
@@ -226,6 +352,9 @@ class InputSanitizer:
             "url": 2000,
         }
 
+        self._pattern_key = _pattern_table_key(self.suspicious_patterns)
+        self._pattern_table = _get_pattern_table(self._pattern_key, self.suspicious_patterns)
+
     def scan_for_threats(self, content: str, content_type: str = "general") -> List[SecurityIssue]:
         """Scan content for security threats.
 
@@ -252,27 +381,31 @@ class InputSanitizer:
                 )
 
             # Scan for suspicious patterns
-            for category, patterns in self.suspicious_patterns.items():
-                for pattern in patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        line_number = content[: match.start()].count("\n") + 1
-
-                        threat_level = ThreatLevel.HIGH
-                        if category == "file_operations":
-                            threat_level = ThreatLevel.MEDIUM
-                        elif category == "network_operations":
-                            threat_level = ThreatLevel.MEDIUM
-
-                        issues.append(
-                            SecurityIssue(
-                                threat_level=threat_level,
-                                issue_type=f"suspicious_{category}",
-                                description=f"Dangerous {category.replace('_', ' ')}: {match.group()}",
-                                line_number=line_number,
-                                recommendation=f"Review {category.replace('_', ' ')} usage",
-                            )
+            table = self._get_pattern_table()
+
+            # Regex IGNORECASE also folds a few non-ASCII characters onto ASCII
+            # letters, so the literal prefilter is only exact for ASCII content
+            lowered = content.lower() if content.isascii() else None
+
+            for category, label, threat_level, regex, literal in table.rules:
+                if literal is not None and lowered is not None and literal not in lowered:
+                    continue
+
+                line_number = 1
+                line_pos = 0
+                for match in regex.finditer(content):
+                    line_number += content.count("\n", line_pos, match.start())
+                    line_pos = match.start()
+
+                    issues.append(
+                        SecurityIssue(
+                            threat_level=threat_level,
+                            issue_type=f"suspicious_{category}",
+                            description=f"Dangerous {label}: {match.group()}",
+                            line_number=line_number,
+                            recommendation=f"Review {label} usage",
                         )
+                    )
 
             # Check for encoded content that might hide malicious code
             if self._has_suspicious_encoding(content):
@@ -297,21 +430,22 @@ class InputSanitizer:
 
         return issues
 
+    def _get_pattern_table(self) -> _CompiledPatternTable:
+        """Return the compiled table, recompiling if the patterns were modified."""
+        key = _pattern_table_key(self.suspicious_patterns)
+        if key != self._pattern_key:
+            self._pattern_key = key
+            self._pattern_table = _get_pattern_table(key, self.suspicious_patterns)
+        return self._pattern_table
+
     def _has_suspicious_encoding(self, content: str) -> bool:
         """Check if content has suspicious encoding patterns."""
-        suspicious_encodings = [
-            r"\\x[0-9a-fA-F]{2}",  # Hex encoding
-            r"\\u[0-9a-fA-F]{4}",  # Unicode encoding
-            r"%[0-9a-fA-F]{2}",  # URL encoding
-            r"&#\d+;",  # HTML entity encoding
-            r"&[a-zA-Z]+;",  # HTML named entities
-            r"\\[0-7]{3}",  # Octal encoding
-        ]
+        if not any(trigger in content for trigger in _ENCODING_TRIGGERS):
+            return False
 
         encoded_count = 0
-        for pattern in suspicious_encodings:
-            matches = re.findall(pattern, content)
-            encoded_count += len(matches)
+        for regex in _SUSPICIOUS_ENCODINGS:
+            encoded_count += len(regex.findall(content))
 
         # If more than 10% of the content appears to be encoded, it's suspicious
         if len(content) > 0:
@@ -399,6 +533,7 @@ class FileContentScanner:
         """
         self.max_file_size = max_file_size
         self.input_sanitizer = InputSanitizer()
+        self._ruleset_version: Optional[str] = None
 
         # File type specific scanners
         self.binary_signatures = {
@@ -439,57 +574,93 @@ class FileContentScanner:
                 )
                 return issues  # Don't scan oversized files
 
-            # Check for binary signatures
             with open(file_path, "rb") as f:
-                header = f.read(16)
+                data = f.read()
 
-            for signature, file_type in self.binary_signatures.items():
-                if header.startswith(signature):
-                    issues.append(
-                        SecurityIssue(
-                            threat_level=ThreatLevel.HIGH,
-                            issue_type="binary_executable",
-                            description=f"File appears to be a binary executable: {file_type}",
-                            file_path=str(file_path),
-                            recommendation="Binary executables not allowed in packages",
-                        )
-                    )
-                    return issues  # Don't scan binary files further
+            issues.extend(self.scan_bytes(data, file_path))
 
-            # Try to read as text and scan content
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                content_issues = self.input_sanitizer.scan_for_threats(content, "file_content")
+        except Exception as e:
+            issues.append(
+                SecurityIssue(
+                    threat_level=ThreatLevel.LOW,
+                    issue_type="scan_error",
+                    description=f"Error scanning file: {e!s}",
+                    file_path=str(file_path),
+                    recommendation="Manual review recommended",
+                )
+            )
 
-                for issue in content_issues:
-                    issue.file_path = str(file_path)
-                    issues.append(issue)
+        return issues
+
+    def scan_bytes(self, data: bytes, file_path: Path) -> List[SecurityIssue]:
+        """Scan already-read file content for security threats.
+
+        Args:
+            data: Raw file content
+            file_path: Path the content was read from, used in reported issues
+
+        Returns:
+            List of security issues found
+        """
+        issues = []
 
-            except UnicodeDecodeError:
-                # File contains binary data
+        # Check for binary signatures
+        header = data[:16]
+        for signature, file_type in self.binary_signatures.items():
+            if header.startswith(signature):
                 issues.append(
                     SecurityIssue(
-                        threat_level=ThreatLevel.MEDIUM,
-                        issue_type="binary_content",
-                        description="File contains binary data but has text extension",
+                        threat_level=ThreatLevel.HIGH,
+                        issue_type="binary_executable",
+                        description=f"File appears to be a binary executable: {file_type}",
                         file_path=str(file_path),
-                        recommendation="Verify file format matches extension",
+                        recommendation="Binary executables not allowed in packages",
                     )
                 )
+                return issues  # Don't scan binary files further
 
-        except Exception as e:
+        # Try to read as text and scan content
+        try:
+            # Match text-mode reads, which translate newlines
+            content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError:
+            # File contains binary data
             issues.append(
                 SecurityIssue(
-                    threat_level=ThreatLevel.LOW,
-                    issue_type="scan_error",
-                    description=f"Error scanning file: {e!s}",
+                    threat_level=ThreatLevel.MEDIUM,
+                    issue_type="binary_content",
+                    description="File contains binary data but has text extension",
                     file_path=str(file_path),
-                    recommendation="Manual review recommended",
+                    recommendation="Verify file format matches extension",
                 )
             )
+            return issues
+
+        for issue in self.input_sanitizer.scan_for_threats(content, "file_content"):
+            issue.file_path = str(file_path)
+            issues.append(issue)
 
         return issues
 
+    @property
+    def ruleset_version(self) -> str:
+        """Digest of the rules this scanner applies.
+
+        Changes whenever patterns, length limits, signatures, the size limit
+        or SCANNER_VERSION change, so stored scan results can be invalidated.
+        """
+        if self._ruleset_version is None:
+            ruleset = {
+                "scanner_version": SCANNER_VERSION,
+                "max_file_size": self.max_file_size,
+                "signatures": sorted(sig.hex() for sig in self.binary_signatures),
+                "patterns": self.input_sanitizer.suspicious_patterns,
+                "max_lengths": self.input_sanitizer.max_lengths,
+            }
+            encoded = json.dumps(ruleset, sort_keys=True).encode("utf-8")
+            self._ruleset_version = hashlib.sha256(encoded).hexdigest()[:16]
+        return self._ruleset_version
+
     def calculate_file_hash(self, file_path: Path, algorithm: str = "sha256") -> str:
         """Calculate hash of file content for integrity verification.
 
@@ -500,13 +671,7 @@ class FileContentScanner:
         Returns:
             Hexadecimal hash string
         """
-        hash_obj = hashlib.new(algorithm)
-
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-
-        return hash_obj.hexdigest()
+        return get_file_hasher().hash_file(file_path, algorithm)
 
 
 class SecurityPolicy:
@@ -1,13 +1,16 @@
 """Persistence components for selection workflow caching and history."""
 
-import asyncio
 import hashlib
 import json
 import logging
+import os
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..core import PathNormalizer
 from .types import SelectionContext, SelectionResult
@@ -121,37 +124,67 @@ class HistoryEntry:
 
 
 class SelectionCache:
-    """Cache for selection results to improve performance."""
+    """Cache for selection results to improve performance.
+
+    Entries are stored in a single SQLite database indexed by key and last
+    access time, so lookups never load the whole cache and LRU eviction only
+    touches the oldest rows. A small in-memory LRU keeps hot entries.
+    """
+
+    CACHE_VERSION = "2.0"
+    DB_FILENAME = "selection_cache.db"
+
+    # Directory listings modified this recently may still change without
+    # moving the directory mtime, so they are not reused
+    RACY_WINDOW_SECONDS = 2.0
 
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
         max_entries: int = 1000,
         default_ttl: Optional[float] = 3600,  # 1 hour
+        max_size_bytes: int = 50 * 1024 * 1024,
+        memory_entries: int = 64,
     ):
         """Initialize selection cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory to store the cache database
             max_entries: Maximum number of cache entries
             default_ttl: Default time-to-live for cache entries in seconds
+            max_size_bytes: Maximum total size of serialized entries
+            memory_entries: Number of recently used entries kept in memory
         """
         self.cache_dir = cache_dir or Path.home() / ".claude" / "pacc" / "cache"
         self.max_entries = max_entries
         self.default_ttl = default_ttl
+        self.max_size_bytes = max_size_bytes
+        self.memory_entries = memory_entries
+        self.db_path = self.cache_dir / self.DB_FILENAME
+
+        # In-memory LRU of recently used entries
+        self._memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
 
-        # In-memory cache for fast access
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        # Running [entry count, total size] of stored rows, counted lazily
+        self._totals: Optional[List[int]] = None
+
+        # Directory path -> (mtime_ns, file paths, subdirectory paths)
+        self._listings: Dict[str, Tuple[int, List[str], List[str]]] = {}
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load existing cache
-        self._load_task = asyncio.create_task(self._load_cache())
-
     def generate_key(self, source_paths: List[Union[str, Path]], context: SelectionContext) -> str:
         """Generate cache key for selection parameters.
 
+        The key covers a fingerprint of each source path (sizes and mtimes of
+        every file below it), so edits to the selected files invalidate it.
+        Directory listings are reused while the directory mtime is unchanged,
+        so only the files themselves are stat'ed on repeated calls.
+
         Args:
             source_paths: Source paths for selection
             context: Selection context
@@ -160,8 +193,10 @@ class SelectionCache:
             Cache key string
         """
         # Normalize paths for consistent keys
-        normalized_paths = [PathNormalizer.to_posix(path) for path in source_paths]
-        normalized_paths.sort()  # Ensure consistent ordering
+        normalized_paths = sorted(
+            (PathNormalizer.to_posix(path), self._fingerprint_path(Path(path)))
+            for path in source_paths
+        )
 
         # Create context hash (excluding non-deterministic fields)
         context_data = {
@@ -169,8 +204,10 @@ class SelectionCache:
             "strategy": context.strategy.value,
             "extensions": sorted(context.extensions) if context.extensions else None,
             "patterns": sorted(context.patterns) if context.patterns else None,
-            "size_limits": context.size_limits,
-            "exclude_hidden": context.exclude_hidden,
+            "exclude_patterns": (
+                sorted(context.exclude_patterns) if context.exclude_patterns else None
+            ),
+            "strict_validation": context.strict_validation,
             "max_selections": context.max_selections,
         }
 
@@ -178,7 +215,7 @@ class SelectionCache:
         key_data = {
             "paths": normalized_paths,
             "context": context_data,
-            "version": "1.0",  # Cache version for invalidation
+            "version": self.CACHE_VERSION,  # Cache version for invalidation
         }
 
         key_json = json.dumps(key_data, sort_keys=True)
@@ -193,42 +230,29 @@ class SelectionCache:
         Returns:
             Cached selection result or None if not found/expired
         """
-        # Check memory cache first
-        if key in self._memory_cache:
-            entry = self._memory_cache[key]
+        with self._lock:
+            # Check memory cache first
+            entry = self._memory_cache.get(key)
+            source = "memory"
+
+            if entry is None:
+                entry = self._read_entry(key)
+                source = "disk"
+
+            if entry is None:
+                logger.debug(f"Cache miss for key {key}")
+                return None
 
             if entry.is_expired:
-                await self._remove_entry(key)
+                self._remove_entry(key)
                 return None
 
             entry.touch()
-            logger.debug(f"Cache hit for key {key}")
+            self._remember(key, entry)
+            self._record_access(entry)
+            logger.debug(f"Cache hit from {source} for key {key}")
             return entry.result
 
-        # Check disk cache
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-
-                entry = self._deserialize_entry(data)
-                if entry and not entry.is_expired:
-                    entry.touch()
-                    self._memory_cache[key] = entry
-                    logger.debug(f"Cache hit from disk for key {key}")
-                    return entry.result
-                else:
-                    # Remove expired entry
-                    cache_file.unlink(missing_ok=True)
-
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Failed to load cache entry {key}: {e}")
-                cache_file.unlink(missing_ok=True)
-
-        logger.debug(f"Cache miss for key {key}")
-        return None
-
     async def set(self, key: str, result: SelectionResult, ttl: Optional[float] = None) -> None:
         """Store selection result in cache.
 
@@ -242,34 +266,59 @@ class SelectionCache:
             logger.debug(f"Not caching failed/cancelled result for key {key}")
             return
 
-        # Create cache entry
+        now = time.time()
         entry = CacheEntry(
             key=key,
             result=result,
-            timestamp=time.time(),
+            timestamp=now,
             context_hash=key,  # Using key as context hash for simplicity
             ttl=ttl or self.default_ttl,
+            last_access=now,
         )
 
-        # Store in memory cache
-        self._memory_cache[key] = entry
-
-        # Store to disk asynchronously
-        self._write_task = asyncio.create_task(self._write_cache_entry(key, entry))
-
-        # Cleanup if we exceed max entries
-        if len(self._memory_cache) > self.max_entries:
-            await self._cleanup_cache()
+        with self._lock:
+            try:
+                data = json.dumps(self._serialize_entry(entry), separators=(",", ":"))
+                connection = self._get_connection()
+                totals = self._get_totals()
+                previous = connection.execute(
+                    "SELECT size FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(key, timestamp, ttl, access_count, last_access, size, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (key, entry.timestamp, entry.ttl, 0, now, len(data), data),
+                    )
+                if previous is None:
+                    totals[0] += 1
+                else:
+                    totals[1] -= previous[0]
+                totals[1] += len(data)
+                self._remember(key, entry)
+                self._evict()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.error(f"Failed to write cache entry {key}: {e}")
+                return
 
         logger.debug(f"Cached result for key {key}")
 
     async def clear(self) -> None:
         """Clear all cache entries."""
-        self._memory_cache.clear()
-
-        # Remove cache files
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink(missing_ok=True)
+        with self._lock:
+            self._memory_cache.clear()
+            try:
+                connection = self._get_connection()
+                with connection:
+                    connection.execute("DELETE FROM entries")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to clear cache: {e}")
+            self._totals = None
+
+            # Remove per-entry files written by older versions
+            for cache_file in self.cache_dir.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
 
         logger.info("Cache cleared")
 
@@ -279,34 +328,25 @@ class SelectionCache:
         Returns:
             Number of entries removed
         """
-        removed_count = 0
-        expired_keys = []
-
-        # Find expired entries in memory
-        for key, entry in self._memory_cache.items():
-            if entry.is_expired:
-                expired_keys.append(key)
+        now = time.time()
+        with self._lock:
+            for key in [k for k, entry in self._memory_cache.items() if entry.is_expired]:
+                del self._memory_cache[key]
 
-        # Remove expired entries
-        for key in expired_keys:
-            await self._remove_entry(key)
-            removed_count += 1
-
-        # Check disk cache for expired entries
-        for cache_file in self.cache_dir.glob("*.json"):
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-
-                entry = self._deserialize_entry(data)
-                if entry and entry.is_expired:
-                    cache_file.unlink(missing_ok=True)
-                    removed_count += 1
-
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Remove corrupted files
-                cache_file.unlink(missing_ok=True)
-                removed_count += 1
+                connection = self._get_connection()
+                with connection:
+                    cursor = connection.execute(
+                        "DELETE FROM entries WHERE ttl IS NOT NULL AND timestamp + ttl < ?",
+                        (now,),
+                    )
+                removed_count = max(cursor.rowcount, 0)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to clean up expired cache entries: {e}")
+                return 0
+            finally:
+                # Recount lazily on the next write
+                self._totals = None
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} expired cache entries")
@@ -319,84 +359,165 @@ class SelectionCache:
         Returns:
             Dictionary with cache statistics
         """
-        memory_entries = len(self._memory_cache)
-        disk_entries = len(list(self.cache_dir.glob("*.json")))
-
-        total_access_count = sum(entry.access_count for entry in self._memory_cache.values())
-        total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.json") if f.exists())
-
-        return {
-            "memory_entries": memory_entries,
-            "disk_entries": disk_entries,
-            "total_access_count": total_access_count,
-            "total_size_bytes": total_size,
-            "cache_dir": str(self.cache_dir),
-            "max_entries": self.max_entries,
-            "default_ttl": self.default_ttl,
-        }
+        with self._lock:
+            try:
+                disk_entries, total_size, total_access_count = (
+                    self._get_connection()
+                    .execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                        "COALESCE(SUM(access_count), 0) FROM entries"
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to read cache statistics: {e}")
+                disk_entries, total_size, total_access_count = 0, 0, 0
+
+            return {
+                "memory_entries": len(self._memory_cache),
+                "disk_entries": disk_entries,
+                "total_access_count": total_access_count,
+                "total_size_bytes": total_size,
+                "cache_dir": str(self.cache_dir),
+                "db_path": str(self.db_path),
+                "max_entries": self.max_entries,
+                "max_size_bytes": self.max_size_bytes,
+                "default_ttl": self.default_ttl,
+            }
+
+    def close(self) -> None:
+        """Close the cache database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._totals = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the cache database, creating the schema on first use."""
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, "
+                    "timestamp REAL NOT NULL, "
+                    "ttl REAL, "
+                    "access_count INTEGER NOT NULL DEFAULT 0, "
+                    "last_access REAL NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "data TEXT NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)"
+                )
+            self._connection = connection
+        return self._connection
+
+    def _get_totals(self) -> List[int]:
+        """Get the running entry count and total size of stored entries."""
+        if self._totals is None:
+            count, size = (
+                self._get_connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")
+                .fetchone()
+            )
+            self._totals = [count, size]
+        return self._totals
 
-    async def _load_cache(self) -> None:
-        """Load cache entries from disk."""
+    def _read_entry(self, key: str) -> Optional[CacheEntry]:
+        """Look up a single entry in the database."""
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file) as f:
-                        data = json.load(f)
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT data, access_count, last_access FROM entries WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load cache entry {key}: {e}")
+            return None
 
-                    entry = self._deserialize_entry(data)
-                    if entry and not entry.is_expired:
-                        key = cache_file.stem
-                        self._memory_cache[key] = entry
-                    else:
-                        # Remove expired entry
-                        cache_file.unlink(missing_ok=True)
+        if row is None:
+            return None
 
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    # Remove corrupted files
-                    cache_file.unlink(missing_ok=True)
+        try:
+            entry = self._deserialize_entry(json.loads(row[0]))
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Failed to load cache entry {key}: {e}")
+            entry = None
 
-            logger.debug(f"Loaded {len(self._memory_cache)} cache entries")
+        if entry is None:
+            self._remove_entry(key)
+            return None
 
-        except Exception as e:
-            logger.error(f"Failed to load cache: {e}")
+        entry.access_count = row[1]
+        entry.last_access = row[2]
+        return entry
 
-    async def _write_cache_entry(self, key: str, entry: CacheEntry) -> None:
-        """Write cache entry to disk."""
+    def _record_access(self, entry: CacheEntry) -> None:
+        """Persist access statistics used for LRU eviction."""
         try:
-            cache_file = self.cache_dir / f"{key}.json"
-            data = self._serialize_entry(entry)
-
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
-
-        except Exception as e:
-            logger.error(f"Failed to write cache entry {key}: {e}")
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "UPDATE entries SET access_count = ?, last_access = ? WHERE key = ?",
+                    (entry.access_count, entry.last_access, entry.key),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to record cache access for {entry.key}: {e}")
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Add an entry to the in-memory LRU."""
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.memory_entries:
+            self._memory_cache.popitem(last=False)
 
-    async def _remove_entry(self, key: str) -> None:
+    def _remove_entry(self, key: str) -> None:
         """Remove cache entry from memory and disk."""
         # Remove from memory
         self._memory_cache.pop(key, None)
 
         # Remove from disk
-        cache_file = self.cache_dir / f"{key}.json"
-        cache_file.unlink(missing_ok=True)
-
-    async def _cleanup_cache(self) -> None:
-        """Clean up cache when it exceeds max entries."""
-        if len(self._memory_cache) <= self.max_entries:
+        try:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove cache entry {key}: {e}")
+
+        # Recount lazily on the next write
+        self._totals = None
+
+    def _evict(self) -> None:
+        """Evict least recently used entries beyond the count and size limits."""
+        totals = self._get_totals()
+        excess_entries = totals[0] - self.max_entries
+        excess_bytes = totals[1] - self.max_size_bytes
+        if excess_entries <= 0 and excess_bytes <= 0:
             return
 
-        # Sort entries by last access time (LRU)
-        sorted_entries = sorted(
-            self._memory_cache.items(), key=lambda x: x[1].last_access or x[1].timestamp
-        )
-
-        # Remove oldest entries
-        entries_to_remove = len(self._memory_cache) - self.max_entries + 10
-        for key, _ in sorted_entries[:entries_to_remove]:
-            await self._remove_entry(key)
-
-        logger.debug(f"Cleaned up {entries_to_remove} cache entries")
+        connection = self._get_connection()
+        evicted = []
+        cursor = connection.execute("SELECT key, size FROM entries ORDER BY last_access")
+        for key, size in cursor:
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            evicted.append((key,))
+            excess_entries -= 1
+            excess_bytes -= size
+            totals[0] -= 1
+            totals[1] -= size
+        cursor.close()
+
+        with connection:
+            connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        for (key,) in evicted:
+            self._memory_cache.pop(key, None)
+
+        logger.debug(f"Evicted {len(evicted)} cache entries")
 
     def _serialize_entry(self, entry: CacheEntry) -> Dict[str, Any]:
         """Serialize cache entry for storage."""
@@ -445,6 +566,73 @@ class SelectionCache:
             logger.warning(f"Failed to deserialize cache entry: {e}")
             return None
 
+    def _fingerprint_path(self, path: Path) -> str:
+        """Fingerprint a file or directory tree from sizes and modification times."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return "missing"
+
+        if not path.is_dir():
+            return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+        digest = hashlib.sha256()
+        pending = [str(path)]
+        while pending:
+            directory = pending.pop()
+            listing = self._list_directory(directory)
+            if listing is None:
+                continue
+
+            files, subdirs = listing
+            pending.extend(subdirs)
+            for file_path in files:
+                try:
+                    file_stat = os.stat(file_path, follow_symlinks=False)
+                except OSError:
+                    continue
+                digest.update(
+                    f"{file_path}\0{file_stat.st_size}\0{file_stat.st_mtime_ns}\n".encode(
+                        "utf-8", "surrogateescape"
+                    )
+                )
+
+        return digest.hexdigest()
+
+    def _list_directory(self, directory: str) -> Optional[Tuple[List[str], List[str]]]:
+        """List a directory's files and subdirectories, reusing it while its mtime holds."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._listings.pop(directory, None)
+            return None
+
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for child in sorted(entries, key=lambda e: e.name):
+                    try:
+                        is_dir = child.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    (subdirs if is_dir else files).append(child.path)
+        except OSError:
+            return None
+
+        with self._lock:
+            if time.time() - mtime_ns / 1e9 > self.RACY_WINDOW_SECONDS:
+                self._listings[directory] = (mtime_ns, files, subdirs)
+            else:
+                self._listings.pop(directory, None)
+        return files, subdirs
+
 
 class SelectionHistory:
     """History tracker for selection operations."""
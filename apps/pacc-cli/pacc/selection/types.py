@@ -41,8 +41,12 @@ class SelectionContext:
     exclude_patterns: Optional[List[str]] = None
 
     # Validation settings
+    validators: List[Any] = field(default_factory=list)  # List[BaseValidator]
+    validate_on_select: bool = True
     strict_validation: bool = False
     auto_fix_issues: bool = True
+    background_validation: bool = True
+    max_concurrent: int = 4
 
     # User interaction
     interactive: bool = True
@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
 from ..core import DirectoryScanner, FileFilter, FilePathValidator
 from ..errors import SourceError, ValidationError
 from ..validators import BaseValidator, ValidationResult
+from ..validators.base import preloaded_file_content
 from .persistence import SelectionCache, SelectionHistory
 from .types import SelectionContext, SelectionMode, SelectionResult, SelectionStrategy
 from .ui import ConfirmationDialog, InteractiveSelector, ProgressTracker
@@ -333,65 +335,93 @@ class SelectionWorkflow:
         context: SelectionContext,
         progress: Optional[ProgressTracker] = None,
     ) -> List[ValidationResult]:
-        """Validate selected files using configured validators."""
+        """Validate selected files using configured validators.
+
+        Each file is read once and handed to every validator. With background
+        validation enabled, files are validated on a bounded thread pool and
+        progress is reported as each file completes; if the workflow is
+        cancelled, all outstanding validations are cancelled with it.
+        """
         if not context.validators:
             return []
 
-        all_results = []
+        if not (context.background_validation and len(selected_files) > 1):
+            # Sequential validation
+            all_results = []
+            for i, file_path in enumerate(selected_files):
+                if progress:
+                    await progress.update(f"Validating file {i + 1}/{len(selected_files)}")
+                all_results.extend(self._validate_file(file_path, context.validators))
+            return all_results
 
-        if context.background_validation and len(selected_files) > 1:
-            # Use concurrent validation for better performance
-            semaphore = asyncio.Semaphore(context.max_concurrent)
+        if progress:
+            await progress.update(f"Validating {len(selected_files)} files...")
 
-            async def validate_file(file_path: Path, validator: BaseValidator) -> ValidationResult:
-                async with semaphore:
-                    # Run validator in thread pool since it's CPU-bound
-                    loop = asyncio.get_event_loop()
-                    return await loop.run_in_executor(None, validator.validate_single, file_path)
+        loop = asyncio.get_event_loop()
+        max_workers = max(1, min(context.max_concurrent, len(selected_files)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pacc-validate")
+        per_file_results: List[List[ValidationResult]] = [[] for _ in selected_files]
 
-            # Create validation tasks
-            tasks = []
-            for file_path in selected_files:
-                for validator in context.validators:
-                    task = validate_file(file_path, validator)
-                    tasks.append(task)
+        async def validate_file(index: int) -> int:
+            per_file_results[index] = await loop.run_in_executor(
+                executor, self._validate_file, selected_files[index], context.validators
+            )
+            return index
 
-            # Execute with progress tracking
-            if progress:
-                await progress.update(f"Validating {len(selected_files)} files...")
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results and handle exceptions
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Validation error: {result}")
-                    # Create error result
-                    error_result = ValidationResult(is_valid=False)
-                    error_result.add_error(
-                        "VALIDATION_EXCEPTION", f"Validation failed with exception: {result}"
+        tasks = [asyncio.ensure_future(validate_file(i)) for i in range(len(selected_files))]
+        try:
+            for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                index = await next_done
+                if progress:
+                    await progress.update(
+                        f"Validated {selected_files[index].name} "
+                        f"({completed}/{len(selected_files)})"
                     )
-                    all_results.append(error_result)
-                else:
-                    all_results.append(result)
+        finally:
+            # Cancel whatever is still pending if we are exiting early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False)
 
-        else:
-            # Sequential validation
-            for i, file_path in enumerate(selected_files):
-                if progress:
-                    await progress.update(f"Validating file {i + 1}/{len(selected_files)}")
+        return [result for file_results in per_file_results for result in file_results]
 
-                for validator in context.validators:
-                    try:
+    @staticmethod
+    def _validate_file(file_path: Path, validators: List[BaseValidator]) -> List[ValidationResult]:
+        """Read a file once and run every validator over its content.
+
+        Files larger than every validator's ``max_file_size`` are not read,
+        so the validators reject them by size without loading them.
+        """
+        content: Optional[str] = None
+        limits = [getattr(validator, "max_file_size", None) for validator in validators]
+        try:
+            too_large = all(isinstance(limit, int) for limit in limits) and (
+                file_path.stat().st_size > max(limits, default=0)
+            )
+            if not too_large:
+                with open(file_path, encoding="utf-8") as f:
+                    content = f.read()
+        except (OSError, UnicodeDecodeError):
+            # Let each validator report the read problem in its own terms
+            content = None
+
+        results = []
+        for validator in validators:
+            try:
+                if content is None:
+                    result = validator.validate_single(file_path)
+                else:
+                    with preloaded_file_content(file_path, content):
                         result = validator.validate_single(file_path)
-                        all_results.append(result)
-                    except Exception as e:
-                        logger.error(f"Validation error for {file_path}: {e}")
-                        error_result = ValidationResult(is_valid=False, file_path=str(file_path))
-                        error_result.add_error("VALIDATION_EXCEPTION", f"Validation failed: {e}")
-                        all_results.append(error_result)
-
-        return all_results
+                results.append(result)
+            except Exception as e:
+                logger.error(f"Validation error for {file_path}: {e}")
+                error_result = ValidationResult(is_valid=False, file_path=str(file_path))
+                error_result.add_error("VALIDATION_EXCEPTION", f"Validation failed: {e}")
+                results.append(error_result)
+
+        return results
 
     async def _confirm_selection(
         self,
@@ -3,9 +3,9 @@
 import os
 import shutil
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 # Cross-platform keyboard handling
 try:
@@ -33,12 +33,39 @@ class SelectableItem:
     description: Optional[str] = None
     selected: bool = False
     metadata: Dict[str, Any] = None
+    _search_keys: Optional[Tuple[str, str, FrozenSet[str], FrozenSet[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize metadata if not provided."""
         if self.metadata is None:
             self.metadata = {}
 
+    def search_key(self, case_sensitive: bool = False) -> Tuple[str, FrozenSet[str]]:
+        """Get normalized display text and its character set for matching.
+
+        A query can only fuzzy-match text whose character set contains every
+        query character, so the set serves as a cheap prefilter. Keys are
+        computed once and recomputed only if display_text changes.
+
+        Args:
+            case_sensitive: Whether to return the original or lowercased text
+
+        Returns:
+            Tuple of (normalized text, set of characters in it)
+        """
+        keys = self._search_keys
+        if keys is None or keys[0] is not self.display_text:
+            text = self.display_text
+            lowered = text.lower()
+            keys = (text, lowered, frozenset(lowered), frozenset(text))
+            self._search_keys = keys
+
+        if case_sensitive:
+            return keys[0], keys[3]
+        return keys[1], keys[2]
+
     def toggle_selection(self) -> None:
         """Toggle selection state."""
         self.selected = not self.selected
@@ -193,6 +220,14 @@ class SearchFilter:
         self.case_sensitive = case_sensitive
         self.current_query = ""
 
+        # Fuzzy match results for each prefix of the query being typed, so
+        # extending the query narrows the previous matches and backspace
+        # reuses them instead of rescanning every item.
+        self._fuzzy_items: Optional[List[SelectableItem]] = None
+        self._fuzzy_items_len = 0
+        self._fuzzy_case_sensitive = case_sensitive
+        self._fuzzy_stack: List[Tuple[str, List[SelectableItem], List[SelectableItem]]] = []
+
     def set_query(self, query: str) -> None:
         """Set search query.
 
@@ -218,7 +253,7 @@ class SearchFilter:
 
         for item in items:
             # Search in display text
-            display_text = item.display_text if self.case_sensitive else item.display_text.lower()
+            display_text, _ = item.search_key(self.case_sensitive)
             if query in display_text:
                 filtered.append(item)
                 continue
@@ -243,6 +278,9 @@ class SearchFilter:
     def fuzzy_filter_items(self, items: List[SelectableItem]) -> List[SelectableItem]:
         """Filter items using fuzzy matching.
 
+        When the query extends a previous query over the same items, only the
+        previous matches are rescored.
+
         Args:
             items: List of items to filter
 
@@ -252,15 +290,75 @@ class SearchFilter:
         if not self.current_query.strip():
             return items
 
+        query = self.current_query if self.case_sensitive else self.current_query.lower()
+        candidates = self._get_fuzzy_candidates(items, query)
+        if candidates is None:
+            # Same query as the last call over the same items
+            return list(self._fuzzy_stack[-1][2])
+
+        query_chars = frozenset(query)
+        text_index, chars_index = (0, 3) if self.case_sensitive else (1, 2)
+        matched = []
         scored_items = []
-        for item in items:
-            score = self._fuzzy_score(item)
-            if score > 0:
-                scored_items.append((score, item))
+        for item in candidates:
+            keys = item._search_keys
+            if keys is None or keys[0] is not item.display_text:
+                item.search_key()
+                keys = item._search_keys
+            text = keys[text_index]
+
+            if query in text:
+                score = 1.0 if query == text else 0.9 if text.startswith(query) else 0.7
+            elif query_chars <= keys[chars_index]:
+                score = self._subsequence_score(query, text)
+                if not score:
+                    continue
+            else:
+                continue
+
+            matched.append(item)
+            scored_items.append((score, item))
 
-        # Sort by score (higher is better)
+        # Sort by score (higher is better); the sort is stable, so ties keep item order
         scored_items.sort(key=lambda x: x[0], reverse=True)
-        return [item for score, item in scored_items]
+        ranked = [item for score, item in scored_items]
+
+        self._fuzzy_stack.append((query, matched, ranked))
+        return list(ranked)
+
+    def _get_fuzzy_candidates(
+        self, items: List[SelectableItem], query: str
+    ) -> Optional[List[SelectableItem]]:
+        """Get the items that can still match query, narrowing from earlier results.
+
+        Any fuzzy match is a subsequence match, and every prefix of a
+        subsequence also matches, so the matches for a prefix of the query
+        contain all matches for the full query.
+
+        Returns:
+            Candidate items in original order, or None if the cached result for
+            exactly this query can be reused
+        """
+        if (
+            items is not self._fuzzy_items
+            or len(items) != self._fuzzy_items_len
+            or self.case_sensitive != self._fuzzy_case_sensitive
+        ):
+            self._fuzzy_items = items
+            self._fuzzy_items_len = len(items)
+            self._fuzzy_case_sensitive = self.case_sensitive
+            self._fuzzy_stack.clear()
+
+        while self._fuzzy_stack and not query.startswith(self._fuzzy_stack[-1][0]):
+            self._fuzzy_stack.pop()
+
+        if not self._fuzzy_stack:
+            return items
+
+        previous_query, previous_matches, _ = self._fuzzy_stack[-1]
+        if previous_query == query:
+            return None
+        return previous_matches
 
     def _fuzzy_score(self, item: SelectableItem) -> float:
         """Calculate fuzzy matching score for an item.
@@ -272,8 +370,20 @@ class SearchFilter:
             Score between 0 and 1 (higher is better match)
         """
         query = self.current_query if self.case_sensitive else self.current_query.lower()
-        text = item.display_text if self.case_sensitive else item.display_text.lower()
+        text, _ = item.search_key(self.case_sensitive)
+        return self._score_text(query, text)
+
+    @staticmethod
+    def _score_text(query: str, text: str) -> float:
+        """Score normalized text against a normalized query.
+
+        Args:
+            query: Normalized query
+            text: Normalized item text
 
+        Returns:
+            Score between 0 and 1 (higher is better match)
+        """
         # Exact match gets highest score
         if query == text:
             return 1.0
@@ -286,21 +396,18 @@ class SearchFilter:
         if query in text:
             return 0.7
 
-        # Fuzzy character matching
-        query_chars = list(query)
-        text_chars = list(text)
-        matches = 0
-        query_idx = 0
-
-        for char in text_chars:
-            if query_idx < len(query_chars) and char == query_chars[query_idx]:
-                matches += 1
-                query_idx += 1
+        return SearchFilter._subsequence_score(query, text)
 
-        if matches == len(query_chars):
-            return 0.5 * (matches / len(text))
+    @staticmethod
+    def _subsequence_score(query: str, text: str) -> float:
+        """Score text containing every query character in order, else 0."""
+        position = 0
+        for char in query:
+            position = text.find(char, position) + 1
+            if not position:
+                return 0.0
 
-        return 0.0
+        return 0.5 * (len(query) / len(text))
 
 
 class PreviewPane:
@@ -1,10 +1,33 @@
 """Base validator classes and validation result types."""
 
 import json
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+_preloaded_files = threading.local()
+
+
+@contextmanager
+def preloaded_file_content(file_path: Union[str, Path], content: str) -> Iterator[None]:
+    """Serve already-read file content to validators running in this thread.
+
+    Lets callers read a file once and run several validators over it without
+    each validator reopening the file.
+
+    Args:
+        file_path: Path of the file whose content was read
+        content: Decoded file content
+    """
+    previous = getattr(_preloaded_files, "entry", None)
+    _preloaded_files.entry = (str(file_path), content)
+    try:
+        yield
+    finally:
+        _preloaded_files.entry = previous
 
 
 @dataclass
@@ -243,13 +266,21 @@ class BaseValidator(ABC):
 
         return None
 
+    def _read_text(self, file_path: Union[str, Path]) -> str:
+        """Read a file as UTF-8 text, reusing content preloaded by the caller."""
+        entry = getattr(_preloaded_files, "entry", None)
+        if entry is not None and entry[0] == str(file_path):
+            return entry[1]
+
+        with open(file_path, encoding="utf-8") as f:
+            return f.read()
+
     def _validate_json_syntax(
         self, file_path: Path
     ) -> tuple[Optional[ValidationError], Optional[Dict[str, Any]]]:
         """Validate JSON syntax and return parsed data."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(self._read_text(file_path))
             return None, data
         except json.JSONDecodeError as e:
             return ValidationError(
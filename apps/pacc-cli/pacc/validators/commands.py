@@ -90,8 +90,7 @@ class CommandsValidator(BaseValidator):
 
         # Read file content
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_text(file_path)
         except UnicodeDecodeError as e:
             result.add_error(
                 "ENCODING_ERROR",
@@ -88,8 +88,7 @@ class FragmentValidator(BaseValidator):
 
         # Read file content
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_text(file_path)
         except UnicodeDecodeError as e:
             result.add_error(
                 "ENCODING_ERROR",
@@ -301,6 +301,19 @@ def large_file(temp_dir: Path) -> Path:
     return large_file
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch) -> Path:
+    """Point the home directory at a temporary directory.
+
+    Components such as the security scan cache default to locations under
+    ~/.claude/pacc, so tests must not read or write the real home directory.
+    """
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
 @pytest.fixture(autouse=True)
 def cleanup_temp_files():
     """Automatically cleanup any temporary files created during tests."""
@@ -4,6 +4,7 @@ import json
 import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -82,6 +83,59 @@ class TestDeepMergeStrategy:
         assert "hook3" in hook_names
         assert hook_names.count("hook2") == 1  # No duplicates
 
+    def test_array_dedupe_key_order_and_unhashable_items(self):
+        """Test dedupe treats dicts with reordered keys as equal and handles odd items."""
+        strategy = DeepMergeStrategy(array_strategy="dedupe")
+
+        existing = {"hooks": [{"name": "a", "matchers": ["*"]}, {1: "x", "b": "y"}]}
+        new = {"hooks": [{"matchers": ["*"], "name": "a"}, {1: "x", "b": "y"}, {"name": "b"}]}
+
+        result = strategy.merge(existing, new)
+
+        assert result.merged_config["hooks"] == [
+            {"name": "a", "matchers": ["*"]},
+            {1: "x", "b": "y"},
+            {"name": "b"},
+        ]
+
+    def test_array_dedupe_large_arrays(self):
+        """Test dedupe of thousands of entries against a large existing array."""
+        strategy = DeepMergeStrategy(array_strategy="dedupe")
+
+        existing = {"hooks": [{"name": f"hook{i}", "events": ["*"]} for i in range(5000)]}
+        new = {"hooks": [{"name": f"hook{i}", "events": ["*"]} for i in range(4000, 6000)]}
+
+        result = strategy.merge(existing, new)
+
+        assert len(result.merged_config["hooks"]) == 6000
+        assert result.changes_made == ["Added 1000 unique items to array at hooks"]
+
+    def test_merge_is_copy_on_write(self):
+        """Test unchanged subtrees are shared and inputs are left untouched."""
+        strategy = DeepMergeStrategy(array_strategy="dedupe")
+
+        existing = {
+            "hooks": [{"name": "hook1"}],
+            "mcps": [{"name": "mcp1"}],
+            "settings": {"nested": {"a": 1}, "other": {"b": 2}},
+        }
+        new = {
+            "hooks": [{"name": "hook2"}],
+            "mcps": [{"name": "mcp1"}],
+            "settings": {"nested": {"c": 3}},
+        }
+
+        result = strategy.merge(existing, new)
+        merged = result.merged_config
+
+        assert existing["hooks"] == [{"name": "hook1"}]
+        assert existing["settings"]["nested"] == {"a": 1}
+        assert merged["hooks"] == [{"name": "hook1"}, {"name": "hook2"}]
+        assert merged["settings"]["nested"] == {"a": 1, "c": 3}
+        assert merged["mcps"] is existing["mcps"]
+        assert merged["settings"]["other"] is existing["settings"]["other"]
+        assert merged["hooks"][1] is not new["hooks"][0]
+
     def test_array_replace_strategy(self):
         """Test array replace strategy."""
         strategy = DeepMergeStrategy(array_strategy="replace")
@@ -327,6 +381,44 @@ class TestClaudeConfigManager:
         finally:
             self.config_manager.get_config_path = original_method
 
+    def test_add_extension_configs_single_update(self):
+        """Test that a batch of extensions is merged and saved once."""
+        config_path = Path(self.temp_dir) / ".claude" / "settings.json"
+        self.config_manager.get_config_path = lambda _: config_path
+
+        with patch.object(
+            self.config_manager, "merge_config", wraps=self.config_manager.merge_config
+        ) as merge, patch.object(
+            self.config_manager, "save_config", wraps=self.config_manager.save_config
+        ) as save:
+            success = self.config_manager.add_extension_configs(
+                [
+                    ("hooks", {"name": "hook_a"}),
+                    ("mcps", {"name": "mcp_a"}),
+                    ("hooks", {"name": "hook_b"}),
+                ]
+            )
+
+        assert success
+        assert merge.call_count == 1
+        assert save.call_count == 1
+
+        config = json.loads(config_path.read_text())
+        assert [h["name"] for h in config["hooks"]] == ["hook_a", "hook_b"]
+        assert [m["name"] for m in config["mcps"]] == ["mcp_a"]
+
+    def test_add_extension_configs_rejects_file_based_types(self):
+        """Test that a batch containing agents is rejected before any update."""
+        config_path = Path(self.temp_dir) / ".claude" / "settings.json"
+        self.config_manager.get_config_path = lambda _: config_path
+
+        with pytest.raises(ConfigurationError):
+            self.config_manager.add_extension_configs(
+                [("hooks", {"name": "hook_a"}), ("agents", {"name": "agent_a"})]
+            )
+
+        assert not config_path.exists()
+
     def test_add_extension_config_invalid_type(self):
         """Test adding extension with invalid type."""
         with pytest.raises(ConfigurationError) as exc_info:
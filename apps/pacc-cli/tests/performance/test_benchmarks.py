@@ -1,14 +1,20 @@
 """Performance benchmarks for PACC source management components."""
 
+import gc
 import json
 import os
+import re
 import time
+import tracemalloc
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import psutil
 import pytest
 
 from pacc.core.file_utils import DirectoryScanner, FileFilter, FilePathValidator, PathNormalizer
+from pacc.plugins.discovery import FragmentInfo, RepositoryInfo, _intern_metadata
 from pacc.security.security_measures import InputSanitizer, SecurityAuditor
 from pacc.validators.base import BaseValidator, ValidationResult
 
@@ -393,6 +399,40 @@ class TestValidationPerformance:
         print(f"Throughput: {throughput:.0f} validations/second")
 
 
+def _reference_scan_patterns(sanitizer: InputSanitizer, content: str) -> List[tuple]:
+    """Pattern scan as done before pattern precompilation, for comparison."""
+    found = []
+    for category, patterns in sanitizer.suspicious_patterns.items():
+        for pattern in patterns:
+            for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+                line_number = content[: match.start()].count("\n") + 1
+                found.append((f"suspicious_{category}", match.group(), line_number))
+    return found
+
+
+def _sanitizer_corpus() -> List[str]:
+    """Command and agent markdown resembling real plugin content."""
+    corpus = []
+    for i in range(200):
+        corpus.append(
+            f"---\ndescription: Review pull request {i}\nallowed-tools: Bash, Read\n---\n\n"
+            f"# Review PR {i}\n\nSummarise the changes, list risky areas and suggest tests.\n"
+            "Use $ARGUMENTS as the pull request number.\n"
+        )
+        corpus.append(
+            f"---\nname: agent-{i}\ndescription: Helps with refactoring\n---\n\n"
+            "You are a careful refactoring assistant. Keep behaviour identical and\n"
+            "explain each step before applying it.\n"
+        )
+        if i % 10 == 0:
+            corpus.append(
+                "# Deploy\n\n```bash\ncurl https://example.com/install.sh | sh\n"
+                "python -c 'import os; os.system(\"ls\")'\n"
+                "echo $(whoami) && cat `which env`\n```\n"
+            )
+    return corpus
+
+
 @pytest.mark.performance
 class TestSecurityPerformance:
     """Performance tests for security components."""
@@ -432,6 +472,46 @@ class TestSecurityPerformance:
         print(f"Found {len(issues)} issues")
         print(f"Throughput: {throughput / 1024:.0f} KB/second")
 
+    def test_input_sanitizer_matches_reference_scan(self):
+        """Test precompiled, prefiltered scanning finds exactly the same issues."""
+        sanitizer = InputSanitizer()
+        samples = [
+            *_sanitizer_corpus()[:40],
+            "line one\nEVAL (x)\n; RM -rf /\nimport   subprocess",
+            "caf\u00e9 import os",  # non-ASCII content skips the literal prefilter
+            "",
+        ]
+
+        for content in samples:
+            issues = [
+                (issue.issue_type, issue.description.split(": ", 1)[1], issue.line_number)
+                for issue in sanitizer.scan_for_threats(content, "command_file")
+                if issue.issue_type.startswith("suspicious_")
+                and issue.issue_type != "suspicious_encoding"
+            ]
+            assert issues == _reference_scan_patterns(sanitizer, content)
+
+    def test_input_sanitizer_corpus_benchmark(self):
+        """Benchmark scanning realistic command/agent content against the old approach."""
+        sanitizer = InputSanitizer()
+        corpus = _sanitizer_corpus()
+
+        start = time.perf_counter()
+        for content in corpus:
+            _reference_scan_patterns(sanitizer, content)
+        reference_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for content in corpus:
+            sanitizer.scan_for_threats(content, "command_file")
+        duration = time.perf_counter() - start
+
+        assert duration < reference_duration
+
+        print(f"Scanned {len(corpus)} documents in {duration:.3f}s")
+        print(f"Reference scan: {reference_duration:.3f}s")
+        print(f"Speedup: {reference_duration / duration:.1f}x")
+
     def test_security_auditor_performance(self, large_test_dataset):
         """Test SecurityAuditor performance with many files."""
         auditor = SecurityAuditor()
@@ -564,6 +644,87 @@ class TestMemoryPerformance:
         print(f"Max memory delta: {max_memory_delta / 1024 / 1024:.1f} MB")
 
 
+@dataclass
+class _DictBackedFragmentInfo:
+    """Pre-slots FragmentInfo layout, used as the memory baseline."""
+
+    name: str
+    path: Path
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    validation_result: Optional[Any] = None
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@pytest.mark.performance
+class TestDiscoveryMemoryPerformance:
+    """Test memory footprint of plugin/fragment discovery records."""
+
+    FRAGMENT_COUNT = 20000
+
+    @staticmethod
+    def _fragment_metadata(index: int) -> Dict[str, Any]:
+        """Build metadata with fresh string objects, as a YAML parser would."""
+        return {
+            "title": f"Fragment {index}",
+            "description": "".join(["Shared team ", "documentation"]),
+            "category": "".join(["refer", "ence"]),
+            "author": "".join(["docs", "-team"]),
+            "tags": ["".join(["do", "cs"]), "".join(["a", "pi"])],
+            "has_frontmatter": True,
+        }
+
+    def _measure(self, build_record) -> int:
+        """Return bytes retained by FRAGMENT_COUNT records."""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            records = [build_record(i) for i in range(self.FRAGMENT_COUNT)]
+            gc.collect()
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(records) == self.FRAGMENT_COUNT
+        return retained
+
+    def test_fragment_record_memory_reduction(self):
+        """Slotted, interned fragment records should use notably less memory."""
+        baseline = self._measure(
+            lambda i: _DictBackedFragmentInfo(
+                name=f"fragment-{i}",
+                path=Path("docs") / "fragments" / f"fragment-{i}.md",
+                metadata=self._fragment_metadata(i),
+            )
+        )
+        compact = self._measure(
+            lambda i: FragmentInfo(
+                name=f"fragment-{i}",
+                path=Path("docs") / "fragments" / f"fragment-{i}.md",
+                metadata=_intern_metadata(self._fragment_metadata(i)),
+            )
+        )
+
+        print(f"Dict-backed records: {baseline / self.FRAGMENT_COUNT:.0f} bytes/fragment")
+        print(f"Slotted records: {compact / self.FRAGMENT_COUNT:.0f} bytes/fragment")
+
+        assert not hasattr(FragmentInfo("x", Path("x.md")), "__dict__")
+        assert compact < baseline * 0.85
+
+    def test_valid_fragment_view_tracks_item_changes(self):
+        """Derived views should reflect changes to the records themselves."""
+        repo_info = RepositoryInfo(path=Path("repo"))
+        repo_info.fragments.extend(
+            FragmentInfo(name=f"f{i}", path=Path(f"f{i}.md")) for i in range(1000)
+        )
+        assert len(repo_info.valid_fragments) == 1000
+
+        repo_info.fragments[0].errors.append("x")
+        repo_info.fragments[1] = FragmentInfo(name="bad", path=Path("bad.md"), errors=["x"])
+
+        assert len(repo_info.valid_fragments) == 998
+        assert [f.name for f in repo_info.invalid_fragments] == ["f0", "bad"]
+
+
 @pytest.mark.performance
 class TestScalabilityBenchmarks:
     """Test scalability with increasing dataset sizes."""
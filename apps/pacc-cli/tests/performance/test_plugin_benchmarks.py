@@ -14,6 +14,7 @@ import yaml
 from pacc.plugins import (
     PluginConfigManager,
     PluginRepositoryManager,
+    SecurityAuditStore,
 )
 
 
@@ -991,6 +992,64 @@ class TestPluginMemoryEfficiency:
                 print(f"  Final memory delta: {final_memory_mb:.1f}MB")
 
 
+@pytest.mark.performance
+@pytest.mark.plugin_benchmarks
+class TestSecurityAuditPerformance:
+    """Performance tests for the security audit history."""
+
+    def test_audit_summary_over_large_history(self, tmp_path):
+        """Test summarizing and querying 100k audit entries."""
+        store = SecurityAuditStore(tmp_path / "audit.db", max_age_days=None)
+        now = time.time()
+        entries = 100_000
+
+        connection = store._get_connection()
+        with connection:
+            connection.executemany(
+                "INSERT INTO audits (id, timestamp, operation, plugin_name, security_level, "
+                "risk_score, max_threat, issue_count, action_taken, user_confirmed, issues) "
+                "VALUES (?, ?, 'plugin_validation', ?, 'standard', ?, ?, 1, ?, 0, '[]')",
+                (
+                    (
+                        i + 1,
+                        now - i * 30,
+                        f"plugin-{i % 500}",
+                        i % 120,
+                        i % 5,
+                        "blocked" if i % 7 == 0 else "approved",
+                    )
+                    for i in range(entries)
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO audit_issues (audit_id, timestamp, issue_type, threat) "
+                "VALUES (?, ?, ?, ?)",
+                ((i + 1, now - i * 30, f"issue_{i % 25}", i % 5) for i in range(entries)),
+            )
+
+        with PluginPerformanceProfiler("Audit Summary") as profiler:
+            summary = store.summarize()
+            profiler.checkpoint("full_summary")
+            week = store.summarize(since=now - 7 * 24 * 60 * 60)
+            profiler.checkpoint("range_summary")
+            plugin = store.summarize(plugin_name="plugin-42")
+            severe = store.query(min_threat="critical", limit=20)
+
+        store.close()
+
+        assert summary["total_audits"] == entries
+        assert week["total_audits"] < entries
+        assert plugin["total_audits"] == entries // 500
+        assert all(entry["max_threat"] == "critical" for entry in severe)
+        assert profiler.duration < 2.0
+
+        print("Audit History Performance:")
+        print(f"  Entries: {entries}")
+        for checkpoint in profiler.checkpoints:
+            print(f"  {checkpoint['name']}: {checkpoint['elapsed']:.3f}s")
+        print(f"  Total: {profiler.duration:.3f}s")
+
+
 # Performance test configuration
 @pytest.fixture(autouse=True, scope="session")
 def plugin_benchmark_setup():
@@ -0,0 +1,118 @@
+"""Tests for installing several extensions with one configuration update."""
+
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from pacc.cli import Extension, PACCCli
+from pacc.core.config_manager import ClaudeConfigManager
+
+
+@pytest.fixture
+def source_extensions(tmp_path):
+    """Create hook, MCP and agent files to install."""
+    source = tmp_path / "source"
+    source.mkdir()
+    extensions = []
+    for name, extension_type, suffix in [
+        ("hook-a", "hooks", ".json"),
+        ("hook-b", "hooks", ".json"),
+        ("server", "mcps", ".json"),
+        ("helper", "agents", ".md"),
+    ]:
+        path = source / f"{name}{suffix}"
+        path.write_text(f"{name} content")
+        extensions.append(Extension(name=name, file_path=path, extension_type=extension_type))
+    return extensions
+
+
+@pytest.fixture
+def claude_dir(tmp_path):
+    """Project-level Claude directory used as the install target."""
+    base_dir = tmp_path / "project" / ".claude"
+    base_dir.mkdir(parents=True)
+    with patch.object(
+        ClaudeConfigManager,
+        "get_config_path",
+        lambda _self, _user=False: base_dir / "settings.json",
+    ):
+        yield base_dir
+
+
+class TestBulkInstall:
+    """Test PACCCli._install_extensions."""
+
+    def test_all_entries_merged_once(self, source_extensions, claude_dir):
+        """Test that files are copied and settings.json is written once."""
+        with patch.object(
+            ClaudeConfigManager,
+            "update_config_atomic",
+            autospec=True,
+            side_effect=ClaudeConfigManager.update_config_atomic,
+        ) as update:
+            PACCCli()._install_extensions(source_extensions, claude_dir)
+
+        assert update.call_count == 1
+        for ext in source_extensions:
+            installed = claude_dir / ext.extension_type / ext.file_path.name
+            assert installed.read_text() == f"{ext.name} content"
+
+        settings = json.loads((claude_dir / "settings.json").read_text())
+        assert [h["name"] for h in settings["hooks"]] == ["hook-a", "hook-b"]
+        assert [m["name"] for m in settings["mcps"]] == ["server"]
+        assert "agents" not in settings
+
+    def test_failed_merge_rolls_back_every_file(self, source_extensions, claude_dir):
+        """Test that new files are removed and overwritten files restored."""
+        existing = claude_dir / "hooks" / "hook-a.json"
+        existing.parent.mkdir()
+        existing.write_text("original")
+
+        with patch.object(ClaudeConfigManager, "update_config_atomic", return_value=False):
+            with pytest.raises(ValueError, match="Failed to update configuration"):
+                PACCCli()._install_extensions(source_extensions, claude_dir, force=True)
+
+        assert existing.read_text() == "original"
+        assert sorted(p.name for p in claude_dir.rglob("*") if p.is_file()) == ["hook-a.json"]
+
+    def test_failed_backup_is_cleaned_up(self, source_extensions, claude_dir, tmp_path):
+        """Test that a failing backup removes its directory and leaves files untouched."""
+        for name in ["hook-a.json", "hook-b.json"]:
+            existing = claude_dir / "hooks" / name
+            existing.parent.mkdir(exist_ok=True)
+            existing.write_text("original")
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+        copy2 = shutil.copy2
+
+        def failing_copy2(src, dst, **kwargs):
+            if dst == backup_dir / "1":
+                raise OSError("disk full")
+            return copy2(src, dst, **kwargs)
+
+        with patch.object(tempfile, "mkdtemp", return_value=str(backup_dir)):
+            with patch.object(shutil, "copy2", side_effect=failing_copy2):
+                with pytest.raises(ValueError, match="disk full"):
+                    PACCCli()._install_extensions(source_extensions, claude_dir, force=True)
+
+        assert not backup_dir.exists()
+        assert sorted(p.name for p in claude_dir.rglob("*") if p.is_file()) == [
+            "hook-a.json",
+            "hook-b.json",
+        ]
+        assert {p.read_text() for p in (claude_dir / "hooks").iterdir()} == {"original"}
+
+    def test_conflicts_checked_before_copying(self, source_extensions, claude_dir):
+        """Test that an existing file aborts the install without changes."""
+        existing = claude_dir / "agents" / "helper.md"
+        existing.parent.mkdir()
+        existing.write_text("original")
+
+        with pytest.raises(ValueError, match="already exists"):
+            PACCCli()._install_extensions(source_extensions, claude_dir)
+
+        assert not (claude_dir / "hooks").exists()
+        assert existing.read_text() == "original"
@@ -1,12 +1,15 @@
 """Integration tests for CLI plugin commands."""
 
+import json
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
 from pacc.cli import PACCCli
+from pacc.plugins import SecurityAuditStore
 
 
 class TestPluginCommands:
@@ -297,6 +300,46 @@ class TestPluginCommands:
         assert repo is None
         assert plugin is None
 
+    def test_plugin_audit_summary(self, tmp_path, capsys):
+        """Test plugin audit command summarizes the audit store."""
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            store = SecurityAuditStore()
+            for i, action in enumerate(["approved", "blocked", "blocked"]):
+                store.record(
+                    timestamp=time.time() - i,
+                    operation="plugin_validation",
+                    plugin_name="risky" if action == "blocked" else "safe",
+                    security_level="standard",
+                    risk_score=60,
+                    action_taken=action,
+                    user_confirmed=False,
+                    issues=[{"threat_level": "high", "issue_type": "dangerous_command"}],
+                )
+            store.close()
+
+            cli = PACCCli()
+            args = Mock()
+            args.plugin = None
+            args.days = 30
+            args.threat = None
+            args.limit = 5
+            args.format = "table"
+            args.compact = False
+            args.import_log = None
+
+            assert cli.handle_plugin_audit(args) == 0
+            output = capsys.readouterr().out
+            assert "Security audits (last 30 days): 3" in output
+            assert "Blocked operations: 2" in output
+            assert "dangerous_command: 3" in output
+
+            args.plugin = "risky"
+            args.format = "json"
+            assert cli.handle_plugin_audit(args) == 0
+            result = json.loads(capsys.readouterr().out)
+            assert result["summary"]["total_audits"] == 2
+            assert {entry["plugin_name"] for entry in result["entries"]} == {"risky"}
+
     def test_plugin_install_invalid_url(self):
         """Test plugin install with invalid Git URL."""
         cli = PACCCli()
@@ -540,6 +540,99 @@ class TestMetadataCache:
             result = cache.get("registry", "search", different_params)
             assert result is None
 
+    def test_entries_packed_into_one_database(self, tmp_path):
+        """Test that entries are stored in one database and survive a restart."""
+        (tmp_path / "0123456789abcdef0123456789abcdef.json").write_text("{}")
+        (tmp_path / "settings.json").write_text("{}")
+        cache = MetadataCache(tmp_path)
+        for i in range(20):
+            cache.set("registry", f"plugins/p{i}", {"name": f"p{i}"})
+        cache.close()
+
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".json"] == ["settings.json"]
+
+        reopened = MetadataCache(tmp_path)
+        assert reopened.get("registry", "plugins/p7") == {"name": "p7"}
+        reopened.close()
+
+    def test_clear_expired_uses_stored_timestamps(self, tmp_path):
+        """Test that expired entries are removed without reading their data."""
+        cache = MetadataCache(tmp_path, default_ttl=60)
+        cache.set("registry", "old", {"data": "old"})
+        cache.set("registry", "new", {"data": "new"})
+        connection = cache._get_connection()
+        with connection:
+            connection.execute(
+                "UPDATE entries SET timestamp = timestamp - 120 WHERE key LIKE '%old'"
+            )
+        cache._memory_cache.clear()
+
+        assert cache.clear_expired() == 1
+        assert cache.get("registry", "old") is None
+        assert cache.get("registry", "new") == {"data": "new"}
+        cache.close()
+
+    def test_invalidate_registry_removes_entries_not_in_memory(self, tmp_path):
+        """Test registry invalidation also removes entries only on disk."""
+        cache = MetadataCache(tmp_path)
+        cache.set("registry1", "endpoint", {"data": "1"})
+        cache.set("registry2", "endpoint", {"data": "2"})
+        cache.close()
+
+        reopened = MetadataCache(tmp_path)
+        reopened.invalidate("registry1")
+
+        assert reopened.get("registry1", "endpoint") is None
+        assert reopened.get("registry2", "endpoint") == {"data": "2"}
+        reopened.close()
+
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        cache = MetadataCache(tmp_path, max_entries=2)
+        cache.set("registry", "a", {"data": "a"})
+        cache.set("registry", "b", {"data": "b"})
+        connection = cache._get_connection()
+        with connection:
+            connection.execute("UPDATE entries SET last_access = last_access - 10")
+        assert cache.get("registry", "a") == {"data": "a"}
+
+        cache.set("registry", "c", {"data": "c"})
+        cache._memory_cache.clear()
+
+        assert cache.get("registry", "b") is None
+        assert cache.get("registry", "a") == {"data": "a"}
+        assert cache.get("registry", "c") == {"data": "c"}
+        cache.close()
+
+    def test_cache_hits_do_not_write(self, tmp_path):
+        """Test that hits only batch their access times until eviction or close."""
+        cache = MetadataCache(tmp_path)
+        cache.set("registry", "a", {"data": "a"})
+        connection = cache._get_connection()
+        changes = connection.total_changes
+
+        for _ in range(3):
+            assert cache.get("registry", "a") == {"data": "a"}
+        cache._memory_cache.clear()
+        assert cache.get("registry", "a") == {"data": "a"}
+
+        assert connection.total_changes == changes
+        cache.close()
+
+    def test_total_size_is_bounded(self, tmp_path):
+        """Test that the stored size stays within the byte budget."""
+        cache = MetadataCache(tmp_path, max_size_bytes=1000)
+        for i in range(50):
+            cache.set("registry", f"plugins/p{i}", {"description": "x" * 80, "index": i})
+
+        count, size = (
+            cache._get_connection().execute("SELECT COUNT(*), SUM(size) FROM entries").fetchone()
+        )
+        assert 0 < count < 50
+        assert size <= 1000
+        assert cache.get("registry", "plugins/p49") is not None
+        cache.close()
+
 
 class TestDependencyResolver:
     """Test dependency resolution algorithm."""
@@ -691,6 +784,244 @@ class TestDependencyResolver:
         assert "plugin-a" in result["chain"]
         assert "plugin-b" in result["chain"]
 
+        missing = self.resolver.check_circular_dependencies("plugin-a", "9.9.9")
+        assert not missing["has_circular"]
+        assert missing["message"] == "Version 9.9.9 not found"
+
+    def test_transitive_dependencies_resolved_breadth_first(self):
+        """Test that dependencies of dependencies are resolved, each looked up once."""
+
+        def make_metadata(name, versions, deps=()):
+            return PluginMetadata(
+                name=name,
+                namespace=None,
+                description=name,
+                author="Author",
+                versions=[
+                    PluginVersion(
+                        version,
+                        datetime.now(),
+                        dependencies=[
+                            PluginDependency(dep, DependencyConstraint.MINIMUM, "1.0.0")
+                            for dep in deps
+                        ],
+                    )
+                    for version in versions
+                ],
+            )
+
+        plugins = {
+            "root": make_metadata("root", ["1.0.0"], ["left", "right"]),
+            "left": make_metadata("left", ["1.0.0", "1.4.0"], ["shared"]),
+            "right": make_metadata("right", ["1.1.0"], ["shared"]),
+            "shared": make_metadata("shared", ["1.0.0", "2.1.0", "1.9.0"]),
+        }
+        lookups = []
+
+        def mock_get_metadata(name):
+            lookups.append(name)
+            return plugins.get(name)
+
+        self.mock_client.get_plugin_metadata = mock_get_metadata
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert result["success"]
+        assert [(dep["name"], dep["version"]) for dep in result["dependencies"]] == [
+            ("left", "1.4.0"),
+            ("right", "1.1.0"),
+            ("shared", "2.1.0"),
+        ]
+        assert sorted(lookups) == sorted(plugins)
+
+
+def _plugin(name, versions, deps=()):
+    """Build metadata whose versions all share the given PluginDependency arguments."""
+    return PluginMetadata(
+        name=name,
+        namespace=None,
+        description=name,
+        author="Author",
+        versions=[
+            PluginVersion(
+                version,
+                datetime.now(),
+                dependencies=[PluginDependency(*dep) for dep in deps],
+            )
+            for version in versions
+        ],
+    )
+
+
+class TestVersionSolver:
+    """Test backtracking resolution of version constraints."""
+
+    def setup_method(self):
+        """Set up resolver over an in-memory registry."""
+        self.plugins = {}
+        self.mock_client = Mock()
+        self.mock_client.get_plugin_metadata = self.plugins.get
+        self.resolver = DependencyResolver(self.mock_client)
+
+    def add(self, name, versions, deps=()):
+        self.plugins[name] = _plugin(name, versions, deps)
+
+    def test_backtracks_to_older_version(self):
+        """Test that a version chosen early is revisited when a later plugin needs another."""
+        self.add(
+            "root",
+            ["1.0.0"],
+            [
+                ("lib", DependencyConstraint.MINIMUM, "1.0.0"),
+                ("tool", DependencyConstraint.MINIMUM, "1.0.0"),
+            ],
+        )
+        self.add("tool", ["1.0.0"], [("lib", DependencyConstraint.EXACT, "1.0.0")])
+        self.add("lib", ["1.0.0", "2.0.0"])
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert result["success"]
+        assert result["solution"] == {"root": "1.0.0", "lib": "1.0.0", "tool": "1.0.0"}
+
+    def test_backtracks_through_intermediate_versions(self):
+        """Test that an older intermediate version is chosen to satisfy a shared pin."""
+        self.add(
+            "root",
+            ["1.0.0"],
+            [
+                ("app", DependencyConstraint.MINIMUM, "1.0.0"),
+                ("lib", DependencyConstraint.EXACT, "1.0.0"),
+            ],
+        )
+        self.plugins["app"] = PluginMetadata(
+            name="app",
+            namespace=None,
+            description="app",
+            author="Author",
+            versions=[
+                PluginVersion(
+                    "2.0.0",
+                    datetime.now(),
+                    dependencies=[PluginDependency("lib", DependencyConstraint.MINIMUM, "2.0.0")],
+                ),
+                PluginVersion(
+                    "1.0.0",
+                    datetime.now(),
+                    dependencies=[PluginDependency("lib", DependencyConstraint.MINIMUM, "1.0.0")],
+                ),
+            ],
+        )
+        self.add("lib", ["1.0.0", "2.0.0"])
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert result["success"]
+        assert result["solution"]["app"] == "1.0.0"
+        assert result["solution"]["lib"] == "1.0.0"
+
+    def test_unsatisfiable_constraints_are_explained(self):
+        """Test that a failed resolution reports the conflicting requirements."""
+        self.add(
+            "root",
+            ["1.0.0"],
+            [
+                ("left", DependencyConstraint.MINIMUM, "1.0.0"),
+                ("right", DependencyConstraint.MINIMUM, "1.0.0"),
+            ],
+        )
+        self.add("left", ["1.0.0", "1.1.0"], [("lib", DependencyConstraint.EXACT, "1.0.0")])
+        self.add("right", ["1.0.0"], [("lib", DependencyConstraint.EXACT, "2.0.0")])
+        self.add("lib", ["1.0.0", "2.0.0"])
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert not result["success"]
+        assert not result["dependencies"]
+        assert len(result["conflicts"]) == 1
+        assert result["explanation"]
+        assert any("lib ==2.0.0" in line for line in result["explanation"])
+
+    def test_conflict_jumps_past_unrelated_decisions(self):
+        """Test that a conflict caused by the root does not enumerate unrelated versions."""
+        deps = [(f"p{i}", DependencyConstraint.MINIMUM, "1.0.0") for i in range(8)]
+        for i in range(8):
+            self.add(f"p{i}", [f"1.{minor}.0" for minor in range(10)])
+        self.add("missing-version", ["1.0.0"])
+        deps.append(("missing-version", DependencyConstraint.EXACT, "9.9.9"))
+        self.add("root", ["1.0.0"], deps)
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert not result["success"]
+        assert result["conflicts"][0]["dependency"] == "missing-version"
+        assert result["conflicts"][0]["reason"].startswith("No compatible version found")
+
+    def test_installed_plugin_is_kept(self):
+        """Test that installed plugins constrain the solution instead of being replaced."""
+        self.add(
+            "root",
+            ["1.0.0"],
+            [("app", DependencyConstraint.MINIMUM, "1.0.0")],
+        )
+        self.plugins["app"] = PluginMetadata(
+            name="app",
+            namespace=None,
+            description="app",
+            author="Author",
+            versions=[
+                PluginVersion(
+                    "2.0.0",
+                    datetime.now(),
+                    dependencies=[PluginDependency("lib", DependencyConstraint.MINIMUM, "2.0.0")],
+                ),
+                PluginVersion(
+                    "1.5.0",
+                    datetime.now(),
+                    dependencies=[PluginDependency("lib", DependencyConstraint.MINIMUM, "1.0.0")],
+                ),
+            ],
+        )
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0", {"lib": "1.2.0"})
+
+        assert result["success"]
+        assert result["solution"] == {"root": "1.0.0", "app": "1.5.0", "lib": "1.2.0"}
+        assert [dep["name"] for dep in result["dependencies"]] == ["app"]
+        assert "Dependency lib already satisfied" in result["messages"]
+
+    def test_unsatisfiable_optional_dependency_is_left_out(self):
+        """Test that optional dependencies do not fail the resolution."""
+        self.add(
+            "root",
+            ["1.0.0"],
+            [
+                ("extra", DependencyConstraint.MINIMUM, "5.0.0", True),
+                ("lib", DependencyConstraint.MINIMUM, "1.0.0"),
+            ],
+        )
+        self.add("extra", ["1.0.0"])
+        self.add("lib", ["1.0.0"])
+
+        result = self.resolver.resolve_dependencies("root", "1.0.0")
+
+        assert result["success"]
+        assert [dep["name"] for dep in result["dependencies"]] == ["lib"]
+        assert result["conflicts"][0]["dependency"] == "extra"
+        assert "extra" not in result["solution"]
+
+    def test_cycles_reported_in_same_pass(self):
+        """Test that cycles among the chosen versions are reported."""
+        self.add("a", ["1.0.0"], [("b", DependencyConstraint.MINIMUM, "1.0.0")])
+        self.add("b", ["1.0.0"], [("c", DependencyConstraint.MINIMUM, "1.0.0")])
+        self.add("c", ["1.0.0"], [("a", DependencyConstraint.MINIMUM, "1.0.0")])
+
+        result = self.resolver.resolve_dependencies("a", "1.0.0")
+
+        assert result["success"]
+        assert result["cycles"] == [["a", "b", "c", "a"]]
+        assert "Circular dependency detected: a -> b -> c -> a" in result["messages"]
+
 
 class TestMarketplaceClient:
     """Test marketplace client functionality."""
@@ -831,6 +1162,90 @@ class TestMarketplaceClient:
         assert self.client.cache.get("test-registry", "plugins/test") is None
 
 
+class TestBatchedMetadata:
+    """Test batched registry lookups used by dependency resolution."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        client = MarketplaceClient(tmp_path / "marketplace.json")
+        client.cache = MetadataCache(cache_dir=tmp_path / "cache")
+        client.registry_file = tmp_path / "registry.json"
+        return client
+
+    @staticmethod
+    def _write_registry(path, count):
+        """Write a registry where plugin-N depends on plugin-(N+1) and plugin-(N+2)."""
+        plugins = []
+        for i in range(count):
+            deps = [
+                {"name": f"plugin-{j}", "constraint_type": "compatible", "version": "1.0.0"}
+                for j in (i + 1, i + 2)
+                if j < count
+            ]
+            plugins.append(
+                {
+                    "name": f"plugin-{i}",
+                    "description": f"Plugin {i}",
+                    "author": "Author",
+                    "version": "1.2.0",
+                    "dependencies": deps,
+                }
+            )
+        path.write_text(json.dumps({"plugins": plugins}))
+
+    def test_get_many_plugin_metadata(self, client):
+        """Test that batch lookups report unknown plugins as None."""
+        self._write_registry(client.registry_file, 3)
+
+        results = client.get_many_plugin_metadata(["plugin-0", "missing", "plugin-2"])
+
+        assert list(results) == ["plugin-0", "missing", "plugin-2"]
+        assert results["missing"] is None
+        assert [dep.name for dep in results["plugin-0"].latest_version.dependencies] == [
+            "plugin-1",
+            "plugin-2",
+        ]
+
+    def test_minimal_registry_dependency(self, client):
+        """Test that a dependency listed by name only resolves to any version."""
+        plugins = [
+            {"name": "app", "version": "1.0.0", "dependencies": [{"name": "lib"}]},
+            {"name": "lib", "version": "0.3.0"},
+        ]
+        client.registry_file.write_text(json.dumps({"plugins": plugins}))
+
+        result = client.dependency_resolver.resolve_dependencies("app", "1.0.0")
+
+        assert result["success"], result["messages"]
+        assert [dep["name"] for dep in result["dependencies"]] == ["lib"]
+
+    def test_registry_reparsed_only_when_changed(self, client):
+        """Test that registry.json is parsed again only after it changes."""
+        self._write_registry(client.registry_file, 2)
+
+        with patch("pacc.plugins.marketplace.json.load", wraps=json.load) as load:
+            assert client._mock_get_plugin_metadata("plugin-0", "community") is not None
+            assert client._mock_get_plugin_metadata("plugin-1", "community") is not None
+            assert load.call_count == 1
+
+            self._write_registry(client.registry_file, 3)
+            assert client._mock_get_plugin_metadata("plugin-2", "community") is not None
+            assert load.call_count == 2
+
+    def test_large_graph_resolves_with_one_registry_load(self, client):
+        """Test that a 200-node dependency graph parses the registry once."""
+        self._write_registry(client.registry_file, 200)
+
+        with patch("pacc.plugins.marketplace.json.load", wraps=json.load) as load:
+            result = client.dependency_resolver.resolve_dependencies("plugin-0", "1.2.0")
+            circular = client.dependency_resolver.check_circular_dependencies("plugin-0", "1.2.0")
+
+        assert result["success"]
+        assert len(result["dependencies"]) == 199
+        assert not circular["has_circular"]
+        assert load.call_count == 1
+
+
 class TestIntegrationScenarios:
     """Test complex integration scenarios."""
 
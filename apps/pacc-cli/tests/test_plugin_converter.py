@@ -707,5 +707,74 @@ class TestEdgeCases:
                 agent_path.unlink()
 
 
+class TestParallelConversion:
+    """Test scanning and converting with a worker pool."""
+
+    @pytest.fixture
+    def claude_dir(self, tmp_path):
+        """Create a .claude tree with agents sharing a name and nested commands."""
+        claude_dir = tmp_path / "project" / ".claude"
+        agent = "---\nname: helper\ndescription: Helps\n---\n\nSee /home/me/.claude/notes.md\n"
+        for rel_path in ["agents/helper.md", "agents/team/helper.md", "agents/review.md"]:
+            (claude_dir / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (claude_dir / rel_path).write_text(agent)
+        command = "---\ndescription: Deploy\n---\n\nDeploy it\n"
+        for rel_path in ["commands/deploy.md", "commands/ops/rollback.md"]:
+            (claude_dir / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (claude_dir / rel_path).write_text(command)
+        (claude_dir / "agents" / "notes.txt").write_text("not an extension")
+        return claude_dir
+
+    def test_scan_matches_serial_scan(self, claude_dir):
+        """Test parallel scanning finds the same extensions in the same order."""
+        serial = PluginConverter(max_workers=1).scan_extensions(claude_dir.parent)
+        parallel = PluginConverter(max_workers=4).scan_extensions(claude_dir.parent)
+
+        assert [(e.extension_type, e.path) for e in parallel] == [
+            (e.extension_type, e.path) for e in serial
+        ]
+        assert [e.path.relative_to(claude_dir).as_posix() for e in parallel] == [
+            "agents/helper.md",
+            "agents/review.md",
+            "agents/team/helper.md",
+            "commands/deploy.md",
+            "commands/ops/rollback.md",
+        ]
+
+    def test_parallel_convert_is_deterministic(self, claude_dir, tmp_path):
+        """Test agent name conflicts resolve in scan order and the manifest counts conversions."""
+        converter = PluginConverter(max_workers=4)
+        extensions = converter.scan_extensions(claude_dir)
+
+        result = converter.convert_to_plugin(extensions, "team-tools", tmp_path / "out")
+
+        assert result.success, result.errors
+        plugin_path = tmp_path / "out" / "team-tools"
+        agents = sorted(p.name for p in (plugin_path / "agents").iterdir())
+        assert agents == ["helper.md", "helper_1.md", "review.md"]
+        assert (plugin_path / "commands" / "ops" / "rollback.md").exists()
+        assert (
+            "${CLAUDE_PLUGIN_ROOT}/notes.md" in (plugin_path / "agents" / "review.md").read_text()
+        )
+
+        manifest = json.loads((plugin_path / "plugin.json").read_text())
+        assert manifest["components"] == {"agents": 3, "commands": 2}
+
+    def test_failed_copy_is_recorded_per_extension(self, claude_dir, tmp_path):
+        """Test one failing copy does not stop the others."""
+        converter = PluginConverter(max_workers=4)
+        extensions = converter.scan_extensions(claude_dir)
+        (claude_dir / "agents" / "review.md").unlink()
+
+        result = converter.convert_to_plugin(extensions, "team-tools", tmp_path / "out")
+
+        assert result.success
+        assert [e.name for e in result.skipped_extensions] == ["review"]
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Failed to convert agent review")
+        manifest = json.loads((tmp_path / "out" / "team-tools" / "plugin.json").read_text())
+        assert manifest["components"] == {"agents": 2, "commands": 2}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
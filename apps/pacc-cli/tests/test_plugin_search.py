@@ -1,10 +1,14 @@
 """Test plugin search functionality."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from pacc.plugins.config import ConfigBackup, PluginConfigManager
 from pacc.plugins.discovery import PluginInfo
 from pacc.plugins.search import (
     LocalPluginIndex,
@@ -510,6 +514,132 @@ class TestLocalPluginIndex:
         assert plugin_type == SearchPluginType.COMMAND
 
 
+class TestLocalPluginIndexCaching:
+    """Test persisted, change-driven refresh of LocalPluginIndex."""
+
+    @pytest.fixture(autouse=True)
+    def _chdir(self, tmp_path, monkeypatch):
+        """Run from tmp_path; the scanner only accepts relative plugin paths."""
+        monkeypatch.chdir(tmp_path)
+
+    def _make_index(self, tmp_path, commit="abc123def456"):
+        """Create a plugins dir with one installed repository."""
+        plugins_dir = tmp_path / "plugins"
+        repo_path = Path("plugins") / "repos" / "owner" / "repo"
+        plugin_dir = tmp_path / repo_path / "plugins" / "my-plugin"
+        (plugin_dir / "commands").mkdir(parents=True)
+        (plugin_dir / "commands" / "hello.md").write_text("# Hello")
+        (plugin_dir / "plugin.json").write_text(
+            json.dumps({"name": "my-plugin", "description": "First description"})
+        )
+
+        config_manager = PluginConfigManager(
+            plugins_dir=plugins_dir,
+            settings_path=tmp_path / "settings.json",
+            backup_manager=ConfigBackup(tmp_path / "backups"),
+        )
+        (plugins_dir / "config.json").write_text(
+            json.dumps(
+                {"repositories": {"owner/repo": {"path": str(repo_path), "current_commit": commit}}}
+            )
+        )
+        (tmp_path / "settings.json").write_text(
+            json.dumps({"enabledPlugins": {"owner/repo": ["my-plugin"]}})
+        )
+        return config_manager, plugin_dir
+
+    def test_index_persisted_and_reused(self, tmp_path):
+        """Test that unchanged repositories are not rescanned."""
+        config_manager, _ = self._make_index(tmp_path)
+
+        index = LocalPluginIndex(config_manager)
+        results = index.get_installed_plugins()
+
+        assert [r.name for r in results] == ["my-plugin"]
+        assert results[0].enabled is True
+        assert results[0].description == "First description"
+        assert (config_manager.plugins_dir / LocalPluginIndex.INDEX_FILENAME).exists()
+
+        # A fresh index (new process) should serve results from disk
+        cold_index = LocalPluginIndex(config_manager)
+        with patch.object(cold_index.scanner, "scan_repository") as mock_scan:
+            cached = cold_index.get_installed_plugins()
+
+        mock_scan.assert_not_called()
+        assert [r.to_dict() for r in cached] == [r.to_dict() for r in results]
+
+    def test_index_refreshes_on_manifest_change(self, tmp_path):
+        """Test that editing a plugin manifest triggers a rescan."""
+        config_manager, plugin_dir = self._make_index(tmp_path)
+        index = LocalPluginIndex(config_manager)
+        index.get_installed_plugins()
+
+        manifest_path = plugin_dir / "plugin.json"
+        manifest_path.write_text(
+            json.dumps({"name": "my-plugin", "description": "Second description"})
+        )
+        stat = manifest_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        results = LocalPluginIndex(config_manager).get_installed_plugins()
+
+        assert results[0].description == "Second description"
+
+    def test_same_index_sees_nested_manifest_change(self, tmp_path):
+        """Test a rescan through the same instance does not reuse stale scanner results."""
+        config_manager, plugin_dir = self._make_index(tmp_path)
+        index = LocalPluginIndex(config_manager)
+        index.get_installed_plugins()
+
+        # Editing a nested file leaves the repository root's mtime unchanged
+        manifest_path = plugin_dir / "plugin.json"
+        manifest_path.write_text(
+            json.dumps({"name": "my-plugin", "description": "Second description"})
+        )
+        stat = manifest_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert index.get_installed_plugins()[0].description == "Second description"
+        assert (
+            index.get_installed_plugins(force_refresh=True)[0].description == "Second description"
+        )
+
+    def test_index_refreshes_on_commit_change(self, tmp_path):
+        """Test that a new commit in config.json triggers a rescan."""
+        config_manager, _ = self._make_index(tmp_path)
+        LocalPluginIndex(config_manager).get_installed_plugins()
+
+        config_path = config_manager.plugins_dir / "config.json"
+        config = json.loads(config_path.read_text())
+        config["repositories"]["owner/repo"]["current_commit"] = "fedcba987654"
+        config_path.write_text(json.dumps(config))
+
+        index = LocalPluginIndex(config_manager)
+        with patch.object(
+            index.scanner, "scan_repository", wraps=index.scanner.scan_repository
+        ) as mock_scan:
+            results = index.get_installed_plugins()
+
+        assert mock_scan.call_count == 1
+        assert results[0].version == "fedcba98"
+
+    def test_force_refresh_and_invalidate(self, tmp_path):
+        """Test explicit refresh paths."""
+        config_manager, _ = self._make_index(tmp_path)
+        index = LocalPluginIndex(config_manager)
+        index.get_installed_plugins()
+
+        with patch.object(
+            index.scanner, "scan_repository", wraps=index.scanner.scan_repository
+        ) as mock_scan:
+            index.get_installed_plugins(force_refresh=True)
+            index.invalidate("owner/repo")
+            index.get_installed_plugins()
+            index.get_installed_plugins()
+
+        assert mock_scan.call_count == 2
+
+
 class TestPluginSearchEngine:
     """Test PluginSearchEngine class."""
 
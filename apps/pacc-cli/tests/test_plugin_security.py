@@ -1,10 +1,14 @@
 """Comprehensive test suite for plugin security features."""
 
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
+from pacc.plugins.audit_store import SecurityAuditStore
 from pacc.plugins.sandbox import PluginSandbox, SandboxConfig, SandboxLevel, SandboxManager
 from pacc.plugins.security import (
     AdvancedCommandScanner,
@@ -14,6 +18,7 @@ from pacc.plugins.security import (
     PluginSecurityManager,
     SecurityAuditLogger,
     SecurityIssue,
+    SecurityScanCache,
     ThreatLevel,
 )
 
@@ -862,6 +867,276 @@ class TestPluginSecurityManager(TestCase):
                 self.assertTrue(is_safe, f"Safe {plugin_type} plugin failed validation")
 
 
+class TestSecurityScanCache(TestCase):
+    """Test reuse of content scan results for unchanged files."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_path = self.temp_dir / "cache" / "security_scans.json"
+        self.audit_log = self.temp_dir / "security_audit.log"
+        self.plugin_dir = self.temp_dir / "plugin"
+        self.plugin_dir.mkdir()
+        (self.plugin_dir / "a.md").write_text("# A\n\nRun `eval(input())` here.\n")
+        (self.plugin_dir / "b.md").write_text("# B\n\nNothing to see.\n")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _manager(self):
+        return PluginSecurityManager(
+            audit_log_path=self.audit_log,
+            scan_cache=SecurityScanCache(self.cache_path),
+            audit_store=SecurityAuditStore(self.temp_dir / "audit.db"),
+        )
+
+    def _content_scans(self, manager):
+        calls = []
+        original = manager.content_scanner.scan_bytes
+
+        def recording_scan(data, file_path):
+            calls.append(Path(file_path).name)
+            return original(data, file_path)
+
+        manager.content_scanner.scan_bytes = recording_scan
+        return calls
+
+    def test_unchanged_files_are_not_rescanned(self):
+        """Test that a second audit reuses stored results with identical issues."""
+        first = self._manager()
+        first_scans = self._content_scans(first)
+        _, first_issues = first.validate_plugin_security(self.plugin_dir, "agents")
+        self.assertEqual(sorted(first_scans), ["a.md", "b.md"])
+        self.assertTrue(self.cache_path.exists())
+
+        second = self._manager()
+        second_scans = self._content_scans(second)
+        _, second_issues = second.validate_plugin_security(self.plugin_dir, "agents")
+
+        self.assertEqual(second_scans, [])
+        self.assertEqual(second_issues, first_issues)
+
+        entry = second.audit_logger.audit_entries[-1]
+        self.assertEqual(sorted(Path(p).name for p in entry.cached_files), ["a.md", "b.md"])
+        last_line = self.audit_log.read_text().strip().splitlines()[-1]
+        self.assertEqual(len(json.loads(last_line)["cached_files"]), 2)
+
+    def test_cached_rescan_does_not_rewrite_cache(self):
+        """Test that a fully cached audit leaves the cache file untouched."""
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+        os.utime(self.cache_path, ns=(0, 0))
+
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+
+        self.assertEqual(self.cache_path.stat().st_mtime_ns, 0)
+
+    def test_changed_file_is_rescanned(self):
+        """Test that only modified files are scanned again."""
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+        (self.plugin_dir / "b.md").write_text("# B\n\nChanged.\n")
+
+        manager = self._manager()
+        scans = self._content_scans(manager)
+        manager.validate_plugin_security(self.plugin_dir, "agents")
+
+        self.assertEqual(scans, ["b.md"])
+
+    def test_security_level_is_part_of_key(self):
+        """Test that results are cached separately per security level."""
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+
+        manager = self._manager()
+        scans = self._content_scans(manager)
+        manager.validate_plugin_security(self.plugin_dir, "agents", PluginSecurityLevel.PARANOID)
+
+        self.assertEqual(sorted(scans), ["a.md", "b.md"])
+
+    def test_ruleset_change_invalidates_results(self):
+        """Test that changing scanner rules invalidates stored results."""
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+
+        manager = self._manager()
+        manager.content_scanner.input_sanitizer.suspicious_patterns["extra"] = [r"nothing"]
+        scans = self._content_scans(manager)
+        manager.validate_plugin_security(self.plugin_dir, "agents")
+
+        self.assertEqual(sorted(scans), ["a.md", "b.md"])
+
+    def test_scanner_version_change_invalidates_results(self):
+        """Test that bumping the scanner version invalidates stored results."""
+        self._manager().validate_plugin_security(self.plugin_dir, "agents")
+
+        with patch("pacc.security.security_measures.SCANNER_VERSION", 2):
+            manager = self._manager()
+            scans = self._content_scans(manager)
+            manager.validate_plugin_security(self.plugin_dir, "agents")
+
+        self.assertEqual(sorted(scans), ["a.md", "b.md"])
+
+
+class TestSecurityAuditStore(TestCase):
+    """Test the indexed security audit store."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = SecurityAuditStore(self.temp_dir / "audit.db")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _record(self, plugin_name, timestamp, threat_level=None, action="approved"):
+        issues = []
+        if threat_level:
+            issues.append({"threat_level": threat_level, "issue_type": f"{threat_level}_issue"})
+        self.store.record(
+            timestamp=timestamp,
+            operation="plugin_validation",
+            plugin_name=plugin_name,
+            security_level="standard",
+            risk_score=100 if threat_level == "critical" else 10,
+            action_taken=action,
+            user_confirmed=False,
+            issues=issues,
+        )
+
+    def test_query_by_plugin_date_and_threat(self):
+        """Test range queries over plugin, time and threat level."""
+        self._record("alpha", 100.0, "low")
+        self._record("alpha", 200.0, "high", action="blocked")
+        self._record("beta", 300.0, "critical", action="blocked")
+        self._record("beta", 400.0)
+
+        alpha = self.store.query(plugin_name="alpha")
+        self.assertEqual([e["timestamp"] for e in alpha], [200.0, 100.0])
+
+        recent = self.store.query(since=200.0, until=400.0)
+        self.assertEqual([e["plugin_name"] for e in recent], ["beta", "alpha"])
+
+        severe = self.store.query(min_threat="high")
+        self.assertEqual([e["max_threat"] for e in severe], ["critical", "high"])
+
+    def test_summary(self):
+        """Test aggregate summary computed by the store."""
+        self._record("alpha", 100.0, "low")
+        self._record("alpha", 200.0, "high", action="blocked")
+        self._record("beta", 300.0, "critical", action="blocked")
+
+        summary = self.store.summarize()
+        self.assertEqual(summary["total_audits"], 3)
+        self.assertEqual(summary["blocked_operations"], 2)
+        self.assertEqual(summary["high_risk_audits"], 1)
+        self.assertEqual(summary["most_audited_plugins"], {"alpha": 2, "beta": 1})
+        self.assertEqual(
+            self.store.summarize(plugin_name="beta")["most_common_issues"], {"critical_issue": 1}
+        )
+
+    def test_database_created_on_first_write(self):
+        """Test that reading an empty history does not create the database."""
+        self.assertEqual(self.store.query(), [])
+        self.assertEqual(self.store.summarize()["total_audits"], 0)
+        self.assertEqual(self.store.compact(vacuum=True), 0)
+        self.assertFalse(self.store.db_path.exists())
+
+        self._record("alpha", 100.0)
+
+        self.assertTrue(self.store.db_path.exists())
+        self.assertEqual(self.store.summarize()["total_audits"], 1)
+
+    def test_compaction_applies_retention(self):
+        """Test that compaction keeps only the newest entries."""
+        self.store.max_age_days = None
+        self.store.max_entries = 2
+        for i in range(5):
+            self._record("alpha", float(i + 1), "low")
+
+        self.assertEqual(self.store.compact(vacuum=True), 3)
+        self.assertEqual([e["timestamp"] for e in self.store.query()], [5.0, 4.0])
+        self.assertEqual(self.store.summarize()["most_common_issues"], {"low_issue": 2})
+
+    def test_compaction_triggered_across_instances(self):
+        """Test that compaction progress is persisted rather than counted per process."""
+        SecurityAuditStore.COMPACT_INTERVAL, interval = 5, SecurityAuditStore.COMPACT_INTERVAL
+        try:
+            self.store.max_entries = 2
+            for i in range(3):
+                self._record("alpha", time.time() + i)
+            self.store.close()
+
+            # A new process only records a couple of entries
+            self.store = SecurityAuditStore(self.temp_dir / "audit.db", max_entries=2)
+            self._record("alpha", time.time() + 3)
+            self.assertEqual(self.store.summarize()["total_audits"], 4)
+            self._record("alpha", time.time() + 4)
+            self.assertEqual(self.store.summarize()["total_audits"], 2)
+        finally:
+            SecurityAuditStore.COMPACT_INTERVAL = interval
+
+    def test_stale_compaction_triggers_retention(self):
+        """Test that age-based retention runs once the last compaction is old."""
+        self.store.max_age_days = 1
+        self._record("alpha", 100.0)
+        connection = self.store._get_connection()
+        with connection:
+            connection.execute("UPDATE meta SET value = 0 WHERE key = 'compacted_at'")
+        self.store.close()
+
+        self.store = SecurityAuditStore(self.temp_dir / "audit.db", max_age_days=1)
+        self._record("alpha", time.time())
+        self.assertEqual(self.store.summarize()["total_audits"], 1)
+
+    def test_logger_writes_to_store_with_bounded_memory(self):
+        """Test audit logger keeps recent entries in memory and all in the store."""
+        log_file = self.temp_dir / "audit.log"
+        audit_logger = SecurityAuditLogger(log_file, store=self.store, max_memory_entries=3)
+        issue = SecurityIssue(
+            threat_level=ThreatLevel.HIGH, issue_type="test_issue", description="Issue"
+        )
+
+        for i in range(10):
+            audit_logger.log_security_event(
+                operation="plugin_validation",
+                plugin_name=f"plugin_{i}",
+                issues=[issue],
+                action_taken="blocked",
+            )
+
+        self.assertEqual(len(audit_logger.audit_entries), 3)
+        summary = audit_logger.get_audit_summary(days=1)
+        self.assertEqual(summary["total_audits"], 10)
+        self.assertEqual(summary["most_common_issues"], {"test_issue": 10})
+
+        # The JSON-lines log can be imported into another store
+        other = SecurityAuditStore(self.temp_dir / "other.db")
+        self.assertEqual(other.import_jsonl(log_file), 10)
+        self.assertEqual(other.summarize()["blocked_operations"], 10)
+        other.close()
+
+    def test_log_file_rotation(self):
+        """Test that the JSON-lines log rotates once it exceeds its size limit."""
+        log_file = self.temp_dir / "audit.log"
+        audit_logger = SecurityAuditLogger(log_file, max_log_bytes=200)
+
+        for i in range(5):
+            audit_logger.log_security_event(
+                operation="plugin_validation",
+                plugin_name=f"plugin_{i}",
+                issues=[],
+                action_taken="approved",
+            )
+
+        rotated = self.temp_dir / "audit.log.1"
+        self.assertTrue(rotated.exists())
+        self.assertLess(len(log_file.read_text().splitlines()), 5)
+
+
 if __name__ == "__main__":
     import unittest
 
@@ -101,7 +101,11 @@ class TestPluginSyncCLI:
 
             assert result == 0  # Success exit code
             mock_sync_manager.sync_plugins.assert_called_once_with(
-                project_dir=self.temp_dir, environment="default", dry_run=False
+                project_dir=self.temp_dir,
+                environment="default",
+                dry_run=False,
+                refresh_lock=False,
+                worktrees=False,
             )
             mock_success.assert_called_once()
             # Should show counts for installed/updated/skipped
@@ -218,7 +222,11 @@ class TestPluginSyncCLI:
             assert result == 0
             # Should pass dry_run=True to sync manager
             mock_sync_manager.sync_plugins.assert_called_with(
-                project_dir=self.temp_dir, environment="default", dry_run=True
+                project_dir=self.temp_dir,
+                environment="default",
+                dry_run=True,
+                refresh_lock=False,
+                worktrees=False,
             )
 
             # Should show dry-run in output
@@ -365,7 +373,11 @@ class TestPluginSyncCLI:
             assert result == 0
             # Should pass environment to sync manager
             mock_sync_manager.sync_plugins.assert_called_with(
-                project_dir=self.temp_dir, environment="production", dry_run=False
+                project_dir=self.temp_dir,
+                environment="production",
+                dry_run=False,
+                refresh_lock=False,
+                worktrees=False,
             )
 
             # Should mention environment in output
@@ -0,0 +1,302 @@
+"""Tests for worktree-based plugin version checkouts."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from pacc.core.project_config import PluginSpec, PluginSyncManager
+from pacc.plugins.config import PluginConfigManager
+from pacc.plugins.repository import PluginRepositoryManager
+from pacc.plugins.worktrees import WorktreeManager
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+
+
+def git(cwd, *args):
+    """Run git and return its stripped output."""
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    """Create a plugins directory with one cloned repository at three commits."""
+    plugins_dir = tmp_path / "plugins"
+    repo_path = plugins_dir / "repos" / "owner" / "repo"
+    repo_path.mkdir(parents=True)
+    git(repo_path, "init", "--quiet")
+    git(repo_path, "config", "user.email", "test@example.com")
+    git(repo_path, "config", "user.name", "Test")
+    for version in ("1", "2", "3"):
+        (repo_path / "plugin.json").write_text(f'{{"version": "{version}"}}')
+        git(repo_path, "add", "plugin.json")
+        git(repo_path, "commit", "--quiet", "-m", f"v{version}")
+        git(repo_path, "tag", f"v{version}")
+    return plugins_dir
+
+
+@pytest.fixture
+def repo_path(plugins_dir):
+    """Path of the installed repository."""
+    return plugins_dir / "repos" / "owner" / "repo"
+
+
+def version_of(repo_path):
+    """Read the version visible through the repository path."""
+    return (repo_path / "plugin.json").read_text()
+
+
+class TestWorktreeManager:
+    """Test activating commits as worktrees."""
+
+    def test_first_activation_adopts_clone(self, plugins_dir, repo_path):
+        """Test the clone moves to the store and repos/ becomes a symlink."""
+        manager = WorktreeManager(plugins_dir)
+
+        assert manager.activate(repo_path, "v1")
+
+        assert repo_path.is_symlink()
+        assert manager.is_managed(repo_path)
+        assert (plugins_dir / "store" / "owner" / "repo" / ".git").is_dir()
+        assert version_of(repo_path) == '{"version": "1"}'
+        assert git(repo_path, "rev-parse", "HEAD") == git(repo_path, "rev-parse", "v1^{commit}")
+
+    def test_switching_back_reuses_worktree(self, plugins_dir, repo_path):
+        """Test flipping to an already materialized commit does not touch its files."""
+        manager = WorktreeManager(plugins_dir)
+        manager.activate(repo_path, "v1")
+        v1_worktree = repo_path.resolve()
+        marker_inode = (v1_worktree / "plugin.json").stat().st_ino
+
+        assert manager.activate(repo_path, "v2")
+        assert version_of(repo_path) == '{"version": "2"}'
+        assert manager.activate(repo_path, "v1")
+
+        assert repo_path.resolve() == v1_worktree
+        assert (repo_path / "plugin.json").stat().st_ino == marker_inode
+
+    def test_least_recently_activated_evicted(self, plugins_dir, repo_path):
+        """Test only max_worktrees worktrees are kept."""
+        manager = WorktreeManager(plugins_dir, max_worktrees=2)
+
+        for tag in ("v1", "v2", "v3"):
+            assert manager.activate(repo_path, tag)
+
+        worktrees = manager.list_worktrees(repo_path)
+        assert len(worktrees) == 2
+        assert worktrees[0] == repo_path.resolve()
+        store = manager.store_path(repo_path)
+        assert git(store, "worktree", "list", "--porcelain").count("worktree ") == 3
+
+    def test_modified_worktree_recreated(self, plugins_dir, repo_path):
+        """Test a worktree edited in place is rebuilt before reuse."""
+        manager = WorktreeManager(plugins_dir)
+        manager.activate(repo_path, "v1")
+        manager.activate(repo_path, "v2")
+        v1_worktree = manager.list_worktrees(repo_path)[1]
+        (v1_worktree / "plugin.json").write_text("edited")
+
+        assert manager.activate(repo_path, "v1")
+        assert version_of(repo_path) == '{"version": "1"}'
+
+    def test_unknown_commit_leaves_clone_in_place(self, plugins_dir, repo_path):
+        """Test a failed activation does not adopt the clone."""
+        manager = WorktreeManager(plugins_dir)
+
+        assert not manager.activate(repo_path, "no-such-ref")
+        assert not repo_path.is_symlink()
+        assert not (plugins_dir / "store").exists()
+
+    def test_symlink_failure_restores_clone(self, plugins_dir, repo_path, monkeypatch):
+        """Test the clone goes back to repos/ when the symlink cannot be created."""
+        manager = WorktreeManager(plugins_dir)
+
+        def no_symlinks(*args, **kwargs):
+            raise OSError("symlinks not supported")
+
+        monkeypatch.setattr(os, "symlink", no_symlinks)
+
+        assert not manager.activate(repo_path, "v1")
+        assert not repo_path.is_symlink()
+        assert (repo_path / ".git").is_dir()
+        assert version_of(repo_path) == '{"version": "3"}'
+        assert not manager.store_path(repo_path).exists()
+        assert manager.list_worktrees(repo_path) == []
+
+    def test_plain_clone_not_adopted_unless_allowed(self, plugins_dir, repo_path):
+        """Test adopt=False leaves a plain clone alone."""
+        assert not WorktreeManager(plugins_dir).activate(repo_path, "v1", adopt=False)
+        assert not repo_path.is_symlink()
+
+    def test_paths_outside_repos_dir_ignored(self, tmp_path, plugins_dir):
+        """Test repositories outside the plugins directory are not managed."""
+        assert not WorktreeManager(plugins_dir).activate(tmp_path, "HEAD")
+
+
+class TestRepositoryManagerWorktrees:
+    """Test repository manager operations on the worktree layout."""
+
+    def test_rollback_flips_symlink(self, plugins_dir, repo_path):
+        """Test rollback of a managed repository activates the old worktree."""
+        manager = PluginRepositoryManager(
+            plugins_dir=plugins_dir, config_manager=PluginConfigManager(plugins_dir=plugins_dir)
+        )
+        v1_sha = git(repo_path, "rev-parse", "v1^{commit}")
+        manager.worktrees.activate(repo_path, "v3")
+
+        assert manager.rollback_plugin(repo_path, v1_sha)
+
+        assert version_of(repo_path) == '{"version": "1"}'
+        assert repo_path.resolve().name == v1_sha
+
+    def test_remove_repository(self, plugins_dir, repo_path):
+        """Test removing a managed repository deletes its store and worktrees."""
+        manager = WorktreeManager(plugins_dir)
+        manager.activate(repo_path, "v1")
+
+        manager.remove_repository(repo_path)
+
+        assert not repo_path.is_symlink()
+        assert not (plugins_dir / "store" / "owner" / "repo").exists()
+        assert not (plugins_dir / "worktrees" / "owner" / "repo").exists()
+
+
+class TestWorktreeUpdate:
+    """Test updating worktree-managed repositories from their upstream."""
+
+    @pytest.fixture
+    def upstream(self, plugins_dir, repo_path):
+        """Replace the installed repository with a clone of an upstream with a dev branch."""
+        upstream = plugins_dir.parent / "upstream"
+        shutil.move(repo_path, upstream)
+        default_branch = git(upstream, "symbolic-ref", "--short", "HEAD")
+        git(upstream, "checkout", "--quiet", "-b", "dev")
+        (upstream / "plugin.json").write_text('{"version": "dev"}')
+        git(upstream, "commit", "--quiet", "-am", "dev")
+        git(upstream, "checkout", "--quiet", default_branch)
+        git(plugins_dir, "clone", "--quiet", str(upstream), str(repo_path))
+        return upstream
+
+    @pytest.fixture
+    def sync_manager(self, plugins_dir, monkeypatch):
+        """Create a sync manager using the test plugins directory."""
+        sync_manager = PluginSyncManager()
+        monkeypatch.setattr(
+            sync_manager, "_get_worktree_manager", lambda: WorktreeManager(plugins_dir)
+        )
+        return sync_manager
+
+    @pytest.fixture
+    def repo_manager(self, plugins_dir):
+        """Create a repository manager using the test plugins directory."""
+        return PluginRepositoryManager(
+            plugins_dir=plugins_dir, config_manager=PluginConfigManager(plugins_dir=plugins_dir)
+        )
+
+    def test_update_follows_pinned_branch(self, upstream, repo_path, sync_manager, repo_manager):
+        """Test a branch pin stays on its branch and unchanged remotes are no-ops."""
+        spec = PluginSpec.from_string("owner/repo@dev")
+        assert sync_manager._checkout_version(spec, repo_path, worktrees=True)
+        assert version_of(repo_path) == '{"version": "dev"}'
+
+        result = repo_manager.update_plugin(repo_path)
+        assert result.success, result.error_message
+        assert not result.had_changes
+
+        git(upstream, "checkout", "--quiet", "dev")
+        (upstream / "plugin.json").write_text('{"version": "dev2"}')
+        git(upstream, "commit", "--quiet", "-am", "dev2")
+
+        result = repo_manager.update_plugin(repo_path)
+        assert result.success, result.error_message
+        assert result.had_changes
+        assert result.new_sha == git(upstream, "rev-parse", "dev")
+        assert version_of(repo_path) == '{"version": "dev2"}'
+
+    def test_unpinned_repository_follows_default_branch(
+        self, upstream, repo_path, sync_manager, repo_manager
+    ):
+        """Test a repository without a version follows the clone's branch."""
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo"), repo_path, worktrees=True
+        )
+        (upstream / "plugin.json").write_text('{"version": "4"}')
+        git(upstream, "commit", "--quiet", "-am", "v4")
+
+        result = repo_manager.update_plugin(repo_path)
+
+        assert result.success, result.error_message
+        assert result.had_changes
+        assert version_of(repo_path) == '{"version": "4"}'
+
+    @pytest.mark.usefixtures("upstream")
+    def test_tag_pin_refuses_update(self, repo_path, sync_manager, repo_manager):
+        """Test repositories pinned to a tag are not moved by update."""
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo@v1"), repo_path, worktrees=True
+        )
+
+        result = repo_manager.update_plugin(repo_path)
+
+        assert not result.success
+        assert "pinned" in result.error_message
+        assert version_of(repo_path) == '{"version": "1"}'
+
+
+class TestSyncCheckout:
+    """Test plugin sync checks versions out as worktrees."""
+
+    def test_checkout_version_uses_worktrees(self, plugins_dir, repo_path, monkeypatch):
+        """Test switching environment pins reuses materialized worktrees."""
+        sync_manager = PluginSyncManager()
+        monkeypatch.setattr(
+            sync_manager, "_get_worktree_manager", lambda: WorktreeManager(plugins_dir)
+        )
+        v1_sha = git(repo_path, "rev-parse", "v1^{commit}")
+
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo@v1"), repo_path, v1_sha, worktrees=True
+        )
+        v1_worktree = repo_path.resolve()
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo@v2"),
+            repo_path,
+            git(repo_path, "rev-parse", "v2^{commit}"),
+        )
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo@v1"), repo_path, v1_sha
+        )
+
+        assert repo_path.resolve() == v1_worktree
+        assert sync_manager._get_current_commit(repo_path) == v1_sha
+
+    def test_plain_sync_checks_out_in_place(self, plugins_dir, repo_path, monkeypatch):
+        """Test sync without worktrees keeps the clone in repos/."""
+        sync_manager = PluginSyncManager()
+        monkeypatch.setattr(
+            sync_manager, "_get_worktree_manager", lambda: WorktreeManager(plugins_dir)
+        )
+
+        assert sync_manager._checkout_version(PluginSpec.from_string("owner/repo@v1"), repo_path)
+
+        assert not repo_path.is_symlink()
+        assert not (plugins_dir / "store").exists()
+        assert version_of(repo_path) == '{"version": "1"}'
+
+    def test_fallback_checkout_uses_resolved_commit(self, tmp_path, repo_path, monkeypatch):
+        """Test the in-place checkout lands on the locked commit, not the branch head."""
+        sync_manager = PluginSyncManager()
+        monkeypatch.setattr(
+            sync_manager, "_get_worktree_manager", lambda: WorktreeManager(tmp_path / "other")
+        )
+        git(repo_path, "branch", "dev", "v3")
+        v2_sha = git(repo_path, "rev-parse", "v2^{commit}")
+
+        assert sync_manager._checkout_version(
+            PluginSpec.from_string("owner/repo@dev"), repo_path, v2_sha
+        )
+
+        assert not repo_path.is_symlink()
+        assert sync_manager._get_current_commit(repo_path) == v2_sha
@@ -0,0 +1,123 @@
+"""Tests for UI search filtering components."""
+
+from pacc.ui.components import MultiSelectList, SearchFilter, SelectableItem
+
+
+def _reference_score(query: str, text: str) -> float:
+    """Original character-by-character scoring, used to check ranking semantics."""
+    if query == text:
+        return 1.0
+    if text.startswith(query):
+        return 0.9
+    if query in text:
+        return 0.7
+
+    matches = 0
+    query_idx = 0
+    for char in text:
+        if query_idx < len(query) and char == query[query_idx]:
+            matches += 1
+            query_idx += 1
+
+    if matches == len(query):
+        return 0.5 * (matches / len(text))
+    return 0.0
+
+
+def _make_items(count: int = 300):
+    names = ["Hook", "command", "agent", "MCP-server", "format", "lint"]
+    return [
+        SelectableItem(id=str(i), display_text=f"{names[i % len(names)]}-tool-{i}")
+        for i in range(count)
+    ]
+
+
+class TestSelectableItemSearchKey:
+    """Test precomputed search keys on SelectableItem."""
+
+    def test_search_key_is_cached(self):
+        """Test that keys are computed once and refreshed on text change."""
+        item = SelectableItem(id="1", display_text="My Hook")
+
+        text, chars = item.search_key()
+        assert text == "my hook"
+        assert item.search_key() == (text, chars)
+        assert chars == frozenset("my hook")
+        assert item.search_key(case_sensitive=True)[0] == "My Hook"
+
+        item.display_text = "Other"
+        assert item.search_key()[0] == "other"
+
+
+class TestSearchFilterFuzzy:
+    """Test fuzzy filtering behaviour."""
+
+    def test_ranking_matches_reference_scoring(self):
+        """Test that results match the reference scorer, ties in item order."""
+        items = _make_items()
+        search_filter = SearchFilter()
+
+        for query in ["h", "ho", "hoo", "hook-tool-1", "cmd", "t1", "mcp", "xyz", "Hook"]:
+            search_filter.set_query(query)
+            result = search_filter.fuzzy_filter_items(items)
+
+            scored = [
+                (_reference_score(query.lower(), item.display_text.lower()), item) for item in items
+            ]
+            expected = [
+                item
+                for score, item in sorted(scored, key=lambda x: x[0], reverse=True)
+                if score > 0
+            ]
+            assert result == expected, query
+
+    def test_extended_query_narrows_previous_matches(self):
+        """Test that extending the query only rescores previous matches."""
+        items = _make_items()
+        search_filter = SearchFilter()
+
+        search_filter.set_query("ag")
+        first = search_filter.fuzzy_filter_items(items)
+
+        candidates = search_filter._get_fuzzy_candidates(items, "agent")
+        assert len(candidates) == len(first) < len(items)
+
+        search_filter.set_query("agent")
+        narrowed = search_filter.fuzzy_filter_items(items)
+        assert narrowed and all("agent" in item.display_text for item in narrowed)
+
+    def test_backspace_reuses_cached_results(self):
+        """Test that returning to an earlier query does not rescore."""
+        items = _make_items()
+        search_filter = SearchFilter()
+
+        search_filter.set_query("li")
+        before = search_filter.fuzzy_filter_items(items)
+        search_filter.set_query("lin")
+        search_filter.fuzzy_filter_items(items)
+
+        assert search_filter._get_fuzzy_candidates(items, "li") is None
+
+        search_filter.set_query("li")
+        assert search_filter.fuzzy_filter_items(items) == before
+
+    def test_new_item_list_resets_cache(self):
+        """Test that results are recomputed for a different item list."""
+        search_filter = SearchFilter()
+        search_filter.set_query("hook")
+        assert len(search_filter.fuzzy_filter_items(_make_items(12))) == 2
+
+        search_filter.set_query("hook-")
+        assert len(search_filter.fuzzy_filter_items(_make_items(24))) == 4
+
+    def test_multi_select_list_search_input(self):
+        """Test incremental search through MultiSelectList."""
+        multi_select = MultiSelectList(_make_items(60))
+
+        for char in "lint":
+            multi_select._handle_search_input(char)
+
+        assert len(multi_select.filtered_items) == 10
+
+        multi_select._handle_search_backspace()
+        assert len(multi_select.filtered_items) == 10
@@ -0,0 +1,261 @@
+"""Unit tests for archive packages and archive conversions."""
+
+import tarfile
+import tempfile
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+from pacc.errors import PACCError
+from pacc.packaging import converters
+from pacc.packaging.converters import FormatConverter, PackageConverter, UniversalConverter
+from pacc.packaging.formats import MultiFilePackage, PackageFormat, TarPackage, ZipPackage
+from pacc.performance.optimization import get_performance_optimizer
+
+FILES = {
+    "README.md": b"readme",
+    "hooks/pre.json": b'{"event": "PreToolUse"}',
+    "hooks/big.bin": bytes(range(256)) * 4096,
+}
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    """Create a ZIP archive with a directory entry and nested files."""
+    path = tmp_path / "plugin.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("hooks/", b"")
+        for name, data in FILES.items():
+            zip_file.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def tar_gz_path(tmp_path, zip_path):
+    """Create a TAR.GZ archive with the same files."""
+    path = tmp_path / "plugin.tar.gz"
+    FormatConverter().convert(zip_path, PackageFormat.TAR_GZ_ARCHIVE, path)
+    return path
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Create a directory package with the same files."""
+    path = tmp_path / "plugin"
+    for name, data in FILES.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def no_temp_dirs(monkeypatch):
+    """Fail if anything creates a temporary directory."""
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("temporary directory created")
+
+    monkeypatch.setattr(tempfile, "mkdtemp", forbidden)
+
+
+class TestArchiveMemberAccess:
+    """Test listing and reading members straight from the archive."""
+
+    @pytest.mark.usefixtures("no_temp_dirs")
+    def test_zip_members(self, zip_path):
+        """Test ZIP listing skips directories and reads members by name."""
+        package = ZipPackage(zip_path)
+
+        assert package.list_contents() == list(FILES)
+        assert package.get_file_content("hooks/big.bin") == FILES["hooks/big.bin"]
+        with pytest.raises(PACCError):
+            package.get_file_content("missing.txt")
+
+    def test_tar_index_read_once(self, tar_gz_path, monkeypatch):
+        """Test TAR headers are parsed once for listing and member reads."""
+        package = TarPackage(tar_gz_path, compression="gz")
+        reads = []
+        real_read_index = package._read_index
+        monkeypatch.setattr(package, "_read_index", lambda: reads.append(1) or real_read_index())
+
+        assert sorted(package.list_contents()) == sorted(FILES)
+        for name, data in FILES.items():
+            assert package.get_file_content(name) == data
+        assert len(reads) == 1
+
+    def test_iter_files_streams_in_archive_order(self, tar_gz_path):
+        """Test members are yielded with metadata and readable content."""
+        streamed = {
+            member.name: (member.size, file_obj.read())
+            for member, file_obj in TarPackage(tar_gz_path, compression="gz").iter_files()
+        }
+
+        assert streamed == {name: (len(data), data) for name, data in FILES.items()}
+
+
+class TestStreamingConversion:
+    """Test archive to archive conversions."""
+
+    @pytest.mark.parametrize(
+        ("target_format", "suffix"),
+        [(PackageFormat.TAR_ARCHIVE, ".tar"), (PackageFormat.TAR_GZ_ARCHIVE, ".tar.gz")],
+    )
+    def test_zip_to_tar_without_extraction(self, tmp_path, zip_path, target_format, suffix):
+        """Test the universal converter streams ZIP members into a TAR."""
+        output = tmp_path / f"out{suffix}"
+        source = ZipPackage(zip_path)
+
+        result = UniversalConverter().convert(source, target_format, output)
+
+        assert result.success, result.error_message
+        with tarfile.open(output) as tar_file:
+            assert {m.name: tar_file.extractfile(m).read() for m in tar_file} == FILES
+
+    @pytest.mark.usefixtures("no_temp_dirs")
+    def test_tar_to_zip_round_trip(self, tmp_path, tar_gz_path):
+        """Test TAR to ZIP conversion preserves every member."""
+        output = tmp_path / "out.zip"
+
+        result = FormatConverter().convert(tar_gz_path, PackageFormat.ZIP_ARCHIVE, output)
+
+        assert result.success, result.error_message
+        with zipfile.ZipFile(output) as zip_file:
+            assert {name: zip_file.read(name) for name in zip_file.namelist()} == FILES
+
+    @pytest.mark.parametrize("mode, suffix", [("w:bz2", ".tar.bz2"), ("w:xz", ".tar.xz")])
+    def test_compressed_tar_without_known_compression(self, tmp_path, source_dir, mode, suffix):
+        """Test that .tar.bz2 and .tar.xz packages convert with detected compression."""
+        archive = tmp_path / f"plugin{suffix}"
+        with tarfile.open(archive, mode) as tar_file:
+            for name in FILES:
+                tar_file.add(source_dir / name, arcname=name)
+        output = tmp_path / "out.zip"
+
+        result = FormatConverter().convert(archive, PackageFormat.ZIP_ARCHIVE, output)
+
+        assert result.success, result.error_message
+        with zipfile.ZipFile(output) as zip_file:
+            assert {name: zip_file.read(name) for name in zip_file.namelist()} == FILES
+
+
+class TestParallelZipConversion:
+    """Test directory to ZIP conversion with worker process compression."""
+
+    def test_large_files_compressed_by_workers(self, tmp_path, source_dir, monkeypatch):
+        """Test large files go through the process pool and the ZIP stays valid."""
+        monkeypatch.setattr(converters, "PARALLEL_COMPRESS_MIN_SIZE", 1)
+        output = tmp_path / "out.zip"
+
+        result = PackageConverter().convert_file(
+            source_dir, PackageFormat.ZIP_ARCHIVE, output, options={"jobs": 2}
+        )
+
+        assert result.success, result.error_message
+        assert result.metadata["parallel_files"] == len(FILES)
+        with zipfile.ZipFile(output) as zip_file:
+            assert zip_file.testzip() is None
+            assert {name: zip_file.read(name) for name in zip_file.namelist()} == FILES
+
+    def test_zip64_members_compressed_by_workers(self, tmp_path, source_dir, monkeypatch):
+        """Test pre-deflated members get valid ZIP64 headers past the size limit."""
+        monkeypatch.setattr(converters, "PARALLEL_COMPRESS_MIN_SIZE", 1)
+        # Treat every member as ZIP64-sized instead of writing 4 GiB files
+        monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 16)
+        output = tmp_path / "out.zip"
+
+        result = PackageConverter().convert_file(
+            source_dir, PackageFormat.ZIP_ARCHIVE, output, options={"jobs": 2}
+        )
+
+        assert result.success, result.error_message
+        assert result.metadata["parallel_files"] == len(FILES)
+        monkeypatch.undo()
+        with zipfile.ZipFile(output) as zip_file:
+            big = zip_file.getinfo("hooks/big.bin")
+            # The local header of a ZIP64 member stores 0xFFFFFFFF sizes
+            with open(output, "rb") as raw:
+                raw.seek(big.header_offset + 18)
+                assert raw.read(8) == b"\xff" * 8
+            assert zip_file.testzip() is None
+            assert {name: zip_file.read(name) for name in zip_file.namelist()} == FILES
+
+    def test_single_job_compresses_in_process(self, tmp_path, source_dir, monkeypatch):
+        """Test jobs=1 never starts a process pool."""
+        monkeypatch.setattr(converters, "PARALLEL_COMPRESS_MIN_SIZE", 1)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool created")
+
+        monkeypatch.setattr(converters, "ProcessPoolExecutor", no_pool)
+        output = tmp_path / "out.zip"
+
+        result = UniversalConverter().convert(
+            MultiFilePackage(source_dir), PackageFormat.ZIP_ARCHIVE, output, {"jobs": 1}
+        )
+
+        assert result.success, result.error_message
+        assert result.metadata == {
+            "files": 3,
+            "bytes": sum(map(len, FILES.values())),
+            "parallel_files": 0,
+        }
+        assert ZipPackage(output).get_file_content("hooks/big.bin") == FILES["hooks/big.bin"]
+
+    @pytest.mark.parametrize("missing", [*converters._RAW_MEMBER_ATTRIBUTES, "FileHeader"])
+    def test_every_zipfile_internal_is_checked(self, tmp_path, monkeypatch, missing):
+        """Test raw member writes are refused when any internal they use is missing."""
+        with zipfile.ZipFile(tmp_path / "probe.zip", "w") as zip_file:
+            internals = {
+                name: getattr(zip_file, name) for name in converters._RAW_MEMBER_ATTRIBUTES
+            }
+        assert converters._supports_raw_member_writes(SimpleNamespace(**internals))
+
+        if missing == "FileHeader":
+            monkeypatch.delattr(zipfile.ZipInfo, "FileHeader")
+        else:
+            del internals[missing]
+
+        assert not converters._supports_raw_member_writes(SimpleNamespace(**internals))
+
+    def test_missing_zipfile_internal_compresses_in_process(
+        self, tmp_path, source_dir, monkeypatch
+    ):
+        """Test a zipfile without one of the internals falls back to in-process writes."""
+        monkeypatch.setattr(converters, "PARALLEL_COMPRESS_MIN_SIZE", 1)
+        monkeypatch.setattr(
+            converters,
+            "_RAW_MEMBER_ATTRIBUTES",
+            (*converters._RAW_MEMBER_ATTRIBUTES, "_removed_internal"),
+        )
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool created")
+
+        monkeypatch.setattr(converters, "ProcessPoolExecutor", no_pool)
+        output = tmp_path / "out.zip"
+
+        result = PackageConverter().convert_file(
+            source_dir, PackageFormat.ZIP_ARCHIVE, output, options={"jobs": 2}
+        )
+
+        assert result.success, result.error_message
+        assert result.metadata["parallel_files"] == 0
+        with zipfile.ZipFile(output) as zip_file:
+            assert {name: zip_file.read(name) for name in zip_file.namelist()} == FILES
+
+    def test_throughput_reported_to_monitor(self, tmp_path, source_dir):
+        """Test conversions record throughput with the performance monitor."""
+        monitor = get_performance_optimizer().monitor
+        before = len(monitor.get_metrics("package_conversion"))
+
+        result = FormatConverter().convert(
+            source_dir, PackageFormat.TAR_GZ_ARCHIVE, tmp_path / "out.tar.gz"
+        )
+
+        assert result.success, result.error_message
+        metrics = monitor.get_metrics("package_conversion")
+        assert len(metrics) == before + 1
+        assert metrics[-1].metadata["bytes"] == sum(map(len, FILES.values()))
+        assert metrics[-1].metadata["target_format"] == "tar_gz_archive"
+        assert result.metadata["throughput_bytes_per_second"] > 0
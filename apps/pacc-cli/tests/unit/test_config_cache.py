@@ -0,0 +1,119 @@
+"""Unit tests for pacc.core.config_cache module."""
+
+import json
+import os
+import time
+
+import pytest
+
+from pacc.core.config_cache import ConfigFileCache, get_config_cache
+from pacc.core.project_config import ProjectConfigManager
+from pacc.plugins.config import PluginConfigManager
+
+
+def write_settled(path, data):
+    """Write JSON and backdate its mtime past the racy window."""
+    path.write_text(json.dumps(data))
+    past = time.time() - 10
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def shared_cache():
+    """Reset the global config cache around a test."""
+    cache = get_config_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+class TestConfigFileCache:
+    """Test ConfigFileCache loading and validation."""
+
+    def test_unchanged_file_served_from_cache(self, tmp_path):
+        """Test repeated loads parse once and return independent copies."""
+        path = tmp_path / "settings.json"
+        write_settled(path, {"hooks": [{"name": "a"}]})
+        cache = ConfigFileCache()
+        validated = []
+
+        first = cache.load_json(path, validate=validated.append)
+        first["hooks"].append({"name": "mutated"})
+        second = cache.load_json(path, validate=validated.append)
+
+        assert second == {"hooks": [{"name": "a"}]}
+        assert len(validated) == 1
+        assert cache.stats()["loads_avoided"] == 1
+
+    def test_change_detected_by_mtime_and_size(self, tmp_path):
+        """Test edits made outside the cache are picked up."""
+        path = tmp_path / "settings.json"
+        write_settled(path, {"a": 1})
+        cache = ConfigFileCache()
+        cache.load_json(path)
+
+        write_settled(path, {"a": 22})
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert cache.load_json(path) == {"a": 22}
+        assert cache.stats()["loads"] == 2
+
+    def test_recently_modified_files_not_cached(self, tmp_path):
+        """Test files inside the racy window are re-read every time."""
+        path = tmp_path / "settings.json"
+        path.write_text('{"a": 1}')
+        cache = ConfigFileCache()
+
+        cache.load_json(path)
+        cache.load_json(path)
+
+        assert cache.stats() == {
+            "loads_avoided": 0,
+            "loads": 2,
+            "invalidations": 0,
+            "cached_files": 0,
+        }
+
+    def test_invalid_content_not_cached(self, tmp_path):
+        """Test parse failures propagate and leave no entry."""
+        path = tmp_path / "settings.json"
+        path.write_text("{broken")
+        past = time.time() - 10
+        os.utime(path, (past, past))
+        cache = ConfigFileCache()
+
+        with pytest.raises(json.JSONDecodeError):
+            cache.load_json(path)
+        assert cache.stats()["cached_files"] == 0
+
+
+class TestSharedConfigCache:
+    """Test managers share the global cache and invalidate on save."""
+
+    def test_plugin_config_write_through(self, tmp_path, shared_cache):
+        """Test saving plugin config invalidates the cached parse."""
+        manager = PluginConfigManager(
+            plugins_dir=tmp_path / "plugins", settings_path=tmp_path / "settings.json"
+        )
+        write_settled(manager.config_path, {"repositories": {"a/b": {}}})
+
+        assert "a/b" in manager._load_plugin_config()["repositories"]
+        assert "a/b" in manager._load_plugin_config()["repositories"]
+        assert shared_cache.stats()["loads_avoided"] == 1
+
+        assert manager._save_plugin_config({"repositories": {"c/d": {}}})
+        assert shared_cache.stats()["invalidations"] == 1
+        assert list(manager._load_plugin_config()["repositories"]) == ["c/d"]
+
+    def test_project_config_write_through(self, tmp_path, shared_cache):
+        """Test saving pacc.json invalidates the cached parse."""
+        manager = ProjectConfigManager()
+        write_settled(tmp_path / "pacc.json", {"name": "demo", "version": "1.0.0"})
+
+        manager.load_project_config(tmp_path)
+        assert manager.load_project_config(tmp_path)["name"] == "demo"
+        assert shared_cache.stats()["loads_avoided"] == 1
+
+        manager.save_project_config(tmp_path, {"name": "renamed", "version": "1.0.0"})
+        assert manager.load_project_config(tmp_path)["name"] == "renamed"
@@ -7,7 +7,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pacc.core.file_utils import DirectoryScanner, FileFilter, FilePathValidator, PathNormalizer
+from pacc.core.file_utils import (
+    DirectoryScanner,
+    FileFilter,
+    FilePathValidator,
+    PathNormalizer,
+    TreeSnapshot,
+)
 
 
 class TestFilePathValidator:
@@ -408,6 +414,45 @@ class TestDirectoryScanner:
             assert stats["total_files"] == 0
 
 
+class TestTreeSnapshot:
+    """Test TreeSnapshot single-walk directory statistics."""
+
+    def test_scan_records_files_and_directories(self, temp_dir):
+        """Test files are listed with stats and sorted by relative path."""
+        (temp_dir / "hooks" / "nested").mkdir(parents=True)
+        (temp_dir / "a.b").write_text("12345")
+        (temp_dir / "hooks" / "pre.json").write_text("{}")
+        (temp_dir / "hooks" / "nested" / "deep.md").write_text("deep")
+        (temp_dir / "empty").mkdir()
+
+        snapshot = TreeSnapshot.scan(temp_dir)
+
+        assert snapshot.paths == ["a.b", "hooks/nested/deep.md", "hooks/pre.json"]
+        assert snapshot.directories == ["empty", "hooks", "hooks/nested"]
+        assert snapshot.total_size == 11
+        entry = snapshot.get("hooks/nested/deep.md")
+        assert entry.size == 4
+        assert stat.S_ISREG(entry.mode)
+        assert snapshot.get("missing") is None
+
+    def test_directory_stats_use_one_walk(self, temp_dir):
+        """Test get_directory_stats scans the tree once."""
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "one.txt").write_text("1")
+        (temp_dir / "sub" / "two.json").write_text("22")
+        scanner = DirectoryScanner()
+        scanner.validator.is_valid_path = lambda path: True
+
+        with patch.object(TreeSnapshot, "scan", wraps=TreeSnapshot.scan) as scan:
+            stats = scanner.get_directory_stats(temp_dir)
+
+        assert scan.call_count == 1
+        assert stats["total_files"] == 2
+        assert stats["total_size"] == 3
+        assert stats["total_directories"] == 1
+        assert stats["extensions"] == {".txt", ".json"}
+
+
 class TestFileFilter:
     """Test FileFilter class functionality."""
 
@@ -246,6 +246,60 @@ class TestCollectionDependencyResolver:
         with pytest.raises(PACCError, match="Circular dependency"):
             self.resolver.resolve_dependencies(metadata)
 
+    def test_transitive_dependencies_in_install_order(self):
+        """Test the full closure is planned with one inventory snapshot."""
+        # team-0 depends on team-1 .. team-49; each team-i also depends on team-(i+1)
+        available = {
+            f"team-{i}": CollectionMetadata(
+                name=f"team-{i}",
+                version="1.0.0",
+                dependencies=[f"team-{i + 1}"] if i < 49 else ["shared"],
+            )
+            for i in range(1, 50)
+        }
+        metadata = CollectionMetadata(
+            name="team-0", version="1.0.0", dependencies=[f"team-{i}" for i in range(1, 50)]
+        )
+        self.storage_manager.list_collections.return_value = {"shared": ["fragment"]}
+
+        plan = self.resolver.plan_installation(metadata, available.get)
+
+        assert plan.install_order == [f"team-{i}" for i in range(49, 0, -1)]
+        assert plan.satisfied == ["shared"]
+        assert plan.unresolved == []
+        assert self.storage_manager.list_collections.call_count == 1
+
+    def test_installed_dependencies_are_not_followed(self):
+        """Test that installed collections end the walk and unknown ones are flagged."""
+        lookups = []
+
+        def find_collection(name):
+            lookups.append(name)
+            return None
+
+        metadata = CollectionMetadata(
+            name="test", version="1.0.0", dependencies=["installed", "unknown"]
+        )
+        self.storage_manager.list_collections.return_value = {"installed": ["fragment"]}
+
+        plan = self.resolver.plan_installation(metadata, find_collection)
+
+        assert plan.install_order == ["unknown"]
+        assert plan.unresolved == ["unknown"]
+        assert lookups == ["unknown"]
+
+    def test_transitive_cycle_detected(self):
+        """Test that cycles through dependencies are reported with their path."""
+        available = {
+            "a": CollectionMetadata(name="a", version="1.0.0", dependencies=["b"]),
+            "b": CollectionMetadata(name="b", version="1.0.0", dependencies=["a"]),
+        }
+        metadata = CollectionMetadata(name="test", version="1.0.0", dependencies=["a"])
+        self.storage_manager.list_collections.return_value = {}
+
+        with pytest.raises(PACCError, match="a -> b -> a"):
+            self.resolver.resolve_dependencies(metadata, available.get)
+
 
 class TestCollectionInstallOptions:
     """Test collection install options."""
@@ -426,6 +480,62 @@ class TestFragmentCollectionManager:
         assert "missing-dep" in result.dependencies_resolved
         assert any("Missing dependencies" in warning for warning in result.warnings)
 
+    def test_install_collection_plans_sibling_dependencies(self):
+        """Test that dependencies found next to the collection are followed transitively."""
+        for name, deps in [("app", ["mid"]), ("mid", ["base"]), ("base", [])]:
+            collection_dir = self.temp_dir / name
+            collection_dir.mkdir()
+            pacc_data = {"collection": {"name": name, "version": "1.0.0", "dependencies": deps}}
+            (collection_dir / "pacc.json").write_text(json.dumps(pacc_data))
+            (collection_dir / f"{name}.md").write_text(f"# {name}")
+
+        options = CollectionInstallOptions(dry_run=True, verify_integrity=False)
+        result = self.collection_manager.install_collection(self.temp_dir / "app", options)
+
+        assert result.success is True
+        assert result.dependencies_resolved == ["base", "mid"]
+
+    def test_sibling_dependency_names_cannot_escape_parent(self):
+        """Test that dependency names with path components are not looked up."""
+        parent = self.temp_dir / "collections"
+        for relative in ["app", "../outside", "sub/inner"]:
+            collection_dir = parent / relative
+            collection_dir.mkdir(parents=True)
+            pacc_data = {"collection": {"name": collection_dir.name, "version": "1.0.0"}}
+            (collection_dir / "pacc.json").write_text(json.dumps(pacc_data))
+
+        find = self.collection_manager._sibling_collection_finder(parent / "app")
+
+        assert find("app").name == "app"
+        for name in ["../outside", "..", "sub/inner", "sub\\inner"]:
+            assert find(name) is None
+
+    def test_install_collection_is_all_or_nothing(self):
+        """Test that a storage failure leaves no collection files behind."""
+        collection_dir = self.temp_dir / "bulk"
+        collection_dir.mkdir()
+        for i in range(30):
+            (collection_dir / f"frag{i}.md").write_text(f"# Fragment {i}")
+
+        options = CollectionInstallOptions(verify_integrity=False)
+        storage = self.collection_manager.storage_manager
+
+        with patch.object(storage, "store_fragments", wraps=storage.store_fragments) as mock_store:
+            result = self.collection_manager.install_collection(collection_dir, options)
+
+        assert result.success is True
+        assert len(result.installed_files) == 30
+        assert mock_store.call_count == 1
+
+        (collection_dir / "extra.md").write_text("# Extra")
+        with patch("pacc.fragments.storage_manager.os.replace", side_effect=OSError("disk full")):
+            result = self.collection_manager.install_collection(collection_dir, options)
+
+        assert result.success is False
+        assert result.skipped_files and "extra" not in result.skipped_files
+        assert storage.find_fragment("extra", "project", "bulk") is None
+        assert len(list((storage.project_storage / "bulk").glob("*.md"))) == 30
+
     def test_verify_collection_integrity(self):
         """Test collection integrity verification."""
         # Create test collection
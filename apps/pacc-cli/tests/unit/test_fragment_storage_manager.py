@@ -8,7 +8,12 @@ from pathlib import Path
 import pytest
 
 from pacc.errors.exceptions import PACCError
-from pacc.fragments.storage_manager import FragmentStorageManager, GitIgnoreManager
+from pacc.fragments import storage_manager as storage_module
+from pacc.fragments.storage_manager import (
+    FragmentStorageIndex,
+    FragmentStorageManager,
+    GitIgnoreManager,
+)
 
 
 class TestFragmentStorageManager:
@@ -398,6 +403,57 @@ class TestFragmentStorageManager:
         found_path = storage_manager.find_fragment("with-extension.md", "project")
         assert found_path is not None
 
+    def test_store_fragments_batch(self, storage_manager, temp_project):
+        """Test storing several fragments in one staged operation."""
+        fragments = {f"frag-{i}": f"# Fragment {i}" for i in range(20)}
+
+        stored = storage_manager.store_fragments(fragments, "project", collection="bulk")
+
+        assert set(stored) == set(fragments)
+        for name, path in stored.items():
+            assert path == storage_manager.project_storage / "bulk" / f"{name}.md"
+            assert path.read_text() == fragments[name]
+
+        # Staging happens outside the storage directory and is cleaned up
+        assert [p.name for p in storage_manager.project_storage.iterdir()] == ["bulk"]
+        assert not list(storage_manager.project_storage.parent.glob(".fragment-staging-*"))
+        assert ".claude/pacc/fragments/" in (temp_project / ".gitignore").read_text()
+
+    def test_store_fragments_conflict_leaves_storage_unchanged(self, storage_manager):
+        """Test that an existing fragment rejects the whole batch."""
+        storage_manager.store_fragment("existing", "Original", "project")
+
+        with pytest.raises(PACCError, match="existing"):
+            storage_manager.store_fragments({"new": "New", "existing": "Changed"}, "project")
+
+        assert storage_manager.find_fragment("new", "project") is None
+        assert storage_manager.load_fragment("existing", "project") == "Original"
+
+    def test_store_fragments_rolls_back_on_failed_move(self, storage_manager, monkeypatch):
+        """Test that a failure part way through restores overwritten fragments."""
+        storage_manager.store_fragment("b", "Original b", "project")
+        real_replace = storage_module.os.replace
+        moves = []
+
+        def failing_replace(src, dst):
+            moves.append(dst)
+            if Path(dst).name == "c.md":
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(storage_module.os, "replace", failing_replace)
+
+        with pytest.raises(PACCError, match="disk full"):
+            storage_manager.store_fragments(
+                {"a": "New a", "b": "New b", "c": "New c"}, "project", overwrite=True
+            )
+
+        monkeypatch.setattr(storage_module.os, "replace", real_replace)
+        assert storage_manager.find_fragment("a", "project") is None
+        assert storage_manager.find_fragment("c", "project") is None
+        assert storage_manager.load_fragment("b", "project") == "Original b"
+        assert not list(storage_manager.project_storage.parent.glob(".fragment-staging-*"))
+
 
 class TestGitIgnoreManager:
     """Test cases for GitIgnoreManager."""
@@ -598,3 +654,105 @@ class TestFragmentStorageIntegration:
         # Test operations on invalid storage types
         fragments = storage_manager.list_fragments(storage_type="invalid")
         assert len(fragments) == 0
+
+
+class TestFragmentStorageIndex:
+    """Test cases for the mtime-validated fragment storage index."""
+
+    @pytest.fixture
+    def storage_dir(self, tmp_path, monkeypatch):
+        """Create a populated storage directory whose listings are trusted at once."""
+        monkeypatch.setattr(FragmentStorageIndex, "RACY_WINDOW_SECONDS", -1)
+        base = tmp_path / ".claude" / "pacc" / "fragments"
+        (base / "docs").mkdir(parents=True)
+        (base / "root.md").write_text("Root")
+        (base / "docs" / "guide.md").write_text("Guide")
+        (base / "docs" / "notes.json").write_text("{}")
+        return base
+
+    @pytest.fixture
+    def scan_counter(self, monkeypatch):
+        """Count directory scans performed by the index."""
+        scanned = []
+        real_scandir = storage_module.os.scandir
+
+        def counting_scandir(path):
+            # shutil.rmtree scans by file descriptor; only count path scans
+            if not isinstance(path, int):
+                scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(storage_module.os, "scandir", counting_scandir)
+        return scanned
+
+    def test_unchanged_directories_are_not_rescanned(self, storage_dir, scan_counter):
+        """Test that repeated snapshots reuse listings until a directory changes."""
+        index = FragmentStorageIndex(storage_dir, {".md", ".txt"}, persist=False)
+
+        listings = index.snapshot()
+        assert set(listings) == {None, "docs"}
+        assert set(listings["docs"].files) == {"guide.md"}
+        assert index.snapshot()["docs"] is listings["docs"]
+        assert sorted(scan_counter) == ["docs", "fragments"]
+
+        (storage_dir / "docs" / "extra.md").write_text("Extra")
+        assert set(index.snapshot()["docs"].files) == {"guide.md", "extra.md"}
+        assert sorted(scan_counter) == ["docs", "docs", "fragments"]
+
+        shutil.rmtree(storage_dir / "docs")
+        assert set(index.snapshot()) == {None}
+
+    def test_persisted_index_avoids_cold_start_scans(self, storage_dir, scan_counter):
+        """Test that a new index loads persisted listings and only stats directories."""
+        FragmentStorageIndex(storage_dir, {".md", ".txt"}).snapshot()
+        assert (storage_dir.parent / FragmentStorageIndex.INDEX_FILENAME).exists()
+        scan_counter.clear()
+
+        listings = FragmentStorageIndex(storage_dir, {".md", ".txt"}).snapshot()
+
+        assert scan_counter == []
+        assert set(listings[None].files) == {"root.md"}
+        assert listings[None].subdirs == ["docs"]
+
+    def test_recently_modified_directories_are_rescanned(
+        self, storage_dir, scan_counter, monkeypatch
+    ):
+        """Test that listings taken within the mtime granularity window are not trusted."""
+        monkeypatch.setattr(FragmentStorageIndex, "RACY_WINDOW_SECONDS", 3600)
+        index = FragmentStorageIndex(storage_dir, {".md", ".txt"}, persist=False)
+
+        index.directory("docs")
+        index.directory("docs")
+
+        assert scan_counter == ["docs", "docs"]
+
+    def test_manager_reflects_in_place_overwrites(self, tmp_path, monkeypatch):
+        """Test that sizes update when the manager overwrites a fragment in place."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        manager = FragmentStorageManager(tmp_path / "project", persist_index=False)
+
+        manager.store_fragment("note", "short", "project")
+        assert manager.list_fragments("project")[0].size == 5
+
+        manager.store_fragment("note", "much longer content", "project", overwrite=True)
+        assert manager.list_fragments("project")[0].size == 19
+        assert manager.get_fragment_stats()["total_size"] == 19
+
+    def test_external_in_place_edits_are_reported(self, tmp_path, monkeypatch):
+        """Test that sizes stay accurate when a fragment is edited outside the manager."""
+        monkeypatch.setattr(FragmentStorageIndex, "RACY_WINDOW_SECONDS", -1)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        manager = FragmentStorageManager(tmp_path / "project")
+        path = manager.store_fragment("note", "short", "project")
+        assert manager.list_fragments("project")[0].size == 5
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(" and some appended content")
+
+        assert manager.list_fragments("project")[0].size == 31
+        assert manager.get_fragment_stats()["total_size"] == 31
+
+        # A fresh manager loading the persisted index sees the same size
+        FragmentStorageIndex._instances.clear()
+        reloaded = FragmentStorageManager(tmp_path / "project")
+        assert reloaded.list_fragments("project")[0].size == 31
@@ -107,6 +107,33 @@ class TestFragmentVersionTracker:
         assert version.author == "Test Author"
         assert "test_fragment" in tracker.versions
 
+    @patch("subprocess.run")
+    def test_track_installations_batch(self, mock_run, temp_project):
+        """Test batch tracking reads Git info once per directory and saves once."""
+        tracker = FragmentVersionTracker(project_root=temp_project)
+        fragments = []
+        for i in range(5):
+            fragment_path = temp_project / f"fragment_{i}.md"
+            fragment_path.write_text(f"# Fragment {i}")
+            fragments.append(
+                (f"fragment_{i}", "https://github.com/test/repo.git", "git", fragment_path)
+            )
+
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="abc123456789\n"),
+            Mock(returncode=0, stdout="Initial commit\n"),
+            Mock(returncode=0, stdout="Test Author\n"),
+        ]
+
+        with patch.object(tracker, "_save_versions") as mock_save:
+            versions = tracker.track_installations(fragments)
+
+        assert mock_run.call_count == 3
+        mock_save.assert_called_once()
+        assert sorted(versions) == [f"fragment_{i}" for i in range(5)]
+        assert all(v.version_id == "abc12345" for v in versions.values())
+        assert all(v.author == "Test Author" for v in versions.values())
+
     def test_track_installation_url(self, temp_project):
         """Test tracking URL source installation."""
         tracker = FragmentVersionTracker(project_root=temp_project)
@@ -0,0 +1,193 @@
+"""Unit tests for pacc.core.hashing module."""
+
+import hashlib
+import os
+
+import pytest
+
+from pacc.core import hashing
+from pacc.core.file_utils import TreeSnapshot
+from pacc.core.hashing import FileHasher, list_tree_files, merkle_root
+from pacc.packaging.formats import MultiFilePackage
+from pacc.packaging.metadata import ManifestGenerator, PackageMetadata
+
+
+@pytest.fixture
+def package_dir(tmp_path, monkeypatch):
+    """Create a small package tree whose digests are cached at once."""
+    monkeypatch.setattr(FileHasher, "RACY_WINDOW_SECONDS", -1)
+    root = tmp_path / "plugin"
+    (root / "hooks").mkdir(parents=True)
+    (root / "README.md").write_text("readme")
+    (root / "hooks" / "pre.json").write_text('{"event": "PreToolUse"}')
+    (root / "hooks" / "post.json").write_text('{"event": "PostToolUse"}')
+    return root
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    """Count uncached file reads performed by the hasher."""
+    reads = []
+    real_digest = hashing._digest_file
+
+    def counting_digest(file_path, algorithm):
+        reads.append(os.path.basename(file_path))
+        return real_digest(file_path, algorithm)
+
+    monkeypatch.setattr(hashing, "_digest_file", counting_digest)
+    return reads
+
+
+class TestFileHasher:
+    """Test FileHasher hashing and caching."""
+
+    def test_hash_file_matches_hashlib(self, tmp_path):
+        """Test digests match a plain hashlib computation."""
+        data = os.urandom(3 * hashing.CHUNK_SIZE + 17)
+        target = tmp_path / "blob.bin"
+        target.write_bytes(data)
+
+        hasher = FileHasher()
+        assert hasher.hash_file(target) == hashlib.sha256(data).hexdigest()
+        assert hasher.hash_file(target, "md5") == hashlib.md5(data).hexdigest()
+
+    def test_digest_cached_until_file_changes(self, tmp_path, read_counter, monkeypatch):
+        """Test files are re-read only after their size or mtime changes."""
+        monkeypatch.setattr(FileHasher, "RACY_WINDOW_SECONDS", -1)
+        target = tmp_path / "file.txt"
+        target.write_text("one")
+        hasher = FileHasher()
+
+        first = hasher.hash_file(target)
+        assert hasher.hash_file(target) == first
+        assert read_counter == ["file.txt"]
+
+        target.write_text("two")
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert hasher.hash_file(target) == hashlib.sha256(b"two").hexdigest()
+        assert len(read_counter) == 2
+
+    def test_recently_modified_files_are_not_cached(self, tmp_path, read_counter, monkeypatch):
+        """Test a same-size rewrite within the mtime granularity window is detected."""
+        monkeypatch.setattr(FileHasher, "RACY_WINDOW_SECONDS", 3600)
+        target = tmp_path / "file.txt"
+        target.write_text("one")
+        mtime_ns = target.stat().st_mtime_ns
+        hasher = FileHasher()
+
+        hasher.hash_file(target)
+        target.write_text("two")
+        os.utime(target, ns=(mtime_ns, mtime_ns))
+
+        assert hasher.hash_file(target) == hashlib.sha256(b"two").hexdigest()
+        assert read_counter == ["file.txt", "file.txt"]
+
+    def test_hash_files_parallel_preserves_order(self, package_dir):
+        """Test parallel hashing returns digests keyed in input order."""
+        files = [package_dir / rel for rel in list_tree_files(package_dir)]
+
+        digests = FileHasher(max_workers=4).hash_files(files)
+
+        assert list(digests) == files
+        for path, digest in digests.items():
+            assert digest == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_cache_is_bounded(self, package_dir):
+        """Test the least recently used digests are evicted."""
+        hasher = FileHasher(max_cache_entries=2)
+        hasher.hash_files(package_dir / rel for rel in list_tree_files(package_dir))
+        assert len(hasher._cache) == 2
+
+
+class TestMerkleRoot:
+    """Test package tree Merkle roots."""
+
+    def test_tree_root_tracks_content_names_and_layout(self, package_dir):
+        """Test that content, renames and moves all change the root."""
+        hasher = FileHasher()
+        root, files = hasher.hash_tree(package_dir)
+
+        assert sorted(files) == ["README.md", "hooks/post.json", "hooks/pre.json"]
+        assert merkle_root(files) == root
+
+        moved = dict(files)
+        moved["post.json"] = moved.pop("hooks/post.json")
+        assert merkle_root(moved) != root
+
+        renamed = dict(files)
+        renamed["hooks/after.json"] = renamed.pop("hooks/post.json")
+        assert merkle_root(renamed) != root
+
+        (package_dir / "README.md").write_text("changed readme")
+        assert hasher.hash_tree(package_dir)[0] != root
+
+    def test_package_metadata_round_trip(self, package_dir, read_counter):
+        """Test metadata creation hashes each file once and verifies afterwards."""
+        package = MultiFilePackage(package_dir)
+        metadata = PackageMetadata.from_package(package)
+
+        assert metadata.checksum_scheme == "merkle"
+        assert sorted(read_counter) == ["README.md", "post.json", "pre.json"]
+        assert metadata.verify_integrity(package) is True
+
+        (package_dir / "hooks" / "pre.json").write_text('{"event": "Other!!!!!"}')
+        assert metadata.verify_integrity(package) is False
+
+    def test_legacy_checksums_still_verify(self, package_dir):
+        """Test manifests without a checksum scheme use the stream checksum."""
+        package = MultiFilePackage(package_dir)
+        data = PackageMetadata.from_package(package).to_dict()
+        data.pop("checksum_scheme")
+        data["checksum"] = package.calculate_checksum(merkle=False)
+
+        assert PackageMetadata.from_dict(data).verify_integrity(package) is True
+
+    def test_manifest_walks_package_once(self, package_dir, monkeypatch):
+        """Test size, checksum, listing and file metadata share one tree walk."""
+        scans = []
+        real_scan = TreeSnapshot.scan
+
+        def counting_scan(root):
+            scans.append(root)
+            return real_scan(root)
+
+        monkeypatch.setattr(TreeSnapshot, "scan", counting_scan)
+
+        manifest = ManifestGenerator().generate_manifest(MultiFilePackage(package_dir))
+
+        assert scans == [package_dir]
+        assert [f["path"] for f in manifest["files"]] == [
+            "README.md",
+            "hooks/post.json",
+            "hooks/pre.json",
+        ]
+        assert manifest["package"]["size_bytes"] == sum(f["size"] for f in manifest["files"])
+
+    def test_direct_calls_reflect_directory_changes(self, package_dir):
+        """Test that size, listing and checksum are not served from an old walk."""
+        package = MultiFilePackage(package_dir)
+        assert len(package.list_contents()) == 3
+        checksum = package.calculate_checksum()
+
+        (package_dir / "hooks" / "post.json").unlink()
+        (package_dir / "NEW.md").write_text("new")
+        with open(package_dir / "README.md", "a") as f:
+            f.write(" appended")
+
+        assert package.list_contents() == ["NEW.md", "README.md", "hooks/pre.json"]
+        assert package.get_size() == 3 + len("readme appended") + len('{"event": "PreToolUse"}')
+        assert package.calculate_checksum() != checksum
+
+    def test_legacy_checksum_orders_by_path_components(self, tmp_path):
+        """Test the legacy stream checksum keeps Path ordering for dotted names."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b").write_text("nested")
+        (tmp_path / "a.b").write_text("dotted")
+
+        stream = hashlib.sha256()
+        for rel_path, data in (("a/b", b"nested"), ("a.b", b"dotted")):
+            stream.update(rel_path.encode())
+            stream.update(data)
+
+        assert MultiFilePackage(tmp_path).calculate_checksum(merkle=False) == stream.hexdigest()
@@ -0,0 +1,225 @@
+"""Unit tests for pacc.core.lockfile and lockfile-driven plugin sync."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from pacc.core.lockfile import (
+    LockedFragment,
+    LockedRepository,
+    LockfileManager,
+    ProjectLock,
+)
+from pacc.core.project_config import PluginSyncManager
+
+LOCKED_SHA = "a" * 40
+UPSTREAM_SHA = "b" * 40
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Create a project whose pacc.json pins one installed repository."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    (tmp_path / "home" / ".claude" / "plugins" / "repos" / "owner" / "repo").mkdir(parents=True)
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "fragments").mkdir()
+    (project_dir / "fragments" / "notes.md").write_text("# Notes\n")
+    (project_dir / "pacc.json").write_text(
+        json.dumps(
+            {
+                "name": "demo",
+                "version": "1.0.0",
+                "plugins": {"repositories": ["owner/repo@main"]},
+                "fragments": {
+                    "notes": {"reference_path": "fragments/notes.md", "version": "1.2.0"}
+                },
+            }
+        )
+    )
+    return project_dir
+
+
+@pytest.fixture
+def head():
+    """Commit the mocked clone of owner/repo is at."""
+    return {"commit": LOCKED_SHA}
+
+
+@pytest.fixture
+def sync_manager(monkeypatch, head):
+    """Create a sync manager whose git operations are mocked."""
+    manager = PluginSyncManager()
+    plugin_manager = Mock()
+    plugin_manager.list_installed_repositories.return_value = {"owner/repo": {}}
+    plugin_manager.update_repository.return_value = True
+
+    def checkout(repo_spec, repo_path, commit=None, worktrees=False):
+        head["commit"] = commit
+        return True
+
+    monkeypatch.setattr(manager, "_get_plugin_manager", lambda: plugin_manager)
+    monkeypatch.setattr(manager, "_get_current_commit", lambda _: head["commit"])
+    monkeypatch.setattr(manager, "_checkout_version", Mock(side_effect=checkout))
+    monkeypatch.setattr(manager, "_resolve_version_to_commit", Mock(return_value=UPSTREAM_SHA))
+    return manager
+
+
+def write_lock(project_dir, commit=LOCKED_SHA):
+    """Write a lock pinning owner/repo@main to a commit."""
+    LockfileManager(project_dir).save(
+        ProjectLock(
+            repositories={
+                "owner/repo@main": LockedRepository("owner/repo", "main", commit),
+            }
+        )
+    )
+
+
+class TestLockfileManager:
+    """Test reading and writing pacc.lock."""
+
+    def test_round_trip_and_unchanged_save(self, tmp_path):
+        """Test a saved lock loads back and identical saves are skipped."""
+        lockfile = LockfileManager(tmp_path)
+        lock = ProjectLock(
+            repositories={"owner/repo@v1": LockedRepository("owner/repo", "v1", LOCKED_SHA)},
+            fragments={"notes": LockedFragment("notes", "1.0", "notes.md", "f" * 64)},
+        )
+
+        assert lockfile.save(lock)
+        assert lockfile.load() == lock
+        assert not lockfile.save(lock)
+        assert json.loads(lockfile.path.read_text())["lockfileVersion"] == 1
+
+    def test_unsupported_version_ignored(self, tmp_path):
+        """Test lockfiles from another format version are not used."""
+        (tmp_path / "pacc.lock").write_text('{"lockfileVersion": 99}')
+
+        assert LockfileManager(tmp_path).load() is None
+
+
+class TestFrozenPluginSync:
+    """Test plugin sync against pacc.lock."""
+
+    def test_first_sync_writes_lock(self, project_dir, sync_manager):
+        """Test resolved commits and fragment hashes are recorded."""
+        result = sync_manager.sync_plugins(project_dir)
+
+        assert result.success, result.error_message
+        assert result.metadata == {"frozen": False, "lock_written": True}
+        lock = LockfileManager(project_dir).load()
+        assert lock.repositories["owner/repo@main"].commit == UPSTREAM_SHA
+        assert lock.fragments["notes"].version == "1.2.0"
+        assert lock.fragments["notes"].content_hash is not None
+
+    def test_locked_sync_skips_resolution(self, project_dir, sync_manager):
+        """Test a repository at its locked commit is not fetched or checked out."""
+        sync_manager.sync_plugins(project_dir)
+        sync_manager._resolve_version_to_commit.reset_mock()
+        sync_manager._checkout_version.reset_mock()
+
+        result = sync_manager.sync_plugins(project_dir)
+
+        assert result.success, result.error_message
+        assert result.skipped_count == 1
+        assert result.metadata == {"frozen": True, "lock_written": False}
+        sync_manager._resolve_version_to_commit.assert_not_called()
+        sync_manager._checkout_version.assert_not_called()
+
+    def test_refresh_lock_re_resolves(self, project_dir, sync_manager):
+        """Test --refresh-lock ignores the lock and records the new commit."""
+        write_lock(project_dir)
+
+        result = sync_manager.sync_plugins(project_dir, refresh_lock=True)
+
+        assert result.updated_count == 1
+        sync_manager._resolve_version_to_commit.assert_called_once()
+        assert (
+            LockfileManager(project_dir).load().repositories["owner/repo@main"].commit
+            == UPSTREAM_SHA
+        )
+
+    def test_fresh_install_checks_out_locked_commit(self, project_dir, sync_manager, head):
+        """Test a new clone of an unpinned spec is moved to its locked commit."""
+        config = json.loads((project_dir / "pacc.json").read_text())
+        config["plugins"]["repositories"] = ["owner/repo"]
+        (project_dir / "pacc.json").write_text(json.dumps(config))
+        LockfileManager(project_dir).save(
+            ProjectLock(
+                repositories={"owner/repo": LockedRepository("owner/repo", None, LOCKED_SHA)}
+            )
+        )
+        plugin_manager = sync_manager._get_plugin_manager()
+        plugin_manager.list_installed_repositories.return_value = {}
+        plugin_manager.install_repository.return_value = True
+        head["commit"] = UPSTREAM_SHA  # a fresh clone is at upstream HEAD
+
+        result = sync_manager.sync_plugins(project_dir)
+
+        assert result.installed_count == 1
+        assert head["commit"] == LOCKED_SHA
+        assert LockfileManager(project_dir).load().repositories["owner/repo"].commit == LOCKED_SHA
+
+    def test_failed_checkout_records_actual_commit(self, project_dir, sync_manager, head):
+        """Test the lock names the commit the clone is at when the checkout fails."""
+        write_lock(project_dir)
+        plugin_manager = sync_manager._get_plugin_manager()
+        plugin_manager.list_installed_repositories.return_value = {}
+        plugin_manager.install_repository.return_value = True
+        sync_manager._checkout_version.side_effect = None
+        sync_manager._checkout_version.return_value = False
+        head["commit"] = UPSTREAM_SHA
+
+        sync_manager.sync_plugins(project_dir)
+
+        assert (
+            LockfileManager(project_dir).load().repositories["owner/repo@main"].commit
+            == UPSTREAM_SHA
+        )
+
+    def test_failed_sync_keeps_locked_commit(self, project_dir, sync_manager, monkeypatch):
+        """Test a repository whose sync raises stays pinned in the lock."""
+        write_lock(project_dir)
+        monkeypatch.setattr(
+            sync_manager, "_sync_repository", Mock(side_effect=RuntimeError("network down"))
+        )
+
+        result = sync_manager.sync_plugins(project_dir)
+
+        assert result.failed_plugins == ["owner/repo"]
+        assert (
+            LockfileManager(project_dir).load().repositories["owner/repo@main"].commit == LOCKED_SHA
+        )
+
+    def test_environment_sync_keeps_other_environments(self, project_dir, sync_manager):
+        """Test syncing one environment keeps lock entries of the others."""
+        config = json.loads((project_dir / "pacc.json").read_text())
+        config["environments"] = {"dev": {"plugins": {"repositories": ["owner/tools@v2.0"]}}}
+        (project_dir / "pacc.json").write_text(json.dumps(config))
+        tools = LockedRepository("owner/tools", "v2.0", LOCKED_SHA)
+        gone = LockedRepository("owner/gone", "v1.0", LOCKED_SHA)
+        write_lock(project_dir)
+        lockfile = LockfileManager(project_dir)
+        lock = lockfile.load()
+        lock.repositories.update({tools.key: tools, gone.key: gone})
+        lockfile.save(lock)
+
+        sync_manager.sync_plugins(project_dir)
+
+        repositories = lockfile.load().repositories
+        assert repositories[tools.key] == tools
+        assert gone.key not in repositories
+        assert "owner/repo@main" in repositories
+
+    def test_modified_fragment_reported(self, project_dir, sync_manager):
+        """Test fragment content that no longer matches the lock is a warning."""
+        sync_manager.sync_plugins(project_dir)
+        (project_dir / "fragments" / "notes.md").write_text("# Edited\n")
+
+        result = sync_manager.sync_plugins(project_dir)
+
+        assert any("notes" in warning for warning in result.warnings)
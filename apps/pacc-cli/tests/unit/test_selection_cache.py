@@ -0,0 +1,163 @@
+"""Tests for the indexed selection cache."""
+
+import os
+import sqlite3
+
+import pytest
+
+from pacc.selection.persistence import SelectionCache
+from pacc.selection.types import SelectionContext, SelectionMode, SelectionResult
+
+
+def _result(tmp_path, name="hook.json"):
+    return SelectionResult(success=True, selected_files=[tmp_path / name])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    selection_cache = SelectionCache(cache_dir=tmp_path / "cache")
+    yield selection_cache
+    selection_cache.close()
+
+
+class TestSelectionCache:
+    """Test SelectionCache storage, lookup and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_survives_restart(self, tmp_path, cache):
+        """Test that entries are read back from the database by a new instance."""
+        await cache.set("abc", _result(tmp_path))
+        cache.close()
+
+        reopened = SelectionCache(cache_dir=tmp_path / "cache")
+        assert not reopened._memory_cache
+
+        result = await reopened.get("abc")
+        assert result is not None
+        assert result.selected_files == [tmp_path / "hook.json"]
+        assert await reopened.get("missing") is None
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_results_are_not_cached(self, cache):
+        """Test that unsuccessful results are skipped."""
+        await cache.set("abc", SelectionResult(success=False))
+        assert await cache.get("abc") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries(self, tmp_path, cache):
+        """Test expired entries are dropped on lookup and cleanup."""
+        await cache.set("old", _result(tmp_path), ttl=0.001)
+        await cache.set("new", _result(tmp_path))
+        cache._memory_cache.clear()
+
+        conn = cache._get_connection()
+        with conn:
+            conn.execute("UPDATE entries SET timestamp = timestamp - 10 WHERE key = 'old'")
+
+        assert await cache.cleanup_expired() == 1
+        assert await cache.get("old") is None
+        assert await cache.get("new") is not None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_count(self, tmp_path):
+        """Test the least recently used entry is evicted first."""
+        cache = SelectionCache(cache_dir=tmp_path / "cache", max_entries=2)
+        await cache.set("a", _result(tmp_path, "a"))
+        await cache.set("b", _result(tmp_path, "b"))
+        cache._memory_cache.clear()
+        assert await cache.get("a") is not None
+
+        await cache.set("c", _result(tmp_path, "c"))
+
+        stats = await cache.get_stats()
+        assert stats["disk_entries"] == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_size(self, tmp_path):
+        """Test that the total stored size stays within the byte budget."""
+        cache = SelectionCache(cache_dir=tmp_path / "cache", max_size_bytes=1500)
+        for i in range(10):
+            await cache.set(f"key{i}", _result(tmp_path, f"file{i}"))
+
+        stats = await cache.get_stats()
+        assert 0 < stats["disk_entries"] < 10
+        assert stats["total_size_bytes"] <= 1500
+        assert await cache.get("key9") is not None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_clear(self, tmp_path, cache):
+        """Test clearing removes database rows and legacy entry files."""
+        legacy = cache.cache_dir / "0123456789abcdef.json"
+        legacy.write_text("{}")
+        await cache.set("abc", _result(tmp_path))
+
+        await cache.clear()
+
+        assert await cache.get("abc") is None
+        assert not legacy.exists()
+        rows = sqlite3.connect(str(cache.db_path)).execute("SELECT COUNT(*) FROM entries")
+        assert rows.fetchone()[0] == 0
+
+    def test_key_changes_when_source_files_change(self, tmp_path, cache):
+        """Test that file fingerprints are part of the cache key."""
+        source = tmp_path / "hooks"
+        source.mkdir()
+        hook = source / "hook.json"
+        hook.write_text("{}")
+        context = SelectionContext(mode=SelectionMode.MULTI_FILE)
+
+        key = cache.generate_key([source], context)
+        assert cache.generate_key([source], context) == key
+
+        stat = hook.stat()
+        os.utime(hook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert cache.generate_key([source], context) != key
+
+        changed = cache.generate_key([source], context)
+        hook.unlink()
+        assert cache.generate_key([source], context) != changed
+
+    def test_unchanged_directories_are_not_rescanned(self, tmp_path, cache, monkeypatch):
+        """Test that listings are reused while directory mtimes are unchanged."""
+        source = tmp_path / "hooks"
+        (source / "nested").mkdir(parents=True)
+        hook = source / "nested" / "hook.json"
+        hook.write_text("{}")
+        for directory in (source, source / "nested"):
+            os.utime(directory, (1_000_000, 1_000_000))
+        context = SelectionContext(mode=SelectionMode.MULTI_FILE)
+
+        key = cache.generate_key([source], context)
+
+        def fail_scandir(path):
+            raise AssertionError(f"unexpected rescan of {path}")
+
+        monkeypatch.setattr(os, "scandir", fail_scandir)
+        assert cache.generate_key([source], context) == key
+
+        # In-place edits are still seen without listing the directory again
+        hook.write_text('{"changed": true}')
+        assert cache.generate_key([source], context) != key
+
+    @pytest.mark.asyncio
+    async def test_running_totals_track_replacements(self, tmp_path, cache):
+        """Test that the running totals match the stored rows."""
+        await cache.set("a", _result(tmp_path, "a"))
+        await cache.set("b", _result(tmp_path, "b"))
+        await cache.set("a", _result(tmp_path, "a" * 40))
+        await cache.cleanup_expired()
+        await cache.set("c", _result(tmp_path, "c"))
+
+        count, size = (
+            cache._get_connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")
+            .fetchone()
+        )
+        assert cache._get_totals() == [count, size]
+        assert count == 3
@@ -0,0 +1,177 @@
+"""Tests for validation in the selection workflow."""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pytest
+
+from pacc.selection.persistence import SelectionCache, SelectionHistory
+from pacc.selection.types import SelectionContext, SelectionMode
+from pacc.selection.workflow import SelectionWorkflow
+from pacc.validators import BaseValidator, ValidationResult
+
+
+class RecordingValidator(BaseValidator):
+    """Validator that records the content it was given."""
+
+    def __init__(self, name: str, gate: Optional[threading.Event] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.gate = gate
+        self.seen = []
+
+    def get_extension_type(self) -> str:
+        return self.name
+
+    def validate_single(self, file_path: Union[str, Path]) -> ValidationResult:
+        if self.gate is not None:
+            self.gate.wait(5)
+        error = self._validate_file_accessibility(Path(file_path))
+        if error is not None:
+            result = ValidationResult(is_valid=False, file_path=str(file_path))
+            result.add_error(error.code, error.message)
+            return result
+        content = self._read_text(file_path)
+        self.seen.append((Path(file_path).name, content))
+        return ValidationResult(is_valid=True, file_path=str(file_path), extension_type=self.name)
+
+    def _find_extension_files(self, directory: Path) -> List[Path]:
+        return list(directory.glob("*.md"))
+
+
+class RecordingProgress:
+    """Progress tracker stand-in capturing update messages."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def update(self, message: str) -> None:
+        self.messages.append(message)
+
+
+@pytest.fixture
+def workflow(tmp_path):
+    cache = SelectionCache(cache_dir=tmp_path / "cache")
+    yield SelectionWorkflow(cache=cache, history=SelectionHistory(history_dir=tmp_path / "hist"))
+    cache.close()
+
+
+def _make_files(tmp_path, count):
+    files = []
+    for i in range(count):
+        path = tmp_path / f"file{i}.md"
+        path.write_text(f"content {i}")
+        files.append(path)
+    return files
+
+
+class TestValidateSelections:
+    """Test the concurrent validation pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_each_file_read_once_for_all_validators(self, tmp_path, workflow, monkeypatch):
+        """Test that validators share a single read of each file."""
+        files = _make_files(tmp_path, 6)
+        validators = [RecordingValidator("a"), RecordingValidator("b")]
+        context = SelectionContext(mode=SelectionMode.MULTI_FILE, validators=validators)
+
+        opened = []
+        real_open = open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(Path(file).name)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        results = await workflow._validate_selections(files, context)
+
+        assert sorted(opened) == sorted(f.name for f in files)
+        assert [(r.file_path, r.extension_type) for r in results] == [
+            (str(f), name) for f in files for name in ("a", "b")
+        ]
+        assert sorted(validators[1].seen) == [(f.name, f.read_text()) for f in files]
+
+    @pytest.mark.asyncio
+    async def test_oversized_file_not_preloaded(self, tmp_path, workflow, monkeypatch):
+        """Test that files over every validator's size limit are rejected unread."""
+        files = _make_files(tmp_path, 2)
+        validators = [RecordingValidator("a", max_file_size=4)]
+        context = SelectionContext(mode=SelectionMode.MULTI_FILE, validators=validators)
+
+        opened = []
+        real_open = open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(Path(file).name)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        results = await workflow._validate_selections(files, context)
+
+        assert opened == []
+        assert [r.errors[0].code for r in results] == ["FILE_TOO_LARGE"] * 2
+
+    @pytest.mark.asyncio
+    async def test_progress_streamed_per_file(self, tmp_path, workflow):
+        """Test that progress is reported as each file completes."""
+        files = _make_files(tmp_path, 4)
+        context = SelectionContext(
+            mode=SelectionMode.MULTI_FILE, validators=[RecordingValidator("a")]
+        )
+        progress = RecordingProgress()
+
+        await workflow._validate_selections(files, context, progress)
+
+        completed = [m for m in progress.messages if m.startswith("Validated ")]
+        assert len(completed) == 4
+        assert completed[-1].endswith("(4/4)")
+
+    @pytest.mark.asyncio
+    async def test_sequential_validation(self, tmp_path, workflow):
+        """Test validation without background workers."""
+        files = _make_files(tmp_path, 3)
+        context = SelectionContext(
+            mode=SelectionMode.MULTI_FILE,
+            validators=[RecordingValidator("a")],
+            background_validation=False,
+        )
+
+        results = await workflow._validate_selections(files, context)
+
+        assert [r.file_path for r in results] == [str(f) for f in files]
+
+    @pytest.mark.asyncio
+    async def test_validator_exception_becomes_error_result(self, tmp_path, workflow):
+        """Test that a failing validator does not abort the other files."""
+        files = _make_files(tmp_path, 2)
+        broken = RecordingValidator("broken")
+        broken.validate_single = lambda _file_path: 1 / 0
+        context = SelectionContext(mode=SelectionMode.MULTI_FILE, validators=[broken])
+
+        results = await workflow._validate_selections(files, context)
+
+        assert len(results) == 2
+        assert all(r.errors[0].code == "VALIDATION_EXCEPTION" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_pending_validations(self, tmp_path, workflow):
+        """Test that cancelling the workflow cancels queued validations."""
+        files = _make_files(tmp_path, 8)
+        gate = threading.Event()
+        validator = RecordingValidator("a", gate=gate)
+        context = SelectionContext(
+            mode=SelectionMode.MULTI_FILE, validators=[validator], max_concurrent=2
+        )
+
+        task = asyncio.ensure_future(workflow._validate_selections(files, context))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        gate.set()
+        await asyncio.sleep(0.1)
+        # Only the two files already running on the pool are validated
+        assert len(validator.seen) <= 2
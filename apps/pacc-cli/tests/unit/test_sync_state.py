@@ -0,0 +1,218 @@
+"""Unit tests for pacc.core.sync_state and fingerprint-based partial syncs."""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pacc.core.project_config import ProjectSyncManager
+from pacc.core.sync_state import SyncState, SyncStateStore, fingerprint, path_fingerprint
+from pacc.fragments.sync_manager import FragmentSyncManager
+
+
+def touch_later(path):
+    """Move a file's mtime forward so stat fingerprints change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Create a project with two local hook extensions."""
+    (tmp_path / "hooks").mkdir()
+    for name in ("a", "b"):
+        (tmp_path / "hooks" / f"{name}.json").write_text(json.dumps({"name": name}))
+    (tmp_path / "pacc.json").write_text(
+        json.dumps(
+            {
+                "name": "demo",
+                "version": "1.0.0",
+                "extensions": {
+                    "hooks": [
+                        {"name": name, "source": f"./hooks/{name}.json", "version": "1.0.0"}
+                        for name in ("a", "b")
+                    ]
+                },
+            }
+        )
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def installer():
+    """Mock extension installer that always succeeds."""
+    installer = Mock()
+    installer.install_extension.return_value = True
+    with patch("pacc.core.project_config.get_extension_installer", return_value=installer):
+        yield installer
+
+
+def installed_names(installer):
+    """Names of the extensions passed to the installer."""
+    return [call[0][0].name for call in installer.install_extension.call_args_list]
+
+
+class TestSyncState:
+    """Test fingerprints and recorded state."""
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test equal values hash equally regardless of dict order."""
+        assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+    def test_path_fingerprint_tracks_changes(self, tmp_path):
+        """Test file and directory fingerprints change when a file changes."""
+        path = tmp_path / "file.txt"
+        path.write_text("x")
+        before = (path_fingerprint(path), path_fingerprint(tmp_path))
+
+        touch_later(path)
+
+        assert path_fingerprint(path) != before[0]
+        assert path_fingerprint(tmp_path) != before[1]
+        assert path_fingerprint(tmp_path / "missing") is None
+
+    def test_store_round_trip(self, tmp_path):
+        """Test partial and complete states are recorded per scope."""
+        store = SyncStateStore(tmp_path)
+        store.save("one", {"a": "1"}, complete=False)
+        store.save("two", {"a": "1"}, complete=True)
+
+        assert store.load("one").changed_entries({"a": "1", "b": "2"}) == ["b"]
+        assert not store.load("one").is_unchanged({"a": "1"})
+        assert store.load("two").is_unchanged({"a": "1"})
+        assert store.load("missing") == SyncState()
+
+
+class TestProjectSyncFingerprints:
+    """Test pacc sync skips extensions that have not changed."""
+
+    def test_repeated_sync_is_noop(self, project_dir, installer):
+        """Test a second sync with unchanged inputs installs nothing."""
+        manager = ProjectSyncManager()
+        assert manager.sync_project(project_dir).installed_count == 2
+
+        result = manager.sync_project(project_dir)
+
+        assert result.success
+        assert result.installed_count == 0
+        assert result.skipped_count == 2
+        assert result.metadata["unchanged"]
+        assert installer.install_extension.call_count == 2
+
+    def test_only_changed_extension_reinstalled(self, project_dir, installer):
+        """Test editing one source reinstalls only that extension."""
+        manager = ProjectSyncManager()
+        manager.sync_project(project_dir)
+        installer.reset_mock()
+
+        touch_later(project_dir / "hooks" / "b.json")
+        result = manager.sync_project(project_dir)
+
+        assert installed_names(installer) == ["b"]
+        assert result.skipped_count == 1
+
+    def test_failed_extension_retried(self, project_dir, installer):
+        """Test extensions that failed to install are processed again."""
+        installer.install_extension.side_effect = lambda spec, *_: spec.name == "a"
+        manager = ProjectSyncManager()
+        assert not manager.sync_project(project_dir).success
+        installer.reset_mock()
+        installer.install_extension.side_effect = None
+
+        manager.sync_project(project_dir)
+
+        assert installed_names(installer) == ["b"]
+
+    def test_remote_extension_always_processed(self, project_dir, installer):
+        """Test URL sources are reinstalled while unchanged local ones are skipped."""
+        config = json.loads((project_dir / "pacc.json").read_text())
+        config["extensions"]["hooks"].append(
+            {"name": "r", "source": "https://example.com/r.json", "version": "1.0.0"}
+        )
+        (project_dir / "pacc.json").write_text(json.dumps(config))
+        manager = ProjectSyncManager()
+        manager.sync_project(project_dir)
+        installer.reset_mock()
+
+        result = manager.sync_project(project_dir)
+
+        assert installed_names(installer) == ["r"]
+        assert result.skipped_count == 2
+        assert "unchanged" not in result.metadata
+
+    @pytest.mark.usefixtures("installer")
+    def test_duplicate_names_reported(self, project_dir):
+        """Test a second spec with the same type and name is reported, not dropped."""
+        config = json.loads((project_dir / "pacc.json").read_text())
+        config["extensions"]["hooks"].append(
+            {"name": "a", "source": "./hooks/b.json", "version": "2.0.0"}
+        )
+        (project_dir / "pacc.json").write_text(json.dumps(config))
+        manager = ProjectSyncManager()
+
+        for _ in range(2):
+            result = manager.sync_project(project_dir)
+
+            assert not result.success
+            assert result.failed_extensions == ["hooks/a"]
+            assert any("Duplicate hooks name 'a'" in warning for warning in result.warnings)
+
+    @pytest.mark.usefixtures("installer")
+    def test_full_sync_processes_everything(self, project_dir):
+        """Test full=True ignores the recorded state."""
+        manager = ProjectSyncManager()
+        manager.sync_project(project_dir)
+
+        assert manager.sync_project(project_dir, full=True).installed_count == 2
+
+    @pytest.mark.usefixtures("installer")
+    def test_dry_run_records_nothing(self, project_dir):
+        """Test dry runs leave no sync state behind."""
+        ProjectSyncManager().sync_project(project_dir, dry_run=True)
+
+        assert not (project_dir / ".pacc" / "sync-state.json").exists()
+
+
+class TestFragmentSyncFingerprints:
+    """Test fragment sync skips fragments that have not changed."""
+
+    @pytest.fixture
+    def fragment_project(self, tmp_path):
+        """Create a project whose single fragment spec is installed."""
+        (tmp_path / "notes.md").write_text("# Notes\n")
+        (tmp_path / "pacc.json").write_text(
+            json.dumps(
+                {
+                    "fragmentSpecs": {"notes": {"source": "./notes.md", "version": "1.0"}},
+                    "fragments": {"notes": {"version": "1.0", "reference_path": "notes.md"}},
+                }
+            )
+        )
+        return tmp_path
+
+    def test_repeated_sync_skips_conflict_detection(self, fragment_project):
+        """Test an unchanged project returns before detecting conflicts."""
+        manager = FragmentSyncManager(project_root=fragment_project)
+        assert manager.sync_fragments(interactive=False).success
+
+        with patch.object(manager, "detect_conflicts") as detect:
+            result = manager.sync_fragments(interactive=False)
+
+        assert result.success
+        assert result.skipped_count == 1
+        detect.assert_not_called()
+
+    def test_edited_fragment_processed_again(self, fragment_project):
+        """Test a changed fragment file is no longer skipped."""
+        manager = FragmentSyncManager(project_root=fragment_project)
+        manager.sync_fragments(interactive=False)
+        touch_later(fragment_project / "notes.md")
+
+        with patch.object(manager, "detect_conflicts", return_value=[]) as detect:
+            result = manager.sync_fragments(interactive=False)
+
+        assert result.skipped_count == 0
+        assert [spec.name for spec in detect.call_args[0][0]] == ["notes"]